@@ -18,7 +18,7 @@ import stat
 import time
 import shutil
 
-from tempfile import mkstemp
+from tempfile import mkdtemp, mkstemp
 
 from ansible.errors import AnsibleError
 from ansible.module_utils._text import to_text
@@ -26,10 +26,13 @@ from ansible.module_utils.six import string_types
 from ansible.module_utils.parsing.convert_bool import boolean
 from ansible.plugins.action import ActionBase
 from ansible.utils.display import Display
-from ansible import cli
 
 from ansible_collections.ibm.ibm_zos_core.plugins.module_utils import encode
 
+from ansible_collections.ibm.ibm_zos_core.plugins.module_utils import fingerprint
+
+from ansible_collections.ibm.ibm_zos_core.plugins.module_utils import transfer
+
 from ansible_collections.ibm.ibm_zos_core.plugins.module_utils import template
 
 display = Display()
@@ -65,6 +68,8 @@ class ActionModule(ActionBase):
         mode = task_args.get("mode", None)
         owner = task_args.get("owner", None)
         group = task_args.get("group", None)
+        transfer_mode = task_args.get("transfer_mode", "files")
+        sync = _process_boolean(task_args.get("sync"), default=False)
 
         is_src_dir = False
         temp_path = is_uss = None
@@ -134,6 +139,8 @@ class ActionModule(ActionBase):
             display.warning(
                 msg="Using force uses operations that are subject to race conditions and can lead to data loss, use with caution.")
         template_dir = None
+        sync_dir = None
+        unchanged_entries = None
 
         if not remote_src:
             if local_follow and not src:
@@ -241,9 +248,51 @@ class ActionModule(ActionBase):
                         else:
                             display.vvv(u"Template File {0} does not exist.".format(rendered_file))
 
+                if sync and is_src_dir:
+                    sync_res = self._get_sync_changes(
+                        src,
+                        dest,
+                        is_uss,
+                        encoding,
+                        binary or executable,
+                        copy_directory=not task_args.get("src").endswith("/"),
+                        task_vars=task_vars
+                    )
+                    if sync_res.get("msg"):
+                        if template_dir:
+                            shutil.rmtree(template_dir, ignore_errors=True)
+                        return self._exit_action(result, sync_res.get("msg"), failed=True)
+
+                    unchanged_entries = sync_res.get("unchanged_entries")
+                    changed_entries = sync_res.get("changed_entries")
+                    display.vvv(
+                        u"ibm_zos_copy sync: {0} changed and {1} unchanged entries".format(len(changed_entries), unchanged_entries),
+                        host=self._play_context.remote_addr
+                    )
+
+                    if unchanged_entries and not changed_entries:
+                        if template_dir:
+                            shutil.rmtree(template_dir, ignore_errors=True)
+                        result.update(dict(
+                            src=task_args.get("src"),
+                            dest=dest,
+                            changed=sync_res.get("changed"),
+                            unchanged_entries=unchanged_entries,
+                            note="All files in src are identical to the ones in dest, no data was copied.",
+                            invocation=dict(module_args=self._task.args),
+                        ))
+                        return result
+
+                    if unchanged_entries:
+                        sync_dir, src = _create_sync_dir(src, changed_entries)
+
                 display.vvv(u"ibm_zos_copy calculated size: {0}".format(os.stat(src).st_size), host=self._play_context.remote_addr)
                 transfer_res = self._copy_to_remote(
-                    src, is_dir=is_src_dir, ignore_stderr=ignore_sftp_stderr, task_vars=task_vars
+                    src,
+                    is_dir=is_src_dir,
+                    ignore_stderr=ignore_sftp_stderr,
+                    task_vars=task_vars,
+                    archive=transfer_mode == "archive"
                 )
 
             temp_path = transfer_res.get("temp_path")
@@ -288,6 +337,10 @@ class ActionModule(ActionBase):
         # Erasing all rendered Jinja2 templates from the controller.
         if template_dir:
             shutil.rmtree(template_dir, ignore_errors=True)
+        if sync_dir:
+            shutil.rmtree(sync_dir, ignore_errors=True)
+        if unchanged_entries is not None:
+            copy_res["unchanged_entries"] = unchanged_entries
         # Remove temporary directory from remote
         if self.tmp_dir is not None:
             path = os.path.normpath(f"{self.tmp_dir}/ansible-zos-copy")
@@ -319,70 +372,57 @@ class ActionModule(ActionBase):
 
         return copy_res
 
-    def _copy_to_remote(self, src, is_dir=False, ignore_stderr=False, task_vars=None):
+    def _copy_to_remote(self, src, is_dir=False, ignore_stderr=False, task_vars=None, archive=False):
         """Copy a file or directory to the remote z/OS system """
         self.tmp_dir = self._connection._shell._options.get("remote_tmp")
         temp_path = os.path.join(self.tmp_dir, _create_temp_path_name())
 
-        rc, stdout, stderr = self._connection.exec_command("mkdir -p {0}".format(temp_path))
-        display.vvv(f"ibm_zos_copy: remote mkdir result {rc}, {stdout}, {stderr} path {temp_path}")
-        if rc > 0:
-            msg = f"Failed to create remote temporary directory in {self.tmp_dir}. Ensure that user has proper access."
-            return self._exit_action({}, msg, failed=True)
-
-        # The temporary dir was created successfully using ssh connection user.
-        rc, stdout, stderr = self._connection.exec_command(F"cd {temp_path} && pwd")
-        display.vvv(f"ibm_zos_copy: remote pwd result {rc}, {stdout}, {stderr} path {temp_path}")
-        if rc > 0:
-            msg = f"Failed to resolve remote temporary directory {temp_path}. Ensure that user has proper access."
-            return self._exit_action({}, msg, failed=True)
-        temp_path = stdout.decode("utf-8").replace("\r", "").replace("\n", "")
-
-        _sftp_action = 'put'
-
-        temp_path = os.path.join(temp_path, os.path.basename(src))
+        temp_base = os.path.basename(src)
         _src = src.replace("#", "\\#")
-        full_temp_path = temp_path
-
+        subdirs = None
+        archive = archive and is_dir
         if is_dir:
             src = src.rstrip("/") if src.endswith("/") else src
-            temp_path = os.path.dirname(temp_path)
-            base = os.path.basename(src)
-            self._connection.exec_command("mkdir -p {0}/{1}".format(temp_path, base))
-            _sftp_action += ' -r'    # add '-r` to clone the source trees
-
-        # To support multiple Ansible versions we must do some version detection and act accordingly
-        version_inf = cli.CLI.version_info(False)
-        version_major = version_inf['major']
-        version_minor = version_inf['minor']
-
-        # Override the Ansible Connection behavior for this module and track users configuration
-        sftp_transfer_method = "sftp"
-        user_ssh_transfer_method = None
-        is_ssh_transfer_method_updated = False
-
-        try:
-            if version_major == 2 and version_minor >= 11:
-                user_ssh_transfer_method = self._connection.get_option('ssh_transfer_method')
-
-                if user_ssh_transfer_method != sftp_transfer_method:
-                    self._connection.set_option('ssh_transfer_method', sftp_transfer_method)
-                    is_ssh_transfer_method_updated = True
-
-            elif version_major == 2 and version_minor <= 10:
-                user_ssh_transfer_method = self._play_context.ssh_transfer_method
-
-                if user_ssh_transfer_method != sftp_transfer_method:
-                    self._play_context.ssh_transfer_method = sftp_transfer_method
-                    is_ssh_transfer_method_updated = True
-
-            if is_ssh_transfer_method_updated:
-                display.vvv(u"ibm_zos_copy SSH transfer method updated from {0} to {1}.".format(user_ssh_transfer_method,
-                            sftp_transfer_method), host=self._play_context.remote_addr)
-
-            display.vvv(u"ibm_zos_copy: {0} {1} TO {2}".format(_sftp_action, _src, temp_path), host=self._play_context.remote_addr)
-
-            (returncode, stdout, stderr) = self._connection._file_transport_command(_src, temp_path, _sftp_action)
+            # When sending a single archive, the module extracts the tree
+            # itself, so there is no need to create its root beforehand.
+            if not archive:
+                subdirs = [os.path.basename(src)]
+
+        with transfer.SFTPSession(
+            self._connection,
+            display=display,
+            host=self._play_context.remote_addr,
+            log_prefix="ibm_zos_copy"
+        ) as session:
+            # The temporary dir (and the tree root when copying a directory) is
+            # created and resolved with the ssh connection user in a single
+            # remote command.
+            rc, resolved_path, stderr = session.prepare_remote_dir(temp_path, subdirs=subdirs)
+            if rc > 0:
+                msg = f"Failed to create remote temporary directory in {self.tmp_dir}. Ensure that user has proper access."
+                return self._exit_action({}, msg, failed=True)
+
+            temp_path = os.path.join(resolved_path, temp_base)
+            full_temp_path = temp_path
+
+            if is_dir:
+                temp_path = os.path.dirname(temp_path)
+
+            if archive:
+                (returncode, stdout, stderr) = self._copy_archive_to_remote(
+                    session,
+                    src,
+                    os.path.join(resolved_path, os.path.basename(src)),
+                    full_temp_path
+                )
+            else:
+                (returncode, stdout, stderr) = session.transfer(
+                    "put",
+                    _src,
+                    temp_path,
+                    recursive=is_dir,
+                    local_path=src
+                )
 
             display.vvv(u"ibm_zos_copy return code: {0}".format(returncode), host=self._play_context.remote_addr)
             display.vvv(u"ibm_zos_copy stdout: {0}".format(stdout), host=self._play_context.remote_addr)
@@ -419,19 +459,69 @@ class ActionModule(ActionBase):
                     failed=True,
                 )
 
-        finally:
-            # Restore the users defined option `ssh_transfer_method` if it was overridden
-            if is_ssh_transfer_method_updated:
-                if version_major == 2 and version_minor >= 11:
-                    self._connection.set_option('ssh_transfer_method', user_ssh_transfer_method)
+        return dict(temp_path=full_temp_path)
 
-                elif version_major == 2 and version_minor <= 10:
-                    self._play_context.ssh_transfer_method = user_ssh_transfer_method
+    def _get_sync_changes(self, src, dest, is_uss, encoding, compare_binary, copy_directory=True, task_vars=None):
+        """Builds the manifest of a local directory and asks the module, in a
+        single remote call, which of its entries differ from dest.
+        """
+        if encoding and encoding.get("from"):
+            charset = encoding.get("from")
+        else:
+            charset = encode.Defaults.get_default_system_charset()
+
+        src = src.rstrip("/")
+        manifest = fingerprint.build_manifest(src, charset=charset, binary=compare_binary, records=not is_uss)
+        if not manifest:
+            return dict(changed_entries=[], unchanged_entries=0)
+
+        # The module applies these itself when nothing has to be copied.
+        file_args = dict(
+            (option, self._task.args.get(option))
+            for option in ("mode", "group", "owner")
+            if self._task.args.get(option) is not None and self._task.args.get(option) != "preserve"
+        )
 
-                display.vvv(u"ibm_zos_copy SSH transfer method restored to {0}".format(user_ssh_transfer_method), host=self._play_context.remote_addr)
-                is_ssh_transfer_method_updated = False
+        dest_root = os.path.basename(src) if is_uss and copy_directory else ""
+        sync_res = self._execute_module(
+            module_name="ibm.ibm_zos_core.zos_copy",
+            module_args=dict(
+                dest=dest,
+                encoding=encoding,
+                binary=_process_boolean(self._task.args.get("binary"), default=False),
+                executable=_process_boolean(self._task.args.get("executable"), default=False),
+                _sync_manifest=dict(entries=manifest, dest_root=dest_root),
+                **file_args
+            ),
+            task_vars=task_vars
+        )
+        if sync_res.get("failed"):
+            return dict(msg="Unable to compare the source with the destination {0}: {1}".format(
+                dest,
+                sync_res.get("msg") or sync_res.get("module_stderr")
+            ))
+
+        changed_entries = sync_res.get("sync_changed_entries", [])
+        return dict(
+            changed=sync_res.get("changed", False),
+            changed_entries=changed_entries,
+            unchanged_entries=len(manifest) - len(changed_entries)
+        )
 
-        return dict(temp_path=full_temp_path)
+    def _copy_archive_to_remote(self, session, src, tree_path, module_src):
+        """Packs a local directory into a single compressed archive and
+        uploads it next to the path the module will receive as its source,
+        where the module expects to find it and extract it.
+        """
+        remote_archive = module_src.rstrip("/") + transfer.ARCHIVE_SUFFIX
+        arcname = os.path.relpath(tree_path, os.path.dirname(remote_archive))
+
+        local_archive = transfer.create_transfer_archive(src, arcname)
+        try:
+            display.vvv(u"ibm_zos_copy archive size: {0}".format(os.stat(local_archive).st_size), host=self._play_context.remote_addr)
+            return session.transfer("put", local_archive, remote_archive)
+        finally:
+            os.remove(local_archive)
 
     def _exit_action(self, result, msg, failed=False):
         """Exit action plugin with a message"""
@@ -477,6 +567,24 @@ def _detect_sftp_errors(stderr):
     return ""
 
 
+def _create_sync_dir(src, changed_entries):
+    """Creates a copy of a local directory holding only the entries that
+    have to be transferred. The copy keeps the name of the original directory
+    and returns the temporary directory holding it along with its path.
+    """
+    sync_dir = mkdtemp()
+    sync_src = os.path.join(sync_dir, os.path.basename(src.rstrip("/")))
+    os.makedirs(sync_src)
+    for relative_path in changed_entries:
+        sync_path = os.path.join(sync_src, relative_path)
+        os.makedirs(os.path.dirname(sync_path), exist_ok=True)
+        shutil.copy2(os.path.join(src, relative_path), sync_path)
+
+    if src.endswith("/"):
+        sync_src += "/"
+    return sync_dir, sync_src
+
+
 def _write_content_to_temp_file(content):
     """Write given content to a temp file and return its path """
     fd, path = mkstemp()
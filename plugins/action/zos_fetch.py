@@ -13,6 +13,7 @@ from __future__ import absolute_import, division, print_function
 
 __metaclass__ = type
 
+import json
 import os
 import re
 
@@ -24,9 +25,8 @@ from ansible.module_utils.parsing.convert_bool import boolean
 from ansible.plugins.action import ActionBase
 from ansible.errors import AnsibleError
 from ansible.utils.display import Display
-from ansible import cli
 
-from ansible_collections.ibm.ibm_zos_core.plugins.module_utils import encode, validation, data_set
+from ansible_collections.ibm.ibm_zos_core.plugins.module_utils import encode, validation, data_set, transfer
 
 SUPPORTED_DS_TYPES = frozenset({
     "PS", "SEQ", "BASIC",
@@ -94,6 +94,11 @@ def _get_file_checksum(src):
     return hash_digest.hexdigest()
 
 
+def _chunk_checksums(chunks):
+    """Returns the size and checksum of every chunk."""
+    return [dict(size=chunk["size"], checksum=chunk["checksum"]) for chunk in chunks]
+
+
 def _detect_sftp_errors(stderr):
     """Detects if the stderr of the SFTP command contains any errors.
        The SFTP command usually returns zero return code even if it
@@ -152,6 +157,7 @@ class ActionModule(ActionBase):
             return result
 
         ds_type = None
+        member_name = None
         fetch_member = data_set.is_member(src)
         if fetch_member:
             member_name = src[src.find("(") + 1: src.find(")")]
@@ -179,6 +185,32 @@ class ActionModule(ActionBase):
                 dict(encoding=dict(to=encode.Defaults.get_default_system_charset()))
             )
         remote_path = None
+        staging = None
+
+        # ********************************************************** #
+        # Send the checksum of the local copy the task would         #
+        # overwrite, so the module can skip staging (and this plugin #
+        # the transfer) when the remote content is the same. Names   #
+        # the module resolves differently (e.g. relative GDS) just   #
+        # won't match. The chunks a previous run left in the journal #
+        # are sent the same way, the module only checks them against #
+        # the source instead of staging them again.                  #
+        # ********************************************************** #
+        predicted_checksum = resume_chunks = None
+        predicted_dest = self._get_local_dest(
+            src,
+            os.path.expanduser(dest),
+            flat,
+            member_name,
+            task_vars
+        ).replace("//", "/")
+        if self._task.args.get("chunk_size"):
+            resume_chunks = self._chunk_journal(predicted_dest, src, new_module_args).read()
+            if resume_chunks:
+                new_module_args.update(_resume_chunks=_chunk_checksums(resume_chunks))
+        elif os.path.isfile(to_bytes(predicted_dest, errors="surrogate_or_strict")):
+            predicted_checksum = _get_file_checksum(predicted_dest)
+            new_module_args.update(_local_checksum=predicted_checksum)
 
         try:
             fetch_res = self._execute_module(
@@ -189,6 +221,8 @@ class ActionModule(ActionBase):
             ds_type = fetch_res.get("ds_type")
             src = fetch_res.get("src")
             remote_path = fetch_res.get("remote_path")
+            if fetch_res.get("chunk_dir"):
+                staging = (fetch_res["chunk_dir"], fetch_res["chunk_pid"])
             # Create a dictionary that is a schema for the return values
             result = dict(
                 src="",
@@ -274,26 +308,10 @@ class ActionModule(ActionBase):
                 )
                 result["failed"] = True
                 return result
-            if dest.endswith(os.sep):
-                if fetch_member:
-                    base = os.path.dirname(dest)
-                    dest = os.path.join(validation.validate_safe_path(base), validation.validate_safe_path(member_name))
-                    display.vvv(u"This is how dest looks {0}".format(dest), host=self._play_context.remote_addr)
-                else:
-                    base = os.path.basename(source_local)
-                    dest = os.path.join(validation.validate_safe_path(dest), validation.validate_safe_path(base))
-                    display.vvv(u"This is how dest looks {0}".format(dest), host=self._play_context.remote_addr)
-            if not dest.startswith("/"):
-                dest = self._loader.path_dwim(dest)
+            dest = self._get_local_dest(source_local, dest, flat, member_name, task_vars)
+            display.vvv(u"This is how dest looks {0}".format(dest), host=self._play_context.remote_addr)
         else:
-            if "inventory_hostname" in task_vars:
-                target_name = task_vars["inventory_hostname"]
-            else:
-                target_name = self._play_context.remote_addr
-            suffix = member_name if fetch_member else source_local
-            dest = "{0}/{1}/{2}".format(
-                self._loader.path_dwim(dest), target_name, suffix
-            )
+            dest = self._get_local_dest(source_local, dest, flat, member_name, task_vars)
             try:
                 dirname = os.path.dirname(dest).replace("//", "/")
                 if not os.path.exists(dirname):
@@ -310,10 +328,33 @@ class ActionModule(ActionBase):
         dest = dest.replace("//", "/")
         local_checksum = _get_file_checksum(dest)
 
+        # ********************************************************** #
+        # When the module found that the local copy already matches  #
+        # the remote content, there's nothing left to transfer.      #
+        # ********************************************************** #
+        if fetch_res.get("checksum_match") and dest == predicted_dest and local_checksum == predicted_checksum:
+            result["changed"] = False
+            result["checksum"] = local_checksum
+            return _update_result(result, src, dest, ds_type, binary=binary)
+
         # ********************************************************** #
         # Fetch remote data.                                         #
+        # If another user created the temporary files, transfers and #
+        # cleanup run with it too, lest we get a permissions issue.  #
         # ********************************************************** #
+        transfer_user = None
+        if self._connection.become:
+            transfer_user = self._play_context._become_user
+
+        session = transfer.SFTPSession(
+            self._connection,
+            display=display,
+            host=self._play_context.remote_addr,
+            log_prefix="ibm_zos_fetch",
+            transfer_user=transfer_user
+        )
         try:
+            session.open()
             if ds_type in SUPPORTED_DS_TYPES:
                 if ds_type == "PO" and os.path.isfile(dest) and not fetch_member:
                     result["msg"] = "Destination must be a directory to fetch a partitioned data set"
@@ -324,15 +365,42 @@ class ActionModule(ActionBase):
                     result["failed"] = True
                     return result
 
-                fetch_content = self._transfer_remote_content(
-                    dest,
-                    remote_path,
-                    ds_type,
-                    ignore_stderr=ignore_sftp_stderr,
-                )
+                if staging:
+                    def restage(chunks):
+                        """Start staging the source again, skipping the chunks given."""
+                        module_args = dict(new_module_args, _resume_chunks=_chunk_checksums(chunks))
+                        restage_res = self._execute_module(
+                            module_name="ibm.ibm_zos_core.zos_fetch",
+                            module_args=module_args,
+                            task_vars=task_vars
+                        )
+                        if restage_res.get("failed", False):
+                            raise AnsibleError(restage_res.get("msg"))
+                        return restage_res["chunk_dir"], restage_res["chunk_pid"]
+
+                    fetch_content = self._fetch_chunks(
+                        session,
+                        new_module_args,
+                        src,
+                        dest,
+                        ds_type,
+                        staging,
+                        resume_chunks,
+                        restage,
+                        ignore_stderr=ignore_sftp_stderr,
+                    )
+                else:
+                    fetch_content = self._transfer_remote_content(
+                        session,
+                        dest,
+                        remote_path,
+                        ds_type,
+                        ignore_stderr=ignore_sftp_stderr,
+                    )
                 if fetch_content.get("msg"):
                     result.update(fetch_content)
                     return result
+                result.update(fetch_content)
 
                 if validate_checksum and ds_type != "GDG" and ds_type != "PO" and not binary:
                     new_checksum = _get_file_checksum(dest)
@@ -361,125 +429,225 @@ class ActionModule(ActionBase):
         # ********************************************************** #
 
         finally:
-            self._remote_cleanup(remote_path, ds_type, encoding)
+            self._remote_cleanup(session, remote_path, ds_type, encoding)
+            session.close()
         return _update_result(result, src, dest, ds_type, binary=binary)
 
+    def _get_local_dest(self, source_local, dest, flat, member_name, task_vars):
+        """ Get the local path where the fetched content is stored.
+            When 'flat' is 'false', hostname and source are appended to
+            dest; otherwise, the source (or member) name is appended only
+            when dest ends with a forward slash.
+        """
+        if flat:
+            if dest.endswith(os.sep):
+                if member_name:
+                    base = os.path.dirname(dest)
+                    dest = os.path.join(validation.validate_safe_path(base), validation.validate_safe_path(member_name))
+                else:
+                    base = os.path.basename(source_local)
+                    dest = os.path.join(validation.validate_safe_path(dest), validation.validate_safe_path(base))
+            if not dest.startswith("/"):
+                dest = self._loader.path_dwim(dest)
+        else:
+            if "inventory_hostname" in task_vars:
+                target_name = task_vars["inventory_hostname"]
+            else:
+                target_name = self._play_context.remote_addr
+            suffix = member_name if member_name else source_local
+            dest = "{0}/{1}/{2}".format(
+                self._loader.path_dwim(dest), target_name, suffix
+            )
+        return dest
+
     def _transfer_remote_content(
-        self, dest, remote_path, src_type, ignore_stderr=False
+        self, session, dest, remote_path, src_type, ignore_stderr=False
     ):
         """ Transfer a file or directory from USS to local machine.
             After the transfer is complete, the USS file or directory will
             be removed.
         """
         result = dict()
-        _sftp_action = 'get'
-
-        if src_type == "PO" or src_type == "GDG":
-            _sftp_action += ' -r'    # add '-r` to clone the source trees
-
-        # To support multiple Ansible versions we must do some version detection and act accordingly
-        version_inf = cli.CLI.version_info(False)
-        version_major = version_inf['major']
-        version_minor = version_inf['minor']
+        recursive = src_type == "PO" or src_type == "GDG"
+
+        (returncode, stdout, stderr) = session.transfer("get", remote_path, dest, recursive=recursive)
+
+        display.vvv(u"ibm_zos_fetch return code: {0}".format(returncode), host=self._play_context.remote_addr)
+        display.vvv(u"ibm_zos_fetch stdout: {0}".format(stdout), host=self._play_context.remote_addr)
+        display.vvv(u"ibm_zos_fetch stderr: {0}".format(stderr), host=self._play_context.remote_addr)
+
+        ansible_verbosity = None
+        ansible_verbosity = display.verbosity
+        display.vvv(u"play context verbosity: {0}".format(ansible_verbosity), host=self._play_context.remote_addr)
+
+        # ************************************************************************* #
+        # When plugin shh connection member _build_command(..) detects verbosity    #
+        # greater than 3, it constructs a command that includes verbosity like      #
+        # 'EXEC sftp -b - -vvv ...' where this then is returned in the connections  #
+        # stream as 'stderr' and if a user has not set ignore_stderr it will fail   #
+        # the modules execution. So in cases where verbosity                        #
+        # (ansible.cfg verbosity = n || CLI -vvv) are collectively summed and       #
+        # amount to greater than 3, ignore_stderr will be set to 'True' so that     #
+        # 'err' which will not be None won't fail the module. 'stderr' does not     #
+        # in our z/OS case actually mean an error happened, it just so happens      #
+        # the verbosity is returned as 'stderr'.                                    #
+        # ************************************************************************* #
+
+        err = _detect_sftp_errors(stderr)
+
+        if ansible_verbosity > 3:
+            ignore_stderr = True
+
+        if re.findall(r"Permission denied", err):
+            result["msg"] = "Insufficient write permission for destination {0}".format(
+                dest
+            )
+        elif returncode != 0 or (err and not ignore_stderr):
+            result["msg"] = "Error transferring remote data from z/OS system"
+            result["rc"] = returncode
+        if result.get("msg"):
+            result["stderr"] = err
+            result["failed"] = True
 
-        # Override the Ansible Connection behavior for this module and track users configuration
-        sftp_transfer_method = "sftp"
-        user_ssh_transfer_method = None
-        is_ssh_transfer_method_updated = False
-        was_user_updated = False
+        return result
 
+    def _chunk_journal(self, dest, src, module_args):
+        """ Journal of the chunks of src fetched into dest. """
+        return transfer.ChunkJournal(dest, dict(
+            src=src,
+            binary=module_args.get("binary", False),
+            encoding=module_args.get("encoding"),
+            chunk_size=module_args.get("chunk_size"),
+        ))
+
+    def _fetch_chunks(
+        self,
+        session,
+        module_args,
+        src,
+        dest,
+        src_type,
+        staging,
+        resume_chunks,
+        restage,
+        ignore_stderr=False
+    ):
+        """ Fetch a data set one chunk at a time, while the module cuts it
+            into chunks. Each one is transferred as soon as it is staged,
+            verified against its checksum, recorded in the local journal and
+            removed from the remote system, which lets the module stage the
+            next one. The chunks the journal already has are only checked
+            against the source on the remote system, a source changed in
+            between is staged again from the first chunk that differs.
+        """
+        journal = self._chunk_journal(dest, src, module_args)
+        journal.load()
+        restaged = False
+        resumed_chunks = 0
         try:
-            if version_major == 2 and version_minor >= 11:
-                user_ssh_transfer_method = self._connection.get_option('ssh_transfer_method')
-
-                if user_ssh_transfer_method != sftp_transfer_method:
-                    self._connection.set_option('ssh_transfer_method', sftp_transfer_method)
-                    is_ssh_transfer_method_updated = True
-
-            elif version_major == 2 and version_minor <= 10:
-                user_ssh_transfer_method = self._play_context.ssh_transfer_method
-
-                if user_ssh_transfer_method != sftp_transfer_method:
-                    self._play_context.ssh_transfer_method = sftp_transfer_method
-                    is_ssh_transfer_method_updated = True
-
-            if is_ssh_transfer_method_updated:
-                display.vvv(u"ibm_zos_fetch SSH transfer method updated from {0} to {1}.".format(user_ssh_transfer_method,
-                            sftp_transfer_method), host=self._play_context.remote_addr)
-
-            if self._connection.become:
-                was_user_updated = True
-                self._connection.set_option('remote_user', self._play_context._become_user)
-                display.vvv(
-                    u"ibm_zos_fetch SSH transfer user updated to {0}".format(self._play_context._become_user),
-                    host=self._play_context.remote_addr
-                )
-
-            display.vvv(u"{0} {1} TO {2}".format(_sftp_action, remote_path, dest), host=self._play_context.remote_addr)
-            display.vvv(u"{0}, {1}".format(vars(self._connection), vars(self._play_context)))
-            (returncode, stdout, stderr) = self._connection._file_transport_command(remote_path, dest, _sftp_action)
-
-            display.vvv(u"ibm_zos_fetch return code: {0}".format(returncode), host=self._play_context.remote_addr)
-            display.vvv(u"ibm_zos_fetch stdout: {0}".format(stdout), host=self._play_context.remote_addr)
-            display.vvv(u"ibm_zos_fetch stderr: {0}".format(stderr), host=self._play_context.remote_addr)
-
-            ansible_verbosity = None
-            ansible_verbosity = display.verbosity
-            display.vvv(u"play context verbosity: {0}".format(ansible_verbosity), host=self._play_context.remote_addr)
-
-            # ************************************************************************* #
-            # When plugin shh connection member _build_command(..) detects verbosity    #
-            # greater than 3, it constructs a command that includes verbosity like      #
-            # 'EXEC sftp -b - -vvv ...' where this then is returned in the connections  #
-            # stream as 'stderr' and if a user has not set ignore_stderr it will fail   #
-            # the modules execution. So in cases where verbosity                        #
-            # (ansible.cfg verbosity = n || CLI -vvv) are collectively summed and       #
-            # amount to greater than 3, ignore_stderr will be set to 'True' so that     #
-            # 'err' which will not be None won't fail the module. 'stderr' does not     #
-            # in our z/OS case actually mean an error happened, it just so happens      #
-            # the verbosity is returned as 'stderr'.                                    #
-            # ************************************************************************* #
-
-            err = _detect_sftp_errors(stderr)
-
-            if ansible_verbosity > 3:
-                ignore_stderr = True
-
-            if re.findall(r"Permission denied", err):
-                result["msg"] = "Insufficient write permission for destination {0}".format(
-                    dest
-                )
-            elif returncode != 0 or (err and not ignore_stderr):
-                result["msg"] = "Error transferring remote data from z/OS system"
-                result["rc"] = returncode
-            if result.get("msg"):
-                result["stderr"] = err
-                result["failed"] = True
-
+            if _chunk_checksums(journal.chunks) != _chunk_checksums(resume_chunks or []):
+                # The journal read before staging wasn't the one of dest.
+                session.exec_command("rm -rf {0}".format(staging[0]))
+                staging = restage(journal.chunks)
+
+            index = 0
+            while True:
+                manifest = self._wait_for_chunk(session, staging, index)
+                if "index" not in manifest:
+                    if manifest.get("changed_chunk") is not None and not restaged:
+                        display.vvv(
+                            u"ibm_zos_fetch {0} changed after chunk {1}, staging it again".format(
+                                src,
+                                manifest["changed_chunk"]
+                            ),
+                            host=self._play_context.remote_addr
+                        )
+                        journal.truncate(manifest["changed_chunk"])
+                        session.exec_command("rm -rf {0}".format(staging[0]))
+                        staging = restage(journal.chunks)
+                        restaged = True
+                        resumed_chunks = index = 0
+                        continue
+                    manifest["failed"] = True
+                    return manifest
+
+                if not manifest["staged"]:
+                    resumed_chunks += 1
+                    if manifest["last"]:
+                        # The source ends earlier than the previous run.
+                        journal.truncate(index + 1)
+                else:
+                    if index < len(journal.chunks):
+                        journal.truncate(index)
+                    chunk_path = journal.part_path + ".chunk"
+                    try:
+                        fetch_content = self._transfer_remote_content(
+                            session,
+                            chunk_path,
+                            "{0}/chunk.{1}".format(staging[0], index),
+                            src_type,
+                            ignore_stderr=ignore_stderr,
+                        )
+                        if fetch_content.get("msg"):
+                            return fetch_content
+                        journal.add_chunk(chunk_path, manifest)
+                    except ValueError as err:
+                        return dict(
+                            msg="Error transferring remote data from z/OS system",
+                            stderr=str(err),
+                            stderr_lines=str(err).splitlines(),
+                            failed=True,
+                        )
+                    finally:
+                        if os.path.exists(chunk_path):
+                            os.remove(chunk_path)
+
+                if manifest["last"]:
+                    break
+                index += 1
         finally:
-            if was_user_updated:
-                self._connection.set_option('remote_user', self._play_context._remote_user)
-                display.vvv(
-                    u"ibm_zos_fetch SSH transfer user restored to {0}".format(self._play_context._remote_user),
-                    host=self._play_context.remote_addr
-                )
+            session.exec_command("rm -rf {0}".format(staging[0]))
 
-            # Restore the users defined option `ssh_transfer_method` if it was overridden
-
-            if is_ssh_transfer_method_updated:
-                if version_major == 2 and version_minor >= 11:
-                    self._connection.set_option('ssh_transfer_method', user_ssh_transfer_method)
-
-                elif version_major == 2 and version_minor <= 10:
-                    self._play_context.ssh_transfer_method = user_ssh_transfer_method
-
-                display.vvv(u"ibm_zos_fetch SSH transfer method restored to {0}".format(user_ssh_transfer_method), host=self._play_context.remote_addr)
-                is_ssh_transfer_method_updated = False
+        if resumed_chunks:
+            display.vvv(
+                u"ibm_zos_fetch resumed {0} after {1} chunk(s)".format(src, resumed_chunks),
+                host=self._play_context.remote_addr
+            )
+        journal.complete()
+        return dict(chunks=len(journal.chunks), resumed_chunks=resumed_chunks)
 
-        return result
+    def _wait_for_chunk(self, session, staging, index):
+        """ Wait until the module staged a chunk, removing the previous one
+            from the remote system, and return its manifest or the error
+            the module ran into.
+        """
+        chunk_dir, chunk_pid = staging
+        manifest = "{0}/chunk.{1}.json".format(chunk_dir, index)
+        error = "{0}/error.json".format(chunk_dir)
+        wait_cmd = (
+            "rm -f {dir}/chunk.{previous} {dir}/chunk.{previous}.json; "
+            "while [ ! -f {manifest} ] && [ ! -f {error} ]; do "
+            "ps -p {pid} >/dev/null 2>&1 || break; sleep 1; done; "
+            "if [ -f {manifest} ]; then cat {manifest}; elif [ -f {error} ]; then cat {error}; fi"
+        ).format(dir=chunk_dir, previous=index - 1, manifest=manifest, error=error, pid=chunk_pid)
+
+        rc, stdout, stderr = session.exec_command(wait_cmd)
+        try:
+            return json.loads(to_text(stdout, errors="surrogate_or_strict"))
+        except ValueError:
+            stderr = to_text(stderr, errors="surrogate_or_strict")
+            return dict(
+                msg="Staging of the chunks stopped before chunk {0} was staged".format(index),
+                rc=rc,
+                stderr=stderr,
+                stderr_lines=stderr.splitlines(),
+            )
 
-    def _remote_cleanup(self, remote_path, src_type, encoding):
+    def _remote_cleanup(self, session, remote_path, src_type, encoding):
         """Remove all temporary files and directories from the remote system"""
+        # Chunked fetches remove every chunk as soon as it's transferred.
+        if not remote_path:
+            return
         # When fetching USS files and no encoding parameter is provided
         # do not remove the original file.
         if not (src_type == "USS" and not encoding):
@@ -487,20 +655,6 @@ class ActionModule(ActionBase):
             if src_type != "PO" and src_type != "GDG":
                 rm_cmd = rm_cmd.replace(" -r", "")
 
-            # If another user created the temporary files, we'll need to run rm
-            # with it too, lest we get a permissions issue.
-            if self._connection.become:
-                self._connection.set_option('remote_user', self._play_context._become_user)
-                display.vvv(
-                    u"ibm_zos_fetch SSH cleanup user updated to {0}".format(self._play_context._become_user),
-                    host=self._play_context.remote_addr
-                )
-
-            self._connection.exec_command(rm_cmd)
-
-            if self._connection.become:
-                self._connection.set_option('remote_user', self._play_context._remote_user)
-                display.vvv(
-                    u"ibm_zos_fetch SSH cleanup user restored to {0}".format(self._play_context._remote_user),
-                    host=self._play_context.remote_addr
-                )
+            # If another user created the temporary files, the session is
+            # already running as that user, lest we get a permissions issue.
+            session.exec_command(rm_cmd)
@@ -0,0 +1,104 @@
+# Copyright (c) IBM Corporation 2026
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#     http://www.apache.org/licenses/LICENSE-2.0
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from __future__ import absolute_import, division, print_function
+__metaclass__ = type
+
+import time
+
+from concurrent.futures import ThreadPoolExecutor
+
+
+DEFAULT_MAX_CONCURRENCY = 4
+
+
+class TaskResult(object):
+    __slots__ = ("item", "result", "error", "elapsed")
+
+    def __init__(self, item, result=None, error=None, elapsed=0.0):
+        """Outcome of running a function over one item.
+
+        Parameters
+        ----------
+        item : object
+            Item the function was called with.
+        result : object
+            Value returned by the function, None when it failed.
+        error : Exception
+            Exception raised by the function, None when it succeeded.
+        elapsed : float
+            Seconds spent in the call.
+        """
+        self.item = item
+        self.result = result
+        self.error = error
+        self.elapsed = elapsed
+
+    @property
+    def failed(self):
+        """Whether the call raised an exception."""
+        return self.error is not None
+
+
+def _run_task(func, item):
+    """Call func with item, capturing its result or the exception it raises.
+
+    Parameters
+    ----------
+    func : callable
+        Function to call.
+    item : object
+        Argument for the function.
+
+    Returns
+    -------
+    TaskResult
+        Outcome of the call.
+    """
+    start = time.time()
+    try:
+        result = func(item)
+    except Exception as err:
+        return TaskResult(item, error=err, elapsed=time.time() - start)
+    return TaskResult(item, result=result, elapsed=time.time() - start)
+
+
+def run_concurrently(func, items, max_concurrency=DEFAULT_MAX_CONCURRENCY):
+    """Call func once for every item using a bounded pool of threads.
+
+    An exception raised for one item doesn't stop the rest; it gets
+    recorded in the item's TaskResult so callers can report every failure
+    at once. Items are processed sequentially when max_concurrency is 1 or
+    lower, or when there is only one item.
+
+    Parameters
+    ----------
+    func : callable
+        Function that takes a single item.
+    items : iterable
+        Items to process.
+    max_concurrency : int
+        Maximum number of calls running at the same time.
+
+    Returns
+    -------
+    list[TaskResult]
+        Outcome of each call, in the same order as items.
+    """
+    items = list(items)
+    if max_concurrency is None:
+        max_concurrency = DEFAULT_MAX_CONCURRENCY
+
+    if max_concurrency <= 1 or len(items) <= 1:
+        return [_run_task(func, item) for item in items]
+
+    with ThreadPoolExecutor(max_workers=min(max_concurrency, len(items))) as executor:
+        return list(executor.map(lambda item: _run_task(func, item), items))
@@ -1,4 +1,4 @@
-# Copyright (c) IBM Corporation 2020, 2025
+# Copyright (c) IBM Corporation 2020, 2026
 # Licensed under the Apache License, Version 2.0 (the "License");
 # you may not use this file except in compliance with the License.
 # You may obtain a copy of the License at
@@ -13,8 +13,11 @@ from __future__ import absolute_import, division, print_function
 
 __metaclass__ = type
 
+import atexit
 import re
+from contextlib import contextmanager
 import tempfile
+import threading
 import traceback
 from os import path, walk, environ
 from random import sample
@@ -28,6 +31,7 @@ from ansible_collections.ibm.ibm_zos_core.plugins.module_utils.ansible_module im
     AnsibleModuleHelper
 from ansible_collections.ibm.ibm_zos_core.plugins.module_utils.import_handler import (
     MissingImport, ZOAUImportError)
+from ansible_collections.ibm.ibm_zos_core.plugins.module_utils.log import SingletonLogger
 
 try:
     from ansible_collections.ibm.ibm_zos_core.plugins.module_utils import vtoc
@@ -45,6 +49,919 @@ except ImportError:
     ztypes = ZOAUImportError(traceback.format_exc())
     GenerationDataGroupCreateException = ZOAUImportError(traceback.format_exc())
 
+# Names looked up by a single IDCAMS run in CatalogCache.listcat_many.
+LISTCAT_BATCH_SIZE = 250
+# Statements sent to a single IDCAMS run by DataSet.run_idcams_statements.
+IDCAMS_BATCH_SIZE = 250
+
+
+class CatalogEntry(object):
+    __slots__ = ("name", "rc", "output", "stderr", "entry_type", "volumes", "cataloged", "data_section")
+
+    def __init__(self, name, rc, output, stderr):
+        """Parsed output of ``LISTCAT ENTRIES(name) ALL`` for a single data set.
+
+        Parameters
+        ----------
+        name : str
+            Name of the data set.
+        rc : int
+            Return code of IDCAMS.
+        output : str
+            Standard output of IDCAMS.
+        stderr : str
+            Standard error of IDCAMS.
+
+        Attributes
+        ----------
+        entry_type : str
+            Type of the catalog entry, like NONVSAM, CLUSTER or GDG BASE.
+            None when the data set is not in the catalog.
+        volumes : list[str]
+            Volumes where the data set is cataloged.
+        cataloged : bool
+            Whether the data set is in the catalog.
+        data_section : str
+            Output lines about the DATA component of a VSAM cluster, which are
+            the same lines ``LISTCAT ENTRIES(name) DATA ALL`` returns.
+            None when the data set is not a VSAM cluster.
+        """
+        self.name = name
+        self.rc = rc
+        self.output = output
+        self.stderr = stderr
+
+        entry = re.search(r"^\S?\s*(NONVSAM|CLUSTER|GDG BASE|ALIAS|AIX|PATH|DATA|INDEX) -+", output, re.MULTILINE)
+        self.entry_type = entry.group(1) if entry else None
+
+        # Volume serials (VOLSER) under 6 chars will have one or more leading '-'s due to the chosen delimiter.
+        # The volser is in between the beginning of each str and the first space.
+        volume_sections = output.split("VOLSER------------")[1:]
+        self.volumes = list(set(section.strip("-").split()[0] for section in volume_sections))
+
+        self.cataloged = rc == 0 and bool(
+            re.search(r"-\s" + re.escape(name) + r"\s*\n\s+IN-CAT", output)
+        )
+
+        self.data_section = None
+        data_start = re.search(r"^\S?\s*DATA -+", output, re.MULTILINE)
+        if data_start:
+            index_start = re.search(r"^\S?\s*INDEX -+", output[data_start.start():], re.MULTILINE)
+            data_end = data_start.start() + index_start.start() if index_start else len(output)
+            self.data_section = output[data_start.start():data_end]
+
+
+class DataSetAttributes(object):
+    __slots__ = ("name", "exists", "type", "dsorg", "recfm", "lrecl", "blksize", "volumes", "space", "source")
+
+    def __init__(
+        self,
+        name,
+        exists=False,
+        type=None,
+        dsorg=None,
+        recfm=None,
+        lrecl=None,
+        blksize=None,
+        volumes=None,
+        space=None,
+        source=None
+    ):
+        """Allocation attributes of a single data set.
+
+        Parameters
+        ----------
+        name : str
+            Name of the data set.
+        exists : bool
+            Whether the data set is in the catalog.
+        type : str
+            Type of the data set, one of "PS", "PO", "DA", "KSDS", "ESDS",
+            "LDS", "RRDS" or "GDG".
+        dsorg : str
+            Data set organization, "VSAM" for VSAM clusters.
+        recfm : str
+            Record format, None for VSAM data sets and GDGs.
+        lrecl : int
+            Record length, None for VSAM data sets and GDGs.
+        blksize : int
+            Block size, None for VSAM data sets and GDGs.
+        volumes : list[str]
+            Volumes where the data set resides.
+        space : int
+            Space allocated to the data set, in bytes. None when the
+            source of the attributes doesn't report it.
+        source : str
+            Where the attributes came from, "listing" when ZOAU listed the
+            data set and "listds" or "listcat" when the output of those
+            commands had to be parsed.
+        """
+        self.name = name
+        self.exists = exists
+        self.type = type
+        self.dsorg = dsorg
+        self.recfm = recfm
+        self.lrecl = lrecl
+        self.blksize = blksize
+        self.volumes = volumes or []
+        self.space = space
+        self.source = source
+
+    @staticmethod
+    def from_listing(name, listing):
+        """Build the attributes from an entry returned by ZOAU's list_datasets.
+
+        Parameters
+        ----------
+        name : str
+            Name of the data set.
+        listing : zoautil_py.ztypes.Dataset
+            Entry of the listing.
+
+        Returns
+        -------
+        DataSetAttributes
+            Attributes of the data set.
+        """
+        volume = getattr(listing, "volume", None)
+        return DataSetAttributes(
+            name,
+            exists=True,
+            type=listing.organization,
+            dsorg=listing.organization,
+            recfm=listing.record_format,
+            lrecl=_to_int(listing.record_length),
+            blksize=_to_int(listing.block_size),
+            volumes=[volume] if volume else [],
+            space=_to_int(getattr(listing, "total_space", None)),
+            source="listing"
+        )
+
+    @property
+    def has_asa_chars(self):
+        """Whether the record format of the data set has ASA control characters."""
+        return bool(self.recfm) and self.recfm.upper() in ("FBA", "VBA")
+
+
+def _to_int(value):
+    """Convert a numeric attribute to int, keeping None and values that
+    aren't numbers as None."""
+    try:
+        return int(value)
+    except (TypeError, ValueError):
+        return None
+
+
+class MemberDirectory(object):
+    def __init__(self, name, members, aliases=None, stats=None, complete=True):
+        """Snapshot of the directory of a PDS/PDSE. Membership questions are
+        answered from a set, and the snapshot is updated as members are
+        written or deleted through DataSet so it can be kept while a cache
+        scope is open.
+
+        Parameters
+        ----------
+        name : str
+            Name of the partitioned data set.
+        members : iterable[str]
+            Names of the members, aliases included.
+        aliases : iterable[str]
+            Names of the members that are aliases. None when alias
+            information wasn't read.
+        stats : dict[str, list[str]]
+            ISPF statistics of each member, the columns ``mls -l`` prints
+            after the member name. None when statistics weren't read.
+        complete : bool
+            False when aliases were left out of the listing, the snapshot
+            then can't answer membership questions about them and is never
+            kept in a cache scope.
+        """
+        self.name = name
+        self.complete = complete
+        self._members = set(member.upper() for member in members)
+        self.aliases = set(alias.upper() for alias in aliases) if aliases is not None else None
+        self.stats = stats
+
+    @staticmethod
+    def read(name, aliases=False, stats=False, members=None, hide_aliases=False):
+        """Read the directory of a partitioned data set.
+
+        Parameters
+        ----------
+        name : str
+            Name of the partitioned data set.
+        aliases : bool
+            Whether to find out which members are aliases.
+        stats : bool
+            Whether to read the ISPF statistics of the members.
+        members : iterable[str]
+            Members, aliases included, already known to be in the directory.
+            The full listing is skipped when given.
+        hide_aliases : bool
+            Whether to list only the members that aren't aliases, with a
+            single listing. The snapshot is then incomplete.
+
+        Returns
+        -------
+        MemberDirectory
+            Snapshot of the directory.
+
+        Raises
+        ------
+        ZOAUException
+            When the directory can't be listed.
+        MVSCmdExecError
+            When the statistics can't be listed.
+        """
+        if hide_aliases:
+            # mls option -H hides aliases.
+            members = datasets.list_members(name, options="-H ")
+        elif members is None:
+            members = datasets.list_members(name)
+        members = set(member.upper() for member in members)
+
+        alias_names = None
+        if hide_aliases:
+            alias_names = set()
+        elif aliases:
+            # mls option -H hides aliases, whatever is missing from this
+            # listing is an alias.
+            alias_names = members.difference(
+                member.upper() for member in datasets.list_members(name, options="-H ")
+            )
+
+        member_stats = None
+        if stats:
+            module = AnsibleModuleHelper(argument_spec={})
+            rc, out, err = module.run_command("mls -l \"'{0}(*)'\"".format(name), errors='replace')
+            # RC 2 for mls means that there aren't any members.
+            if rc not in (0, 2):
+                raise MVSCmdExecError(rc, out, err)
+            member_stats = {}
+            for line in out.splitlines():
+                columns = line.split()
+                if columns:
+                    member = extract_member_name(columns[0]) if "(" in columns[0] else columns[0]
+                    member_stats[member.upper()] = columns[1:]
+
+        return MemberDirectory(name, members, aliases=alias_names, stats=member_stats, complete=not hide_aliases)
+
+    def __contains__(self, member):
+        return member.upper() in self._members
+
+    def __len__(self):
+        return len(self._members)
+
+    def __iter__(self):
+        return iter(sorted(self._members))
+
+    def members(self, aliases=True):
+        """Get the names of the members.
+
+        Parameters
+        ----------
+        aliases : bool
+            Whether to include aliases, they can only be left out when the
+            snapshot was read with alias information.
+
+        Returns
+        -------
+        list[str]
+            Sorted names of the members.
+        """
+        if aliases or self.aliases is None:
+            return sorted(self._members)
+        return sorted(self._members.difference(self.aliases))
+
+    def add(self, member):
+        """Record that a member was written.
+
+        Parameters
+        ----------
+        member : str
+            Name of the member.
+        """
+        member = member.upper()
+        self._members.add(member)
+        if self.aliases is not None:
+            self.aliases.discard(member)
+        if self.stats is not None:
+            # Statistics of a rewritten member are no longer known.
+            self.stats.pop(member, None)
+
+    def discard(self, member):
+        """Record that a member was deleted.
+
+        Parameters
+        ----------
+        member : str
+            Name of the member.
+        """
+        member = member.upper()
+        self._members.discard(member)
+        if self.aliases is not None:
+            self.aliases.discard(member)
+        if self.stats is not None:
+            self.stats.pop(member, None)
+
+
+class CatalogCache(object):
+    def __init__(self):
+        """Catalog information of data sets, kept while a block of code runs
+        inside scope. A single ``LISTCAT ENTRIES(name) ALL`` answers every
+        question DataSet asks about a name, and the allocation attributes and
+        member directory of a data set are kept next to its entry. Only data
+        sets found in the catalog are kept, so allocations are always seen,
+        and the methods of DataSet that change the catalog invalidate the
+        names they touch. Outside of a scope nothing is kept and every lookup
+        reads the system again.
+
+        Attributes
+        ----------
+        hits : int
+            Lookups answered from the cache.
+        misses : int
+            Lookups that ran IDCAMS.
+        """
+        self._entries = {}
+        self._attributes = {}
+        self._directories = {}
+        self._depth = 0
+        self.hits = 0
+        self.misses = 0
+
+    @property
+    def enabled(self):
+        """Whether lookups are being kept, which only happens inside scope."""
+        return self._depth > 0
+
+    @contextmanager
+    def scope(self):
+        """Keep the catalog information and VTOC indexes read inside the
+        block. Data sets must only be created, deleted or copied inside it
+        through DataSet, MVSDataSet and GenerationDataGroup, which invalidate
+        what they touch; ZOAU calls, programs or shell commands that change
+        data sets directly would leave stale answers behind. Everything is
+        dropped when the outermost block ends.
+        """
+        self._depth += 1
+        try:
+            with vtoc.cache_scope():
+                yield self
+        finally:
+            self._depth -= 1
+            if not self._depth:
+                self.invalidate()
+
+    def attributes(self, name, tmphlq=None):
+        """Get the allocation attributes of a data set.
+
+        The ZOAU listing answers for every data set that isn't VSAM or a GDG
+        with a single call. The catalog entry of the data set is used for
+        the rest, and the output of LISTDS is parsed only when the listing
+        misses a non-VSAM data set the catalog knows about.
+
+        Parameters
+        ----------
+        name : str
+            Name of the data set, a member name is ignored.
+        tmphlq : str
+            High Level Qualifier for temporary datasets.
+
+        Returns
+        -------
+        DataSetAttributes
+            Attributes of the data set. Only attributes of data sets found
+            in the catalog are kept.
+
+        Raises
+        ------
+        DatasetBusyError
+            The dataset may be open by another user.
+        MVSCmdExecError
+            Another error while executing LISTDS.
+        """
+        name = extract_dsname(name.upper().replace("\\", ""))
+        if name in self._attributes:
+            SingletonLogger().logger.debug("Attribute cache hit for %s.", name)
+            return self._attributes[name]
+
+        attributes = None
+        try:
+            listing = [data_set for data_set in datasets.list_datasets(name) if data_set.name.upper() == name]
+        except (exceptions.ZOAUException, exceptions.DatasetVerificationError):
+            listing = []
+        if listing:
+            attributes = DataSetAttributes.from_listing(name, listing[0])
+        else:
+            attributes = CatalogCache._attributes_from_catalog(
+                name, self.listcat(name, tmphlq=tmphlq), tmphlq=tmphlq
+            )
+
+        SingletonLogger().logger.debug("Attributes of %s read from %s.", name, attributes.source)
+        if attributes.exists and self.enabled:
+            self._attributes[name] = attributes
+        return attributes
+
+    @staticmethod
+    def _attributes_from_catalog(name, entry, tmphlq=None):
+        """Build the attributes of a data set ZOAU couldn't list from its
+        catalog entry, running LISTDS for non-VSAM data sets.
+
+        Parameters
+        ----------
+        name : str
+            Name of the data set.
+        entry : CatalogEntry
+            Catalog entry of the data set.
+        tmphlq : str
+            High Level Qualifier for temporary datasets.
+
+        Returns
+        -------
+        DataSetAttributes
+            Attributes of the data set.
+        """
+        if entry.rc != 0 or entry.entry_type is None:
+            return DataSetAttributes(name, source="listcat")
+
+        if entry.entry_type == "GDG BASE":
+            return DataSetAttributes(name, exists=True, type="GDG", source="listcat")
+
+        if entry.entry_type == "CLUSTER":
+            vsam_type = None
+            if entry.data_section:
+                for keyword, data_set_type in (("INDEXED", "KSDS"), ("NONINDEXED", "ESDS"), ("LINEAR", "LDS"), ("NUMBERED", "RRDS")):
+                    if re.search(r"\b{0}\b".format(keyword), entry.data_section):
+                        vsam_type = data_set_type
+                        break
+            return DataSetAttributes(
+                name,
+                exists=True,
+                type=vsam_type,
+                dsorg="VSAM",
+                volumes=entry.volumes,
+                source="listcat"
+            )
+
+        listds_rc, listds_out, listds_err = mvs_cmd.ikjeft01(
+            "  LISTDS '{0}'".format(name),
+            authorized=True,
+            tmphlq=tmphlq
+        )
+        if listds_rc != 0:
+            if re.findall(r"ALREADY IN USE", listds_out):
+                raise DatasetBusyError(name)
+            if re.findall(r"NOT IN CATALOG", listds_out):
+                return DataSetAttributes(name, source="listds")
+            raise MVSCmdExecError(listds_rc, listds_out, listds_err)
+
+        parsed = DataSetUtils._process_listds_output(listds_out)
+        return DataSetAttributes(
+            name,
+            exists=parsed.get("exists", False),
+            type=parsed.get("dsorg"),
+            dsorg=parsed.get("dsorg"),
+            recfm=parsed.get("recfm"),
+            lrecl=parsed.get("lrecl"),
+            blksize=parsed.get("blksize"),
+            volumes=entry.volumes,
+            source="listds"
+        )
+
+    def member_directory(self, name, aliases=False, stats=False, hide_aliases=False):
+        """Get the directory snapshot of a partitioned data set, reading it
+        the first time it's needed or when it lacks the requested details.
+
+        Parameters
+        ----------
+        name : str
+            Name of the partitioned data set, a member name is ignored.
+        aliases : bool
+            Whether the snapshot needs to know which members are aliases.
+        stats : bool
+            Whether the snapshot needs the ISPF statistics of the members.
+        hide_aliases : bool
+            Whether only the members that aren't aliases are needed. Unless
+            a snapshot with alias information is kept, they're listed by
+            themselves and the snapshot isn't kept.
+
+        Returns
+        -------
+        MemberDirectory
+            Snapshot of the directory.
+
+        Raises
+        ------
+        ZOAUException
+            When the directory can't be listed.
+        MVSCmdExecError
+            When the statistics can't be listed.
+        """
+        name = extract_dsname(name.upper().replace("\\", ""))
+        directory = self._directories.get(name)
+        aliases = aliases or hide_aliases
+        if directory is not None and (not aliases or directory.aliases is not None) and (
+                not stats or directory.stats is not None):
+            SingletonLogger().logger.debug("Member directory cache hit for %s.", name)
+            return directory
+
+        if hide_aliases and not stats:
+            return MemberDirectory.read(name, hide_aliases=True)
+
+        directory = MemberDirectory.read(
+            name,
+            aliases=aliases or (directory is not None and directory.aliases is not None),
+            stats=stats or (directory is not None and directory.stats is not None),
+            members=directory.members() if directory is not None else None
+        )
+        SingletonLogger().logger.debug("Read the directory of %s, %d members.", name, len(directory))
+        if self.enabled:
+            self._directories[name] = directory
+        return directory
+
+    def member_written(self, name):
+        """Add a member to the directory snapshot of its data set, if there
+        is one.
+
+        Parameters
+        ----------
+        name : str
+            Name of the data set including the member name.
+        """
+        self._update_member(name, MemberDirectory.add)
+
+    def member_deleted(self, name):
+        """Remove a member from the directory snapshot of its data set, if
+        there is one.
+
+        Parameters
+        ----------
+        name : str
+            Name of the data set including the member name.
+        """
+        self._update_member(name, MemberDirectory.discard)
+
+    def _update_member(self, name, update):
+        """Apply an update to the snapshot of the data set of a member.
+        Snapshots are dropped when the member name is a pattern.
+
+        Parameters
+        ----------
+        name : str
+            Name of the data set including the member name.
+        update : callable
+            Method of MemberDirectory that takes the member name.
+        """
+        name = name.upper().replace("\\", "")
+        dsname = extract_dsname(name)
+        directory = self._directories.get(dsname)
+        if directory is None:
+            return
+
+        member = extract_member_name(name)
+        if not member or "*" in member or "?" in member:
+            del self._directories[dsname]
+        else:
+            update(directory, member)
+
+    def listcat(self, name, tmphlq=None):
+        """Get the catalog entry of a data set.
+
+        Parameters
+        ----------
+        name : str
+            Name of the data set.
+        tmphlq : str
+            High Level Qualifier for temporary datasets.
+
+        Returns
+        -------
+        CatalogEntry
+            Parsed LISTCAT output.
+        """
+        name = name.upper()
+        logger = SingletonLogger().logger
+        if name in self._entries:
+            self.hits += 1
+            logger.debug("Catalog cache hit for %s (hits: %d, misses: %d).", name, self.hits, self.misses)
+            return self._entries[name]
+
+        self.misses += 1
+        logger.debug("Catalog cache miss for %s (hits: %d, misses: %d).", name, self.hits, self.misses)
+
+        module = AnsibleModuleHelper(argument_spec={})
+        cmd = "mvscmdauth --pgm=idcams --sysprint=* --sysin=stdin"
+        if tmphlq:
+            cmd = "{0} -Q={1}".format(cmd, tmphlq)
+        rc, stdout, stderr = module.run_command(
+            cmd,
+            data=" LISTCAT ENTRIES('{0}') ALL".format(name),
+            errors='replace'
+        )
+
+        entry = CatalogEntry(name, rc, stdout, stderr)
+        if rc == 0 and self.enabled:
+            self._entries[name] = entry
+        return entry
+
+    def listcat_many(self, names, tmphlq=None):
+        """Get the catalog entries of many data sets, running a single IDCAMS
+        for every LISTCAT_BATCH_SIZE names that are not cached yet.
+
+        Like listcat, only entries of cataloged data sets are kept in the
+        cache. Answers for data sets that are not in the catalog are only
+        returned to the caller, which can use them for its own checks.
+
+        Parameters
+        ----------
+        names : list[str]
+            Names of the data sets.
+        tmphlq : str
+            High Level Qualifier for temporary datasets.
+
+        Returns
+        -------
+        dict[str, CatalogEntry]
+            Parsed LISTCAT output of each data set, keyed by the upper case name.
+        """
+        names = list(dict.fromkeys(name.upper() for name in names))
+        entries = dict((name, self._entries[name]) for name in names if name in self._entries)
+        missing = [name for name in names if name not in entries]
+        self.hits += len(entries)
+        self.misses += len(missing)
+        SingletonLogger().logger.debug(
+            "Catalog cache lookup of %d data sets, %d not cached (hits: %d, misses: %d).",
+            len(names), len(missing), self.hits, self.misses
+        )
+
+        module = AnsibleModuleHelper(argument_spec={})
+        cmd = "mvscmdauth --pgm=idcams --sysprint=* --sysin=stdin"
+        if tmphlq:
+            cmd = "{0} -Q={1}".format(cmd, tmphlq)
+
+        for start in range(0, len(missing), LISTCAT_BATCH_SIZE):
+            batch = missing[start:start + LISTCAT_BATCH_SIZE]
+            rc, stdout, stderr = module.run_command(
+                cmd,
+                data="\n".join(" LISTCAT ENTRIES('{0}') ALL".format(name) for name in batch),
+                errors='replace'
+            )
+            sections = CatalogCache._split_listcat_output(stdout)
+
+            for name in batch:
+                output = sections.get(name)
+                if output is None:
+                    # IDCAMS stopped before getting to this statement.
+                    entry = CatalogEntry(name, max(rc, 12), stdout, stderr)
+                else:
+                    condition_code = re.search(r"CONDITION CODE (?:IS|WAS) (\d+)", output)
+                    entry = CatalogEntry(name, int(condition_code.group(1)) if condition_code else rc, output, stderr)
+                if entry.rc == 0 and self.enabled:
+                    self._entries[name] = entry
+                entries[name] = entry
+
+        return entries
+
+    @staticmethod
+    def _split_listcat_output(output):
+        """Split the SYSPRINT of many LISTCAT statements into the lines
+        printed for each one of them.
+
+        Parameters
+        ----------
+        output : str
+            Standard output of IDCAMS.
+
+        Returns
+        -------
+        dict[str, str]
+            Output lines of each statement, keyed by the data set name.
+        """
+        sections = {}
+        statements = list(re.finditer(r"^\S?\s*LISTCAT ENTRIES\('([^']+)'\)", output, re.MULTILINE))
+        for index, statement in enumerate(statements):
+            end = statements[index + 1].start() if index + 1 < len(statements) else len(output)
+            sections[statement.group(1).upper()] = output[statement.start():end]
+        return sections
+
+    def invalidate(self, name=None):
+        """Drop the cached entries, attributes and member directory of a data
+        set, or all of them.
+        Entries of the components of a VSAM cluster go along with it.
+
+        Parameters
+        ----------
+        name : str
+            Name of the data set, a member name is ignored.
+            All the entries are dropped when None.
+        """
+        if name is None:
+            self._entries.clear()
+            self._attributes.clear()
+            self._directories.clear()
+            return
+
+        name = extract_dsname(name.upper().replace("\\", ""))
+        for cache in (self._entries, self._attributes, self._directories):
+            for cached_name in list(cache):
+                if cached_name == name or cached_name.startswith(name + "."):
+                    del cache[cached_name]
+
+
+catalog_cache = CatalogCache()
+
+
+class TempDataSetPool(object):
+    # Approximate size in kilobytes of each unit of space.
+    _SPACE_UNIT_KB = {"K": 1, "M": 1024, "G": 1024 * 1024, "TRK": 56, "CYL": 840}
+    # Smallest space class, in kilobytes.
+    _MIN_SPACE_CLASS = 64
+
+    def __init__(self):
+        """Temporary sequential data sets shared during a module run.
+
+        Data sets are pooled by HLQ, record format, record length, space
+        class, which is the requested primary space rounded up to a power
+        of two kilobytes, and secondary space. The primary space allocated
+        is the space class so the data set fits any request in it, while
+        the secondary space is the one requested. A released data set is
+        emptied and handed out to the next request with the same key instead
+        of being deleted, and every data set the pool allocated gets deleted
+        when the module exits.
+
+        Attributes
+        ----------
+        allocations : int
+            Data sets allocated by the pool.
+        reuses : int
+            Requests answered with a released data set.
+        """
+        self._free = {}
+        self._in_use = {}
+        self._lock = threading.Lock()
+        self._cleanup_registered = False
+        self.allocations = 0
+        self.reuses = 0
+
+    def acquire(
+        self,
+        hlq="",
+        type="SEQ",
+        record_format="FB",
+        space_primary=5,
+        space_secondary=5,
+        space_type="M",
+        record_length=80,
+    ):
+        """Get an empty temporary data set. Takes the same arguments as
+        DataSet.create_temp. Only sequential data sets are pooled, any other
+        type is allocated with DataSet.create_temp.
+
+        Returns
+        -------
+        str
+            The name of the temporary data set.
+        """
+        if type.upper() != "SEQ":
+            return DataSet.create_temp(
+                hlq=hlq,
+                type=type,
+                record_format=record_format,
+                space_primary=space_primary,
+                space_secondary=space_secondary,
+                space_type=space_type,
+                record_length=record_length,
+            )
+
+        space_class = self._space_class(space_primary, space_type)
+        secondary_kb = self._space_kb(space_secondary, space_type)
+        key = ((hlq or "").upper(), record_format.upper(), record_length, space_class, secondary_kb)
+        with self._lock:
+            free = self._free.get(key)
+            if free:
+                name = free.pop()
+                self._in_use[name] = key
+                self.reuses += 1
+                SingletonLogger().logger.debug(
+                    "Reusing temporary data set %s (allocations: %d, reuses: %d).", name, self.allocations, self.reuses
+                )
+                return name
+
+        name = DataSet.create_temp(
+            hlq=hlq,
+            type="SEQ",
+            record_format=record_format,
+            space_primary=space_class,
+            space_secondary=secondary_kb,
+            space_type="K",
+            record_length=record_length,
+        )
+        with self._lock:
+            self._in_use[name] = key
+            self.allocations += 1
+            if not self._cleanup_registered:
+                atexit.register(self.cleanup)
+                self._cleanup_registered = True
+        return name
+
+    def release(self, name):
+        """Give back a data set obtained with acquire. It gets emptied so it
+        can be reused, or deleted when it wasn't pooled or can't be emptied.
+
+        Parameters
+        ----------
+        name : str
+            The name of the temporary data set.
+        """
+        if not name:
+            return
+        with self._lock:
+            key = self._in_use.pop(name, None)
+
+        if key is None or not self._truncate(name):
+            datasets.delete(name)
+            return
+
+        with self._lock:
+            self._free.setdefault(key, []).append(name)
+
+    def cleanup(self):
+        """Delete every data set allocated by the pool."""
+        with self._lock:
+            names = list(self._in_use)
+            for free in self._free.values():
+                names.extend(free)
+            self._in_use.clear()
+            self._free.clear()
+
+        for name in names:
+            try:
+                datasets.delete(name)
+            except Exception:
+                pass
+
+    @staticmethod
+    def _truncate(name):
+        """Remove every record of a sequential data set.
+
+        Parameters
+        ----------
+        name : str
+            The name of the data set.
+
+        Returns
+        -------
+        bool
+            Whether the data set was emptied.
+        """
+        module = AnsibleModuleHelper(argument_spec={})
+        rc, stdout, stderr = module.run_command(["cp", "/dev/null", "//'{0}'".format(name)])
+        return rc == 0
+
+    @staticmethod
+    def _space_class(space_primary, space_type):
+        """Round a primary space up to a power of two kilobytes.
+
+        Parameters
+        ----------
+        space_primary : int
+            The amount of primary space requested.
+        space_type : str
+            The unit of measurement of the space.
+
+        Returns
+        -------
+        int
+            The space class in kilobytes.
+        """
+        size = TempDataSetPool._space_kb(space_primary or 1, space_type)
+        space_class = TempDataSetPool._MIN_SPACE_CLASS
+        while space_class < size:
+            space_class *= 2
+        return space_class
+
+    @staticmethod
+    def _space_kb(space, space_type):
+        """Convert an amount of space to kilobytes.
+
+        Parameters
+        ----------
+        space : int
+            The amount of space.
+        space_type : str
+            The unit of measurement of the space.
+
+        Returns
+        -------
+        int
+            The space in kilobytes, 0 when no space was given.
+        """
+        return (space or 0) * TempDataSetPool._SPACE_UNIT_KB.get((space_type or "M").upper(), 1024)
+
+
+temp_data_set_pool = TempDataSetPool()
+
 
 class DataSet(object):
     """Perform various data set operations such as creation, deletion and cataloging."""
@@ -89,6 +1006,18 @@ class DataSet(object):
     MVS_PARTITIONED = frozenset({"PE", "PO", "PDSE", "PDS"})
     MVS_SEQ = frozenset({"PS", "SEQ", "BASIC"})
     MVS_VSAM = frozenset({"KSDS", "ESDS", "RRDS", "LDS", "VSAM"})
+    # Types bulk_create can allocate with IDCAMS, mapped to their DSNTYPE.
+    BULK_CREATE_TYPES = {"SEQ": None, "BASIC": "BASIC", "LARGE": "LARGE", "PDS": "PDS", "PDSE": "LIBRARY"}
+    # IDCAMS keywords for each unit of space.
+    _IDCAMS_SPACE_UNITS = {
+        "TRK": "TRACKS",
+        "CYL": "CYLINDERS",
+        "K": "AVBLOCK(1) AVGREC(K)",
+        "M": "AVBLOCK(1) AVGREC(M)",
+        "G": "AVBLOCK(1024) AVGREC(M)",
+    }
+    # Directory blocks asked for a PDSE, which grows its directory as needed.
+    _IDCAMS_DEFAULT_DIRECTORY_BLOCKS = 5
 
     @staticmethod
     def ensure_present(
@@ -415,11 +1344,10 @@ class DataSet(object):
         # Now adding special parameters for sequential and partitioned
         # data sets.
         if model_type not in DataSet.MVS_VSAM:
-            try:
-                data_set = datasets.list_datasets(model)[0]
-            except IndexError:
+            model_attributes = DataSet.get_attributes(model, tmphlq=tmphlq)
+            if not model_attributes.exists:
                 raise AttributeError("Could not retrieve model data set block size.")
-            block_size = data_set.block_size
+            block_size = model_attributes.blksize
             alloc_cmd = """{0} -
             BLKSIZE({1})""".format(alloc_cmd, block_size)
 
@@ -437,6 +1365,8 @@ class DataSet(object):
             DSNTYPE(LIBRARY)""".format(alloc_cmd)
 
         rc, out, err = mvs_cmd.ikjeft01(alloc_cmd, authorized=True, tmphlq=tmphlq)
+        catalog_cache.invalidate(ds_name)
+        vtoc.invalidate()
         if rc != 0:
             raise MVSCmdExecError(rc, out, err)
 
@@ -474,9 +1404,9 @@ class DataSet(object):
         DatasetCreateError
             When the allocation fails.
         """
-        model_attributes = datasets.list_datasets(model)[0]
-        dataset_type = model_attributes.organization
-        record_format = model_attributes.record_format
+        model_attributes = DataSet.get_attributes(model, tmphlq=tmphlq)
+        dataset_type = model_attributes.dsorg
+        record_format = model_attributes.recfm
 
         if executable:
             dataset_type = "library"
@@ -496,9 +1426,9 @@ class DataSet(object):
             state="absent",
             record_format=record_format,
             volumes=vol,
-            block_size=model_attributes.block_size,
-            record_length=model_attributes.record_length,
-            space_primary=model_attributes.total_space,
+            block_size=model_attributes.blksize,
+            record_length=model_attributes.lrecl,
+            space_primary=model_attributes.space,
             space_type=''
         )
 
@@ -541,32 +1471,20 @@ class DataSet(object):
         # special characters just fine.
         name = name.upper().replace("\\", '')
 
-        module = AnsibleModuleHelper(argument_spec={})
-        stdin = " LISTCAT ENTRIES('{0}')".format(name)
-
-        cmd = "mvscmdauth --pgm=idcams --sysprint=* --sysin=stdin"
-        if tmphlq:
-            cmd = "{0} -Q={1}".format(cmd, tmphlq)
-
-        rc, stdout, stderr = module.run_command(
-            cmd,
-            data=stdin,
-            errors='replace'
-        )
+        entry = catalog_cache.listcat(name, tmphlq=tmphlq)
 
-        # The above 'listcat entries' command to idcams returns:
+        # The above 'listcat entries all' command to idcams returns:
         # rc=0 if data set found in catalog
         # rc=4 if data set NOT found in catalog
         # rc>4 for other errors
-        if rc > 4:
-            raise MVSCmdExecError(rc, stdout, stderr)
+        if entry.rc > 4:
+            raise MVSCmdExecError(entry.rc, entry.output, entry.stderr)
 
         if volumes:
-            cataloged_volume_list = DataSet.data_set_cataloged_volume_list(name, tmphlq=tmphlq) or []
-            if bool(set(volumes) & set(cataloged_volume_list)):
+            if bool(set(volumes) & set(entry.volumes)):
                 return True
         else:
-            if re.search(r"-\s" + re.escape(name) + r"\s*\n\s+IN-CAT", stdout):
+            if re.search(r"-\s" + re.escape(name) + r"\s*\n\s+IN-CAT", entry.output):
                 return True
 
         return False
@@ -588,36 +1506,68 @@ class DataSet(object):
             A list of volumes where the dataset is cataloged.
 
         """
-        name = name.upper()
-        module = AnsibleModuleHelper(argument_spec={})
-        stdin = " LISTCAT ENTRIES('{0}') ALL".format(name)
-
-        cmd = "mvscmdauth --pgm=idcams --sysprint=* --sysin=stdin"
-        if tmphlq:
-            cmd = "{0} -Q={1}".format(cmd, tmphlq)
-
-        rc, stdout, stderr = module.run_command(
-            cmd,
-            data=stdin,
-            errors='replace'
-        )
+        entry = catalog_cache.listcat(name, tmphlq=tmphlq)
         # The above 'listcat entries all' command to idcams returns:
         # rc=0 if data set found in catalog
         # rc=4 if data set NOT found in catalog
         # rc>4 for other errors
-        if rc > 4:
-            raise MVSCmdExecError(rc, stdout, stderr)
+        if entry.rc > 4:
+            raise MVSCmdExecError(entry.rc, entry.output, entry.stderr)
 
-        delimiter = 'VOLSER------------'
-        arr = stdout.split(delimiter)[1:]  # throw away header
+        volume_list = list(entry.volumes)
+        return volume_list
 
-        # Volume serials (VOLSER) under 6 chars will have one or more leading '-'s due to the chosen delimiter.
-        # The volser is in between the beginning of each str and the first space.
-        # Strip away any leading '-'s, then split on the next whitespace and throw away the remaining in each str.
-        volume_list = [x.strip('-').split()[0] for x in arr]
+    @staticmethod
+    def get_catalog_entries(names, tmphlq=None):
+        """Query the catalog for many data sets at once. Inside a cache
+        scope, lookups done afterwards for the names that are cataloged,
+        like data_set_cataloged or data_set_exists, are answered without
+        running IDCAMS again.
 
-        volume_list = list(set(volume_list))  # remove duplicates, order doesn't matter
-        return volume_list
+        Parameters
+        ----------
+        names : list[str]
+            Names of the data sets, escaped characters are allowed.
+        tmphlq : str
+            High Level Qualifier for temporary datasets.
+
+        Returns
+        -------
+        dict[str, CatalogEntry]
+            Parsed catalog information of each data set, keyed by the
+            unescaped upper case name.
+        """
+        return catalog_cache.listcat_many(
+            [name.replace("\\", '') for name in names],
+            tmphlq=tmphlq
+        )
+
+    @staticmethod
+    def get_attributes(name, tmphlq=None):
+        """Get the allocation attributes of a data set. Inside a cache scope
+        they are read once, later calls for the same name get the cached record.
+
+        Parameters
+        ----------
+        name : str
+            Name of the data set, a member name is ignored.
+        tmphlq : str
+            High Level Qualifier for temporary datasets.
+
+        Returns
+        -------
+        DataSetAttributes
+            Attributes of the data set, its exists attribute is False when
+            the data set is not in the catalog.
+
+        Raises
+        ------
+        DatasetBusyError
+            The dataset may be open by another user.
+        MVSCmdExecError
+            Another error while reading the attributes.
+        """
+        return catalog_cache.attributes(name, tmphlq=tmphlq)
 
     @staticmethod
     def data_set_exists(name, volume=None, tmphlq=None):
@@ -647,7 +1597,9 @@ class DataSet(object):
 
     @staticmethod
     def data_set_member_exists(name):
-        """Checks for existence of data set member.
+        """Checks for existence of data set member. The directory snapshot of
+        the data set answers when it can be read, so checking many members of
+        the same data set lists its directory only once.
 
         Parameters
         ----------
@@ -659,6 +1611,12 @@ class DataSet(object):
         bool
             If data set member exists.
         """
+        member = extract_member_name(name)
+        if member and "*" not in member and "?" not in member:
+            directory = DataSet._read_member_directory(name)
+            if directory is not None:
+                return member in directory
+
         module = AnsibleModuleHelper(argument_spec={})
         rc, stdout, stderr = module.run_command(
             "head \"//'{0}'\"".format(name), errors='replace')
@@ -666,6 +1624,63 @@ class DataSet(object):
             return False
         return True
 
+    @staticmethod
+    def get_member_directory(name, aliases=False, stats=False, hide_aliases=False):
+        """Get the directory snapshot of a partitioned data set. Inside a
+        cache scope the directory is read once and kept up to date as members
+        are created or deleted through DataSet, so scopes must not write
+        members by other means, like datasets.copy, cp or IEBCOPY. Outside
+        of one the directory is read on every call.
+
+        Parameters
+        ----------
+        name : str
+            Name of the partitioned data set, a member name is ignored.
+        aliases : bool
+            Whether the snapshot needs to know which members are aliases.
+        stats : bool
+            Whether the snapshot needs the ISPF statistics of the members.
+        hide_aliases : bool
+            Whether only the members that aren't aliases are needed, like
+            when copying the members of a data set. Outside of a cache scope
+            they're read with a single listing.
+
+        Returns
+        -------
+        MemberDirectory
+            Snapshot of the directory.
+
+        Raises
+        ------
+        ZOAUException
+            When the directory can't be listed.
+        MVSCmdExecError
+            When the statistics can't be listed.
+        """
+        return catalog_cache.member_directory(name, aliases=aliases, stats=stats, hide_aliases=hide_aliases)
+
+    @staticmethod
+    def _read_member_directory(name):
+        """Get the directory snapshot of a data set, or None when it can't be
+        listed, like when the data set doesn't exist or isn't partitioned.
+
+        Parameters
+        ----------
+        name : str
+            Name of the data set, a member name is ignored.
+
+        Returns
+        -------
+        MemberDirectory
+            Snapshot of the directory.
+        None
+            When the directory can't be listed.
+        """
+        try:
+            return catalog_cache.member_directory(name)
+        except Exception:
+            return None
+
     @staticmethod
     def data_set_shared_members(src, dest):
         """Checks for the existence of members from a source data set in
@@ -683,13 +1698,15 @@ class DataSet(object):
         bool
             If at least one of the members in src exists in dest.
         """
-        src_members = datasets.list_members(src)
-
-        for member in src_members:
-            if DataSet.data_set_member_exists("{0}({1})".format(dest, member)):
-                return True
+        if extract_member_name(src):
+            src_members = datasets.list_members(src)
+        else:
+            src_members = DataSet.get_member_directory(src)
 
-        return False
+        dest_directory = DataSet._read_member_directory(dest)
+        if dest_directory is None:
+            return False
+        return any(member in dest_directory for member in src_members)
 
     @staticmethod
     def get_member_name_from_file(file_name):
@@ -738,11 +1755,10 @@ class DataSet(object):
 
         files = [DataSet.get_member_name_from_file(file) for file in files]
 
-        for file in files:
-            if DataSet.data_set_member_exists("{0}({1})".format(dest, file)):
-                return True
-
-        return False
+        dest_directory = DataSet._read_member_directory(dest)
+        if dest_directory is None:
+            return False
+        return any(file in dest_directory for file in files)
 
     @staticmethod
     def data_set_volume(name, tmphlq=None):
@@ -866,22 +1882,14 @@ class DataSet(object):
         MVSCmdExecError
             When IDCAMS fails to get the data.
         """
-        name = name.upper()
-        module = AnsibleModuleHelper(argument_spec={})
-        stdin = " LISTCAT ENT('{0}') DATA ALL".format(name)
-
-        cmd = "mvscmdauth --pgm=idcams --sysprint=* --sysin=stdin"
-        if tmphlq:
-            cmd = "{0} -Q={1}".format(cmd, tmphlq)
-
-        rc, stdout, stderr = module.run_command(
-            cmd, data=stdin, errors='replace'
-        )
+        entry = catalog_cache.listcat(name, tmphlq=tmphlq)
 
-        if rc != 0:
-            raise MVSCmdExecError(rc, stdout, stderr)
+        # Only VSAM clusters have a DATA component, anything else gets the
+        # same treatment a LISTCAT of the DATA component would give it.
+        if entry.rc != 0 or entry.data_section is None:
+            raise MVSCmdExecError(entry.rc or 4, entry.output, entry.stderr)
 
-        return stdout
+        return entry.data_section
 
     @staticmethod
     def is_empty(name, volume=None, tmphlq=None):
@@ -1141,16 +2149,10 @@ class DataSet(object):
         bool
             If data set was found in table of contents for volume.
         """
-        data_sets = vtoc.get_volume_entry(volume, tmphlq=tmphlq)
-        data_set = vtoc.find_data_set_in_volume_output(name, data_sets)
-        if data_set is not None:
-            return True
-        vsam_name = name + ".data"
-        vsam_data_set = vtoc.find_data_set_in_volume_output(
-            vsam_name, data_sets)
-        if vsam_data_set is not None:
-            return True
-        return False
+        volume_index = vtoc.get_volume_index(volume, tmphlq=tmphlq)
+        if volume_index is None:
+            return False
+        return name in volume_index or name + ".data" in volume_index
 
     @staticmethod
     def replace(
@@ -1249,6 +2251,7 @@ class DataSet(object):
             Defaults to None.
         """
         arguments = locals()
+        catalog_cache.invalidate(name)
         DataSet.delete(name)
         changed, data_set = DataSet.create(**arguments)
         return changed, data_set
@@ -1405,6 +2408,8 @@ class DataSet(object):
         """
         original_args = locals()
         formatted_args = DataSet._build_zoau_args(**original_args)
+        catalog_cache.invalidate(name)
+        vtoc.invalidate()
         try:
             data_set = datasets.create(**formatted_args)
         except exceptions._ZOAUExtendableException as create_exception:
@@ -1436,10 +2441,212 @@ class DataSet(object):
         DatasetDeleteError
             When data set deletion fails.
         """
+        catalog_cache.invalidate(name)
+        vtoc.invalidate()
         rc = datasets.delete(name, no_scratch=noscratch)
         if rc > 0:
             raise DatasetDeleteError(name, rc)
 
+    @staticmethod
+    def bulk_delete(names, tmphlq=None, noscratch=None):
+        """Delete many cataloged data sets with a single IDCAMS run.
+        A failure deleting one of them doesn't stop the rest.
+
+        Parameters
+        ----------
+        names : list[str]
+            Names of the data sets to delete.
+        tmphlq : str
+            High Level Qualifier for temporary datasets.
+        noscratch : list[bool]
+            Whether each data set should only be uncataloged instead of
+            removed from its volume. All of them are removed when None.
+
+        Returns
+        -------
+        list[tuple(int, str)]
+            Condition code and IDCAMS output of each deletion, in the same
+            order as names.
+        """
+        noscratch = noscratch or [False] * len(names)
+        vtoc.invalidate()
+        statements = []
+        for name, uncatalog_only in zip(names, noscratch):
+            name = name.replace("\\", '')
+            catalog_cache.invalidate(name)
+            statements.append(" DELETE '{0}'{1}".format(name, " NOSCRATCH" if uncatalog_only else ""))
+        return DataSet.run_idcams_statements(statements, tmphlq=tmphlq)
+
+    @staticmethod
+    def can_bulk_create(type, record_format=None, block_size=None, directory_blocks=None, **kwargs):
+        """Determine whether bulk_create allocates a data set with the same
+        attributes DataSet.create would. ALLOCATE only gets the attributes
+        that are given, so data sets that depend on ZOAU filling in a block
+        size for RECFM U or the directory blocks of a PDS must go through
+        DataSet.create instead.
+
+        Parameters
+        ----------
+        type : str
+            The type of the data set.
+        record_format : str
+            The record format of the data set.
+        block_size : int
+            The block size of the data set.
+        directory_blocks : int
+            The number of directory blocks of the data set.
+
+        Returns
+        -------
+        bool
+            Whether the data set can be allocated by bulk_create.
+        """
+        ds_type = (type or "").upper()
+        if ds_type not in DataSet.BULK_CREATE_TYPES:
+            return False
+        if (record_format or "").upper() == "U" and not block_size:
+            return False
+        if ds_type == "PDS" and not directory_blocks:
+            return False
+        return True
+
+    @staticmethod
+    def bulk_create(data_sets, tmphlq=None):
+        """Allocate and catalog many non-VSAM data sets with a single IDCAMS run.
+        A failure allocating one of them doesn't stop the rest.
+
+        Parameters
+        ----------
+        data_sets : list[dict]
+            Arguments for each data set, the same ones DataSet.create takes.
+            Each one of them must pass can_bulk_create.
+        tmphlq : str
+            High Level Qualifier for temporary datasets.
+
+        Returns
+        -------
+        list[tuple(int, str)]
+            Condition code and IDCAMS output of each allocation, in the same
+            order as data_sets.
+        """
+        vtoc.invalidate()
+        statements = []
+        for arguments in data_sets:
+            catalog_cache.invalidate(arguments.get("name"))
+            statements.append(DataSet._build_allocate_statement(**arguments))
+        return DataSet.run_idcams_statements(statements, tmphlq=tmphlq)
+
+    @staticmethod
+    def _build_allocate_statement(
+        name,
+        type,
+        space_primary=None,
+        space_secondary=None,
+        space_type=None,
+        record_format=None,
+        record_length=None,
+        block_size=None,
+        directory_blocks=None,
+        sms_storage_class=None,
+        sms_data_class=None,
+        sms_management_class=None,
+        volumes=None,
+        **kwargs
+    ):
+        """Build the IDCAMS ALLOCATE statement for a new non-VSAM data set.
+
+        Parameters
+        ----------
+        name : str
+            The name of the data set.
+        type : str
+            The type of the data set, one of BULK_CREATE_TYPES.
+
+        Other parameters are the ones DataSet.create takes.
+
+        Returns
+        -------
+        str
+            ALLOCATE statement, split in lines IDCAMS can read.
+        """
+        ds_type = type.upper()
+        keywords = ["DSNAME('{0}')".format(name.replace("\\", '')), "NEW CATALOG"]
+
+        if DataSet.BULK_CREATE_TYPES[ds_type]:
+            keywords.append("DSNTYPE({0})".format(DataSet.BULK_CREATE_TYPES[ds_type]))
+        if ds_type in DataSet.MVS_PARTITIONED:
+            keywords.append("DSORG(PO) DIR({0})".format(directory_blocks or DataSet._IDCAMS_DEFAULT_DIRECTORY_BLOCKS))
+        else:
+            keywords.append("DSORG(PS)")
+
+        if space_primary is not None:
+            space = str(space_primary)
+            if space_secondary is not None:
+                space = "{0},{1}".format(space, space_secondary)
+            keywords.append("SPACE({0}) {1}".format(space, DataSet._IDCAMS_SPACE_UNITS[(space_type or "M").upper()]))
+
+        if record_format:
+            keywords.append("RECFM({0})".format(",".join(record_format.upper())))
+        if record_length is not None:
+            keywords.append("LRECL({0})".format(record_length))
+        if block_size is not None:
+            keywords.append("BLKSIZE({0})".format(block_size))
+        if volumes:
+            keywords.append("VOLUME({0})".format(",".join(volumes).upper()))
+        if sms_storage_class:
+            keywords.append("STORCLAS({0})".format(sms_storage_class.upper()))
+        if sms_data_class:
+            keywords.append("DATACLAS({0})".format(sms_data_class.upper()))
+        if sms_management_class:
+            keywords.append("MGMTCLAS({0})".format(sms_management_class.upper()))
+
+        return " ALLOCATE -\n    " + " -\n    ".join(keywords)
+
+    @staticmethod
+    def run_idcams_statements(statements, tmphlq=None):
+        """Run many IDCAMS statements, up to IDCAMS_BATCH_SIZE of them in
+        each IDCAMS run, and split the output between them.
+
+        IDCAMS ends the messages of every statement with the condition code
+        it got, so the output is split at each one of those messages.
+
+        Parameters
+        ----------
+        statements : list[str]
+            IDCAMS statements to run.
+        tmphlq : str
+            High Level Qualifier for temporary datasets.
+
+        Returns
+        -------
+        list[tuple(int, str)]
+            Condition code and output lines of each statement, in the same
+            order as statements. Statements IDCAMS didn't get to report its
+            return code, or 16 if it was lower.
+        """
+        module = AnsibleModuleHelper(argument_spec={})
+        cmd = "mvscmdauth --pgm=idcams --sysprint=* --sysin=stdin"
+        if tmphlq:
+            cmd = "{0} -Q={1}".format(cmd, tmphlq)
+
+        results = []
+        for batch_start in range(0, len(statements), IDCAMS_BATCH_SIZE):
+            batch = statements[batch_start:batch_start + IDCAMS_BATCH_SIZE]
+            rc, stdout, stderr = module.run_command(cmd, data="\n".join(batch), errors='replace')
+
+            batch_results = []
+            start = 0
+            for condition_code in re.finditer(r"^.*(?:HIGHEST CONDITION CODE WAS|CONDITION CODE IS) (\d+).*$", stdout, re.MULTILINE):
+                batch_results.append((int(condition_code.group(1)), stdout[start:condition_code.end()]))
+                start = condition_code.end()
+                if len(batch_results) == len(batch):
+                    break
+
+            while len(batch_results) < len(batch):
+                batch_results.append((max(rc, 16), stdout + stderr))
+            results.extend(batch_results)
+        return results
+
     @staticmethod
     # TODO: verify that this method works for all lengths etc
     def create_member(name, tmphlq=None):
@@ -1470,6 +2677,7 @@ class DataSet(object):
         )
         if rc != 0:
             raise DatasetMemberCreateError(name, rc)
+        catalog_cache.member_written(name)
 
     @staticmethod
     def delete_member(name, force=False):
@@ -1489,6 +2697,7 @@ class DataSet(object):
         rc = datasets.delete_members(name, force=force)
         if rc > 0:
             raise DatasetMemberDeleteError(name, rc)
+        catalog_cache.member_deleted(name)
 
     @staticmethod
     def catalog(name, volumes, tmphlq=None):
@@ -1503,10 +2712,13 @@ class DataSet(object):
         tmphlq : str
             High Level Qualifier for temporary datasets.
         """
-        if DataSet.is_vsam(name, volumes, tmphlq=tmphlq):
-            DataSet._catalog_vsam(name, volumes, tmphlq=tmphlq)
-        else:
-            DataSet._catalog_non_vsam(name, volumes, tmphlq=tmphlq)
+        try:
+            if DataSet.is_vsam(name, volumes, tmphlq=tmphlq):
+                DataSet._catalog_vsam(name, volumes, tmphlq=tmphlq)
+            else:
+                DataSet._catalog_non_vsam(name, volumes, tmphlq=tmphlq)
+        finally:
+            catalog_cache.invalidate(name)
 
     @staticmethod
     # TODO: extend for multi volume data sets
@@ -1639,10 +2851,13 @@ class DataSet(object):
             High Level Qualifier for temporary datasets.
 
         """
-        if DataSet.is_vsam(name, tmphlq=tmphlq):
-            DataSet._uncatalog_vsam(name, tmphlq=tmphlq)
-        else:
-            DataSet._uncatalog_non_vsam(name, tmphlq=tmphlq)
+        try:
+            if DataSet.is_vsam(name, tmphlq=tmphlq):
+                DataSet._uncatalog_vsam(name, tmphlq=tmphlq)
+            else:
+                DataSet._uncatalog_non_vsam(name, tmphlq=tmphlq)
+        finally:
+            catalog_cache.invalidate(name)
 
     @staticmethod
     def _uncatalog_non_vsam(name, tmphlq=None):
@@ -1664,7 +2879,7 @@ class DataSet(object):
         iehprogm_input = DataSet._NON_VSAM_UNCATALOG_COMMAND.format(name)
         temp_name = None
         try:
-            temp_name = DataSet.create_temp(name.split(".")[0])
+            temp_name = temp_data_set_pool.acquire(name.split(".")[0])
             DataSet.write(temp_name, iehprogm_input)
 
             cmd = "mvscmdauth --pgm=iehprogm --sysprint=* --sysin={0}".format(temp_name)
@@ -1676,8 +2891,7 @@ class DataSet(object):
             if rc != 0 or "NORMAL END OF TASK RETURNED" not in stdout:
                 raise DatasetUncatalogError(name, rc)
         finally:
-            if temp_name:
-                datasets.delete(temp_name)
+            temp_data_set_pool.release(temp_name)
         return
 
     @staticmethod
@@ -1756,11 +2970,13 @@ class DataSet(object):
         bool
             If the data set is VSAM.
         """
-        data_sets = vtoc.get_volume_entry(volume, tmphlq=tmphlq)
+        volume_index = vtoc.get_volume_index(volume, tmphlq=tmphlq)
+        if volume_index is None:
+            return False
         vsam_name = name + ".DATA"
-        data_set = vtoc.find_data_set_in_volume_output(vsam_name, data_sets)
+        data_set = volume_index.get(vsam_name)
         if data_set is None:
-            data_set = vtoc.find_data_set_in_volume_output(name, data_sets)
+            data_set = volume_index.get(name)
         if data_set is not None and data_set.get("data_set_organization", "") == "VS":
             return True
         return False
@@ -1781,14 +2997,7 @@ class DataSet(object):
         bool
             If the data set is VSAM.
         """
-        module = AnsibleModuleHelper(argument_spec={})
-        stdin = " LISTCAT ENTRIES('{0}')".format(name.upper())
-
-        cmd = "mvscmdauth --pgm=idcams --sysprint=* --sysin=stdin"
-        if tmphlq:
-            cmd = "{0} -Q={1}".format(cmd, tmphlq)
-
-        rc, stdout, stderr = module.run_command(cmd, data=stdin, errors='replace')
+        stdout = catalog_cache.listcat(name, tmphlq=tmphlq).output
         if re.search(r"^0CLUSTER[ ]+-+[ ]+" + name + r"[ ]*$", stdout, re.MULTILINE):
             return True
         return False
@@ -2245,7 +3454,7 @@ class DataSet(object):
         temp_dd_location = None
 
         try:
-            temp_dd_location = DataSet.create_temp(
+            temp_dd_location = temp_data_set_pool.acquire(
                 hlq=tmp_hlq,
                 type='SEQ',
                 record_format=record_format,
@@ -2273,8 +3482,7 @@ class DataSet(object):
 
             return response
         finally:
-            if temp_dd_location:
-                datasets.delete(temp_dd_location)
+            temp_data_set_pool.release(temp_dd_location)
 
 
 class DataSetUtils(object):
@@ -2456,8 +3664,9 @@ class DataSetUtils(object):
         return self.ds_info.get("recfm")
 
     def _gather_data_set_info(self):
-        """Retrieves information about the input data set using LISTDS and
-        LISTCAT commands.
+        """Retrieves information about the input data set from its cached
+        attributes, which come from the ZOAU listing when available and from
+        the LISTCAT and LISTDS commands otherwise.
 
         Returns
         -------
@@ -2471,37 +3680,26 @@ class DataSetUtils(object):
         MVSCmdExecError
             Another error while executing the command.
         """
-        result = dict()
         self.data_set = self.data_set.upper().replace("\\", '')
-        listds_rc, listds_out, listds_err = mvs_cmd.ikjeft01(
-            "  LISTDS '{0}'".format(self.data_set),
-            authorized=True,
-            tmphlq=self.tmphlq
-        )
-
-        if listds_rc == 0:
-            result.update(self._process_listds_output(listds_out))
-        else:
-            if re.findall(r"ALREADY IN USE", listds_out):
-                raise DatasetBusyError(self.data_set)
-            if re.findall(r"NOT IN CATALOG", listds_out):
-                self.ds_info["exists"] = False
-            else:
-                raise MVSCmdExecError(listds_rc, listds_out, listds_err)
-
-        listcat_rc, listcat_out, listcat_err = mvs_cmd.idcams(
-            "  LISTCAT ENT({0}) ALL".format(self.data_set), authorized=True
-        )
-        if listcat_rc == 0:
-            result.update(self._process_listcat_output(listcat_out))
-        else:
-            if re.findall(r"NOT FOUND|NOT LISTED", listcat_out):
-                self.ds_info["exists"] = False
-            else:
-                raise MVSCmdExecError(listcat_rc, listcat_out, listcat_err)
+        attributes = catalog_cache.attributes(self.data_set, tmphlq=self.tmphlq)
+        if not attributes.exists:
+            self.ds_info["exists"] = False
+            return dict()
+
+        result = dict(exists=True)
+        for key, value in (
+            ("dsorg", attributes.dsorg),
+            ("recfm", attributes.recfm),
+            ("lrecl", attributes.lrecl),
+            ("blksize", attributes.blksize),
+            ("volser", attributes.volumes[0] if attributes.volumes else None),
+        ):
+            if value is not None:
+                result[key] = value
         return result
 
-    def _process_listds_output(self, output):
+    @staticmethod
+    def _process_listds_output(output):
         """Parses the output generated by LISTDS command.
 
         Parameters
@@ -2532,28 +3730,6 @@ class DataSetUtils(object):
                         result["blksize"] = int(ds_params[2])
         return result
 
-    def _process_listcat_output(self, output):
-        """Parses the output generated by LISTCAT command.
-
-        Parameters
-        ----------
-        output : str
-            The output of LISTCAT command.
-
-        Returns
-        -------
-        dict
-            Dictionary containing the output parameters of LISTCAT.
-        """
-        result = dict()
-        if "NOT FOUND" not in output:
-            volser_output = re.findall(r"VOLSER-*[A-Z|0-9]*", output)
-            if volser_output:
-                result["volser"] = "".join(
-                    re.findall(r"-[A-Z|0-9]*", volser_output[0])
-                ).replace("-", "")
-        return result
-
     @staticmethod
     def verify_dataset_disposition(data_set, disposition):
         """Function to call iefbr14 to verify the dsp of data_set
@@ -2681,6 +3857,8 @@ class MVSDataSet():
         if DataSet.data_set_exists(self.name, tmphlq=tmp_hlq):
             DataSet.delete(self.name)
             changed = True
+        catalog_cache.invalidate(self.name)
+        vtoc.invalidate()
         zoau_data_set = datasets.create(**formatted_args)
         if zoau_data_set is not None:
             self.set_state("present")
@@ -3010,6 +4188,7 @@ class GenerationDataGroup():
             Indicates if changes were made.
         """
         GenerationDataGroup._validate_gdg_name(self.name)
+        catalog_cache.invalidate(self.name)
         gdg = gdgs.create(
             name=self.name,
             limit=self.limit,
@@ -3045,6 +4224,7 @@ class GenerationDataGroup():
         GenerationDataGroup._validate_gdg_name(name)
 
         def _create_gdg(args):
+            catalog_cache.invalidate(args.get("name"))
             try:
                 return gdgs.create(**args)
             except exceptions._ZOAUExtendableException as e:
@@ -3091,6 +4271,8 @@ class GenerationDataGroup():
         """
         # Check whether GDG exists or not
         if gdgs.exists(name=self.name):
+            catalog_cache.invalidate(self.name)
+            vtoc.invalidate()
             # Try to delete
             rc = datasets.delete(self.name, no_scratch=noscratch)
             if rc > 0:
@@ -3134,6 +4316,8 @@ class GenerationDataGroup():
         int
             Indicates if changes were made.
         """
+        catalog_cache.invalidate(self.name)
+        vtoc.invalidate()
         if isinstance(self.gdg, gdgs.GenerationDataGroupView):
             self.gdg.clear()
         else:
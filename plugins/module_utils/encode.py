@@ -19,27 +19,36 @@ from math import floor, ceil
 from os import path, walk, makedirs, unlink
 
 import shutil
+import codecs
 import errno
+import importlib
+import io
 import os
 import re
 import locale
 import traceback
 
+from ansible.module_utils.common.text.converters import to_bytes, to_text
 from ansible_collections.ibm.ibm_zos_core.plugins.module_utils.import_handler import (
     ZOAUImportError,
 )
 from ansible_collections.ibm.ibm_zos_core.plugins.module_utils.better_arg_parser import (
     BetterArgParser,
 )
-from ansible_collections.ibm.ibm_zos_core.plugins.module_utils import copy, system, validation
+from ansible_collections.ibm.ibm_zos_core.plugins.module_utils import copy, data_set, system, validation
+from ansible_collections.ibm.ibm_zos_core.plugins.module_utils.concurrency import (
+    DEFAULT_MAX_CONCURRENCY,
+    run_concurrently,
+)
 from ansible_collections.ibm.ibm_zos_core.plugins.module_utils.ansible_module import (
     AnsibleModuleHelper,
 )
 
 try:
-    from zoautil_py import datasets
+    from zoautil_py import datasets, zoau_io
 except Exception:
     datasets = ZOAUImportError(traceback.format_exc())
+    zoau_io = ZOAUImportError(traceback.format_exc())
 
 from shlex import quote
 
@@ -74,6 +83,317 @@ class Defaults:
         return system_charset
 
 
+# Python codecs used to convert between the code sets most commonly used
+# with the collection without starting iconv. Any other code set is
+# converted by iconv.
+EBCDIC_CODECS = {
+    "IBM-037": "cp037",
+    "IBM-273": "cp273",
+    "IBM-500": "cp500",
+    "IBM-875": "cp875",
+    "IBM-1026": "cp1026",
+    "IBM-1047": "cp1047",
+    "IBM-1140": "cp1140",
+}
+ASCII_CODECS = {
+    "ISO8859-1": "latin-1",
+    "UTF-8": "utf-8",
+}
+
+# EBCDIC code page 1047 only differs from 037 in these positions.
+_CP1047_FROM_CP037 = {
+    0x5F: u"^",
+    0xAD: u"[",
+    0xB0: u"\xac",
+    0xBA: u"\xdd",
+    0xBB: u"\xa8",
+    0xBD: u"]",
+}
+
+# Amount of data read from a file every time it's converted in-process.
+CONVERSION_CHUNK_SIZE = 1024 * 1024
+# Records read from a data set at a time when converting it record by
+# record, which bounds memory use to this many times its record length.
+RECORD_BATCH_SIZE = 1000
+# Data set types that can be converted record by record.
+RECORD_CONVERSION_TYPES = ("PS", "KSDS")
+# Upper bound for the combined length of the paths given to a single chtag
+# invocation, well under the argument size limit of z/OS UNIX.
+TAG_BATCH_LENGTH = 32 * 1024
+
+# Code sets whose encoding of NUL takes more than one byte, which can't be
+# used to separate the strings converted by a single iconv process.
+WIDE_CODE_SET_PATTERN = re.compile(r"^(UTF-?(16|32)|UCS-?(2|4))", re.IGNORECASE)
+
+_codec_cache = {}
+_converter_cache = {}
+
+
+def _build_ebcdic_codec(code_set, codec_name):
+    """Builds the codec for an EBCDIC code page. Python maps the EBCDIC
+    newline character (NL, 0x15) to U+0085 and line feed (0x25) to U+000A,
+    while z/OS iconv, and every USS text file, uses NL for line feed, so both
+    positions are swapped.
+
+    Parameters
+    ----------
+    code_set : str
+        Code set name, as used by iconv.
+    codec_name : str
+        Name of the Python codec the table is based on.
+
+    Returns
+    -------
+    codecs.CodecInfo
+        Codec for the code set.
+    """
+    if codec_name == "cp1047":
+        decoding_table = list(importlib.import_module("encodings.cp037").decoding_table)
+        for position, char in _CP1047_FROM_CP037.items():
+            decoding_table[position] = char
+    else:
+        decoding_table = list(importlib.import_module("encodings." + codec_name).decoding_table)
+
+    decoding_table[0x15], decoding_table[0x25] = decoding_table[0x25], decoding_table[0x15]
+    decoding_table = u"".join(decoding_table)
+    encoding_table = codecs.charmap_build(decoding_table)
+
+    def encode(input, errors="strict"):
+        return codecs.charmap_encode(input, errors, encoding_table)
+
+    def decode(input, errors="strict"):
+        return codecs.charmap_decode(input, errors, decoding_table)
+
+    class IncrementalEncoder(codecs.IncrementalEncoder):
+        def encode(self, input, final=False):
+            return codecs.charmap_encode(input, self.errors, encoding_table)[0]
+
+    class IncrementalDecoder(codecs.IncrementalDecoder):
+        def decode(self, input, final=False):
+            return codecs.charmap_decode(input, self.errors, decoding_table)[0]
+
+    return codecs.CodecInfo(
+        name=code_set.lower(),
+        encode=encode,
+        decode=decode,
+        incrementalencoder=IncrementalEncoder,
+        incrementaldecoder=IncrementalDecoder,
+    )
+
+
+def get_codec(code_set):
+    """Get the Python codec that converts data from or to a code set the
+    same way iconv does in z/OS.
+
+    Parameters
+    ----------
+    code_set : str
+        Code set name, as used by iconv (e.g. IBM-1047).
+
+    Returns
+    -------
+    codecs.CodecInfo
+        Codec for the code set, None when it has to be converted by iconv.
+    """
+    if not code_set:
+        return None
+    code_set = code_set.upper()
+    if code_set not in _codec_cache:
+        codec = None
+        if code_set in EBCDIC_CODECS:
+            codec = _build_ebcdic_codec(code_set, EBCDIC_CODECS[code_set])
+        elif code_set in ASCII_CODECS:
+            codec = codecs.lookup(ASCII_CODECS[code_set])
+        _codec_cache[code_set] = codec
+    return _codec_cache[code_set]
+
+
+def _is_single_byte(code_set):
+    return code_set.upper() in EBCDIC_CODECS or code_set.upper() == "ISO8859-1"
+
+
+def _build_translation_table(from_codec, to_codec):
+    """Builds a byte translation table between two single-byte code sets.
+
+    Parameters
+    ----------
+    from_codec : codecs.CodecInfo
+        Codec of the source code set.
+    to_codec : codecs.CodecInfo
+        Codec of the destination code set.
+
+    Returns
+    -------
+    bytes
+        Translation table for bytes.translate, None if a character can't be
+        represented in the destination code set.
+    """
+    try:
+        table = bytearray()
+        for byte in range(256):
+            char = from_codec.decode(bytes(bytearray([byte])))[0]
+            table.extend(to_codec.encode(char)[0])
+    except UnicodeError:
+        return None
+    if len(table) != 256:
+        return None
+    return bytes(table)
+
+
+class CodeSetConverter(object):
+    def __init__(self, from_code, to_code, chunk_size=CONVERSION_CHUNK_SIZE):
+        """In-process replacement of iconv for the code sets that have a
+        Python codec. Data is converted in chunks through an incremental
+        decoder and encoder, so memory use doesn't depend on the size of
+        the data. Single-byte code sets are translated with a byte table,
+        either straight into the destination code set or into ISO8859-1,
+        whose codec is much faster than the generic one when the other code
+        set is multi-byte.
+
+        Parameters
+        ----------
+        from_code : str
+            The source code set.
+        to_code : str
+            The destination code set.
+        chunk_size : int
+            Number of bytes converted at a time.
+
+        Attributes
+        ----------
+        supported : bool
+            Whether both code sets can be converted in-process.
+        single_byte : bool
+            Whether both code sets are single-byte, in which case converted
+            data keeps the same length.
+        """
+        self.from_code = from_code
+        self.to_code = to_code
+        self.chunk_size = chunk_size
+        self.from_codec = get_codec(from_code)
+        self.to_codec = get_codec(to_code)
+        self.supported = self.from_codec is not None and self.to_codec is not None
+        self._table = self._decode_table = self._encode_table = None
+        self.single_byte = False
+        if not self.supported:
+            return
+
+        from_single_byte = _is_single_byte(from_code)
+        to_single_byte = _is_single_byte(to_code)
+        if from_single_byte and to_single_byte:
+            self._table = _build_translation_table(self.from_codec, self.to_codec)
+            self.single_byte = self._table is not None
+        elif from_single_byte:
+            self._decode_table = _build_translation_table(self.from_codec, get_codec("ISO8859-1"))
+        elif to_single_byte:
+            self._encode_table = _build_translation_table(get_codec("ISO8859-1"), self.to_codec)
+
+    def _decode(self, decoder, chunk, final=False):
+        if self._decode_table is not None:
+            return chunk.translate(self._decode_table).decode("latin-1")
+        return decoder.decode(chunk, final)
+
+    def _encode(self, encoder, text, final=False):
+        if self._encode_table is not None:
+            try:
+                return text.encode("latin-1").translate(self._encode_table)
+            except UnicodeEncodeError:
+                # Characters outside ISO8859-1 may still exist in to_code.
+                return self.to_codec.encode(text)[0]
+        return encoder.encode(text, final)
+
+    def iter_convert(self, infile):
+        """Converts the content of a binary file object chunk by chunk.
+
+        Parameters
+        ----------
+        infile : file
+            File object opened in binary mode.
+
+        Returns
+        -------
+        generator[bytes]
+            Converted chunks.
+
+        Raises
+        ------
+        EncodeError
+            When the data can't be converted between the code sets.
+        """
+        try:
+            if self._table is not None:
+                chunk = infile.read(self.chunk_size)
+                while chunk:
+                    yield chunk.translate(self._table)
+                    chunk = infile.read(self.chunk_size)
+                return
+
+            decoder = self.from_codec.incrementaldecoder("strict")
+            encoder = self.to_codec.incrementalencoder("strict")
+            chunk = infile.read(self.chunk_size)
+            while chunk:
+                yield self._encode(encoder, self._decode(decoder, chunk))
+                chunk = infile.read(self.chunk_size)
+            yield self._encode(encoder, self._decode(decoder, b"", final=True), final=True)
+        except UnicodeError as err:
+            raise EncodeError(
+                "Unable to convert from {0} to {1}: {2}".format(self.from_code, self.to_code, err)
+            )
+
+    def convert(self, data):
+        """Converts data held in memory.
+
+        Parameters
+        ----------
+        data : bytes
+            Data in the source code set.
+
+        Returns
+        -------
+        bytes
+            Data in the destination code set.
+        """
+        if self._table is not None:
+            return data.translate(self._table)
+        return b"".join(self.iter_convert(io.BytesIO(data)))
+
+    def convert_file(self, src, dest):
+        """Converts a file into another one. dest must not be src.
+
+        Parameters
+        ----------
+        src : str
+            Path of the file to convert.
+        dest : str
+            Path of the converted file.
+        """
+        with open(src, "rb") as infile, open(dest, "wb") as outfile:
+            for chunk in self.iter_convert(infile):
+                outfile.write(chunk)
+
+
+def get_converter(from_code, to_code):
+    """Get a converter between two code sets. Converters are cached, so
+    their translation tables are only built once per module run.
+
+    Parameters
+    ----------
+    from_code : str
+        The source code set.
+    to_code : str
+        The destination code set.
+
+    Returns
+    -------
+    CodeSetConverter
+        Converter between both code sets.
+    """
+    key = (from_code.upper(), to_code.upper())
+    if key not in _converter_cache:
+        _converter_cache[key] = CodeSetConverter(from_code, to_code)
+    return _converter_cache[key]
+
+
 class EncodeUtils(object):
     def __init__(self):
         """Call the coded character set conversion utility iconv
@@ -235,7 +555,9 @@ class EncodeUtils(object):
         return reclen, space_u
 
     def temp_data_set(self, reclen, space_u):
-        """Creates a temporary data set with the given record length and size.
+        """Gets an empty temporary VB data set with the given record length and
+        size from the pool of the module run. It must be given back with
+        data_set.temp_data_set_pool.release.
 
         Parameters
         ----------
@@ -251,24 +573,22 @@ class EncodeUtils(object):
 
         Raises
         ------
-        ZOAUException
-            When any exception is raised during the data set allocation.
-            DatasetVerificationError: When the data set creation could not be verified.
+        DatasetCreateError
+            When the data set allocation fails.
         """
-        size = str(space_u * 2) + "K"
         if self.tmphlq:
             hlq = self.tmphlq
         else:
             hlq = datasets.get_hlq()
-        temp_ps = datasets.tmp_name(high_level_qualifier=hlq)
-        temporary_data_set = datasets.create(
-            name=temp_ps,
-            dataset_type="SEQ",
-            primary_space=size,
+        return data_set.temp_data_set_pool.acquire(
+            hlq=hlq,
+            type="SEQ",
             record_format="VB",
+            space_primary=space_u * 2,
+            space_secondary=0,
+            space_type="K",
             record_length=reclen,
         )
-        return temporary_data_set.name
 
     def get_codeset(self):
         """Get the list of supported encodings from the  USS command 'iconv -l'.
@@ -310,6 +630,33 @@ class EncodeUtils(object):
         str
             The string content after the encoding.
 
+        Raises
+        ------
+        EncodeError
+            When any exception is raised during the conversion.
+        """
+        return self.strings_convert_encoding([src], from_encoding, to_encoding)[0]
+
+    def strings_convert_encoding(self, strings, from_encoding, to_encoding):
+        """Convert the encoding of several strings in a single call. Code sets
+        with a Python codec are converted in-process with a cached converter,
+        the rest are converted by one iconv process for all of the strings.
+
+        Parameters
+        ----------
+        strings : list[Union[str, bytes]]
+            The input strings. Bytes are taken as data already encoded
+            in from_encoding.
+        from_encoding : str
+            The source code set of the strings.
+        to_encoding : str
+            The destination code set for the strings.
+
+        Returns
+        -------
+        list[str]
+            The strings after the encoding, in the same order.
+
         Raises
         ------
         EncodeError
@@ -317,12 +664,63 @@ class EncodeUtils(object):
         """
         from_encoding = self._validate_encoding(from_encoding)
         to_encoding = self._validate_encoding(to_encoding)
-        iconv_cmd = "printf {0} | iconv -f {1} -t {2}".format(
-            quote(src), quote(from_encoding), quote(to_encoding)
+        converter = get_converter(from_encoding, to_encoding)
+        if converter.supported:
+            converted = []
+            for src in strings:
+                try:
+                    if not isinstance(src, bytes):
+                        src = converter.from_codec.encode(src)[0]
+                except UnicodeError as err:
+                    raise EncodeError(err)
+                converted.append(to_text(converter.convert(src), errors='replace'))
+            return converted
+
+        if not strings:
+            return []
+        data = [src if isinstance(src, bytes) else to_bytes(src) for src in strings]
+        if WIDE_CODE_SET_PATTERN.match(from_encoding) or WIDE_CODE_SET_PATTERN.match(to_encoding):
+            return [to_text(self._iconv_convert(src, from_encoding, to_encoding), errors='replace') for src in data]
+
+        # NUL is kept by iconv between single and multi-byte code sets alike,
+        # so it separates the strings sent through the same process.
+        converted = self._iconv_convert(b"\0".join(data), from_encoding, to_encoding).split(b"\0")
+        if len(converted) != len(data):
+            raise EncodeError("Unable to split the strings converted from {0} to {1}.".format(from_encoding, to_encoding))
+        return [to_text(src, errors='replace') for src in converted]
+
+    def _iconv_convert(self, data, from_encoding, to_encoding):
+        """Convert data with iconv.
+
+        Parameters
+        ----------
+        data : bytes
+            Data in the source code set.
+        from_encoding : str
+            The source code set.
+        to_encoding : str
+            The destination code set.
+
+        Returns
+        -------
+        bytes
+            Data in the destination code set.
+
+        Raises
+        ------
+        EncodeError
+            When iconv fails.
+        """
+        if not data:
+            return b""
+        rc, out, err = self.module.run_command(
+            ["iconv", "-f", from_encoding, "-t", to_encoding],
+            data=data,
+            binary_data=True,
+            encoding=None
         )
-        rc, out, err = self.module.run_command(iconv_cmd, use_unsafe_shell=True, errors='replace')
         if rc:
-            raise EncodeError(err)
+            raise EncodeError(to_text(err, errors='replace'))
         return out
 
     def uss_convert_encoding(self, src, dest, from_code, to_code):
@@ -361,13 +759,17 @@ class EncodeUtils(object):
             temp_fi = dest
         else:
             temp_fo, temp_fi = mkstemp()
-        iconv_cmd = "iconv -f {0} -t {1} {2} > {3}".format(
-            quote(from_code), quote(to_code), quote(src), quote(temp_fi)
-        )
+        converter = get_converter(from_code, to_code)
         try:
-            rc, out, err = self.module.run_command(iconv_cmd, use_unsafe_shell=True, errors='replace')
-            if rc:
-                raise EncodeError(err)
+            if converter.supported:
+                converter.convert_file(src, temp_fi)
+            else:
+                iconv_cmd = "iconv -f {0} -t {1} {2} > {3}".format(
+                    quote(from_code), quote(to_code), quote(src), quote(temp_fi)
+                )
+                rc, out, err = self.module.run_command(iconv_cmd, use_unsafe_shell=True, errors='replace')
+                if rc:
+                    raise EncodeError(err)
             if dest == temp_fi:
                 convert_rc = True
             else:
@@ -392,7 +794,9 @@ class EncodeUtils(object):
                         raise
         return convert_rc
 
-    def uss_convert_encoding_prev(self, src, dest, from_code, to_code):
+    def uss_convert_encoding_prev(
+        self, src, dest, from_code, to_code, max_concurrency=DEFAULT_MAX_CONCURRENCY
+    ):
         """For multiple files conversion, such as a USS path or MVS PDS data set,
         use this method to split then do the conversion.
 
@@ -406,6 +810,9 @@ class EncodeUtils(object):
             The source code set of the input path.
         to_code : str
             The destination code set for the output path.
+        max_concurrency : int
+            Maximum number of files converted at the same time
+            when src is a directory.
 
         Returns
         -------
@@ -416,6 +823,9 @@ class EncodeUtils(object):
         ------
         EncodeError
             When directory is empty or copy multiple files to a single file.
+        EncodeFilesError
+            When some of the files inside a directory could not be converted.
+            The rest of the files are converted regardless.
         """
         src = self._validate_path(src)
         dest = self._validate_path(dest)
@@ -448,6 +858,7 @@ class EncodeUtils(object):
                         " (dest) {1}.".format(src, dest)
                     )
                 else:
+                    file_pairs = list()
                     for file in file_list:
                         if dest == src:
                             dest_f = file
@@ -456,9 +867,14 @@ class EncodeUtils(object):
                             dest_dir = path.dirname(dest_f)
                             if not path.exists(dest_dir):
                                 makedirs(dest_dir)
-                        convert_rc = self.uss_convert_encoding(
-                            file, dest_f, from_code, to_code
-                        )
+                        file_pairs.append((file, dest_f))
+
+                    converted, failures = self.uss_convert_encoding_files(
+                        file_pairs, from_code, to_code, max_concurrency=max_concurrency
+                    )
+                    if failures:
+                        raise EncodeFilesError(failures, converted)
+                    convert_rc = True
         else:
             if path.isdir(dest):
                 file_name = path.basename(path.abspath(src))
@@ -467,6 +883,51 @@ class EncodeUtils(object):
 
         return convert_rc
 
+    def uss_convert_encoding_files(
+        self, file_pairs, from_code, to_code, max_concurrency=DEFAULT_MAX_CONCURRENCY
+    ):
+        """Convert the encoding of several USS files. A file that fails to
+        convert doesn't stop the rest.
+
+        Conversions done in process hold the GIL, so they run one file at a
+        time. Only conversions that fall back to iconv, which spend their
+        time waiting on a child process, use a bounded pool of workers.
+
+        Parameters
+        ----------
+        file_pairs : list[tuple(str, str)]
+            Input and output paths of each file to convert. Both paths
+            can be the same to convert a file in place.
+        from_code : str
+            The source code set of the input files.
+        to_code : str
+            The destination code set for the output files.
+        max_concurrency : int
+            Maximum number of iconv conversions run at the same time.
+
+        Returns
+        -------
+        tuple(list[str], dict)
+            Output paths of the files that were converted, and a dictionary
+            mapping the input path of each file that failed to its error message.
+        """
+        def convert(file_pair):
+            if not self.uss_convert_encoding(file_pair[0], file_pair[1], from_code, to_code):
+                raise EncodeError("Conversion of {0} failed.".format(file_pair[0]))
+
+        if get_converter(from_code, to_code).supported:
+            max_concurrency = 1
+
+        converted = list()
+        failures = dict()
+        for task in run_concurrently(convert, file_pairs, max_concurrency=max_concurrency):
+            if task.failed:
+                failures[task.item[0]] = getattr(task.error, "msg", str(task.error))
+            else:
+                converted.append(task.item[1])
+
+        return converted, failures
+
     def mvs_convert_encoding(
         self, src, dest, from_code, to_code, src_type=None, dest_type=None, tmphlq=None
     ):
@@ -475,6 +936,11 @@ class EncodeUtils(object):
            2) MVS to USS
            3) MVS to MVS
 
+        Conversions between sequential data sets, members, KSDS and between
+        two PDS/E whose records fit in the destination are done record by
+        record when both code sets are single-byte. Any other conversion
+        stages the data in USS files and converts them.
+
         Parameters
         ----------
         src : str
@@ -505,6 +971,12 @@ class EncodeUtils(object):
         from_code = self._validate_encoding(from_code)
         to_code = self._validate_encoding(to_code)
         convert_rc = False
+        converter = get_converter(from_code, to_code)
+        if converter.single_byte and self._mvs_convert_records(
+            src, dest, converter, src_type, dest_type, tmphlq=tmphlq
+        ):
+            return True
+
         temp_ps = None
         temp_src = src
         temp_dest = dest
@@ -555,8 +1027,7 @@ class EncodeUtils(object):
         except Exception:
             raise
         finally:
-            if temp_ps:
-                datasets.delete(temp_ps)
+            data_set.temp_data_set_pool.release(temp_ps)
             if temp_src and temp_src != src:
                 if os.path.isdir(temp_src):
                     shutil.rmtree(temp_src)
@@ -566,6 +1037,169 @@ class EncodeUtils(object):
 
         return convert_rc
 
+    def _mvs_convert_records(self, src, dest, converter, src_type, dest_type, tmphlq=None):
+        """Convert the encoding of a data set into another one record by record
+        with zoau_io, without staging the data in USS files. Only
+        RECORD_BATCH_SIZE records are held in memory at a time. A KSDS is
+        read or written through a sequential data set with REPRO.
+
+        Parameters
+        ----------
+        src : str
+            The input data set or member.
+        dest : str
+            The output data set or member.
+        converter : CodeSetConverter
+            Converter between two single-byte code sets.
+        src_type : str
+            The input data set type: PS, PO or KSDS.
+        dest_type : str
+            The output data set type: PS, PO or KSDS.
+        tmphlq : str
+            High Level Qualifier for temporary datasets.
+
+        Returns
+        -------
+        bool
+            Whether the data was converted. False when the data sets can't
+            be converted record by record, in which case nothing was written.
+        """
+        if not (src_type == dest_type == "PO") and (
+            src_type not in RECORD_CONVERSION_TYPES or dest_type not in RECORD_CONVERSION_TYPES
+        ):
+            return False
+
+        src_layout = self._get_record_layout(src, src_type, tmphlq=tmphlq)
+        dest_layout = self._get_record_layout(dest, dest_type, tmphlq=tmphlq)
+        if not src_layout or not dest_layout or not self._records_fit(src_layout, dest_layout):
+            return False
+
+        if src_type == "PO":
+            data_set_pairs = [
+                ("{0}({1})".format(src, member), "{0}({1})".format(dest, member))
+                for member in datasets.list_members(src)
+            ]
+        else:
+            data_set_pairs = [(src, dest)]
+
+        temp_data_sets = []
+        try:
+            if src_type == "KSDS":
+                temp_src = self.temp_data_set(src_layout[1], max(src_layout[2], 1))
+                temp_data_sets.append(temp_src)
+                copy.copy_vsam_ps(src.upper(), temp_src, tmphlq=tmphlq)
+                data_set_pairs = [(temp_src, dest)]
+
+            # Records can't be written back while they are being read, so
+            # converting in place goes through a temporary data set too.
+            temp_dest = None
+            if dest_type == "KSDS":
+                temp_dest = self.temp_data_set(dest_layout[1], max(dest_layout[2], 1))
+            elif src.upper() == dest.upper():
+                record_format, record_length, space_u = src_layout
+                if record_format.startswith("F"):
+                    record_length += 4
+                temp_dest = self.temp_data_set(record_length, max(space_u, 1))
+            if temp_dest:
+                temp_data_sets.append(temp_dest)
+
+            for read_name, write_name in data_set_pairs:
+                if not temp_dest:
+                    self._copy_records(read_name, write_name, converter)
+                    continue
+                self._copy_records(read_name, temp_dest, converter)
+                if dest_type == "KSDS":
+                    copy.copy_vsam_ps(temp_dest, dest.upper(), tmphlq=tmphlq)
+                else:
+                    self._copy_records(temp_dest, write_name)
+        finally:
+            for temp_data_set in temp_data_sets:
+                data_set.temp_data_set_pool.release(temp_data_set)
+
+        return True
+
+    def _get_record_layout(self, ds_name, ds_type, tmphlq=None):
+        """Get the layout of the records of a data set or member. A KSDS is
+        described by the sequential data set its records are staged in.
+
+        Parameters
+        ----------
+        ds_name : str
+            The data set or member name.
+        ds_type : str
+            The data set type.
+        tmphlq : str
+            High Level Qualifier for temporary datasets.
+
+        Returns
+        -------
+        tuple(str, int, int)
+            Record format, record length and space of the data set in KB,
+            or None when its records can't be read one by one.
+        """
+        if ds_type == "KSDS":
+            reclen, space_u = self.listdsi_data_set(ds_name.upper(), tmphlq=tmphlq)
+            # RDW takes the first 4 bytes of the records in the VB format.
+            return "VB", reclen + 4, space_u
+
+        data_sets_found = datasets.list_datasets(data_set.extract_dsname(ds_name))
+        if not data_sets_found:
+            return None
+        attributes = data_sets_found[0]
+        record_format = (attributes.record_format or "").upper()
+        if not record_format or record_format.startswith("U") or not attributes.record_length:
+            return None
+        return record_format, attributes.record_length, int(ceil((attributes.total_space or 0) / 1024))
+
+    @staticmethod
+    def _records_fit(src_layout, dest_layout):
+        """Check whether the records of a data set can be written unchanged
+        to another one, keeping the format and length of the destination.
+
+        Parameters
+        ----------
+        src_layout : tuple(str, int, int)
+            Record format, record length and space of the source.
+        dest_layout : tuple(str, int, int)
+            Record format, record length and space of the destination.
+
+        Returns
+        -------
+        bool
+            Whether every record of the source fits in the destination.
+        """
+        src_format, src_length = src_layout[0], src_layout[1]
+        dest_format, dest_length = dest_layout[0], dest_layout[1]
+        if dest_format.startswith("F"):
+            return src_format.startswith("F") and src_length == dest_length
+        if src_format.startswith("F"):
+            # Variable records take 4 more bytes for the RDW.
+            src_length += 4
+        return src_length <= dest_length
+
+    @staticmethod
+    def _copy_records(src, dest, converter=None):
+        """Copy the records of a sequential data set or member to another
+        one, RECORD_BATCH_SIZE records at a time.
+
+        Parameters
+        ----------
+        src : str
+            The input data set or member.
+        dest : str
+            The output data set or member, its content is replaced.
+        converter : CodeSetConverter
+            Converter applied to every record, if any.
+        """
+        with zoau_io.RecordIO("//'{0}'".format(src), "r") as reader:
+            with zoau_io.RecordIO("//'{0}'".format(dest), "w") as writer:
+                records = reader.readrecords(RECORD_BATCH_SIZE)
+                while records:
+                    if converter:
+                        records = [converter.convert(record) for record in records]
+                    writer.writerecords(records)
+                    records = reader.readrecords(RECORD_BATCH_SIZE)
+
     def uss_tag_encoding(self, file_path, tag):
         """Tag the file/directory specified with the given code set.
         If `file_path` is a directory, all of the files and subdirectories will
@@ -590,6 +1224,74 @@ class EncodeUtils(object):
         if rc != 0:
             raise TaggingError(file_path, tag, rc, out, err)
 
+    def uss_tag_encoding_files(self, file_paths, tag):
+        """Tag several files and directories with the given code set using
+        as few chtag invocations as possible. Directories are tagged
+        recursively, like in uss_tag_encoding.
+
+        When a batch fails, its paths are tagged one by one so that
+        only the paths that can't be tagged get reported.
+
+        Parameters
+        ----------
+        file_paths : list[str]
+            Absolute paths to tag.
+        tag : str
+            Code set to tag the files with.
+
+        Returns
+        -------
+        dict
+            Paths that couldn't be tagged, mapped to the error reported by chtag.
+        """
+        files = [file_path for file_path in file_paths if not os.path.isdir(file_path)]
+        dirs = [file_path for file_path in file_paths if os.path.isdir(file_path)]
+        failures = dict()
+
+        for flags, paths in (("-tc", files), ("-Rc", dirs)):
+            for batch in self._split_tag_batches(paths):
+                rc, out, err = self.module.run_command(["chtag", flags, tag] + batch, errors='replace')
+                if rc == 0:
+                    continue
+                if len(batch) == 1:
+                    failures[batch[0]] = err or out
+                    continue
+                for file_path in batch:
+                    rc, out, err = self.module.run_command(["chtag", flags, tag, file_path], errors='replace')
+                    if rc != 0:
+                        failures[file_path] = err or out
+
+        return failures
+
+    @staticmethod
+    def _split_tag_batches(file_paths):
+        """Split a list of paths into batches short enough for one chtag call.
+
+        Parameters
+        ----------
+        file_paths : list[str]
+            Paths to split.
+
+        Returns
+        -------
+        list[list[str]]
+            Batches of paths.
+        """
+        batches = list()
+        batch = list()
+        batch_length = 0
+        for file_path in file_paths:
+            if batch and batch_length + len(file_path) + 1 > TAG_BATCH_LENGTH:
+                batches.append(batch)
+                batch = list()
+                batch_length = 0
+            batch.append(file_path)
+            batch_length += len(file_path) + 1
+
+        if batch:
+            batches.append(batch)
+        return batches
+
     def uss_file_tag(self, file_path):
         """Returns the current tag set for a file.
 
@@ -642,6 +1344,36 @@ class EncodeError(Exception):
         super(EncodeError, self).__init__(self.msg)
 
 
+class EncodeFilesError(EncodeError):
+    def __init__(self, failures, converted=None):
+        """Error during the encoding of some of the files inside a directory.
+
+        Parameters
+        ----------
+        failures : dict
+            Paths of the files that failed, mapped to their error messages.
+        converted : list[str]
+            Paths of the files that were converted.
+
+        Attributes
+        ----------
+        msg : str
+            Human readable string describing the exception.
+        failures : dict
+            Paths of the files that failed, mapped to their error messages.
+        converted : list[str]
+            Paths of the files that were converted.
+        """
+        self.failures = failures
+        self.converted = converted or []
+        super(EncodeFilesError, self).__init__(
+            "{0} file(s) could not be converted: {1}".format(
+                len(failures),
+                "; ".join("{0}: {1}".format(file_path, message) for file_path, message in sorted(failures.items()))
+            )
+        )
+
+
 class TaggingError(Exception):
     def __init__(self, file_path, tag, rc, stdout, stderr):
         """Error during tagging.
@@ -0,0 +1,155 @@
+# Copyright (c) IBM Corporation 2026
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#     http://www.apache.org/licenses/LICENSE-2.0
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from __future__ import absolute_import, division, print_function
+
+__metaclass__ = type
+
+import os
+
+from hashlib import sha256
+
+from ansible_collections.ibm.ibm_zos_core.plugins.module_utils.encode import get_codec
+
+# Content fingerprints used to sync a local directory against its
+# destination. The action plugins build the manifest of the local tree and
+# the modules compare it with what is already in the managed node, so this
+# module is imported on both sides.
+
+
+def text_fingerprint(text):
+    """Computes the size and SHA-256 digest of decoded text content, so the
+    same text has the same fingerprint whatever code set it's stored in.
+    The text is taken as is, line endings and blanks included, which is what
+    a USS destination receives.
+
+    Parameters
+    ----------
+    text : str
+        Content, already decoded.
+
+    Returns
+    -------
+    list
+        Size in bytes and hex digest of the UTF-8 content.
+    """
+    return binary_fingerprint(text.encode("utf-8"))
+
+
+def record_fingerprint(lines):
+    """Computes the size and SHA-256 digest of text content the way it looks
+    once written to the records of a data set. Line endings and trailing
+    blanks are dropped, as well as trailing empty lines, since fixed length
+    records pad them and a data set can't tell them apart.
+
+    Parameters
+    ----------
+    lines : iterable[str]
+        Lines of the content, already decoded.
+
+    Returns
+    -------
+    list
+        Size in bytes and hex digest of the normalized UTF-8 content.
+    """
+    normalized = [line.rstrip("\r\n ") for line in lines]
+    while normalized and not normalized[-1]:
+        normalized.pop()
+    content = "\n".join(normalized).encode("utf-8")
+    return [len(content), sha256(content).hexdigest()]
+
+
+def binary_fingerprint(data):
+    """Computes the size and SHA-256 digest of binary content.
+
+    Parameters
+    ----------
+    data : bytes
+        Content to fingerprint.
+
+    Returns
+    -------
+    list
+        Size in bytes and hex digest of the content.
+    """
+    return [len(data), sha256(data).hexdigest()]
+
+
+def file_fingerprint(path, charset=None, binary=False, records=False):
+    """Computes the fingerprint of a file, decoding it with charset when it
+    holds text.
+
+    Parameters
+    ----------
+    path : str
+        Path of the file.
+    charset : str
+        Charset of the file when it holds text.
+    binary : bool
+        Whether to fingerprint the raw bytes of the file.
+    records : bool
+        Whether to fingerprint the text the way it's written to data set
+        records instead of exactly.
+
+    Returns
+    -------
+    list
+        Size and digest of the file, or None when it can't be decoded.
+    """
+    with open(path, "rb") as infile:
+        data = infile.read()
+
+    if binary:
+        return binary_fingerprint(data)
+
+    codec = get_codec(charset)
+    if codec is None:
+        return None
+    try:
+        text = codec.decode(data)[0]
+    except UnicodeError:
+        return None
+    if records:
+        return record_fingerprint(text.splitlines())
+    return text_fingerprint(text)
+
+
+def build_manifest(src_dir, charset=None, binary=False, records=False):
+    """Builds the manifest of a directory tree used to sync it against a
+    destination.
+
+    Parameters
+    ----------
+    src_dir : str
+        Directory to walk.
+    charset : str
+        Charset of the files when they hold text.
+    binary : bool
+        Whether to fingerprint the raw bytes of the files.
+    records : bool
+        Whether the destination is a data set, whose records pad lines.
+
+    Returns
+    -------
+    dict
+        Relative path of every file mapped to its size and digest. Files that
+        can't be fingerprinted are mapped to None so they're always copied.
+    """
+    manifest = {}
+    for root, dirs, files in os.walk(src_dir, followlinks=True):
+        for name in files:
+            file_path = os.path.join(root, name)
+            relative_path = os.path.relpath(file_path, src_dir)
+            try:
+                manifest[relative_path] = file_fingerprint(file_path, charset, binary, records)
+            except (IOError, OSError):
+                manifest[relative_path] = None
+    return manifest
@@ -14,7 +14,9 @@ from __future__ import absolute_import, division, print_function
 __metaclass__ = type
 
 import fnmatch
+import io
 import re
+import threading
 import traceback
 from time import sleep
 from timeit import default_timer as timer
@@ -22,6 +24,7 @@ from timeit import default_timer as timer
 # when a job's output has non-printable chars that conflict with JSON's control
 # chars.
 from json import JSONDecodeError
+from ansible_collections.ibm.ibm_zos_core.plugins.module_utils import concurrency
 from ansible_collections.ibm.ibm_zos_core.plugins.module_utils.better_arg_parser import (
     BetterArgParser,
 )
@@ -57,8 +60,345 @@ JOB_ERROR_STATUSES = frozenset(["ABEND",      # ZOAU job ended abnormally
                                 "FLU"         # ZOAU job was flushed
                                 ])
 
+# DD written by JES2 whose first lines carry the system and node that ran the job.
+JES2_HEADER_DD = "JESMSGLG"
+# DD with the allocation messages where steps report their condition codes.
+JES2_SYSTEM_MESSAGES_DD = "JESYSMSG"
+# IDs of the JES2 and system messages indexed in a job log, and how many are
+# kept so a chatty job doesn't make the result grow without bounds.
+JOB_LOG_MAX_MESSAGES = 100
+JOB_LOG_MESSAGE_ID = re.compile(r"(?<![\w$])(\$HASP\d{3}|IE[AF]\d{3,4}[A-Z])(?!\w)")
+# Step that ended abnormally, as reported by IEF450I, with its system and user abend codes.
+JOB_LOG_ABEND = re.compile(r"(\S+)\s+-\s+ABEND=(S[0-9A-F]{3})\s+(U\d{4})")
+
+
+class DDContentSelection(object):
+    MODES = frozenset(["full", "none", "head", "tail", "bytes", "match"])
+
+    def __init__(self, mode="full", lines=None, start=None, end=None, pattern=None):
+        """Part of the content of each DD that a job query returns.
+
+        Parameters
+        ----------
+        mode : str
+            One of:
+            'full'
+                Every line of the DD.
+            'none'
+                No content, only the metadata of the DD. Its content isn't read.
+            'head'
+                The first lines of the DD.
+            'tail'
+                The last lines of the DD.
+            'bytes'
+                The lines of the content between two byte offsets of its
+                UTF-8 encoding.
+            'match'
+                The lines that match a regular expression.
+        lines : int
+            Number of lines for 'head' and 'tail'.
+        start : int
+            Byte offset where the content begins for 'bytes', 0 when None.
+        end : int
+            Byte offset where the content ends for 'bytes', the end of the
+            DD when None.
+        pattern : str
+            Regular expression lines have to match for 'match'.
+
+        Raises
+        ------
+        ValueError
+            When the mode is unknown or lacks the values it needs.
+        """
+        mode = (mode or "full").lower()
+        if mode not in DDContentSelection.MODES:
+            raise ValueError("Unknown DD content mode {0}.".format(mode))
+        if mode in ("head", "tail") and (lines is None or lines < 0):
+            raise ValueError("DD content mode {0} needs a number of lines.".format(mode))
+        if mode == "bytes" and ((start or 0) < 0 or (end is not None and end < (start or 0))):
+            raise ValueError("DD content mode bytes needs a valid range.")
+        if mode == "match" and not pattern:
+            raise ValueError("DD content mode match needs a pattern.")
+
+        self.mode = mode
+        self.lines = lines
+        self.start = start or 0
+        self.end = end
+        self.regex = re.compile(pattern) if mode == "match" else None
+
+    @property
+    def reads_content(self):
+        """Whether the content of the DDs has to be read at all."""
+        return self.mode != "none"
+
+    def select(self, text):
+        """Pick the selected part of the content of a DD.
+
+        Only the selected lines are split out of the text, so a small part of
+        a large DD never gets turned into a list with every one of its lines.
+
+        Parameters
+        ----------
+        text : str
+            Content of the DD.
+
+        Returns
+        -------
+        list[str]
+            Selected lines.
+        None
+            When the mode is 'none'.
+        """
+        if self.mode == "none":
+            return None
+        if self.mode == "full":
+            return text.split("\n")
+        if self.mode == "head":
+            return text.split("\n", self.lines)[:self.lines] if self.lines else []
+        if self.mode == "tail":
+            return text.rstrip("\n").rsplit("\n", self.lines)[-self.lines:] if self.lines else []
+        if self.mode == "bytes":
+            # Characters cut in half by an offset are left out.
+            content = text.encode("utf-8")[self.start:self.end]
+            return content.decode("utf-8", errors="ignore").split("\n")
+        return [line.rstrip("\n") for line in io.StringIO(text) if self.regex.search(line)]
+
+
+class CompletionPoller(object):
+    INITIAL_INTERVAL = 0.2
+    BACKOFF_FACTOR = 2
+    MAX_INTERVAL = 5
+
+    def __init__(
+        self,
+        timeout,
+        start_time=None,
+        initial_interval=INITIAL_INTERVAL,
+        backoff_factor=BACKOFF_FACTOR,
+        max_interval=MAX_INTERVAL
+    ):
+        """Paces the polls made while waiting for a job to reach a state.
+
+        The first polls come quickly so short jobs are seen as soon as they
+        finish, then the interval grows exponentially up to max_interval so
+        long running jobs aren't polled needlessly. Every wait is cut short
+        so the poller never sleeps past the timeout.
+
+        Parameters
+        ----------
+        timeout : int
+            Seconds since start_time after which polling stops.
+        start_time : float
+            Time the wait started at, now when None.
+        initial_interval : float
+            Seconds to wait before the first poll.
+        backoff_factor : float
+            Factor the interval grows by after every poll.
+        max_interval : float
+            Longest interval between two polls.
+        """
+        self.timeout = timeout
+        self.start_time = timer() if start_time is None else start_time
+        self.initial_interval = initial_interval
+        self.backoff_factor = backoff_factor
+        self.max_interval = max_interval
+        self.interval = initial_interval
+        self.polls = 0
+        self.wait_time = 0.0
+        self._lock = threading.Lock()
+
+    @property
+    def duration(self):
+        """Whole seconds elapsed since the wait started."""
+        return round(timer() - self.start_time)
+
+    def wait(self):
+        """Sleep until the next poll is due.
+
+        Returns
+        -------
+        bool
+            True when the caller should poll again, False when the timeout
+            was reached and no time was spent waiting.
+        """
+        remaining = self.timeout - (timer() - self.start_time)
+        if remaining <= 0:
+            return False
+
+        with self._lock:
+            interval = min(self.interval, remaining)
+            self.interval = min(self.interval * self.backoff_factor, self.max_interval)
+            self.polls += 1
+            self.wait_time += interval
+        sleep(interval)
+        return True
+
+    def pause(self, seconds=1):
+        """Sleep a fixed number of seconds, counted like any other wait.
+
+        Used for the single probe still made when there's no timeout to
+        wait for, as a job that was just submitted may not be visible yet.
+
+        Parameters
+        ----------
+        seconds : float
+            Seconds to sleep.
+        """
+        with self._lock:
+            self.polls += 1
+            self.wait_time += seconds
+        sleep(seconds)
+
+    def reset(self):
+        """Go back to fast polls, keeping the counters, when waiting for a new state."""
+        with self._lock:
+            self.interval = self.initial_interval
+
+    def stats(self):
+        """Cost of the polling done so far.
+
+        Returns
+        -------
+        dict
+            Number of polls made and seconds spent waiting between them.
+        """
+        return dict(polls=self.polls, wait_time=round(self.wait_time, 3))
+
+
+class JobLogIndex(object):
+    def __init__(self, max_messages=JOB_LOG_MAX_MESSAGES):
+        """Steps, condition codes, abend codes and message IDs found in the
+        JES2 DDs of a job.
+
+        Each DD is walked once, line by line, so the rest of the module reads
+        job level information from the index instead of scanning the text of
+        the DDs again.
+
+        Parameters
+        ----------
+        max_messages : int
+            Most message IDs kept, the first ones found are.
+
+        Attributes
+        ----------
+        system : str
+            System that ran the job, from the JES2 job log header.
+        node : str
+            Node that ran the job, from the JES2 job log header.
+        steps : list[dict]
+            Steps that were executed with their condition code, the DD and
+            the line that reported them.
+        abends : list[dict]
+            Steps that ended abnormally with their abend code, the DD and the
+            line that reported them.
+        messages : list[dict]
+            ID of the first IEF, IEA and $HASP messages with the DD and the
+            line they were found in.
+        messages_truncated : bool
+            Whether messages were left out because there were more than
+            max_messages.
+        """
+        self.system = None
+        self.node = None
+        self.steps = []
+        self.abends = []
+        self.messages = []
+        self.messages_truncated = False
+        self.max_messages = max_messages
+
+    def scan(self, dd_name, text):
+        """Add what's found in the content of a DD to the index.
+
+        Parameters
+        ----------
+        dd_name : str
+            Name of the DD.
+        text : str
+            Content of the DD.
+        """
+        for number, line in enumerate(io.StringIO(text)):
+            # JES2 writes the system and node that ran the job in the header
+            # at the top of its job log.
+            if dd_name == JES2_HEADER_DD and number < 5:
+                self._scan_header(line)
+
+            match = JOB_LOG_MESSAGE_ID.search(line)
+            if match is not None:
+                if len(self.messages) < self.max_messages:
+                    self.messages.append(dict(msg_id=match.group(1), dd_name=dd_name, line=number))
+                else:
+                    self.messages_truncated = True
+
+            if " - STEP WAS EXECUTED - " in line:
+                before, after = line.split(" - STEP WAS EXECUTED - ", 1)
+                code = after.split()[-1] if after.split() else ""
+                self.steps.append(dict(
+                    step_name=before.split()[-1],
+                    step_cc=int(code) if code.isdigit() else None,
+                    dd_name=dd_name,
+                    line=number
+                ))
+                continue
+
+            abend = JOB_LOG_ABEND.search(line) if "ABEND=" in line else None
+            if abend is not None:
+                step_name, system_code, user_code = abend.groups()
+                self.abends.append(dict(
+                    step_name=step_name,
+                    abend_code=user_code if system_code == "S000" else system_code,
+                    dd_name=dd_name,
+                    line=number
+                ))
+
+    def _scan_header(self, line):
+        """Get the system and node from a line of the JES2 job log header."""
+        if self.system is None and "--  S Y S T E M  " in line:
+            tmptext = line.split("--  S Y S T E M  ")[1]
+            self.system = (tmptext.split("--", 1)[0]).replace(" ", "").strip()
+        if self.node is None and "--  N O D E " in line:
+            tmptext = line.split("--  N O D E ")[1]
+            self.node = tmptext.replace(" ", "").strip()
+
+    def step_results(self):
+        """Steps in the format returned by the job modules.
+
+        Returns
+        -------
+        list[dict]
+            Name and condition code of every step that was executed.
+        """
+        return [dict(step_name=step["step_name"], step_cc=step["step_cc"]) for step in self.steps]
+
+    def to_dict(self):
+        """Index in the format returned by the job modules.
+
+        Returns
+        -------
+        dict
+            Steps, abends and messages found and whether messages were left out.
+        """
+        return dict(
+            steps=self.steps,
+            abends=self.abends,
+            messages=self.messages,
+            messages_truncated=self.messages_truncated
+        )
+
 
-def job_output(job_id=None, owner=None, job_name=None, dd_name=None, sysin=False, dd_scan=True, duration=0, timeout=0, start_time=timer()):
+def job_output(
+    job_id=None,
+    owner=None,
+    job_name=None,
+    dd_name=None,
+    sysin=False,
+    dd_scan=True,
+    duration=0,
+    timeout=0,
+    start_time=timer(),
+    dd_content=None,
+    max_concurrency=concurrency.DEFAULT_MAX_CONCURRENCY,
+    poller=None
+):
     """Get the output from a z/OS job based on various search criteria.
 
     Keyword Parameters
@@ -81,6 +421,15 @@ def job_output(job_id=None, owner=None, job_name=None, dd_name=None, sysin=False
         How long to wait in seconds for a job to complete.
     start_time : int
         Time the JCL started its submission.
+    dd_content : DDContentSelection
+        Part of the content of each DD to return, every line when None.
+    max_concurrency : int
+        Maximum number of calls to JES2 running at the same time. Jobs are
+        collected concurrently when many match, and the DDs of a job are read
+        concurrently when only one does.
+    poller : CompletionPoller
+        Paces the polls made while waiting for the job and its DDs, one
+        bound to timeout and start_time is used when None.
 
     Returns
     -------
@@ -117,7 +466,10 @@ def job_output(job_id=None, owner=None, job_name=None, dd_name=None, sysin=False
         sysin=sysin,
         dd_scan=dd_scan,
         timeout=timeout,
-        start_time=start_time
+        start_time=start_time,
+        dd_content=dd_content,
+        max_concurrency=max_concurrency,
+        poller=poller
     )
 
     if len(job_detail) == 0:
@@ -135,7 +487,10 @@ def job_output(job_id=None, owner=None, job_name=None, dd_name=None, sysin=False
             dd_scan=dd_scan,
             duration=duration,
             timeout=timeout,
-            start_time=start_time
+            start_time=start_time,
+            dd_content=dd_content,
+            max_concurrency=max_concurrency,
+            poller=poller
         )
     return job_detail
 
@@ -216,7 +571,7 @@ def _job_not_found(job_id, owner, job_name, dd_name):
     return jobs
 
 
-def job_status(job_id=None, owner=None, job_name=None, dd_name=None):
+def job_status(job_id=None, owner=None, job_name=None, dd_name=None, include_extended=True):
     """Get the status information of a z/OS job based on various search criteria.
 
     Keyword Parameters
@@ -231,6 +586,9 @@ def job_status(job_id=None, owner=None, job_name=None, dd_name=None):
         If populated, return ONLY this DD in the job list (default: {None})
         note: no routines call job_status with dd_name, so we are speeding this routine with
         'dd_scan=False'.
+    include_extended : bool
+        Whether to fetch the extended information of the jobs, like the
+        program name, callers that only need their status can skip it.
 
     Returns
     -------
@@ -260,6 +618,7 @@ def job_status(job_id=None, owner=None, job_name=None, dd_name=None):
         owner=owner,
         job_name=job_name,
         dd_scan=False,
+        include_extended=include_extended,
     )
 
     if len(job_status_result) == 0:
@@ -272,39 +631,83 @@ def job_status(job_id=None, owner=None, job_name=None, dd_name=None):
             owner=owner,
             job_name=job_name,
             dd_scan=False,
+            include_extended=include_extended,
         )
 
     return job_status_result
 
 
-def _parse_steps(job_str):
-    """Parse the dd section of output to retrieve step-wise CC's.
+def _pushdown_pattern(pattern):
+    """Pattern JES can filter jobs by for a job name pattern.
+
+    Only the literal prefix of the pattern is handed to JES, followed by a
+    wildcard when the pattern had more to it, since wildcards placed anywhere
+    else aren't honored by every release of ZOAU.
 
     Parameters
     ----------
-    job_str : str
-        The content for a given dd.
+    pattern : str
+        Job name pattern, with wildcards.
 
     Returns
     -------
-    Union[dict]
-        A list of step names listed as "step executed" the related CC.
+    str
+        Pattern for JES, None when it would list every job anyway.
     """
-    stp = []
-    if "STEP WAS EXECUTED" in job_str:
-        steps = re.findall(
-            r"(.*?)\s-\sSTEP\sWAS\sEXECUTED\s-\s(.*?)\n", job_str)
-        for match in steps:
-            st = {
-                "step_name": match[0].split()[-1],
-                "step_cc": int(match[1].split()[-1]) if match[1].split()[-1] is not None else None,
-            }
-            stp.append(st)
+    if not pattern:
+        return None
+    prefix = re.split(r"[*?]", pattern, 1)[0]
+    if not prefix:
+        return None
+    return prefix if prefix == pattern else prefix + "*"
+
 
-    return stp
+def _read_dd_content(job_id, step_name, dd_name):
+    """Read the content of a DD of a job.
+
+    Parameters
+    ----------
+    job_id : str
+        ID of the job.
+    step_name : str
+        Step the DD belongs to.
+    dd_name : str
+        Name of the DD.
+
+    Returns
+    -------
+    str
+        Content of the DD, or a message telling the user it couldn't be read.
+    """
+    # In case ZOAU fails when reading the job output, we'll add a
+    # message to the user telling them of this. ZOAU cannot read
+    # partial output from a job, so we have to make do with nothing
+    # from this step if it fails.
+    try:
+        return jobs.read_output(job_id, step_name, dd_name)
+    except (UnicodeDecodeError, JSONDecodeError, TypeError, KeyError) as e:
+        error_type = e.__class__.__name__
+        return (
+            f"Non-printable UTF-8 characters were present in this output, a {error_type} error has occurred."
+            "Please access the content from the job log."
+        )
 
 
-def _get_job_status(job_id="*", owner="*", job_name="*", dd_name=None, sysin=False, dd_scan=True, duration=0, timeout=0, start_time=timer()):
+def _get_job_status(
+    job_id="*",
+    owner="*",
+    job_name="*",
+    dd_name=None,
+    sysin=False,
+    dd_scan=True,
+    duration=0,
+    timeout=0,
+    start_time=timer(),
+    dd_content=None,
+    max_concurrency=concurrency.DEFAULT_MAX_CONCURRENCY,
+    poller=None,
+    include_extended=True
+):
     """Get job status.
 
     Parameters
@@ -327,6 +730,18 @@ def _get_job_status(job_id="*", owner="*", job_name="*", dd_name=None, sysin=Fal
         How long to wait in seconds for a job to complete.
     start_time : int
         Time the JCL started its submission.
+    dd_content : DDContentSelection
+        Part of the content of each DD to return, every line when None.
+    max_concurrency : int
+        Maximum number of calls to JES2 running at the same time. Jobs are
+        collected concurrently when many match, and the DDs of a job are read
+        concurrently when only one does.
+    poller : CompletionPoller
+        Paces the polls made while waiting for the job and its DDs, one
+        bound to timeout and start_time is used when None.
+    include_extended : bool
+        Whether to fetch the extended information of the jobs, like the
+        program name, which takes JES longer to gather.
 
     Returns
     -------
@@ -343,18 +758,35 @@ def _get_job_status(job_id="*", owner="*", job_name="*", dd_name=None, sysin=Fal
 
     final_entries = []
 
-    # In ZOAU>= 1.3.0, include_extended has to be set to true so we get the program name for a job.
-    # Observation shows the job_name parameter is not being used, so we will drop that
-
-    # expanding > 1.3.0 of zoau, to include all params
-    entries = jobs.fetch_multiple(job_id=job_id_temp, job_owner=owner, include_extended=True)
-
-    while ((entries is None or len(entries) == 0) and duration <= timeout):
-        current_time = timer()
-        duration = round(current_time - start_time)
-        sleep(1)
-        entries = jobs.fetch_multiple(job_id=job_id_temp, job_owner=owner, include_extended=True)
+    # JES filters the jobs by the literal prefix of the job name so the whole
+    # spool of an owner isn't listed to find a few jobs, the exact pattern is
+    # still matched below.
+    query = dict(job_id=job_id_temp, job_owner=owner)
+    job_name_prefix = _pushdown_pattern(job_name)
+    if job_name_prefix is not None:
+        query["job_name"] = job_name_prefix
 
+    # In ZOAU>= 1.3.0, include_extended has to be set to true so we get the program name for a job.
+    entries = jobs.fetch_multiple(include_extended=include_extended, **query)
+
+    if not entries:
+        # Wait for the job to show up with a status only probe, the extended
+        # information is fetched once, when there's something to fetch.
+        poller = poller or CompletionPoller(timeout, start_time)
+        poller.reset()
+        if timeout == 0:
+            # Without a timeout the job still gets one more probe, a job
+            # that was just submitted may not be listed yet.
+            poller.pause()
+            duration = poller.duration
+            entries = jobs.fetch_multiple(**query)
+        while not entries and poller.wait():
+            duration = poller.duration
+            entries = jobs.fetch_multiple(**query)
+        if entries and include_extended:
+            entries = jobs.fetch_multiple(include_extended=True, **query)
+
+    selected_entries = []
     if entries:
         for entry in entries:
             if owner != "*":
@@ -367,175 +799,261 @@ def _get_job_status(job_id="*", owner="*", job_name="*", dd_name=None, sysin=Fal
                 if not fnmatch.fnmatch(entry.job_id, job_id):
                     continue
 
-            job = {}
-            job["job_id"] = entry.job_id
-            job["job_name"] = entry.name
-            job["subsystem"] = None
-            job["system"] = None
-            job["owner"] = entry.owner
-            job["cpu_time"] = None
-            job["execution_node"] = None
-            job["origin_node"] = None
-            # Sometimes, with job type STC, the first entry will have an extra
-            # space at the end of it.
-            job["content_type"] = entry.job_type.strip()
-
-            # From v1.3.0, ZOAU sets unavailable job fields as None, instead of '?'.
-            job["ret_code"] = {}
-            job["ret_code"]["msg"] = entry.status
-            job["ret_code"]["msg_code"] = entry.return_code
-            job["ret_code"]["code"] = None
-            if entry.return_code and len(entry.return_code) > 0:
-                if entry.return_code.isdigit():
-                    job["ret_code"]["code"] = int(entry.return_code)
-            job["ret_code"]["msg_txt"] = entry.status
-
-            # Beginning in ZOAU v1.3.0, the Job class changes svc_class to service_class.
-            job["svc_class"] = entry.service_class
-            job["job_class"] = entry.job_class
-            job["priority"] = entry.priority
-            job["asid"] = entry.asid
-            job["creation_date"] = str(entry.creation_datetime)[0:10]
-            job["creation_time"] = str(entry.creation_datetime)[12:]
-            job["queue_position"] = entry.queue_position
-            job["program_name"] = entry.program_name
-            job["class"] = None
-            job["steps"] = []
-            job["dds"] = []
-            job["duration"] = duration
-            if hasattr(entry, "execution_time"):
-                job["execution_time"] = entry.execution_time
-            if hasattr(entry, "system"):
-                job["system"] = entry.system
-            if hasattr(entry, "subsystem"):
-                job["subsystem"] = entry.subsystem
-            if hasattr(entry, "cpu_time"):
-                job["cpu_time"] = entry.cpu_time
-            if hasattr(entry, "execution_node"):
-                job["execution_node"] = entry.execution_node
-            if hasattr(entry, "origin_node"):
-                job["origin_node"] = entry.origin_node
-
-            if dd_scan:
-                # If true, it means the job is not ready for DD queries and the duration and
-                # timeout should apply here instructing the user to add more time
-                is_dd_query_exception = False
-                is_jesjcl = False
-                list_of_dds = []
-
-                try:
-                    list_of_dds = jobs.list_dds(entry.job_id, sysin=sysin)
-                except exceptions.DDQueryException:
-                    is_dd_query_exception = True
-
-                # Check if the Job has JESJCL, if not, its in the JES INPUT queue, thus wait the full wait_time_s.
-                # Idea here is to force a TYPRUN{HOLD|JCLHOLD|COPY} job to go the full wait duration since we have
-                # currently no way to detect them, but if we know the job is one of the JOB_ERROR_STATUS lets
-                # exit the wait time supplied as we know it is a job failure.
-                is_jesjcl = True if search_dictionaries("dd_name", "JESJCL", list_of_dds) else False
-                is_job_error_status = True if entry.status in JOB_ERROR_STATUSES else False
-
-                while ((list_of_dds is None or len(list_of_dds) == 0 or is_dd_query_exception) and
-                        (not is_jesjcl and not is_job_error_status and duration <= timeout)):
-                    current_time = timer()
-                    duration = round(current_time - start_time)
-                    sleep(1)
-                    try:
-                        # Note, in the event of an exception, eg job has TYPRUN=HOLD
-                        # list_of_dds will still be populated with valuable content
-                        list_of_dds = jobs.list_dds(entry.job_id, sysin=sysin)
-                        is_jesjcl = True if search_dictionaries("dd_name", "JESJCL", list_of_dds) else False
-                        is_job_error_status = True if entry.status in JOB_ERROR_STATUSES else False
-                    except exceptions.DDQueryException:
-                        is_dd_query_exception = True
-                        continue
-
-                job["duration"] = duration
-                for single_dd in list_of_dds:
-
-                    dd = {}
-
-                    if "dd_name" not in single_dd:
-                        continue
-
-                    # If dd_name not None, only that specific dd_name should be returned
-                    if dd_name is not None:
-                        if dd_name not in single_dd["dd_name"]:
-                            continue
-                        else:
-                            dd["dd_name"] = single_dd["dd_name"]
-
-                    if "records" in single_dd:
-                        dd["record_count"] = single_dd["records"]
-                    else:
-                        dd["record_count"] = None
-
-                    if "dsid" in single_dd:
-                        dd["id"] = single_dd["dsid"]
-                    else:
-                        dd["id"] = "?"
-
-                    if "step_name" in single_dd:
-                        dd["stepname"] = single_dd["step_name"]
-                    else:
-                        dd["stepname"] = None
-
-                    if "procstep" in single_dd:
-                        dd["procstep"] = single_dd["procstep"]
-                    else:
-                        dd["procstep"] = None
-
-                    if "bytes" in single_dd:
-                        dd["byte_count"] = single_dd["bytes"]
-                    else:
-                        dd["byte_count"] = 0
-
-                    tmpcont = None
-                    if "step_name" in single_dd:
-                        if "dd_name" in single_dd:
-                            # In case ZOAU fails when reading the job output, we'll add a
-                            # message to the user telling them of this. ZOAU cannot read
-                            # partial output from a job, so we have to make do with nothing
-                            # from this step if it fails.
-                            try:
-                                tmpcont = jobs.read_output(
-                                    entry.job_id,
-                                    single_dd["step_name"],
-                                    single_dd["dd_name"]
-                                )
-                            except (UnicodeDecodeError, JSONDecodeError, TypeError, KeyError) as e:
-                                error_type = e.__class__.__name__
-                                tmpcont = (
-                                    f"Non-printable UTF-8 characters were present in this output, a {error_type} error has occurred."
-                                    "Please access the content from the job log."
-                                )
-
-                    dd["content"] = tmpcont.split("\n")
-
-                    job["steps"].extend(_parse_steps(tmpcont))
-
-                    job["dds"].append(dd)
-                    if job["class"] is None:
-                        job["class"] = entry.job_class
-
-                    if job["system"] is None:
-                        if "--  S Y S T E M  " in tmpcont:
-                            tmptext = tmpcont.split("--  S Y S T E M  ")[1]
-                            job["system"] = (tmptext.split(
-                                "--", 1)[0]).replace(" ", "")
-
-                    if job["subsystem"] is None:
-                        if "--  N O D E " in tmpcont:
-                            tmptext = tmpcont.split("--  N O D E ")[1]
-                            job["subsystem"] = (tmptext.split("\n")[
-                                                0]).replace(" ", "")
-
-            final_entries.append(job)
+            selected_entries.append(entry)
+
+        # Jobs are collected at the same time when there's more than one, their DDs
+        # are read at the same time otherwise, so there are never more than
+        # max_concurrency calls to JES2 running.
+        job_concurrency = max_concurrency if len(selected_entries) > 1 else 1
+        dd_concurrency = max_concurrency if len(selected_entries) == 1 else 1
+        for task in concurrency.run_concurrently(
+            lambda entry: _build_job(
+                entry,
+                dd_name=dd_name,
+                sysin=sysin,
+                dd_scan=dd_scan,
+                duration=duration,
+                timeout=timeout,
+                start_time=start_time,
+                selection=dd_content or DDContentSelection(),
+                max_concurrency=dd_concurrency,
+                # Every job waits for its DDs with its own poller, a poller is
+                # only shared when a single job is built.
+                poller=poller if len(selected_entries) == 1 else None
+            ),
+            selected_entries,
+            max_concurrency=job_concurrency
+        ):
+            if task.failed:
+                raise task.error
+            final_entries.append(task.result)
     if not final_entries:
         final_entries = _job_not_found(job_id, owner, job_name, "unavailable")
     return final_entries
 
 
+def _build_job(entry, dd_name, sysin, dd_scan, duration, timeout, start_time, selection, max_concurrency, poller=None):
+    """Build the information returned for a job, reading its DDs.
+
+    Parameters
+    ----------
+    entry : zoautil_py.ztypes.Job
+        Job as returned by ZOAU.
+    dd_name : str
+        The data definition to retrieve.
+    sysin : bool
+        The input DD SYSIN.
+    dd_scan : bool
+        Whether or not to pull information from the dd's for this job.
+    duration : int
+        The time the submitted job ran for.
+    timeout : int
+        How long to wait in seconds for a job to complete.
+    start_time : int
+        Time the JCL started its submission.
+    selection : DDContentSelection
+        Part of the content of each DD to return.
+    max_concurrency : int
+        Maximum number of DDs read at the same time.
+    poller : CompletionPoller
+        Paces the polls made while waiting for the DDs of the job, one
+        bound to timeout and start_time is used when None.
+
+    Returns
+    -------
+    dict
+        The output information of the job.
+    """
+    job = {}
+    job["job_id"] = entry.job_id
+    job["job_name"] = entry.name
+    job["subsystem"] = None
+    job["system"] = None
+    job["owner"] = entry.owner
+    job["cpu_time"] = None
+    job["execution_node"] = None
+    job["origin_node"] = None
+    # Sometimes, with job type STC, the first entry will have an extra
+    # space at the end of it.
+    job["content_type"] = entry.job_type.strip()
+
+    # From v1.3.0, ZOAU sets unavailable job fields as None, instead of '?'.
+    job["ret_code"] = {}
+    job["ret_code"]["msg"] = entry.status
+    job["ret_code"]["msg_code"] = entry.return_code
+    job["ret_code"]["code"] = None
+    if entry.return_code and len(entry.return_code) > 0:
+        if entry.return_code.isdigit():
+            job["ret_code"]["code"] = int(entry.return_code)
+    job["ret_code"]["msg_txt"] = entry.status
+
+    # Beginning in ZOAU v1.3.0, the Job class changes svc_class to service_class.
+    job["svc_class"] = entry.service_class
+    job["job_class"] = entry.job_class
+    job["priority"] = entry.priority
+    job["asid"] = entry.asid
+    job["creation_date"] = str(entry.creation_datetime)[0:10]
+    job["creation_time"] = str(entry.creation_datetime)[12:]
+    job["queue_position"] = entry.queue_position
+    job["program_name"] = getattr(entry, "program_name", None)
+    job["class"] = None
+    job["steps"] = []
+    job["dds"] = []
+    job["duration"] = duration
+    if hasattr(entry, "execution_time"):
+        job["execution_time"] = entry.execution_time
+    if hasattr(entry, "system"):
+        job["system"] = entry.system
+    if hasattr(entry, "subsystem"):
+        job["subsystem"] = entry.subsystem
+    if hasattr(entry, "cpu_time"):
+        job["cpu_time"] = entry.cpu_time
+    if hasattr(entry, "execution_node"):
+        job["execution_node"] = entry.execution_node
+    if hasattr(entry, "origin_node"):
+        job["origin_node"] = entry.origin_node
+
+    if dd_scan:
+        # If true, it means the job is not ready for DD queries and the duration and
+        # timeout should apply here instructing the user to add more time
+        is_dd_query_exception = False
+        is_jesjcl = False
+        list_of_dds = []
+
+        try:
+            list_of_dds = jobs.list_dds(entry.job_id, sysin=sysin)
+        except exceptions.DDQueryException:
+            is_dd_query_exception = True
+
+        # Check if the Job has JESJCL, if not, its in the JES INPUT queue, thus wait the full wait_time_s.
+        # Idea here is to force a TYPRUN{HOLD|JCLHOLD|COPY} job to go the full wait duration since we have
+        # currently no way to detect them, but if we know the job is one of the JOB_ERROR_STATUS lets
+        # exit the wait time supplied as we know it is a job failure.
+        is_jesjcl = True if search_dictionaries("dd_name", "JESJCL", list_of_dds) else False
+        is_job_error_status = True if entry.status in JOB_ERROR_STATUSES else False
+
+        poller = poller or CompletionPoller(timeout, start_time)
+        poller.reset()
+        while ((list_of_dds is None or len(list_of_dds) == 0 or is_dd_query_exception) and
+                (not is_jesjcl and not is_job_error_status and poller.wait())):
+            duration = poller.duration
+            try:
+                # Note, in the event of an exception, eg job has TYPRUN=HOLD
+                # list_of_dds will still be populated with valuable content
+                list_of_dds = jobs.list_dds(entry.job_id, sysin=sysin)
+                is_jesjcl = True if search_dictionaries("dd_name", "JESJCL", list_of_dds) else False
+                is_job_error_status = True if entry.status in JOB_ERROR_STATUSES else False
+            except exceptions.DDQueryException:
+                is_dd_query_exception = True
+                continue
+
+        job["duration"] = duration
+        # Content of the JES2 DDs read so far, job level information comes from them.
+        jes_dd_contents = {}
+        selected_dds = []
+        for single_dd in list_of_dds:
+            if "dd_name" not in single_dd:
+                continue
+
+            # If dd_name not None, only that specific dd_name should be returned
+            if dd_name is not None and dd_name not in single_dd["dd_name"]:
+                continue
+
+            selected_dds.append(single_dd)
+
+        tasks = concurrency.run_concurrently(
+            lambda single_dd: _read_selected_content(entry.job_id, single_dd, selection),
+            selected_dds,
+            max_concurrency=max_concurrency
+        )
+        for single_dd, task in zip(selected_dds, tasks):
+            if task.failed:
+                raise task.error
+            content, jes_content = task.result
+
+            dd = {}
+            if dd_name is not None:
+                dd["dd_name"] = single_dd["dd_name"]
+
+            if "records" in single_dd:
+                dd["record_count"] = single_dd["records"]
+            else:
+                dd["record_count"] = None
+
+            if "dsid" in single_dd:
+                dd["id"] = single_dd["dsid"]
+            else:
+                dd["id"] = "?"
+
+            if "step_name" in single_dd:
+                dd["stepname"] = single_dd["step_name"]
+            else:
+                dd["stepname"] = None
+
+            if "procstep" in single_dd:
+                dd["procstep"] = single_dd["procstep"]
+            else:
+                dd["procstep"] = None
+
+            if "bytes" in single_dd:
+                dd["byte_count"] = single_dd["bytes"]
+            else:
+                dd["byte_count"] = 0
+
+            if jes_content is not None:
+                jes_dd_contents[single_dd["dd_name"]] = jes_content
+
+            dd["content"] = content
+
+            job["dds"].append(dd)
+            if job["class"] is None:
+                job["class"] = entry.job_class
+
+        # Steps, abends and messages come from the JES2 DDs alone, walked once
+        # whatever part of the DDs the user asked for. They're only indexed
+        # when they were read, a DD filter or a content mode that leaves them
+        # out doesn't cost two more reads.
+        log_index = JobLogIndex()
+        for jes_dd_name in (JES2_HEADER_DD, JES2_SYSTEM_MESSAGES_DD):
+            if jes_dd_name in jes_dd_contents:
+                log_index.scan(jes_dd_name, jes_dd_contents[jes_dd_name])
+
+        job["steps"] = log_index.step_results()
+        job["log_index"] = log_index.to_dict()
+        if job["system"] is None:
+            job["system"] = log_index.system
+        if job["subsystem"] is None:
+            job["subsystem"] = log_index.node
+
+    return job
+
+
+def _read_selected_content(job_id, single_dd, selection):
+    """Read the selected part of the content of a DD.
+
+    Parameters
+    ----------
+    job_id : str
+        ID of the job.
+    single_dd : dict
+        DD as returned by list_dds.
+    selection : DDContentSelection
+        Part of the content to return.
+
+    Returns
+    -------
+    tuple(list[str], str)
+        Selected lines of the DD and its whole content when it's one of the
+        JES2 DDs job level information comes from.
+    """
+    if "step_name" not in single_dd or not selection.reads_content:
+        return None, None
+
+    tmpcont = _read_dd_content(job_id, single_dd["step_name"], single_dd["dd_name"])
+    jes_content = tmpcont if single_dd["dd_name"] in (JES2_HEADER_DD, JES2_SYSTEM_MESSAGES_DD) else None
+    return selection.select(tmpcont), jes_content
+
+
 def _ddname_pattern(contents, resolve_dependencies):
     """Resolver for ddname_pattern type arguments.
 
@@ -0,0 +1,502 @@
+# Copyright (c) IBM Corporation 2026
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#     http://www.apache.org/licenses/LICENSE-2.0
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from __future__ import absolute_import, division, print_function
+
+__metaclass__ = type
+
+import json
+import os
+import tarfile
+import time
+
+from hashlib import sha256
+from tempfile import mkstemp
+
+# This module is to be used locally by action plugins, it only relies on the
+# connection object handed to it by the caller, so it never needs to be
+# imported in a managed node. Helpers shared with the modules, like the
+# fingerprints used by sync, live in fingerprint.py instead.
+
+# SSH options that make every ssh/sftp process started for the same host,
+# port and user share a single authenticated master connection. The control
+# socket outlives the task, so later copy/fetch tasks in the play reuse it
+# instead of paying a new handshake.
+MULTIPLEX_OPTIONS = "-o ControlMaster=auto -o ControlPersist={0}s"
+DEFAULT_PERSIST_SECONDS = 60
+
+# Suffix of the single compressed archive used to upload a whole directory
+# tree. Modules expect it right next to the path of the tree it holds.
+ARCHIVE_SUFFIX = ".tar.gz"
+ARCHIVE_COMPRESS_LEVEL = 6
+
+# Suffixes of the files kept next to the destination of a chunked fetch until
+# its last chunk arrives.
+PART_SUFFIX = ".part"
+JOURNAL_SUFFIX = ".journal"
+
+_BLOCK_SIZE = 64 * 1024
+
+
+class SFTPSession(object):
+    def __init__(
+        self,
+        connection,
+        display=None,
+        host=None,
+        log_prefix="ibm_zos_core",
+        transfer_user=None,
+        persist_seconds=DEFAULT_PERSIST_SECONDS
+    ):
+        """Per-host transfer session used by action plugins that need to move
+        data between the controller and z/OS with SFTP.
+
+        The session forces the connection to use SFTP, makes sure the SSH
+        connection is multiplexed so that all commands and transfers issued
+        while it is open (and by later tasks against the same host) go through
+        one master connection, batches all remote preparation into a single
+        remote command and keeps the elapsed time of every transfer. With
+        Ansible's default ssh_args the connection is multiplexed already and
+        the session leaves it untouched.
+
+        Parameters
+        ----------
+        connection : ansible.plugins.connection.ConnectionBase
+            Connection of the action plugin.
+        display : ansible.utils.display.Display
+            Display used to report verbose messages.
+        host : str
+            Remote address, used when displaying messages.
+        log_prefix : str
+            Prefix added to every verbose message.
+        transfer_user : str
+            User that should own the transfers, used when become is active.
+        persist_seconds : int
+            How long the SSH master connection stays alive after its last use.
+
+        Attributes
+        ----------
+        transfers : list[dict]
+            Action, source, destination, return code, size and elapsed time
+            of every transfer done by the session.
+        """
+        self.connection = connection
+        self.display = display
+        self.host = host
+        self.log_prefix = log_prefix
+        self.transfer_user = transfer_user
+        self.persist_seconds = persist_seconds
+        self.transfers = []
+        self._saved_options = {}
+        self._is_open = False
+
+    def __enter__(self):
+        self.open()
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+        return False
+
+    def open(self):
+        """Overrides the connection options needed by the session. Options
+        defined by the user are saved so they can be restored by close.
+        """
+        if self._is_open:
+            return
+
+        self._override_option("ssh_transfer_method", "sftp")
+
+        if not self._is_multiplexed():
+            common_args = self._get_option("ssh_common_args") or ""
+            self._override_option(
+                "ssh_common_args",
+                "{0} {1}".format(
+                    common_args,
+                    MULTIPLEX_OPTIONS.format(self.persist_seconds)
+                ).strip()
+            )
+
+        if self.transfer_user:
+            self._override_option("remote_user", self.transfer_user)
+
+        self._is_open = True
+
+    def close(self):
+        """Restores the connection options overridden by open and reports
+        the total time spent transferring data.
+        """
+        if not self._is_open:
+            return
+
+        for option, value in self._saved_options.items():
+            self.connection.set_option(option, value)
+            self._log("{0} restored to {1}".format(option, value))
+        self._saved_options = {}
+        self._is_open = False
+
+        if self.transfers:
+            self._log("{0} transfer(s) took {1:.3f}s in total".format(
+                len(self.transfers),
+                sum(transfer["elapsed"] for transfer in self.transfers)
+            ))
+
+    def exec_command(self, cmd):
+        """Runs a command on the remote host through the session connection.
+
+        Parameters
+        ----------
+        cmd : str
+            Command to run.
+
+        Returns
+        -------
+        tuple(int, bytes, bytes)
+            Return code, stdout and stderr of the command.
+        """
+        return self.connection.exec_command(cmd)
+
+    def prepare_remote_dir(self, path, subdirs=None):
+        """Creates a remote directory (and optionally some subdirectories
+        inside it) and resolves its absolute path in one remote command.
+
+        Parameters
+        ----------
+        path : str
+            Remote directory to create.
+        subdirs : list[str]
+            Names of subdirectories to create inside path.
+
+        Returns
+        -------
+        tuple(int, str, bytes)
+            Return code, resolved path of the directory and stderr.
+        """
+        paths = [path]
+        if subdirs:
+            paths.extend(os.path.join(path, subdir) for subdir in subdirs)
+
+        # Paths are left unquoted so that the remote shell expands the
+        # '~' found in the default remote_tmp.
+        cmd = "mkdir -p {0} && cd {1} && pwd".format(" ".join(paths), path)
+        rc, stdout, stderr = self.exec_command(cmd)
+        self._log("remote prepare result {0}, {1}, {2} path {3}".format(rc, stdout, stderr, path))
+
+        resolved_path = None
+        if rc == 0:
+            resolved_path = stdout.decode("utf-8").replace("\r", "").replace("\n", "")
+        return rc, resolved_path, stderr
+
+    def transfer(self, action, src, dest, recursive=False, local_path=None):
+        """Transfers a file or directory with SFTP and records how long it took.
+
+        Parameters
+        ----------
+        action : str
+            SFTP action, either 'put' or 'get'.
+        src : str
+            Source of the transfer.
+        dest : str
+            Destination of the transfer.
+        recursive : bool
+            Whether to transfer a whole directory tree.
+        local_path : str
+            Controller path used to compute the size of the transfer, when
+            it differs from src or dest (e.g. escaped for SFTP).
+
+        Returns
+        -------
+        tuple(int, bytes, bytes)
+            Return code, stdout and stderr of the SFTP command.
+        """
+        sftp_action = "{0} -r".format(action) if recursive else action
+        self._log("{0} {1} TO {2}".format(sftp_action, src, dest))
+
+        start = time.time()
+        returncode, stdout, stderr = self.connection._file_transport_command(src, dest, sftp_action)
+        elapsed = time.time() - start
+
+        if local_path is None:
+            local_path = src if action == "put" else dest
+        size = _get_local_size(local_path)
+        self.transfers.append(dict(
+            action=sftp_action,
+            src=src,
+            dest=dest,
+            rc=returncode,
+            size=size,
+            elapsed=elapsed
+        ))
+        self._log("{0} of {1} bytes finished with return code {2} in {3:.3f}s".format(
+            sftp_action,
+            size,
+            returncode,
+            elapsed
+        ))
+
+        return returncode, stdout, stderr
+
+    def _is_multiplexed(self):
+        """Checks whether SSH connection sharing is already configured.
+
+        Ansible's default ssh_args already enable ControlMaster and
+        ControlPersist, so the session only adds them when the user replaced
+        ssh_args with options that don't share the connection. Options
+        that set ControlMaster or ControlPersist in any way, including
+        turning them off, are left as the user wrote them.
+        """
+        for option in ("ssh_args", "ssh_common_args", "ssh_extra_args", "sftp_extra_args"):
+            value = self._get_option(option) or ""
+            if "ControlPersist" in value or "ControlMaster" in value:
+                return True
+        return False
+
+    def _get_option(self, option):
+        try:
+            return self.connection.get_option(option)
+        except KeyError:
+            return None
+
+    def _override_option(self, option, value):
+        current_value = self._get_option(option)
+        if current_value == value:
+            return
+
+        if option not in self._saved_options:
+            self._saved_options[option] = current_value
+        self.connection.set_option(option, value)
+        self._log("{0} updated from {1} to {2}".format(option, current_value, value))
+
+    def _log(self, msg):
+        if self.display is not None:
+            self.display.vvv(u"{0}: {1}".format(self.log_prefix, msg), host=self.host)
+
+
+def _get_local_size(path):
+    """Returns the size in bytes of a local file or directory tree, or None
+    when the path does not exist in the controller.
+    """
+    try:
+        if os.path.isdir(path):
+            return sum(
+                os.path.getsize(os.path.join(root, name))
+                for root, dirs, files in os.walk(path)
+                for name in files
+            )
+        return os.path.getsize(path)
+    except OSError:
+        return None
+
+
+def create_transfer_archive(src, arcname):
+    """Packs a local directory tree into one compressed tar archive so it can
+    be sent to the managed node as a single object.
+
+    Parameters
+    ----------
+    src : str
+        Local directory to pack.
+    arcname : str
+        Relative path the directory will have once the archive is extracted.
+
+    Returns
+    -------
+    str
+        Path of the local archive. The caller is responsible for removing it.
+    """
+    fd, archive_path = mkstemp(suffix=ARCHIVE_SUFFIX)
+    os.close(fd)
+    try:
+        with tarfile.open(archive_path, "w:gz", compresslevel=ARCHIVE_COMPRESS_LEVEL) as archive:
+            # Following links mirrors what an SFTP 'put -r' would upload.
+            archive.dereference = True
+            archive.add(src, arcname=arcname)
+    except Exception:
+        os.remove(archive_path)
+        raise
+    return archive_path
+
+
+class ChunkJournal(object):
+    def __init__(self, dest, source):
+        """Local journal of a chunked transfer. Chunks are appended to a
+        partial file next to the destination and recorded in the journal once
+        their checksum is verified, so an interrupted transfer can resume from
+        the first chunk that is missing.
+
+        Parameters
+        ----------
+        dest : str
+            Local destination of the transfer.
+        source : dict
+            Description of what is being transferred (source name, encoding,
+            chunk size...). A journal written for a different source is
+            discarded.
+
+        Attributes
+        ----------
+        part_path : str
+            Partial file holding the chunks received so far.
+        journal_path : str
+            File holding the journal.
+        chunks : list[dict]
+            Index, size and checksum of every chunk received so far.
+        finished : bool
+            Whether the last chunk was already received.
+        """
+        self.dest = dest
+        self.source = source
+        self.part_path = dest + PART_SUFFIX
+        self.journal_path = dest + JOURNAL_SUFFIX
+        self.chunks = []
+        self.finished = False
+
+    def read(self):
+        """Reads the chunks recorded by a previous run without changing the
+        journal or the partial file.
+
+        Returns
+        -------
+        list[dict]
+            Index, size and checksum of the chunks recorded, empty when the
+            journal was written for a different source or the partial file
+            doesn't hold them anymore.
+        """
+        return self._read_journal().get("chunks", [])
+
+    def load(self):
+        """Reads the journal left by a previous run, if it still matches the
+        source, and drops any data written to the partial file after the last
+        chunk recorded.
+
+        Returns
+        -------
+        int
+            Number of chunks that don't need to be transferred again.
+        """
+        journal = self._read_journal()
+        self.chunks = journal.get("chunks", [])
+        self.finished = journal.get("finished", False)
+        self.truncate(len(self.chunks))
+        return len(self.chunks)
+
+    def truncate(self, count):
+        """Keeps only the first chunks recorded, for a source that changed
+        after them.
+
+        Parameters
+        ----------
+        count : int
+            Number of chunks to keep.
+        """
+        if count < len(self.chunks):
+            self.chunks = self.chunks[:count]
+            self.finished = False
+        with open(self.part_path, "ab") as outfile:
+            outfile.truncate(sum(chunk["size"] for chunk in self.chunks))
+        self._save()
+
+    def add_chunk(self, chunk_path, chunk):
+        """Verifies a chunk and appends it to the partial file.
+
+        Parameters
+        ----------
+        chunk_path : str
+            Local file holding the chunk.
+        chunk : dict
+            Index, size, checksum and whether the chunk is the last one, as
+            reported by the managed node.
+
+        Raises
+        ------
+        ValueError
+            When the chunk is out of order or doesn't match its checksum.
+        """
+        if chunk["index"] != len(self.chunks):
+            raise ValueError("Expected chunk {0} but received chunk {1}".format(
+                len(self.chunks),
+                chunk["index"]
+            ))
+
+        size, checksum = _get_file_digest(chunk_path)
+        if size != chunk["size"] or checksum != chunk["checksum"]:
+            raise ValueError(
+                "Checksum of chunk {0} doesn't match, expected {1} ({2} bytes) "
+                "but received {3} ({4} bytes)".format(
+                    chunk["index"],
+                    chunk["checksum"],
+                    chunk["size"],
+                    checksum,
+                    size
+                )
+            )
+
+        with open(chunk_path, "rb") as infile, open(self.part_path, "ab") as outfile:
+            block = infile.read(_BLOCK_SIZE)
+            while block:
+                outfile.write(block)
+                block = infile.read(_BLOCK_SIZE)
+            outfile.flush()
+            os.fsync(outfile.fileno())
+
+        self.chunks.append(dict(index=chunk["index"], size=size, checksum=checksum))
+        self.finished = chunk.get("last", False)
+        self._save()
+
+    def complete(self):
+        """Moves the partial file to the destination and removes the journal."""
+        os.replace(self.part_path, self.dest)
+        os.remove(self.journal_path)
+
+    def _read_journal(self):
+        """Returns the journal of a previous run, or an empty dict when it
+        doesn't match the source or the partial file."""
+        journal = None
+        try:
+            with open(self.journal_path, "r") as infile:
+                journal = json.load(infile)
+        except (IOError, OSError, ValueError):
+            pass
+
+        if not journal or journal.get("source") != self.source:
+            return {}
+
+        try:
+            part_size = os.path.getsize(self.part_path)
+        except OSError:
+            part_size = None
+        if part_size is None or part_size < sum(chunk["size"] for chunk in journal.get("chunks", [])):
+            # The partial file is gone or was damaged, start over.
+            return {}
+        return journal
+
+    def _save(self):
+        """Writes the journal, replacing the previous one atomically."""
+        temp_path = self.journal_path + ".tmp"
+        with open(temp_path, "w") as outfile:
+            json.dump(
+                dict(source=self.source, chunks=self.chunks, finished=self.finished),
+                outfile
+            )
+        os.replace(temp_path, self.journal_path)
+
+
+def _get_file_digest(path):
+    """Returns the size and SHA-256 hex digest of a local file."""
+    size = 0
+    hash_digest = sha256()
+    with open(path, "rb") as infile:
+        block = infile.read(_BLOCK_SIZE)
+        while block:
+            size += len(block)
+            hash_digest.update(block)
+            block = infile.read(_BLOCK_SIZE)
+    return size, hash_digest.hexdigest()
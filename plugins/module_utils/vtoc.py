@@ -1,4 +1,4 @@
-# Copyright (c) IBM Corporation 2020, 2024
+# Copyright (c) IBM Corporation 2020, 2026
 # Licensed under the Apache License, Version 2.0 (the "License");
 # you may not use this file except in compliance with the License.
 # You may obtain a copy of the License at
@@ -15,11 +15,185 @@ from __future__ import absolute_import, division, print_function
 __metaclass__ = type
 
 import re
+from contextlib import contextmanager
 from ansible_collections.ibm.ibm_zos_core.plugins.module_utils.ansible_module import (
     AnsibleModuleHelper,
 )
 
 
+DATA_SET_SECTION_DELIMITER = "0---------------DATA SET NAME----------------"
+
+_ROW_REGEXES = [
+    re.compile(
+        r"(0-*DATA SET NAME-*\s+)(SER NO\s+)(SEQNO\s+)(DATE.CRE\s+)(DATE.EXP\s+)"
+        r"(DATE.REF\s+)(EXT\s+)(DSORG\s+)(RECFM\s+)(OPTCD\s+)(BLKSIZE[ ]*)"
+    ),
+    re.compile(
+        r"(0SMS.IND\s+)(LRECL\s+)(KEYLEN\s+)(INITIAL ALLOC\s+)(2ND ALLOC\s+)"
+        r"(EXTEND\s+)(LAST BLK\(T-R-L\)\s+)(DIR.REM\s+)(F2 OR F3\(C-H-R\)\s+)(DSCB\(C-H-R\)[ ]*)"
+    ),
+    re.compile(r"([ ]*EATTR[ ]*)"),
+]
+_EXTEND_REGEX = re.compile(r"([0-9]+)(AV|BY|KB|MB)")
+_THREE_NUMBERS_REGEX = re.compile(r"[ ]*([0-9]+)[ ]+([0-9]+)[ ]+([0-9]+)")
+_LAST_BLK_REGEX = re.compile(r"[ ]*([0-9]+)[ ]+([0-9]+)[ ]+([0-9]+)?")
+_CYLINDER_HEAD_REGEX = re.compile(r"[ ]*([0-9]+)[ ]+([0-9]+)")
+_NO_EXTENTS_REGEX = re.compile(r"THE\sABOVE\sDATASET\sHAS\sNO\sEXTENTS")
+_EXTENTS_INDENT_REGEX = re.compile(r"(0\s*EXTENTS\s+)(?:(NO\s+)(LOW\(C-H\)\s+)(HIGH\(C-H\)[ ]*))")
+_EXTENTS_HEADER_REGEX = re.compile(r"(NO\s+)(LOW\(C-H\)\s+)(HIGH\(C-H\)[ ]*)")
+
+# Every section of a listing has the same headers, so the column layout
+# of each one and the regular expression for its extents are only built once.
+_column_layouts = {}
+_extent_regexes = {}
+
+# Volume indexes built inside a cache_scope, keyed by volume name.
+_volume_indexes = {}
+# Number of cache_scope blocks currently open.
+_scope_depth = 0
+
+
+class VolumeTableOfContents(object):
+    def __init__(self, listing):
+        """Index of the data sets in the LISTVTOC output of a volume.
+
+        The listing is split by data set once. Each data set's section,
+        including its DSCB and extent details, is only parsed the first
+        time it is looked up.
+
+        Parameters
+        ----------
+        listing : str
+            The output of LISTVTOC.
+
+        Attributes
+        ----------
+        names : list[str]
+            Names of the data sets on the volume, in the order they are listed.
+        """
+        self._sections = {}
+        self._entries = {}
+        self.names = []
+        for section in _separate_data_set_sections(listing):
+            lines = section.split("\n", 2)
+            if len(lines) < 2 or not lines[1].strip():
+                continue
+            name = lines[1].split(None, 1)[0]
+            self._sections[name] = section
+            self.names.append(name)
+
+    def __contains__(self, data_set_name):
+        return data_set_name.upper() in self._sections
+
+    def __len__(self):
+        return len(self.names)
+
+    def get(self, data_set_name):
+        """Get the VTOC information of a data set.
+
+        Parameters
+        ----------
+        data_set_name : str
+            The name of the data set.
+
+        Returns
+        -------
+        dict
+            The information for the data set found in VTOC, None when it
+            is not on the volume.
+        """
+        data_set_name = data_set_name.upper()
+        if data_set_name not in self._entries:
+            section = self._sections.get(data_set_name)
+            if section is None:
+                return None
+            self._entries[data_set_name] = _parse_data_set_info(section)
+        return self._entries[data_set_name]
+
+    def entries(self):
+        """Get the VTOC information of every data set on the volume.
+
+        Returns
+        -------
+        Union[dict]
+            List of dictionaries holding data set information from VTOC.
+        """
+        return [self.get(name) for name in self.names]
+
+
+@contextmanager
+def cache_scope():
+    """Keep the indexes of the volumes read inside the block, so each
+    VTOC is listed once. Code inside the block must only allocate or
+    scratch data sets through DataSet, which invalidates the indexes.
+    Indexes are dropped when the outermost block ends.
+    """
+    global _scope_depth
+    _scope_depth += 1
+    try:
+        yield
+    finally:
+        _scope_depth -= 1
+        if not _scope_depth:
+            invalidate()
+
+
+def get_volume_index(volume, tmphlq=None):
+    """Get the index of the data sets on a volume. Inside a cache_scope,
+    IEHLIST runs the first time a volume is requested and later requests
+    get the same index until it is invalidated. Outside of one, the VTOC
+    is listed every time.
+
+    Parameters
+    ----------
+    volume : str
+        The name of the volume.
+    tmphlq : str
+        High Level Qualifier for temporary datasets.
+
+    Returns
+    -------
+    VolumeTableOfContents
+        Index of the data sets on the volume, None when IEHLIST fails.
+
+    Raises
+    ------
+    VolumeTableOfContentsError
+        When any exception is raised during VTOC operations.
+    """
+    volume = volume.upper()
+    if volume in _volume_indexes:
+        return _volume_indexes[volume]
+    try:
+        stdin = "  LISTVTOC FORMAT,VOL=3390={0}".format(volume)
+        # dd = "SYS1.VVDS.V{0}".format(volume.upper())
+        dd = "{0},vol".format(volume)
+        stdout = _iehlist(dd, stdin, tmphlq=tmphlq)
+        if stdout is None:
+            return None
+        index = VolumeTableOfContents(stdout)
+    except Exception as e:
+        raise VolumeTableOfContentsError(repr(e))
+    if _scope_depth:
+        _volume_indexes[volume] = index
+    return index
+
+
+def invalidate(volume=None):
+    """Drop the index of a volume, or all of them, so the next lookup
+    reads the VTOC again. Used after data sets are allocated or scratched.
+
+    Parameters
+    ----------
+    volume : str
+        The name of the volume. All the indexes are dropped when None.
+    """
+    if volume is None:
+        _volume_indexes.clear()
+    else:
+        _volume_indexes.pop(volume.upper(), None)
+
+
 def get_volume_entry(volume, tmphlq=None):
     """Retrieve VTOC information for all data sets with entries
     on the volume.
@@ -41,14 +215,11 @@ def get_volume_entry(volume, tmphlq=None):
     VolumeTableOfContentsError
         When any exception is raised during VTOC operations.
     """
+    index = get_volume_index(volume, tmphlq=tmphlq)
+    if index is None:
+        return None
     try:
-        stdin = "  LISTVTOC FORMAT,VOL=3390={0}".format(volume.upper())
-        # dd = "SYS1.VVDS.V{0}".format(volume.upper())
-        dd = "{0},vol".format(volume.upper())
-        stdout = _iehlist(dd, stdin, tmphlq=tmphlq)
-        if stdout is None:
-            return None
-        data_sets = _process_output(stdout)
+        data_sets = index.entries()
     except Exception as e:
         raise VolumeTableOfContentsError(repr(e))
     return data_sets
@@ -72,13 +243,10 @@ def get_data_set_entry(data_set_name, volume, tmphlq=None):
     dict
         The information for the data set found in VTOC.
     """
-    data_set = None
-    data_sets = get_volume_entry(volume, tmphlq=tmphlq)
-    for ds in data_sets:
-        if ds.get("data_set_name") == data_set_name.upper():
-            data_set = ds
-            break
-    return data_set
+    index = get_volume_index(volume, tmphlq=tmphlq)
+    if index is None:
+        return None
+    return index.get(data_set_name)
 
 
 def find_data_set_in_volume_output(data_set_name, data_sets):
@@ -91,14 +259,17 @@ def find_data_set_in_volume_output(data_set_name, data_sets):
     ----------
     data_set_name : str
         The name of the data set to retrieve information for.
-    data_sets : list[dict]
-        List of dictionaries holding data set information from VTOC.
+    data_sets : Union[list[dict], VolumeTableOfContents]
+        List of dictionaries holding data set information from VTOC,
+        or the index of a volume.
 
     Returns
     -------
     dict
         The information for the data set found in VTOC.
     """
+    if isinstance(data_sets, VolumeTableOfContents):
+        return data_sets.get(data_set_name)
     if isinstance(data_sets, list):
         for data_set in data_sets:
             if data_set.get("data_set_name") == data_set_name.upper():
@@ -173,9 +344,8 @@ def _separate_data_set_sections(contents):
     Union[str]
         LISTVTOC output separated into sections by data set.
     """
-    delimeter = "0---------------DATA SET NAME----------------"
-    data_sets = re.split(delimeter, contents)
-    fixed_ds = [delimeter + x for x in data_sets[1:]]
+    data_sets = contents.split(DATA_SET_SECTION_DELIMITER)
+    fixed_ds = [DATA_SET_SECTION_DELIMITER + x for x in data_sets[1:]]
     return fixed_ds
 
 
@@ -195,20 +365,9 @@ def _parse_data_set_info(data_set_string):
     """
     lines = data_set_string.split("\n")
     data_set_info = {}
-    regex_for_rows = [
-        (
-            r"(0-*DATA SET NAME-*\s+)(SER NO\s+)(SEQNO\s+)(DATE.CRE\s+)(DATE.EXP\s+)"
-            r"(DATE.REF\s+)(EXT\s+)(DSORG\s+)(RECFM\s+)(OPTCD\s+)(BLKSIZE[ ]*)"
-        ),
-        (
-            r"(0SMS.IND\s+)(LRECL\s+)(KEYLEN\s+)(INITIAL ALLOC\s+)(2ND ALLOC\s+)"
-            r"(EXTEND\s+)(LAST BLK\(T-R-L\)\s+)(DIR.REM\s+)(F2 OR F3\(C-H-R\)\s+)(DSCB\(C-H-R\)[ ]*)"
-        ),
-        r"([ ]*EATTR[ ]*)",
-    ]
-    data_set_info.update(_parse_table_row(regex_for_rows[0], lines[0], lines[1]))
-    data_set_info.update(_parse_table_row(regex_for_rows[1], lines[2], lines[3]))
-    data_set_info.update(_parse_table_row(regex_for_rows[2], lines[4], lines[5]))
+    data_set_info.update(_parse_table_row(_ROW_REGEXES[0], lines[0], lines[1]))
+    data_set_info.update(_parse_table_row(_ROW_REGEXES[1], lines[2], lines[3]))
+    data_set_info.update(_parse_table_row(_ROW_REGEXES[2], lines[4], lines[5]))
     data_set_info.update(_parse_extents(lines[6:]))
     return data_set_info
 
@@ -219,7 +378,7 @@ def _parse_table_row(regex, header_row, data_row):
 
     Parameters
     ----------
-    regex : str
+    regex : re.Pattern
         The regular expression used to parse table row.
     header_row : str
         The row of the table containing headers.
@@ -232,7 +391,34 @@ def _parse_table_row(regex, header_row, data_row):
         Structured data for the row of the table.
     """
     table_data = {}
-    fields = re.findall(regex, header_row)
+    layout = _column_layouts.get((regex.pattern, header_row))
+    if layout is None:
+        layout = _column_layout(regex, header_row)
+        _column_layouts[(regex.pattern, header_row)] = layout
+
+    for name, start, end in layout:
+        table_data[name] = data_row[start:end].strip()
+    table_data = _format_table_data(table_data)
+    return table_data
+
+
+def _column_layout(regex, header_row):
+    """Find where each column of a VTOCLIST table row starts and ends.
+
+    Parameters
+    ----------
+    regex : re.Pattern
+        The regular expression used to parse table row.
+    header_row : str
+        The row of the table containing headers.
+
+    Returns
+    -------
+    list[tuple(str, int, int)]
+        Name, start and end position of each column.
+    """
+    layout = []
+    fields = regex.findall(header_row)
 
     if len(fields) > 0:
         if isinstance(fields[0], str):
@@ -240,10 +426,9 @@ def _parse_table_row(regex, header_row, data_row):
         count = 0
         for field in fields[0]:
             end = count + len(field)
-            table_data[field.strip(" -0")] = data_row[count:end].strip()
-            count += len(field)
-    table_data = _format_table_data(table_data)
-    return table_data
+            layout.append((field.strip(" -0"), count, end))
+            count = end
+    return layout
 
 
 def _format_table_data(table_data):
@@ -261,35 +446,11 @@ def _format_table_data(table_data):
     dict
         Updated data.
     """
-    handlers = {
-        "DATA SET NAME": "data_set_name",
-        "SER NO": "volume",
-        "SEQNO": "sequence",
-        "DATE.CRE": "creation_date",
-        "DATE.EXP": "expiration_date",
-        "DATE.REF": "last_referenced_date",
-        "EXT": "number_of_extents",
-        "DSORG": "data_set_organization",
-        "RECFM": "record_format",
-        "OPTCD": "option_code",
-        "BLKSIZE": "block_size",
-        "SMS.IND": "sms_attributes",
-        "LRECL": "record_length",
-        "KEYLEN": "key_length",
-        "INITIAL ALLOC": "space_type",
-        "2ND ALLOC": "space_secondary",
-        "EXTEND": _format_extend,
-        "LAST BLK(T-R-L)": {"name": "last_block_pointer", "func": _format_last_blk},
-        "DIR.REM": "last_directory_block_bytes_used",
-        "F2 OR F3(C-H-R)": {"name": "dscb_format_2_or_3", "func": _format_f2_or_f3},
-        "DSCB(C-H-R)": {"name": "dscb_format_1_or_8", "func": _format_dscb},
-        "EATTR": "extended_attributes",
-    }
     formatted_table_data = {}
     for key, value in table_data.items():
         if not value:
             continue
-        updated_data_item = handlers.get(key, key)
+        updated_data_item = _TABLE_DATA_HANDLERS.get(key, key)
         if isinstance(updated_data_item, str):  # only need to update name
             formatted_table_data[updated_data_item] = value
         elif isinstance(updated_data_item, dict):  # need to update value, name defined
@@ -318,7 +479,7 @@ def _format_extend(contents, formatted_table_data):
     dict
         The updated formatted_table_data dictionary.
     """
-    matches = re.search(r"([0-9]+)(AV|BY|KB|MB)", contents)
+    matches = _EXTEND_REGEX.search(contents)
     original_space_secondary = ""
     average_block_size = ""
     if matches:
@@ -351,7 +512,7 @@ def _format_last_blk(contents):
         Structured data parsed from last blk field contents.
     """
     result = None
-    matches = re.search(r"[ ]*([0-9]+)[ ]+([0-9]+)[ ]+([0-9]+)?", contents)
+    matches = _LAST_BLK_REGEX.search(contents)
     if matches:
         result = {}
         result["track"] = matches.group(1)
@@ -375,7 +536,7 @@ def _format_f2_or_f3(contents):
         Structured data parsed from the F2 or F3 field contents.
     """
     result = None
-    matches = re.search(r"[ ]*([0-9]+)[ ]+([0-9]+)[ ]+([0-9]+)", contents)
+    matches = _THREE_NUMBERS_REGEX.search(contents)
     if matches:
         result = {}
         result["cylinder"] = matches.group(1)
@@ -398,7 +559,7 @@ def _format_dscb(contents):
         Structured data parsed from the dscb field contents.
     """
     result = None
-    matches = re.search(r"[ ]*([0-9]+)[ ]+([0-9]+)[ ]+([0-9]+)", contents)
+    matches = _THREE_NUMBERS_REGEX.search(contents)
     if matches:
         result = {}
         result["cylinder"] = matches.group(1)
@@ -407,6 +568,33 @@ def _format_dscb(contents):
     return result
 
 
+# How each VTOCLIST field is renamed or formatted by _format_table_data.
+_TABLE_DATA_HANDLERS = {
+    "DATA SET NAME": "data_set_name",
+    "SER NO": "volume",
+    "SEQNO": "sequence",
+    "DATE.CRE": "creation_date",
+    "DATE.EXP": "expiration_date",
+    "DATE.REF": "last_referenced_date",
+    "EXT": "number_of_extents",
+    "DSORG": "data_set_organization",
+    "RECFM": "record_format",
+    "OPTCD": "option_code",
+    "BLKSIZE": "block_size",
+    "SMS.IND": "sms_attributes",
+    "LRECL": "record_length",
+    "KEYLEN": "key_length",
+    "INITIAL ALLOC": "space_type",
+    "2ND ALLOC": "space_secondary",
+    "EXTEND": _format_extend,
+    "LAST BLK(T-R-L)": {"name": "last_block_pointer", "func": _format_last_blk},
+    "DIR.REM": "last_directory_block_bytes_used",
+    "F2 OR F3(C-H-R)": {"name": "dscb_format_2_or_3", "func": _format_f2_or_f3},
+    "DSCB(C-H-R)": {"name": "dscb_format_1_or_8", "func": _format_dscb},
+    "EATTR": "extended_attributes",
+}
+
+
 def _parse_extents(lines):
     """Parse and structure extent data from VTOCLIST.
 
@@ -423,17 +611,16 @@ def _parse_extents(lines):
         Structured data parsed from the extent field contents.
     """
     extents = []
-    if re.search(r"THE\sABOVE\sDATASET\sHAS\sNO\sEXTENTS", "".join(lines)):
+    if _NO_EXTENTS_REGEX.search("".join(lines)):
         return {}
-    regex_for_extents_indent = (
-        r"(0\s*EXTENTS\s+)(?:(NO\s+)(LOW\(C-H\)\s+)(HIGH\(C-H\)[ ]*))"
-    )
-    regex_for_header_row = r"(NO\s+)(LOW\(C-H\)\s+)(HIGH\(C-H\)[ ]*)"
-    indent_group = re.findall(regex_for_extents_indent, lines[0])
-    indent_length = len(indent_group[0][0])
-    header_groups = re.findall(regex_for_header_row, lines[0])
-    regex_for_extents_data = _extent_regex_builder(indent_length, header_groups)
-    extent_data = re.findall(regex_for_extents_data, "\n".join(lines), re.MULTILINE)
+    regex_for_extents_data = _extent_regexes.get(lines[0])
+    if regex_for_extents_data is None:
+        indent_group = _EXTENTS_INDENT_REGEX.findall(lines[0])
+        indent_length = len(indent_group[0][0])
+        header_groups = _EXTENTS_HEADER_REGEX.findall(lines[0])
+        regex_for_extents_data = re.compile(_extent_regex_builder(indent_length, header_groups), re.MULTILINE)
+        _extent_regexes[lines[0]] = regex_for_extents_data
+    extent_data = regex_for_extents_data.findall("\n".join(lines))
     if len(extent_data) > 0:
         extents = _format_extent_data(extent_data)
     return {"extents": extents}
@@ -483,19 +670,14 @@ def _format_extent_data(extent_data):
     extents = []
     flattened_extent_data = []
     for extent in extent_data:
-        reduced_extent = [x.strip() for x in extent if x.strip() != ""]
-        flattened_extent_data = flattened_extent_data + reduced_extent
+        flattened_extent_data.extend(x.strip() for x in extent if x.strip() != "")
     for index in range(int(len(flattened_extent_data) / 3)):
         position = index * 3
         extent = {}
         extent["number"] = flattened_extent_data[position]
-        low = re.search(
-            r"[ ]*([0-9]+)[ ]+([0-9]+)", flattened_extent_data[position + 1]
-        )
+        low = _CYLINDER_HEAD_REGEX.search(flattened_extent_data[position + 1])
         extent["low"] = {"cylinder": low.group(1), "track": low.group(2)}
-        high = re.search(
-            r"[ ]*([0-9]+)[ ]+([0-9]+)", flattened_extent_data[position + 2]
-        )
+        high = _CYLINDER_HEAD_REGEX.search(flattened_extent_data[position + 2])
         extent["high"] = {"cylinder": high.group(1), "track": high.group(2)}
         extents.append(extent)
     return extents
@@ -168,6 +168,19 @@ options:
           - The encoding to be converted to
         required: false
         type: str
+  max_concurrency:
+    description:
+      - Maximum number of files converted at the same time when C(encoding)
+        is applied to a directory.
+      - Only conversions that are done with iconv run in parallel. Code sets
+        the module converts by itself, like ISO8859-1, UTF-8 and the EBCDIC
+        single-byte code pages, are converted one file at a time.
+      - Files that fail to convert don't stop the conversion of the rest of
+        the directory, all of them are reported when the task fails.
+      - A value of 1 converts the files one at a time.
+    type: int
+    required: false
+    default: 4
   tmp_hlq:
     description:
       - Override the default high level qualifier (HLQ) for temporary and backup
@@ -337,6 +350,49 @@ options:
         to another without removing the destination PDS/E.
       - Required unless using C(content).
     type: str
+  transfer_mode:
+    description:
+      - How a local directory C(src) is sent to the managed node.
+      - When set to C(files), every file in the directory is sent in its own
+        SFTP request.
+      - When set to C(archive), the directory is packed into a single compressed
+        tar archive on the controller, sent as one object and extracted in the
+        remote temporary directory. Encoding conversion and line ending
+        normalization are then applied to the extracted tree.
+      - C(archive) greatly reduces the transfer time of trees with many small
+        files.
+      - Only used when C(src) is a local directory and C(remote_src=false),
+        otherwise ignored.
+    type: str
+    choices:
+      - files
+      - archive
+    default: files
+    required: false
+  sync:
+    description:
+      - If set to C(true), only the files of a local directory C(src) whose
+        content differs from what is already in C(dest) are transferred and
+        written.
+      - The module compares the size and SHA-256 checksum of every file with
+        the matching USS file or partitioned data set member in C(dest),
+        computed in a single remote call before any data is transferred.
+      - Text content is compared after encoding conversion. Files in a USS
+        C(dest) must match exactly, line endings and blanks included. Members
+        of a data set C(dest) are compared ignoring line endings, trailing
+        blanks and trailing empty lines, which fixed length records pad.
+      - When every file is unchanged, I(mode), I(owner) and I(group) are
+        still applied to a USS C(dest).
+      - Unchanged files and members are not rewritten, so their timestamps,
+        ISPF statistics and directory entries stay the same.
+      - Files and members that are in C(dest) but not in C(src) are kept.
+      - When C(binary=true) or C(executable=true) and C(dest) is a data set,
+        every file is considered changed.
+      - Only used when C(src) is a local directory and C(remote_src=false),
+        otherwise ignored.
+    type: bool
+    default: false
+    required: false
   validate:
     description:
       - Specifies whether to perform checksum validation for source and
@@ -895,6 +951,12 @@ state:
     returned: success and if dest is USS
     type: str
     sample: file
+unchanged_entries:
+    description: Number of files in C(src) that were not copied because they
+      were identical to their counterparts in C(dest).
+    returned: When ``sync=true``
+    type: int
+    sample: 39650
 note:
     description: A note to the user after module terminates.
     returned: When ``replace=true`` and ``dest`` exists
@@ -943,8 +1005,11 @@ import math
 import os
 import shutil
 import stat
+import subprocess
+import tarfile
 import tempfile
 import traceback
+from collections import Counter
 from hashlib import sha256
 from re import IGNORECASE
 
@@ -952,7 +1017,7 @@ from ansible.module_utils._text import to_bytes, to_native
 from ansible.module_utils.basic import AnsibleModule
 from ansible.module_utils.six import PY3
 from ansible_collections.ibm.ibm_zos_core.plugins.module_utils import (
-    backup, better_arg_parser, copy, data_set, encode, validation)
+    backup, better_arg_parser, concurrency, copy, data_set, encode, fingerprint, validation)
 from ansible_collections.ibm.ibm_zos_core.plugins.module_utils.ansible_module import \
     AnsibleModuleHelper
 from ansible_collections.ibm.ibm_zos_core.plugins.module_utils.data_set import (
@@ -976,10 +1041,11 @@ else:
     from re import match as fullmatch
 
 try:
-    from zoautil_py import datasets, gdgs
+    from zoautil_py import datasets, gdgs, zoau_io
 except Exception:
     datasets = ZOAUImportError(traceback.format_exc())
     gdgs = ZOAUImportError(traceback.format_exc())
+    zoau_io = ZOAUImportError(traceback.format_exc())
 
 try:
     from zoautil_py import exceptions as zoau_exceptions
@@ -998,7 +1064,8 @@ class CopyHandler(object):
         backup_name=None,
         force=False,
         identical_gdg_copy=False,
-        tmphlq=None
+        tmphlq=None,
+        max_concurrency=concurrency.DEFAULT_MAX_CONCURRENCY
     ):
         """Utility class to handle copying data between two targets.
 
@@ -1029,6 +1096,9 @@ class CopyHandler(object):
             process.
         tmphlq : str
             High Level Qualifier for temporary datasets.
+        max_concurrency : int
+            Maximum number of files converted at the same
+            time when converting a directory.
 
         Attributes
         ----------
@@ -1054,6 +1124,9 @@ class CopyHandler(object):
             process.
         tmphlq : str
             High Level Qualifier for temporary datasets.
+        max_concurrency : int
+            Maximum number of files converted at the same
+            time when converting a directory.
         """
         self.module = module
         self.binary = binary
@@ -1064,6 +1137,7 @@ class CopyHandler(object):
         self.force = force
         self.identical_gdg_copy = identical_gdg_copy
         self.tmphlq = tmphlq
+        self.max_concurrency = max_concurrency
 
     def run_command(self, cmd, **kwargs):
         """Wrapper for AnsibleModule.run_command.
@@ -1386,6 +1460,10 @@ class CopyHandler(object):
     def _convert_encoding_dir(self, dir_path, from_code_set, to_code_set):
         """Convert encoding for all files inside a given directory.
 
+        Files converted with iconv run in parallel, up to max_concurrency
+        at a time.
+        Every file is attempted before reporting the ones that failed.
+
         Parameters
         ----------
         dir_path : str
@@ -1397,21 +1475,34 @@ class CopyHandler(object):
 
         Raises
         ------
-        EncodingConversionError
-            When the encoding of a USS file is not
+        CopyOperationError
+            When the encoding of one or more USS files is not
             able to be converted.
         """
         enc_utils = encode.EncodeUtils()
+        file_pairs = []
         for path, dirs, files in os.walk(dir_path):
             for file_path in files:
                 full_file_path = os.path.join(validation.validate_safe_path(path), validation.validate_safe_path(file_path))
-                rc = enc_utils.uss_convert_encoding(
-                    full_file_path, full_file_path, from_code_set, to_code_set
-                )
-                if not rc:
-                    raise EncodingConversionError(
-                        full_file_path, from_code_set, to_code_set
-                    )
+                file_pairs.append((full_file_path, full_file_path))
+
+        converted, failures = enc_utils.uss_convert_encoding_files(
+            file_pairs,
+            from_code_set,
+            to_code_set,
+            max_concurrency=self.max_concurrency
+        )
+        if failures:
+            failure_lines = [
+                "{0}: {1}".format(file_path, message) for file_path, message in sorted(failures.items())
+            ]
+            raise CopyOperationError(
+                msg="Unable to convert encoding of {0} file(s) from {1} to {2}".format(
+                    len(failures), from_code_set, to_code_set
+                ),
+                stderr="\n".join(failure_lines),
+                stderr_lines=failure_lines
+            )
 
     def _tag_file_encoding(self, file_path, tag, is_dir=False):
         """Tag the file specified by 'file_path' with the given code set.
@@ -1467,77 +1558,134 @@ class CopyHandler(object):
             result.update(arg)
         return result
 
-    def file_has_crlf_endings(self, src):
-        """Reads src as a binary file and checks whether it uses CRLF or LF
-        line endings.
-
-        Parameters
-        ----------
-        src : str
-            Path to a USS file.
-
-        Returns
-        -------
-        bool
-            True if the file uses CRLF endings, False if it uses LF
-            ones.
-        """
-        # Python has to read the file in binary mode to not mask CRLF
-        # endings or enable universal newlines. If we used encoding="cp037",
-        # we would get '\n' as the line ending even when the file uses '\r\n'.
-        with open(src, "rb") as src_file:
-            # Reading the file in 1024-byte chunks.
-            content = src_file.read(1024)
-
-            while content:
-                # In UTF-8, \r is bytes 0d
-                if b'\x0d' in content:
-                    return True
-                content = src_file.read(1024)
-
-        return False
-
-    def create_temp_with_lf_endings(self, src):
+    def create_temp_with_lf_endings(self, src, code_set="UTF-8"):
         """Creates a temporary file with the same content as src but without
-        carriage returns.
+        carriage returns, reading and writing the data once.
 
         Parameters
         ----------
         src : str
             Path to a USS source file.
+        code_set : str, optional
+            Code set of src.
 
         Returns
         -------
         str
-            Path to the temporary file created.
+            Path to the temporary file created, or src when it doesn't
+            contain any carriage returns.
 
         Raises
         ------
         CopyOperationError
             If the conversion fails.
         """
+        converted_src = None
         try:
             fd, converted_src = tempfile.mkstemp(dir=os.environ['TMPDIR'])
             os.close(fd)
-            # defining 32 MB chunk size for reading large files efficiently
-            chunk_size = 32 * 1024 * 1024
             with open(converted_src, "wb") as converted_file:
-                with open(src, "rb") as src_file:
-                    chunk = src_file.read(chunk_size)
-                    while chunk:
-                        # In IBM-037, \r is the byte 0d.
-                        converted_file.write(chunk.replace(b'\x0d', b''))
-                        chunk = src_file.read(chunk_size)
+                if encode.get_codec(code_set) is not None:
+                    # Every code set with a codec is either single-byte or
+                    # UTF-8 and encodes CR as the byte 0d, which can't be part
+                    # of another character, so there's no need to decode it.
+                    with open(src, "rb") as src_file:
+                        found_cr = self._remove_cr_bytes(src_file, converted_file.write)
+                else:
+                    found_cr = self._remove_cr_with_iconv(src, converted_file, code_set)
+
+            if not found_cr:
+                os.remove(converted_src)
+                return src
 
-            self._tag_file_encoding(converted_src, "IBM-037")
+            # Removing carriage returns doesn't change the code set of the
+            # content, so the temporary file is tagged with the one of src.
+            self._tag_file_encoding(converted_src, code_set)
 
             return converted_src
         except Exception as err:
+            if converted_src and os.path.exists(converted_src):
+                os.remove(converted_src)
             raise CopyOperationError(
                 msg="Error while trying to convert EOL sequence for source.",
                 stderr=to_native(err)
             )
 
+    def _remove_cr_bytes(self, src_file, write):
+        """Writes the content of a binary file object without the byte 0d.
+
+        Parameters
+        ----------
+        src_file : file
+            File object opened in binary mode.
+        write : function
+            Function that receives every chunk without carriage returns.
+
+        Returns
+        -------
+        bool
+            Whether any carriage return was found.
+        """
+        found_cr = False
+        chunk = src_file.read(encode.CONVERSION_CHUNK_SIZE)
+        while chunk:
+            if b'\x0d' in chunk:
+                found_cr = True
+                chunk = chunk.replace(b'\x0d', b'')
+            write(chunk)
+            chunk = src_file.read(encode.CONVERSION_CHUNK_SIZE)
+        return found_cr
+
+    def _remove_cr_with_iconv(self, src, converted_file, code_set):
+        """Removes carriage returns from a file in a code set without a
+        Python codec. The file is decoded to UTF-8 by one iconv process and
+        encoded back by another, with the carriage returns removed from the
+        stream between them, so no intermediate file is written.
+
+        Parameters
+        ----------
+        src : str
+            Path to a USS source file.
+        converted_file : file
+            File object where the result is written.
+        code_set : str
+            Code set of src.
+
+        Returns
+        -------
+        bool
+            Whether any carriage return was found.
+
+        Raises
+        ------
+        EncodeError
+            If iconv fails.
+        """
+        decoder = subprocess.Popen(
+            ["iconv", "-f", code_set, "-t", "UTF-8", src],
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE
+        )
+        encoder = subprocess.Popen(
+            ["iconv", "-f", "UTF-8", "-t", code_set],
+            stdin=subprocess.PIPE,
+            stdout=converted_file,
+            stderr=subprocess.PIPE
+        )
+        try:
+            found_cr = self._remove_cr_bytes(decoder.stdout, encoder.stdin.write)
+        finally:
+            encoder.stdin.close()
+            decoder.stdout.close()
+            decoder_err = decoder.stderr.read()
+            encoder_err = encoder.stderr.read()
+            decoder_rc = decoder.wait()
+            encoder_rc = encoder.wait()
+
+        if decoder_rc or encoder_rc:
+            raise encode.EncodeError(to_native(decoder_err or encoder_err))
+        return found_cr
+
     def remove_cr_endings(self, src):
         """Creates a temporary file with the same content as src but without
         carriage returns.
@@ -1704,22 +1852,7 @@ class USSCopyHandler(CopyHandler):
                 dest, changed_files = self._copy_to_dir(src, dest, conv_path, replace)
 
         if self.common_file_args is not None:
-            mode = self.common_file_args.get("mode")
-            group = self.common_file_args.get("group")
-            owner = self.common_file_args.get("owner")
-            if mode is not None:
-                if not os.path.isdir(dest):
-                    self.module.set_mode_if_different(dest, mode, False)
-                if changed_files:
-                    self.module.set_mode_if_different(dest, mode, False)
-                    for filepath in changed_files:
-                        self.module.set_mode_if_different(
-                            os.path.join(validation.validate_safe_path(dest), validation.validate_safe_path(filepath)), mode, False
-                        )
-            if group is not None:
-                self.module.set_group_if_different(dest, group, False)
-            if owner is not None:
-                self.module.set_owner_if_different(dest, owner, False)
+            set_common_file_args(self.module, dest, self.common_file_args, changed_files)
         return dest
 
     def _copy_to_file(self, src, dest, content_copy, conv_path):
@@ -2149,11 +2282,9 @@ class PDSECopyHandler(CopyHandler):
             else:
                 # The 'members' variable below is used to store a list of members in the src PDS/E.
                 # Items in the list are passed to the copy_to_member function.
-                # Aliases are included in the output by list_members unless the alias option is disabled.
-                # The logic for preserving/copying aliases is contained in the copy_to_member function.
-                opts = {}
-                opts['options'] = '-H '  # mls option to hide aliases
-                members = datasets.list_members(new_src, **opts)
+                # Aliases are left out of the list, the logic for preserving/copying aliases is
+                # contained in the copy_to_member function.
+                members = data_set.DataSet.get_member_directory(new_src, hide_aliases=True).members(aliases=False)
 
             src_members = ["{0}({1})".format(src_data_set_name, member) for member in members]
             dest_members = [
@@ -2162,7 +2293,7 @@ class PDSECopyHandler(CopyHandler):
                 for member in members
             ]
 
-        existing_members = datasets.list_members(dest)  # fyi - this list includes aliases
+        existing_members = data_set.DataSet.get_member_directory(dest)  # fyi - this snapshot includes aliases
         overwritten_members = []
         new_members = []
         bulk_src_members = ""
@@ -2921,8 +3052,8 @@ def get_attributes_of_any_dataset_created(
                 volume=volume
             )
     else:
-        src_attributes = datasets.list_datasets(src_name)[0]
-        size = int(src_attributes.total_space)
+        src_attributes = data_set.DataSet.get_attributes(src_name)
+        size = src_attributes.space
         params = get_data_set_attributes(
             dest,
             size=size,
@@ -3059,8 +3190,8 @@ def allocate_destination_data_set(
             try:
                 # Dumping the member into a file in USS to compute the record length and
                 # size for the new data set.
-                src_attributes = datasets.list_datasets(src_name)[0]
-                record_length = int(src_attributes.record_length)
+                src_attributes = data_set.DataSet.get_attributes(src_name, tmphlq=tmphlq)
+                record_length = src_attributes.lrecl
                 temp_dump = dump_data_set_member_to_file(src, binary)
                 create_seq_dataset_from_file(
                     temp_dump,
@@ -3084,11 +3215,11 @@ def allocate_destination_data_set(
             else:
                 data_set.DataSet.allocate_model_data_set(ds_name=dest, model=src_name, executable=executable, asa_text=asa_text, vol=volume, tmphlq=tmphlq)
         elif src_ds_type in data_set.DataSet.MVS_SEQ:
-            src_attributes = datasets.list_datasets(src_name)[0]
+            src_attributes = data_set.DataSet.get_attributes(src_name, tmphlq=tmphlq)
             # The size returned by listing is in bytes.
-            size = int(src_attributes.total_space)
-            record_format = src_attributes.record_format
-            record_length = int(src_attributes.record_length)
+            size = src_attributes.space
+            record_format = src_attributes.recfm
+            record_length = src_attributes.lrecl
             dest_params = get_data_set_attributes(
                 dest,
                 size,
@@ -3196,8 +3327,8 @@ def allocate_destination_data_set(
             asa_text,
             volume
         )
-        dest_attributes = datasets.list_datasets(dest)[0]
-        record_format = dest_attributes.record_format
+        dest_attributes = data_set.DataSet.get_attributes(dest, tmphlq=tmphlq)
+        record_format = dest_attributes.recfm
         dest_params["type"] = dest_ds_type
         dest_params["record_format"] = record_format
 
@@ -3205,8 +3336,7 @@ def allocate_destination_data_set(
 
 
 def normalize_line_endings(src, encoding=None):
-    """Normalizes src's encoding to UTF-8, then normalizes
-    its line endings to LF and after encodes back as per encoding param.
+    """Normalizes the line endings of src to LF, keeping its encoding.
 
     Parameters
     ----------
@@ -3223,51 +3353,164 @@ def normalize_line_endings(src, encoding=None):
     # Before copying into a destination dataset, we'll make sure that
     # the source file doesn't contain any carriage returns that would
     # result in empty records in the destination.
-    # Due to the differences between encodings, we'll normalize to UTF-8
-    # before checking the EOL sequence.
     enc_utils = encode.EncodeUtils()
     src_tag = enc_utils.uss_file_tag(src)
     copy_handler = CopyHandler(AnsibleModuleHelper(dict()))
 
-    if src_tag == "untagged":
+    if not src_tag or src_tag == "untagged":
         # This should only be true when src is a remote file and no encoding
         # was specified by the user.
         if not encoding:
             src_tag = encode.Defaults.get_default_system_charset()
         else:
             src_tag = encoding["to"]
-    is_convertedto_utf8 = False
-    if src_tag != "UTF-8":
-        fd, converted_src = tempfile.mkstemp(dir=os.environ['TMPDIR'])
-        os.close(fd)
 
-        enc_utils.uss_convert_encoding(
-            src,
-            converted_src,
-            src_tag,
-            "UTF-8"
-        )
-        copy_handler._tag_file_encoding(converted_src, "UTF-8")
-        src = converted_src
-        is_convertedto_utf8 = True
+    return copy_handler.create_temp_with_lf_endings(src, src_tag)
 
-    if copy_handler.file_has_crlf_endings(src):
-        src = copy_handler.create_temp_with_lf_endings(src)
 
-    if is_convertedto_utf8:
-        fd, converted_source = tempfile.mkstemp(dir=os.environ['TMPDIR'])
-        os.close(fd)
+def extract_transfer_archive(src):
+    """Extracts the compressed archive that the action plugin uploads when
+    copying a local directory with transfer_mode=archive. The archive is
+    located right next to src (src + '.tar.gz') and holds the tree relative to
+    its own directory. The archive is removed after extraction.
 
-        enc_utils.uss_convert_encoding(
-            src,
-            converted_source,
-            "UTF-8",
-            src_tag
-        )
-        copy_handler._tag_file_encoding(converted_src, src_tag)
-        src = converted_source
+    Parameters
+    ----------
+    src : str
+        Path of the directory the archive holds.
+
+    Returns
+    -------
+    bool
+        Whether an archive was found and extracted.
+    """
+    archive_path = "{0}.tar.gz".format(os.path.normpath(src))
+    if not os.path.isfile(archive_path):
+        return False
+
+    extract_dir = os.path.dirname(archive_path)
+    with tarfile.open(archive_path, "r:gz") as archive:
+        if hasattr(tarfile, "data_filter"):
+            archive.extractall(extract_dir, filter="data")
+        else:
+            real_extract_dir = os.path.realpath(extract_dir)
+            for member in archive.getmembers():
+                member_path = os.path.realpath(os.path.join(extract_dir, member.name))
+                if os.path.commonpath([real_extract_dir, member_path]) != real_extract_dir:
+                    raise ValueError("Archive member {0} is outside of {1}".format(member.name, extract_dir))
+            archive.extractall(extract_dir)
+
+    os.remove(archive_path)
+    return True
+
+
+def set_common_file_args(module, dest, common_file_args, changed_files=None):
+    """Applies the mode, group and owner requested by the user to a USS
+    destination.
+
+    Parameters
+    ----------
+    module : AnsibleModule
+        The AnsibleModule object from currently running module.
+    dest : str
+        USS file or directory copied.
+    common_file_args : dict
+        Mode, group and owner to apply.
+    changed_files : list[str]
+        Files copied inside a directory dest, relative to it.
+
+    Returns
+    -------
+    bool
+        Whether any attribute was changed.
+    """
+    changed = False
+    mode = common_file_args.get("mode")
+    group = common_file_args.get("group")
+    owner = common_file_args.get("owner")
+    if mode is not None:
+        if not os.path.isdir(dest):
+            changed = module.set_mode_if_different(dest, mode, False) or changed
+        if changed_files:
+            changed = module.set_mode_if_different(dest, mode, False) or changed
+            for filepath in changed_files:
+                changed = module.set_mode_if_different(
+                    os.path.join(validation.validate_safe_path(dest), validation.validate_safe_path(filepath)), mode, False
+                ) or changed
+    if group is not None:
+        changed = module.set_group_if_different(dest, group, False) or changed
+    if owner is not None:
+        changed = module.set_owner_if_different(dest, owner, False) or changed
+    return changed
+
+
+def get_sync_changed_entries(entries, dest, dest_root, to_charset, binary=False):
+    """Compares the manifest of a local directory with the content already
+    in dest and returns the entries that have to be copied. Anything that
+    can't be compared is considered changed. Files in a USS dest have to
+    match the converted content exactly, members of a data set only have to
+    match once records pad the lines.
+
+    Parameters
+    ----------
+    entries : dict
+        Relative path of every local file mapped to its size and digest.
+    dest : str
+        USS directory or partitioned data set the files are copied into.
+    dest_root : str
+        Path relative to a USS dest where the directory lands.
+    to_charset : str
+        Charset the content has in dest.
+    binary : bool
+        Whether the content is compared byte by byte.
+
+    Returns
+    -------
+    list[str]
+        Relative paths of the files that are new or differ from dest.
+    """
+    if "/" in dest:
+        root = os.path.join(dest, dest_root) if dest_root else dest
+        changed_entries = []
+        for relative_path, expected in entries.items():
+            dest_path = os.path.join(root, relative_path)
+            try:
+                if expected is None or not os.path.isfile(dest_path) \
+                        or fingerprint.file_fingerprint(dest_path, to_charset, binary) != expected:
+                    changed_entries.append(relative_path)
+            except (IOError, OSError):
+                changed_entries.append(relative_path)
+        return changed_entries
 
-    return src
+    codec = encode.get_codec(to_charset)
+    if binary or codec is None:
+        return list(entries.keys())
+
+    try:
+        existing_members = data_set.DataSet.get_member_directory(dest)
+    except Exception:
+        return list(entries.keys())
+
+    member_names = [
+        data_set.DataSet.get_member_name_from_file(os.path.basename(relative_path)).upper()
+        for relative_path in entries
+    ]
+    duplicated_members = set(name for name, count in Counter(member_names).items() if count > 1)
+
+    changed_entries = []
+    for (relative_path, expected), member_name in zip(entries.items(), member_names):
+        if expected is None or member_name not in existing_members or member_name in duplicated_members:
+            changed_entries.append(relative_path)
+            continue
+        try:
+            with zoau_io.RecordIO("//'{0}({1})'".format(dest, member_name), "r") as member:
+                records = member.readrecords()
+            lines = (codec.decode(record)[0] for record in records)
+            if fingerprint.record_fingerprint(lines) != expected:
+                changed_entries.append(relative_path)
+        except Exception:
+            changed_entries.append(relative_path)
+    return changed_entries
 
 
 def remote_cleanup(module):
@@ -3428,10 +3671,22 @@ def run_module(module, arg_def):
     force = module.params.get('force')
     content = module.params.get('content')
     identical_gdg_copy = module.params.get('identical_gdg_copy', False)
+    transfer_mode = module.params.get('transfer_mode')
 
     # Set temporary directory at os environment level
     os.environ['TMPDIR'] = f"{os.path.realpath(module.tmpdir)}/"
 
+    # When a local directory was sent as a single archive, the tree has to be
+    # extracted before anything else inspects src.
+    if transfer_mode == "archive" and not remote_src and not content and "/" in src:
+        try:
+            extract_transfer_archive(src)
+        except Exception as err:
+            module.fail_json(
+                msg="Unable to extract the archive transferred for source {0}".format(originalsrc),
+                stderr=str(err)
+            )
+
     dest_data_set = module.params.get('dest_data_set')
     if dest_data_set:
         if volume:
@@ -3531,136 +3786,135 @@ def run_module(module, arg_def):
     # characters. We'll only update these variables when they are
     # data sets with record format 'FBA' or 'VBA'.
     src_has_asa_chars = dest_has_asa_chars = False
-    try:
-        if "/" in src:
-            src_ds_type = "USS"
-
-            if os.path.isdir(src):
-                is_src_dir = True
-
-            # When the destination is a dataset, we'll normalize the source
-            # file to UTF-8 for the record length computation as Python
-            # generally uses UTF-8 as the default encoding.
-            if not binary and not is_uss and not executable:
-                new_src = src
-                new_src = os.path.normpath(new_src)
-                # Normalizing encoding when src is a USS file (only).
-                encode_utils = encode.EncodeUtils()
-                src_tag = encode_utils.uss_file_tag(new_src)
-                # Normalizing to UTF-8.
-                if not is_src_dir and src_tag != "UTF-8":
-                    # If untagged, assuming the encoding/tag is the system's default.
-                    if src_tag == "untagged" or src_tag is None:
-                        if encoding:
-                            src_tag = encoding["from"]
-                        else:
-                            src_tag = encode.Defaults.get_default_system_charset()
-
-                    # Converting the original src to a temporary one in UTF-8.
-                    fd, converted_src = tempfile.mkstemp(dir=os.environ['TMPDIR'])
-                    os.close(fd)
-                    encode_utils.uss_convert_encoding(
-                        new_src,
-                        converted_src,
-                        src_tag,
-                        "UTF-8"
-                    )
+    # The checks below only read the catalog, so its answers are kept until
+    # they are done. Nothing is cached once the copy starts writing.
+    with data_set.catalog_cache.scope():
+        try:
+            if "/" in src:
+                src_ds_type = "USS"
+
+                if os.path.isdir(src):
+                    is_src_dir = True
+
+                # When the destination is a dataset, we'll normalize the source
+                # file to UTF-8 for the record length computation as Python
+                # generally uses UTF-8 as the default encoding.
+                if not binary and not is_uss and not executable:
+                    new_src = src
+                    new_src = os.path.normpath(new_src)
+                    # Normalizing encoding when src is a USS file (only).
+                    encode_utils = encode.EncodeUtils()
+                    src_tag = encode_utils.uss_file_tag(new_src)
+                    # Normalizing to UTF-8.
+                    if not is_src_dir and src_tag != "UTF-8":
+                        # If untagged, assuming the encoding/tag is the system's default.
+                        if src_tag == "untagged" or src_tag is None:
+                            if encoding:
+                                src_tag = encoding["from"]
+                            else:
+                                src_tag = encode.Defaults.get_default_system_charset()
+
+                        # Converting the original src to a temporary one in UTF-8.
+                        fd, converted_src = tempfile.mkstemp(dir=os.environ['TMPDIR'])
+                        os.close(fd)
+                        encode_utils.uss_convert_encoding(
+                            new_src,
+                            converted_src,
+                            src_tag,
+                            "UTF-8"
+                        )
 
-                    # Creating the handler just for tagging, we're not copying yet!
-                    copy_handler = CopyHandler(module, binary=binary)
-                    copy_handler._tag_file_encoding(converted_src, "UTF-8")
-        else:
-            if (is_src_gds and data_set.DataSet.data_set_exists(src, tmphlq=tmphlq)) or (
-                    not is_src_gds and data_set.DataSet.data_set_exists(src_name, tmphlq=tmphlq)):
-                if src_member and not data_set.DataSet.data_set_member_exists(src):
+                        # Creating the handler just for tagging, we're not copying yet!
+                        copy_handler = CopyHandler(module, binary=binary)
+                        copy_handler._tag_file_encoding(converted_src, "UTF-8")
+            else:
+                if (is_src_gds and data_set.DataSet.data_set_exists(src, tmphlq=tmphlq)) or (
+                        not is_src_gds and data_set.DataSet.data_set_exists(src_name, tmphlq=tmphlq)):
+                    if src_member and not data_set.DataSet.data_set_member_exists(src):
+                        raise NonExistentSourceError(src)
+                    src_ds_type = data_set.DataSet.data_set_type(src_name, tmphlq=tmphlq)
+
+                    if src_ds_type not in data_set.DataSet.MVS_VSAM and src_ds_type != "GDG":
+                        src_has_asa_chars = data_set.DataSet.get_attributes(src_name, tmphlq=tmphlq).has_asa_chars
+                else:
                     raise NonExistentSourceError(src)
-                src_ds_type = data_set.DataSet.data_set_type(src_name, tmphlq=tmphlq)
 
-                if src_ds_type not in data_set.DataSet.MVS_VSAM and src_ds_type != "GDG":
-                    src_attributes = datasets.list_datasets(src_name)[0]
-                    if src_attributes.record_format == 'FBA' or src_attributes.record_format == 'VBA':
-                        src_has_asa_chars = True
-            else:
-                raise NonExistentSourceError(src)
-
-            # An empty VSAM will throw an error when IDCAMS tries to open it to copy
-            # the contents.
-            if src_ds_type in data_set.DataSet.MVS_VSAM and data_set.DataSet.is_empty(src_name):
-                module.exit_json(
-                    note="The source VSAM {0} is likely empty. No data was copied.".format(src_name),
-                    changed=False,
-                    dest=dest
-                )
+                # An empty VSAM will throw an error when IDCAMS tries to open it to copy
+                # the contents.
+                if src_ds_type in data_set.DataSet.MVS_VSAM and data_set.DataSet.is_empty(src_name):
+                    module.exit_json(
+                        note="The source VSAM {0} is likely empty. No data was copied.".format(src_name),
+                        changed=False,
+                        dest=dest
+                    )
 
-            if encoding:
-                module.fail_json(
-                    msg="Encoding conversion is only valid for USS source"
-                )
+                if encoding:
+                    module.fail_json(
+                        msg="Encoding conversion is only valid for USS source"
+                    )
 
-        if is_uss:
-            dest_ds_type = "USS"
-            if src_ds_type == "USS" and not is_src_dir and (dest.endswith("/") or os.path.isdir(dest)):
-                src_basename = os.path.basename(src) if not content else "inline_copy"
-                dest = os.path.normpath("{0}/{1}".format(dest, src_basename))
-                if dest.startswith("//"):
-                    dest = dest.replace("//", "/")
-
-            if is_src_dir and not src.endswith("/"):
-                dest_exists = os.path.exists(os.path.normpath("{0}/{1}".format(dest, os.path.basename(src))))
-            else:
-                dest_exists = os.path.exists(dest)
+            if is_uss:
+                dest_ds_type = "USS"
+                if src_ds_type == "USS" and not is_src_dir and (dest.endswith("/") or os.path.isdir(dest)):
+                    src_basename = os.path.basename(src) if not content else "inline_copy"
+                    dest = os.path.normpath("{0}/{1}".format(dest, src_basename))
+                    if dest.startswith("//"):
+                        dest = dest.replace("//", "/")
 
-            if dest_exists and not os.access(dest, os.W_OK):
-                module.fail_json(msg="Destination {0} is not writable".format(raw_dest))
-        else:
-            dest_exists = data_set.DataSet.data_set_exists(dest_name, volume, tmphlq=tmphlq)
-            dest_ds_type = data_set.DataSet.data_set_type(dest_name, volume, tmphlq=tmphlq)
-
-            # When dealing with a new generation, we'll override its type to None
-            # so it will be the same type as the source (or whatever dest_data_set has)
-            # a couple lines down.
-            if is_dest_gds and not is_dest_gds_active:
-                dest_exists = False
-                dest_ds_type = None
-
-            # dest_data_set.type overrides `dest_ds_type` given precedence rules
-            if dest_data_set and dest_data_set.get("type"):
-                dest_ds_type = dest_data_set.get("type").upper()
-            elif executable:
-                # When executable is selected and dest_exists is false means an executable PDSE was copied to remote,
-                # so we need to provide the correct dest_ds_type that will later be transformed into LIBRARY.
-                # Not using LIBRARY at this step since there are many checks with dest_ds_type in data_set.DataSet.MVS_PARTITIONED
-                # and LIBRARY is not in MVS_PARTITIONED frozen set.
-                dest_ds_type = "PDSE"
+                if is_src_dir and not src.endswith("/"):
+                    dest_exists = os.path.exists(os.path.normpath("{0}/{1}".format(dest, os.path.basename(src))))
+                else:
+                    dest_exists = os.path.exists(dest)
 
-            if dest_data_set and (dest_data_set.get('record_format', '') == 'fba' or dest_data_set.get('record_format', '') == 'vba'):
-                dest_has_asa_chars = True
-            elif not dest_exists and asa_text:
-                dest_has_asa_chars = True
-            elif dest_exists and dest_ds_type not in data_set.DataSet.MVS_VSAM and dest_ds_type != "GDG":
-                dest_attributes = datasets.list_datasets(dest_name)[0]
-                if dest_attributes.record_format == 'FBA' or dest_attributes.record_format == 'VBA':
+                if dest_exists and not os.access(dest, os.W_OK):
+                    module.fail_json(msg="Destination {0} is not writable".format(raw_dest))
+            else:
+                dest_exists = data_set.DataSet.data_set_exists(dest_name, volume, tmphlq=tmphlq)
+                dest_ds_type = data_set.DataSet.data_set_type(dest_name, volume, tmphlq=tmphlq)
+
+                # When dealing with a new generation, we'll override its type to None
+                # so it will be the same type as the source (or whatever dest_data_set has)
+                # a couple lines down.
+                if is_dest_gds and not is_dest_gds_active:
+                    dest_exists = False
+                    dest_ds_type = None
+
+                # dest_data_set.type overrides `dest_ds_type` given precedence rules
+                if dest_data_set and dest_data_set.get("type"):
+                    dest_ds_type = dest_data_set.get("type").upper()
+                elif executable:
+                    # When executable is selected and dest_exists is false means an executable PDSE was copied to remote,
+                    # so we need to provide the correct dest_ds_type that will later be transformed into LIBRARY.
+                    # Not using LIBRARY at this step since there are many checks with dest_ds_type in data_set.DataSet.MVS_PARTITIONED
+                    # and LIBRARY is not in MVS_PARTITIONED frozen set.
+                    dest_ds_type = "PDSE"
+
+                if dest_data_set and (dest_data_set.get('record_format', '') == 'fba' or dest_data_set.get('record_format', '') == 'vba'):
                     dest_has_asa_chars = True
-
-            if dest_ds_type in data_set.DataSet.MVS_PARTITIONED:
-                # Checking if we need to copy a member when the user requests it implicitly.
-                # src is a file and dest was just the PDS/E dataset name.
-                if not copy_member and src_ds_type == "USS" and os.path.isfile(src):
-                    copy_member = True
-                    dest_member = data_set.DataSet.get_member_name_from_file(os.path.basename(src))
-                    dest = f"{dest_name}({dest_member})"
-
-                # Checking if the members that would be created from the directory files
-                # are already present on the system.
-                if copy_member:
-                    dest_member_exists = dest_exists and data_set.DataSet.data_set_member_exists(dest)
-                elif src_ds_type == "USS":
-                    root_dir = src
-                    dest_member_exists = dest_exists and data_set.DataSet.files_in_data_set_members(root_dir, dest)
-                elif src_ds_type in data_set.DataSet.MVS_PARTITIONED:
-                    dest_member_exists = dest_exists and data_set.DataSet.data_set_shared_members(src, dest)
-    except Exception as err:
-        module.fail_json(msg=str(err))
+                elif not dest_exists and asa_text:
+                    dest_has_asa_chars = True
+                elif dest_exists and dest_ds_type not in data_set.DataSet.MVS_VSAM and dest_ds_type != "GDG":
+                    dest_has_asa_chars = data_set.DataSet.get_attributes(dest_name, tmphlq=tmphlq).has_asa_chars
+
+                if dest_ds_type in data_set.DataSet.MVS_PARTITIONED:
+                    # Checking if we need to copy a member when the user requests it implicitly.
+                    # src is a file and dest was just the PDS/E dataset name.
+                    if not copy_member and src_ds_type == "USS" and os.path.isfile(src):
+                        copy_member = True
+                        dest_member = data_set.DataSet.get_member_name_from_file(os.path.basename(src))
+                        dest = f"{dest_name}({dest_member})"
+
+                    # Checking if the members that would be created from the directory files
+                    # are already present on the system.
+                    if copy_member:
+                        dest_member_exists = dest_exists and data_set.DataSet.data_set_member_exists(dest)
+                    elif src_ds_type == "USS":
+                        root_dir = src
+                        dest_member_exists = dest_exists and data_set.DataSet.files_in_data_set_members(root_dir, dest)
+                    elif src_ds_type in data_set.DataSet.MVS_PARTITIONED:
+                        dest_member_exists = dest_exists and data_set.DataSet.data_set_shared_members(src, dest)
+        except Exception as err:
+            module.fail_json(msg=str(err))
     identical_gdg_copy = module.params.get('identical_gdg_copy', False)
     if identical_gdg_copy:
         # Validate destination GDG doesn't exist
@@ -3881,7 +4135,8 @@ def run_module(module, arg_def):
         backup_name=backup_name,
         force=force,
         identical_gdg_copy=module.params.get('identical_gdg_copy', False),
-        tmphlq=tmphlq
+        tmphlq=tmphlq,
+        max_concurrency=module.params.get('max_concurrency')
     )
 
     try:
@@ -4062,6 +4317,12 @@ def main():
             local_follow=dict(type='bool', default=True),
             remote_src=dict(type='bool', default=False),
             ignore_sftp_stderr=dict(type='bool', default=True),
+            transfer_mode=dict(type='str', default='files', choices=['files', 'archive']),
+            max_concurrency=dict(type='int', default=concurrency.DEFAULT_MAX_CONCURRENCY),
+            sync=dict(type='bool', default=False),
+            # Used by the action plugin to ask for the entries that differ
+            # from dest before transferring a directory with sync=true.
+            _sync_manifest=dict(type='dict', required=False),
             validate=dict(type='bool', default=False),
             volume=dict(type='str', required=False),
             dest_data_set=dict(
@@ -4140,6 +4401,34 @@ def main():
     )
     validate_dependencies(module)
 
+    sync_manifest = module.params.get("_sync_manifest")
+    if sync_manifest is not None:
+        encoding = module.params.get("encoding") or dict()
+        dest = module.params.get("dest").replace("£", "$")
+        changed_entries = get_sync_changed_entries(
+            sync_manifest.get("entries", dict()),
+            dest,
+            sync_manifest.get("dest_root", ""),
+            encoding.get("to") or encode.Defaults.get_default_system_charset(),
+            binary=module.params.get("binary") or module.params.get("executable")
+        )
+
+        # When nothing has to be copied there won't be a copy to apply the
+        # file attributes afterwards, so they're applied now.
+        changed = False
+        if not changed_entries and "/" in dest:
+            dest_root = sync_manifest.get("dest_root", "")
+            changed = set_common_file_args(
+                module,
+                os.path.join(dest, dest_root) if dest_root else dest,
+                dict(
+                    mode=module.params.get("mode"),
+                    group=module.params.get("group"),
+                    owner=module.params.get("owner")
+                )
+            )
+        module.exit_json(changed=changed, sync_changed_entries=changed_entries)
+
     arg_def = dict(
         src=dict(arg_type='data_set_or_path', required=False),
         dest=dict(arg_type='data_set_or_path', required=True),
@@ -4154,6 +4443,9 @@ def main():
         local_follow=dict(arg_type='bool', default=True, required=False),
         remote_src=dict(arg_type='bool', default=False, required=False),
         ignore_sftp_stderr=dict(type='bool', default=True),
+        transfer_mode=dict(arg_type='str', required=False, default='files'),
+        max_concurrency=dict(arg_type='int', required=False, default=concurrency.DEFAULT_MAX_CONCURRENCY),
+        sync=dict(arg_type='bool', required=False, default=False),
         validate=dict(arg_type='bool', required=False),
         volume=dict(arg_type='str', required=False),
         replace=dict(type='bool', default=False),
@@ -939,7 +939,7 @@ from ansible_collections.ibm.ibm_zos_core.plugins.module_utils.better_arg_parser
     BetterArgParser,
 )
 from ansible_collections.ibm.ibm_zos_core.plugins.module_utils.data_set import (
-    DataSet, GenerationDataGroup, MVSDataSet, Member
+    DataSet, GenerationDataGroup, MVSDataSet, Member, catalog_cache
 )
 from ansible.module_utils.basic import AnsibleModule
 from ansible_collections.ibm.ibm_zos_core.plugins.module_utils.dependency_checker import (
@@ -1535,6 +1535,217 @@ def get_data_set_handler(**params):
         )
 
 
+def prefetch_catalog_entries(data_set_param_list):
+    """Query the catalog for all the data sets of a batch with as few
+    IDCAMS runs as possible, so the checks done for each one of them
+    don't need their own.
+
+    Parameters
+    ----------
+    data_set_param_list : list[dict]
+        Parameters of each data set in the batch.
+
+    Returns
+    -------
+    dict[str, CatalogEntry]
+        Catalog information of each data set, keyed by the upper case name.
+        Empty when the batch has a single data set.
+    """
+    names = [
+        data_set_params.get("name") for data_set_params in data_set_param_list
+        if data_set_params.get("type") not in ("gdg", "member")
+        and not DataSet.is_gds_relative_name(data_set_params.get("name"))
+    ]
+    if len(names) > 1:
+        return DataSet.get_catalog_entries(names, tmphlq=data_set_param_list[0].get("tmp_hlq"))
+    return {}
+
+
+def get_bulk_operation(data_set_params, catalog_entries):
+    """Determine whether a batch entry can be handled along with others
+    in a single IDCAMS run.
+
+    Parameters
+    ----------
+    data_set_params : dict
+        Parameters of the data set.
+    catalog_entries : dict[str, CatalogEntry]
+        Catalog information of the data sets in the batch.
+
+    Returns
+    -------
+    str
+        "delete" or "create" when the entry can be part of a bulk
+        deletion or allocation, None otherwise.
+    """
+    if data_set_params.get("type") in ("gdg", "member"):
+        return None
+    entry = catalog_entries.get(data_set_params.get("name", "").upper().replace("\\", ""))
+    if entry is None or entry.rc > 4:
+        return None
+
+    state = data_set_params.get("state")
+    if state == "absent" and entry.cataloged and entry.entry_type == "NONVSAM" \
+            and not data_set_params.get("volumes"):
+        return "delete"
+    if state == "present" and not entry.cataloged and DataSet.can_bulk_create(
+            data_set_params.get("type"),
+            record_format=data_set_params.get("record_format"),
+            block_size=data_set_params.get("block_size"),
+            directory_blocks=data_set_params.get("directory_blocks")):
+        return "create"
+    return None
+
+
+def perform_bulk_operations(operations):
+    """Runs the deletions and then the allocations of a group of batch
+    entries with one IDCAMS run each. Entries that fail go through
+    perform_data_set_operations on their own, so their errors get
+    reported the same way as when they are not part of a batch.
+
+    Parameters
+    ----------
+    operations : list[tuple(str, MVSDataSet, dict)]
+        Bulk operation, data set object and parameters of each entry.
+        No two entries can have the same name.
+
+    Returns
+    -------
+    bool
+        If changes were made.
+    """
+    changed = False
+    if len(operations) < 2:
+        for operation, data_set, data_set_params in operations:
+            changed = perform_single_data_set_operations(data_set, data_set_params) or changed
+        return changed
+
+    logger = SingletonLogger().logger
+    tmp_hlq = operations[0][2].get("tmp_hlq")
+    deletions = [(data_set, params) for operation, data_set, params in operations if operation == "delete"]
+    allocations = [(data_set, params) for operation, data_set, params in operations if operation == "create"]
+    pending = []
+
+    if deletions:
+        results = DataSet.bulk_delete(
+            [data_set.name for data_set, params in deletions],
+            tmphlq=tmp_hlq,
+            noscratch=[params.get("noscratch") for data_set, params in deletions]
+        )
+        for (data_set, data_set_params), (rc, output) in zip(deletions, results):
+            if rc == 0:
+                data_set.set_state("absent")
+                changed = True
+            else:
+                logger.debug("Bulk deletion of %s ended with condition code %d: %s", data_set.name, rc, output)
+                pending.append((data_set, data_set_params))
+
+    if allocations:
+        results = DataSet.bulk_create(
+            [dict(
+                name=data_set.name,
+                type=data_set.data_set_type,
+                space_primary=data_set.space_primary,
+                space_secondary=data_set.space_secondary,
+                space_type=data_set.space_type,
+                record_format=data_set.record_format,
+                record_length=data_set.record_length,
+                block_size=data_set.block_size,
+                directory_blocks=data_set.directory_blocks,
+                sms_storage_class=data_set.sms_storage_class,
+                sms_data_class=data_set.sms_data_class,
+                sms_management_class=data_set.sms_management_class,
+                volumes=data_set.volumes,
+            ) for data_set, params in allocations],
+            tmphlq=tmp_hlq
+        )
+        for (data_set, data_set_params), (rc, output) in zip(allocations, results):
+            if rc == 0:
+                data_set.set_state("present")
+                changed = True
+            else:
+                logger.debug("Bulk allocation of %s ended with condition code %d: %s", data_set.name, rc, output)
+                pending.append((data_set, data_set_params))
+
+    for data_set, data_set_params in pending:
+        changed = perform_single_data_set_operations(data_set, data_set_params) or changed
+    return changed
+
+
+def perform_single_data_set_operations(data_set, data_set_params):
+    """Calls perform_data_set_operations with the parameters of a batch entry.
+
+    Parameters
+    ----------
+    data_set : {MVSDataSet | Member | GenerationDataGroup}
+        Data set object to perform operations on.
+    data_set_params : dict
+        Parameters of the data set.
+
+    Returns
+    -------
+    bool
+        If changes were made.
+    """
+    return perform_data_set_operations(
+        data_set=data_set,
+        state=data_set_params.get("state"),
+        replace=data_set_params.get("replace"),
+        tmp_hlq=data_set_params.get("tmp_hlq"),
+        force=data_set_params.get("force"),
+        noscratch=data_set_params.get("noscratch"),
+    )
+
+
+def perform_batch_data_set_operations(data_set_param_list):
+    """Performs the operations requested for every data set of a batch.
+
+    The catalog is queried for all of them up front, and its answers are
+    kept while the batch runs since every change goes through DataSet,
+    MVSDataSet or GenerationDataGroup. Consecutive entries
+    that delete cataloged non-VSAM data sets or allocate new ones that
+    DataSet.can_bulk_create accepts are grouped, and each group gets its
+    deletions and allocations done with one IDCAMS run each for every
+    IDCAMS_BATCH_SIZE entries. The rest of the entries, VSAM and zFS data
+    sets included, and any entry whose name is already in the current
+    group, are handled in order on their own.
+
+    Parameters
+    ----------
+    data_set_param_list : list[dict]
+        Parameters of each data set in the batch.
+
+    Returns
+    -------
+    tuple(bool, list)
+        If changes were made and the data set objects of every entry.
+    """
+    changed = False
+    data_set_list = []
+    operations = []
+
+    with catalog_cache.scope():
+        catalog_entries = prefetch_catalog_entries(data_set_param_list)
+        for data_set_params in data_set_param_list:
+            data_set_params["scratch"] = determine_scratch(data_set_params)
+            data_set_params["noscratch"] = not data_set_params["scratch"]
+            # this returns MVSDataSet, Member or GenerationDataGroup
+            data_set = get_data_set_handler(**data_set_params)
+            operation = get_bulk_operation(data_set_params, catalog_entries)
+
+            if operation is None or any(queued.name == data_set.name for _, queued, _ in operations):
+                changed = perform_bulk_operations(operations) or changed
+                operations = []
+            if operation is None:
+                changed = perform_single_data_set_operations(data_set, data_set_params) or changed
+            else:
+                operations.append((operation, data_set, data_set_params))
+            data_set_list.append(data_set)
+
+        changed = perform_bulk_operations(operations) or changed
+    return changed, data_set_list
+
+
 def perform_data_set_operations(data_set, state, replace, tmp_hlq, force, noscratch):
     """Calls functions to perform desired operations on
     one or more data sets. Returns boolean indicating if changes were made.
@@ -2105,21 +2316,7 @@ def run_module():
             module_verbosity_level = module._verbosity
             SingletonLogger().get_logger(module_verbosity_level)
 
-            for data_set_params in data_set_param_list:
-                data_set_params["scratch"] = determine_scratch(data_set_params)
-                data_set_params["noscratch"] = not data_set_params["scratch"]
-                # this returns MVSDataSet, Member or GenerationDataGroup
-                data_set = get_data_set_handler(**data_set_params)
-                current_changed = perform_data_set_operations(
-                    data_set=data_set,
-                    state=data_set_params.get("state"),
-                    replace=data_set_params.get("replace"),
-                    tmp_hlq=data_set_params.get("tmp_hlq"),
-                    force=data_set_params.get("force"),
-                    noscratch=data_set_params.get("noscratch"),
-                )
-                data_set_list.append(data_set)
-                result["changed"] = result["changed"] or current_changed
+            result["changed"], data_set_list = perform_batch_data_set_operations(data_set_param_list)
             # Build return schema from created data sets.
             result.update(build_return_schema(data_set_list))
         except Exception as e:
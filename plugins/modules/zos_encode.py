@@ -120,6 +120,20 @@ options:
         that is not available, then the value C(TMPHLQ) is used.
     required: false
     type: str
+  max_concurrency:
+    description:
+      - Maximum number of files converted at the same time when I(src) is a
+        USS directory.
+      - Only conversions that are done with iconv run in parallel. Code sets
+        the module converts by itself, like ISO8859-1, UTF-8 and the EBCDIC
+        single-byte code pages, are converted one file at a time.
+      - Files that fail to convert don't stop the conversion of the rest of
+        the directory. The files that were converted are tagged and the ones
+        that failed are reported when the task fails.
+      - A value of 1 converts the files one at a time.
+    required: false
+    type: int
+    default: 4
 
 attributes:
   action:
@@ -323,12 +337,21 @@ encoding:
       type: str
       sample: ISO8859-1
       returned: always
+failed_files:
+  description:
+    - Files inside a USS directory that could not be converted, mapped to
+      the error found while converting them.
+  type: dict
+  returned: failure converting some of the files in a directory
+  sample:
+    /zos_encode/test/file1: 'An error occurred during encoding: "iconv: cannot convert"'
 """
 from ansible_collections.ibm.ibm_zos_core.plugins.module_utils.import_handler import (
     ZOAUImportError,
 )
 from ansible_collections.ibm.ibm_zos_core.plugins.module_utils import (
     better_arg_parser,
+    concurrency,
     data_set,
     encode,
     backup as zos_backup,
@@ -506,6 +529,7 @@ def run_module():
         backup_name=dict(type="str", required=False, default=None),
         backup_compress=dict(type="bool", required=False, default=False),
         tmp_hlq=dict(type='str', required=False, default=None),
+        max_concurrency=dict(type="int", required=False, default=concurrency.DEFAULT_MAX_CONCURRENCY),
     )
 
     module = AnsibleModule(argument_spec=module_args)
@@ -535,6 +559,7 @@ def run_module():
         backup_name=dict(arg_type="data_set_or_path", required=False, default=None),
         backup_compress=dict(arg_type="bool", required=False, default=False),
         tmp_hlq=dict(type='qualifier_or_empty', required=False, default=None),
+        max_concurrency=dict(arg_type="int", required=False, default=concurrency.DEFAULT_MAX_CONCURRENCY),
     )
 
     parser = better_arg_parser.BetterArgParser(arg_defs)
@@ -552,6 +577,7 @@ def run_module():
     from_encoding = parsed_args.get("from_encoding").upper()
     to_encoding = parsed_args.get("to_encoding").upper()
     tmphlq = module.params.get('tmp_hlq')
+    max_concurrency = parsed_args.get("max_concurrency")
 
     # is_uss_src(dest) to determine whether the src(dest) is a USS file/path or not
     # is_mvs_src(dest) to determine whether the src(dest) is a MVS data set or not
@@ -709,9 +735,15 @@ def run_module():
             )
 
         if is_uss_src and is_uss_dest:
-            convert_rc = eu.uss_convert_encoding_prev(
-                new_src, new_dest, from_encoding, to_encoding
-            )
+            try:
+                convert_rc = eu.uss_convert_encoding_prev(
+                    new_src, new_dest, from_encoding, to_encoding, max_concurrency=max_concurrency
+                )
+            except encode.EncodeFilesError as err:
+                # Tag what got converted so it matches its new contents
+                # before reporting the files that failed.
+                eu.uss_tag_encoding_files(err.converted, to_encoding)
+                raise
         else:
             convert_rc = eu.mvs_convert_encoding(
                 new_src,
@@ -738,6 +770,9 @@ def run_module():
             stdout_lines=e.stdout.splitlines(),
             stderr_lines=e.stderr.splitlines(),
         )
+    except encode.EncodeFilesError as e:
+        result.update(dict(changed=bool(e.converted), failed_files=e.failures))
+        module.fail_json(msg=e.msg, **result)
     except Exception as e:
         module.fail_json(msg=repr(e), **result)
 
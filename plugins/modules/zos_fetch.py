@@ -34,6 +34,8 @@ description:
   - When fetching a PDS/PDSE member, destination will be a file.
   - Files that already exist at C(dest) will be overwritten if they are different
     than C(src).
+  - When C(dest) already holds the same content as C(src), which is checked by
+    comparing checksums on the remote system, no data is transferred.
   - When fetching a GDS, the relative name will be resolved to its absolute one.
   - When fetching a generation data group, the destination will be a directory
     with the same name as the GDG.
@@ -120,6 +122,27 @@ options:
         that is not available, then the value C(TMPHLQ) is used.
     required: false
     type: str
+  chunk_size:
+    description:
+      - Size in megabytes of the chunks used to fetch a sequential data set,
+        a member of a PDS or PDSE, or a VSAM data set.
+      - When set, the source is read once and cut into chunk files on the
+        remote system while it is read. Every chunk is transferred as soon as
+        it is staged and removed once transferred, so at most two chunks are
+        kept on the remote system at any time, whatever the size of the
+        source.
+      - Every chunk carries a SHA-256 checksum that is verified once it is
+        transferred. Completed chunks are recorded in a journal kept next
+        to I(dest), so rerunning a task that was interrupted resumes the
+        transfer from the first missing chunk.
+      - When resuming, the chunks of the journal are read from the source and
+        checked against their checksums, but are neither staged nor
+        transferred again. A source modified after the interrupted run is
+        fetched again from the first chunk that changed.
+      - This option is ignored for USS files, partitioned data sets and
+        generation data groups.
+    required: false
+    type: int
   ignore_sftp_stderr:
     description:
       - During data transfer through SFTP, the SFTP command directs content to
@@ -148,8 +171,8 @@ attributes:
     description: Can run in check_mode and return changed status prediction without modifying target. If not supported, the action will be skipped.
 
 notes:
-    - When fetching PDSE and VSAM data sets, temporary storage will be used
-      on the remote z/OS system. After the PDSE or VSAM data set is
+    - When fetching PDSE and VSAM data sets without I(chunk_size), temporary
+      storage will be used on the remote z/OS system. After the PDSE or VSAM data set is
       successfully transferred, the temporary storage will be deleted. The size
       of the temporary storage will correspond to the size of PDSE or VSAM
       data set being fetched. If module execution fails, the temporary
@@ -161,6 +184,9 @@ notes:
     - All data sets are always assumed to be cataloged. If an uncataloged
       data set needs to be fetched, it should be cataloged first.
     - Fetching HFS or ZFS type data sets is currently not supported.
+    - When I(chunk_size) is used, the data being fetched is kept in a
+      C(.part) file next to I(dest) along with a C(.journal) file until the
+      last chunk is transferred, then it is moved to I(dest).
     - For supported character sets used to encode data, refer to the
       L(documentation,https://ibm.github.io/z_ansible_collections_doc/ibm_zos_core/docs/source/resources/character_set.html).
     - This module uses SFTP (Secure File Transfer Protocol) for the underlying
@@ -205,6 +231,13 @@ EXAMPLES = r"""
     dest: /tmp/
     flat: true
 
+- name: Fetch a large VSAM data set in resumable chunks of 256 megabytes
+  zos_fetch:
+    src: USER.TEST.LARGE.VSAM
+    dest: /tmp/
+    flat: true
+    chunk_size: 256
+
 - name: Fetch a PDS member named 'DATA'
   zos_fetch:
     src: USER.TEST.PDS(DATA)
@@ -268,6 +301,18 @@ data_set_type:
     returned: success
     type: str
     sample: PDSE
+chunks:
+    description: Number of chunks that make up the fetched data set.
+    returned: success and chunk_size is used
+    type: int
+    sample: 12
+resumed_chunks:
+    description:
+        - Number of chunks found in the journal of a previous run, which
+          were not transferred again.
+    returned: success and chunk_size is used
+    type: int
+    sample: 5
 msg:
     description: Any important messages from the module.
     returned: always
@@ -301,10 +346,15 @@ rc:
 """
 
 
+import json
 import tempfile
 import re
 import os
+import subprocess
+import threading
+import time
 import traceback
+from hashlib import sha256
 from math import ceil
 from shutil import rmtree
 from ansible.module_utils.basic import AnsibleModule
@@ -338,6 +388,160 @@ except Exception:
     zoau_exceptions = ZOAUImportError(traceback.format_exc())
 
 
+# Chunk files staged ahead of the transfer, the remote storage used by a
+# chunked fetch is bounded by this many chunks whatever the size of the source.
+CHUNK_WINDOW = 2
+# Seconds the staging process waits for the controller to take a chunk before
+# it gives up and removes its staging directory.
+CHUNK_IDLE_TIMEOUT = 600
+CHUNK_POLL_INTERVAL = 0.5
+CHUNK_FILE = "chunk.{0}"
+CHUNK_MANIFEST = "chunk.{0}.json"
+CHUNK_ERROR = "error.json"
+CHUNK_FILE_PATTERN = re.compile(r"^chunk\.\d+$")
+_BLOCK_SIZE = 64 * 1024
+
+
+class ChunkStager(object):
+    def __init__(
+        self,
+        staging_dir,
+        chunk_size,
+        resume_chunks=None,
+        window=CHUNK_WINDOW,
+        idle_timeout=CHUNK_IDLE_TIMEOUT
+    ):
+        """Cuts the content of a source into chunk files while it is read,
+        for the action plugin to transfer them one by one.
+
+        Every chunk is published in staging_dir as a chunk file and a
+        manifest with its index, size, checksum and whether it is the last
+        one. A new chunk is only started while fewer than window chunk files
+        wait for the action plugin, which removes each one once transferred.
+        The chunks recorded in the journal of a previous run are read from
+        the source and checked against their checksums, but never written.
+
+        Parameters
+        ----------
+        staging_dir : str
+            USS directory the chunks are published in.
+        chunk_size : int
+            Size of a chunk in megabytes.
+        resume_chunks : list[dict]
+            Size and checksum of the chunks the controller already has.
+        window : int
+            Most chunk files waiting to be transferred at the same time.
+        idle_timeout : int
+            Seconds to wait for a chunk to be transferred before giving up.
+        """
+        self.staging_dir = staging_dir
+        self.chunk_bytes = chunk_size * 1024 * 1024
+        self.resume_chunks = resume_chunks or []
+        self.window = window
+        self.idle_timeout = idle_timeout
+
+    def stage(self, blocks, completed=None):
+        """Publish the chunks of a source.
+
+        Parameters
+        ----------
+        blocks : iterable[bytes]
+            Content of the source.
+        completed : callable
+            Called once the source is read, before its last chunk is
+            published. Raises when the source was not read whole.
+
+        Raises
+        ------
+        SourceChangedError
+            When a chunk the controller already has doesn't match the source.
+        ChunkStagingError
+            When the controller didn't take a chunk in time.
+        """
+        index = 0
+        chunk = self._start(index)
+        try:
+            for block in blocks:
+                view = memoryview(block)
+                while len(view):
+                    if chunk["size"] == self.chunk_bytes:
+                        # There's more content, so the full chunk isn't the last one.
+                        self._finish(chunk, last=False)
+                        index += 1
+                        chunk = self._start(index)
+                    taken = view[:self.chunk_bytes - chunk["size"]]
+                    chunk["digest"].update(taken)
+                    if chunk["outfile"] is not None:
+                        chunk["outfile"].write(taken)
+                    chunk["size"] += len(taken)
+                    view = view[len(taken):]
+
+            if completed is not None:
+                completed()
+            self._finish(chunk, last=True)
+        finally:
+            if chunk["outfile"] is not None:
+                chunk["outfile"].close()
+
+    def fail(self, msg, **kwargs):
+        """Tell the action plugin that staging failed.
+
+        Parameters
+        ----------
+        msg : str
+            Description of the failure.
+        **kwargs : dict
+            Return code, stdout, stderr or the index of the chunk of the
+            source that changed.
+        """
+        self._write_json(CHUNK_ERROR, dict(kwargs, msg=msg))
+
+    def _start(self, index):
+        """Start a chunk, waiting for room when it has to be written."""
+        outfile = None
+        path = os.path.join(self.staging_dir, CHUNK_FILE.format(index))
+        if index >= len(self.resume_chunks):
+            self._wait_for_room()
+            outfile = open(path + ".tmp", "wb")
+        return dict(index=index, path=path, size=0, digest=sha256(), outfile=outfile)
+
+    def _finish(self, chunk, last):
+        """Publish a chunk, or check it against the journal when the
+        controller already has it."""
+        manifest = dict(
+            index=chunk["index"],
+            size=chunk["size"],
+            checksum=chunk["digest"].hexdigest(),
+            last=last,
+            staged=chunk["outfile"] is not None,
+        )
+        if chunk["outfile"] is None:
+            expected = self.resume_chunks[chunk["index"]]
+            if expected.get("size") != manifest["size"] or expected.get("checksum") != manifest["checksum"]:
+                raise SourceChangedError(chunk["index"])
+        else:
+            chunk["outfile"].close()
+            os.rename(chunk["path"] + ".tmp", chunk["path"])
+        self._write_json(CHUNK_MANIFEST.format(chunk["index"]), manifest)
+
+    def _wait_for_room(self):
+        """Wait until fewer than window chunk files are waiting to be taken."""
+        start = time.time()
+        while len([name for name in os.listdir(self.staging_dir) if CHUNK_FILE_PATTERN.match(name)]) >= self.window:
+            if time.time() - start > self.idle_timeout:
+                raise ChunkStagingError(
+                    "No chunk was transferred within {0} seconds".format(self.idle_timeout)
+                )
+            time.sleep(CHUNK_POLL_INTERVAL)
+
+    def _write_json(self, name, content):
+        """Write a file of the staging directory atomically."""
+        path = os.path.join(self.staging_dir, name)
+        with open(path + ".tmp", "w") as outfile:
+            json.dump(content, outfile)
+        os.rename(path + ".tmp", path)
+
+
 class FetchHandler:
     def __init__(self, module):
         self.module = module
@@ -459,8 +663,8 @@ class FetchHandler:
         if tmphlq is None:
             tmphlq = "MVSTMP"
         try:
-            sysin = data_set.DataSet.create_temp(tmphlq)
-            sysprint = data_set.DataSet.create_temp(tmphlq)
+            sysin = data_set.temp_data_set_pool.acquire(tmphlq)
+            sysprint = data_set.temp_data_set_pool.acquire(tmphlq)
             out_ds_name = data_set.DataSet.create_temp(
                 tmphlq, space_primary=vsam_size, space_type="K", record_format="VB", record_length=max_recl
             )
@@ -529,8 +733,8 @@ class FetchHandler:
             )
 
         finally:
-            datasets.delete(sysprint)
-            datasets.delete(sysin)
+            data_set.temp_data_set_pool.release(sysprint)
+            data_set.temp_data_set_pool.release(sysin)
 
         return out_ds_name
 
@@ -616,6 +820,357 @@ class FetchHandler:
 
         return file_path
 
+    def _start_chunk_staging(self, src, ds_type, binary, chunk_size, resume_chunks=None, encoding=None):
+        """Start a process that streams a data set into chunk files. The
+        process outlives the module, the action plugin transfers the chunks
+        while it reads the data set.
+
+        Parameters
+        ----------
+        src : str
+            Name of the data set or member.
+        ds_type : str
+            Type of the data set.
+        binary : bool
+            If it is binary.
+        chunk_size : int
+            Size of a chunk in megabytes.
+        resume_chunks : list[dict]
+            Size and checksum of the chunks the controller already has.
+        encoding : dict
+            The file encoding.
+
+        Returns
+        -------
+        tuple(str,int)
+            USS directory the chunks are published in and ID of the staging
+            process.
+        """
+        dump_args = None
+        if ds_type in data_set.DataSet.MVS_VSAM:
+            dump_args = self._prepare_vsam_dump(src)
+        if (not binary) and encoding:
+            # Codecs are looked up before the module exits, the staging
+            # process can't import anything once the module is gone.
+            encode.get_converter(encoding.get("from"), encoding.get("to"))
+
+        staging_dir = tempfile.mkdtemp()
+        read_fd, write_fd = os.pipe()
+        pid = os.fork()
+        if pid == 0:
+            # Detach the staging process so the module can return while it
+            # runs, the same way Ansible starts asynchronous tasks.
+            os.close(read_fd)
+            os.setsid()
+            staging_pid = os.fork()
+            if staging_pid:
+                os.write(write_fd, str(staging_pid).encode())
+                os._exit(0)
+            os.close(write_fd)
+            devnull = os.open(os.devnull, os.O_RDWR)
+            for fd in (0, 1, 2):
+                os.dup2(devnull, fd)
+            try:
+                self._stage_chunks(src, ds_type, binary, staging_dir, chunk_size, resume_chunks, encoding, dump_args)
+            finally:
+                os._exit(0)
+
+        os.close(write_fd)
+        os.waitpid(pid, 0)
+        staging_pid = int(os.read(read_fd, 32) or 0)
+        os.close(read_fd)
+        return staging_dir, staging_pid
+
+    def _stage_chunks(self, src, ds_type, binary, staging_dir, chunk_size, resume_chunks, encoding, dump_args):
+        """Stream a data set through a named pipe and cut it into chunk
+        files. Runs in the staging process, failures are reported to the
+        action plugin in the staging directory.
+
+        Parameters
+        ----------
+        src : str
+            Name of the data set or member.
+        ds_type : str
+            Type of the data set.
+        binary : bool
+            If it is binary.
+        staging_dir : str
+            USS directory the chunks are published in.
+        chunk_size : int
+            Size of a chunk in megabytes.
+        resume_chunks : list[dict]
+            Size and checksum of the chunks the controller already has.
+        encoding : dict
+            The file encoding.
+        dump_args : dict
+            Data sets and record length used to dump a VSAM data set.
+        """
+        stager = ChunkStager(staging_dir, chunk_size, resume_chunks)
+        pipe_path = os.path.join(staging_dir, "source")
+        os.mkfifo(pipe_path)
+        errors = []
+
+        def dump():
+            try:
+                if dump_args is not None:
+                    self._dump_vsam(src, pipe_path, binary, **dump_args)
+                else:
+                    datasets.copy(source=src, target=pipe_path, options="-B" if binary else "")
+            except Exception as err:
+                errors.append(err)
+            finally:
+                # A dump that failed before opening the pipe would leave the
+                # reader waiting for a writer forever.
+                os.close(os.open(pipe_path, os.O_WRONLY))
+
+        def completed():
+            dumper.join()
+            if errors:
+                raise errors[0]
+
+        dumper = threading.Thread(target=dump)
+        dumper.daemon = True
+        dumper.start()
+        try:
+            with open(pipe_path, "rb") as source:
+                stager.stage(self._read_converted(source, binary, encoding), completed=completed)
+        except SourceChangedError as err:
+            stager.fail(
+                "Chunk {0} of {1} changed since the previous run".format(err.index, src),
+                changed_chunk=err.index
+            )
+        except ZOSFetchError as err:
+            stager.fail(**err.json_args)
+        except ChunkStagingError:
+            # The controller is gone, nobody will read an error.
+            rmtree(staging_dir, ignore_errors=True)
+        except zoau_exceptions.ZOAUException as err:
+            stager.fail(
+                "Unable to copy {0} to USS".format(src),
+                rc=err.response.rc,
+                stdout=err.response.stdout_response,
+                stderr=err.response.stderr_response,
+            )
+        except Exception as err:
+            if os.path.isdir(staging_dir):
+                stager.fail("Unable to stage the chunks of {0}".format(src), stderr=str(err))
+        finally:
+            if dump_args is not None:
+                for name in (dump_args["sysin"], dump_args["sysprint"]):
+                    datasets.delete(name)
+            if os.path.exists(pipe_path):
+                os.remove(pipe_path)
+
+        if not os.path.exists(os.path.join(staging_dir, CHUNK_ERROR)):
+            return
+        # Nobody takes the chunks of a failed run once the error is read.
+        start = time.time()
+        while os.path.isdir(staging_dir) and time.time() - start < CHUNK_IDLE_TIMEOUT:
+            time.sleep(CHUNK_POLL_INTERVAL)
+        if os.path.isdir(staging_dir):
+            rmtree(staging_dir, ignore_errors=True)
+
+    @staticmethod
+    def _read_converted(source, binary, encoding=None):
+        """Read a stream converted to the encoding of the destination.
+
+        Parameters
+        ----------
+        source : file
+            Stream opened in binary mode.
+        binary : bool
+            If it is binary.
+        encoding : dict
+            The file encoding.
+
+        Returns
+        -------
+        generator[bytes]
+            Converted content.
+
+        Raises
+        ------
+        EncodeError
+            When the content can't be converted.
+        """
+        if binary or not encoding:
+            block = source.read(_BLOCK_SIZE)
+            while block:
+                yield block
+                block = source.read(_BLOCK_SIZE)
+            return
+
+        from_code_set = encoding.get("from")
+        to_code_set = encoding.get("to")
+        converter = encode.get_converter(from_code_set, to_code_set)
+        if converter.supported:
+            for block in converter.iter_convert(source):
+                yield block
+            return
+
+        iconv = subprocess.Popen(
+            ["iconv", "-f", from_code_set, "-t", to_code_set],
+            stdin=source,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE
+        )
+        block = iconv.stdout.read(_BLOCK_SIZE)
+        while block:
+            yield block
+            block = iconv.stdout.read(_BLOCK_SIZE)
+        err = iconv.stderr.read()
+        if iconv.wait():
+            raise encode.EncodeError(err.decode("utf-8", errors="replace"))
+
+    def _prepare_vsam_dump(self, ds_name):
+        """Allocate the data sets IDCAMS needs to dump a VSAM data set, before
+        the staging process starts so their failures fail the module.
+
+        Parameters
+        ----------
+        ds_name : str
+            VSAM data set name.
+
+        Returns
+        -------
+        dict
+            SYSIN and SYSPRINT data sets, record length of the dump and
+            number of records of the VSAM data set.
+        """
+        vsam_size, max_recl, rec_total = self._get_vsam_size(ds_name)
+        if max_recl == 0:
+            max_recl = 80
+        tmphlq = self.module.params.get("tmp_hlq") or "MVSTMP"
+        # The staging process outlives the module, so these can't come from
+        # the pool, which deletes its data sets when the module exits.
+        sysin = data_set.DataSet.create_temp(tmphlq)
+        sysprint = data_set.DataSet.create_temp(tmphlq)
+        datasets.write(sysin, " REPRO INFILE(INPUT)  OUTFILE(OUTPUT) ")
+        # RDW takes the first 4 bytes of the records in the VB format.
+        return dict(sysin=sysin, sysprint=sysprint, record_length=max_recl + 4, rec_total=rec_total)
+
+    def _dump_vsam(self, ds_name, path, binary, sysin, sysprint, record_length, rec_total):
+        """Dump the records of a VSAM data set into a USS file or named pipe
+        with IDCAMS REPRO, without staging them in a data set.
+
+        Parameters
+        ----------
+        ds_name : str
+            VSAM data set name.
+        path : str
+            USS file or named pipe the records are written to.
+        binary : bool
+            If it is binary.
+        sysin : str
+            Data set holding the REPRO statement.
+        sysprint : str
+            Data set IDCAMS writes its messages to.
+        record_length : int
+            Record length of the dump.
+        rec_total : int
+            Number of records of the VSAM data set.
+
+        Raises
+        ------
+        ZOSFetchError
+            When IDCAMS fails.
+        """
+        dd_statements = [
+            ztypes.DDStatement(name="sysin", definition=ztypes.DatasetDefinition(sysin)),
+            ztypes.DDStatement(name="input", definition=ztypes.DatasetDefinition(ds_name)),
+            ztypes.DDStatement(
+                name="output",
+                definition=ztypes.FileDefinition(
+                    path,
+                    file_data="binary" if binary else "text",
+                    record_format="VB",
+                    record_length=record_length
+                )
+            ),
+            ztypes.DDStatement(name="sysprint", definition=ztypes.DatasetDefinition(sysprint)),
+        ]
+        response = mvscmd.execute_authorized(pgm="idcams", dds=dd_statements)
+        # An empty VSAM data set ends with return code 12, it's fetched as an empty file.
+        if response.rc != 0 and rec_total > 0:
+            raise ZOSFetchError(
+                msg="Non-zero return code received while executing mvscmd to copy VSAM data set {0}".format(ds_name),
+                rc=response.rc,
+                stdout=response.stdout_response,
+                stderr=response.stderr_response,
+            )
+
+    @staticmethod
+    def _get_file_checksum(file_path):
+        """Calculate the SHA256 hash of a USS file.
+
+        Parameters
+        ----------
+        file_path : str
+            Path of the file.
+
+        Returns
+        -------
+        str
+            Hex digest of the file.
+        """
+        blksize = 64 * 1024
+        hash_digest = sha256()
+        with open(file_path, "rb") as infile:
+            block = infile.read(blksize)
+            while block:
+                hash_digest.update(block)
+                block = infile.read(blksize)
+        return hash_digest.hexdigest()
+
+    def _get_uss_checksum(self, src, binary, encoding=None):
+        """Calculate the SHA256 hash of the content that would be staged
+        when fetching a USS file, without writing it to disk.
+
+        Parameters
+        ----------
+        src : str
+            Source of the file.
+        binary : bool
+            If is binary.
+        encoding : dict
+            The file encoding.
+
+        Returns
+        -------
+        str
+            Hex digest of the content, None when it couldn't be converted.
+        """
+        if binary or not encoding:
+            return self._get_file_checksum(src)
+
+        # Same conversion done by EncodeUtils.uss_convert_encoding, streamed
+        # through the hash instead of a temporary file.
+        hash_digest = sha256()
+        converter = encode.CodeSetConverter(encoding.get("from"), encoding.get("to"))
+        if converter.supported:
+            try:
+                with open(src, "rb") as infile:
+                    for chunk in converter.iter_convert(infile):
+                        hash_digest.update(chunk)
+            except encode.EncodeError:
+                return None
+            return hash_digest.hexdigest()
+
+        iconv_cmd = ["iconv", "-f", encoding.get("from"), "-t", encoding.get("to"), src]
+        blksize = 64 * 1024
+        try:
+            process = subprocess.Popen(iconv_cmd, stdout=subprocess.PIPE, stderr=subprocess.DEVNULL)
+        except OSError:
+            return None
+        block = process.stdout.read(blksize)
+        while block:
+            hash_digest.update(block)
+            block = process.stdout.read(blksize)
+        process.stdout.close()
+        if process.wait() != 0:
+            return None
+        return hash_digest.hexdigest()
+
     def _fetch_pdse(self, src, binary, temp_dir=None, encoding=None):
         """Copy a partitioned data set to a USS directory. If the data set
         is not being fetched in binary mode, encoding for all members inside
@@ -855,6 +1410,9 @@ def run_module():
             encoding=dict(required=False, type="dict"),
             ignore_sftp_stderr=dict(type="bool", default=True, required=False),
             tmp_hlq=dict(required=False, type="str", default=None),
+            chunk_size=dict(required=False, type="int"),
+            _local_checksum=dict(required=False, type="str"),
+            _resume_chunks=dict(required=False, type="list", elements="dict"),
         )
     )
     validate_dependencies(module)
@@ -877,6 +1435,7 @@ def run_module():
         binary=dict(arg_type="bool", required=False, default=False),
         use_qualifier=dict(arg_type="bool", required=False, default=False),
         tmp_hlq=dict(type='qualifier_or_empty', required=False, default=None),
+        chunk_size=dict(arg_type="int", required=False),
     )
 
     if not module.params.get("encoding").get("from") and not module.params.get("binary"):
@@ -923,6 +1482,11 @@ def run_module():
     binary = boolean(parsed_args.get("binary"))
     encoding = module.params.get("encoding")
     tmphlq = module.params.get("tmp_hlq")
+    chunk_size = parsed_args.get("chunk_size")
+    local_checksum = module.params.get("_local_checksum")
+
+    if chunk_size is not None and chunk_size < 1:
+        module.fail_json(msg="The chunk_size must be a positive number of megabytes")
 
     # ********************************************************** #
     #  Check for data set existence and determine its type       #
@@ -1003,11 +1567,33 @@ def run_module():
             msg="Error while gathering source information", stderr=str(err)
         )
 
+    # ********************************************************** #
+    #  Stream a sequential data set, member or VSAM into chunks  #
+    #  the action plugin transfers while they're staged. Only    #
+    #  the chunks it doesn't have yet are written.               #
+    # ********************************************************** #
+
+    fetch_in_chunks = bool(chunk_size) and (
+        ds_type in data_set.DataSet.MVS_SEQ
+        or ds_type in data_set.DataSet.MVS_VSAM
+        or (ds_type in data_set.DataSet.MVS_PARTITIONED and is_member)
+    )
+
+    if fetch_in_chunks:
+        result["chunk_dir"], result["chunk_pid"] = fetch_handler._start_chunk_staging(
+            src_data_set.name,
+            ds_type,
+            binary,
+            chunk_size,
+            resume_chunks=module.params.get("_resume_chunks"),
+            encoding=encoding
+        )
+
     # ********************************************************** #
     #                  Fetch a sequential data set               #
     # ********************************************************** #
 
-    if ds_type in data_set.DataSet.MVS_SEQ:
+    elif ds_type in data_set.DataSet.MVS_SEQ:
         file_path = fetch_handler._fetch_mvs_data(
             src_data_set.name,
             binary,
@@ -1043,12 +1629,21 @@ def run_module():
             module.fail_json(
                 msg="File '{0}' does not have appropriate read permission".format(src)
             )
-        file_path = fetch_handler._fetch_uss_file(
+        if local_checksum and local_checksum == fetch_handler._get_uss_checksum(
             src,
             binary,
             encoding=encoding
-        )
-        result["remote_path"] = file_path
+        ):
+            # The controller already holds this content, no need to stage it.
+            result["checksum"] = local_checksum
+            result["checksum_match"] = True
+        else:
+            file_path = fetch_handler._fetch_uss_file(
+                src,
+                binary,
+                encoding=encoding
+            )
+            result["remote_path"] = file_path
 
     # ********************************************************** #
     #                  Fetch a VSAM data set                     #
@@ -1073,6 +1668,25 @@ def run_module():
             encoding=encoding
         )
 
+    # ********************************************************** #
+    #  Compare the staged content with the copy the controller   #
+    #  already holds, so the action plugin can skip transferring #
+    #  it when they match.                                       #
+    # ********************************************************** #
+
+    if (
+        local_checksum
+        and ds_type != "USS"
+        and not fetch_in_chunks
+        and result["remote_path"]
+        and os.path.isfile(result["remote_path"])
+    ):
+        result["checksum"] = fetch_handler._get_file_checksum(result["remote_path"])
+        if result["checksum"] == local_checksum:
+            os.remove(result["remote_path"])
+            result["remote_path"] = ""
+            result["checksum_match"] = True
+
     if ds_type == "USS":
         result["src"] = src
     else:
@@ -1118,6 +1732,32 @@ class ZOSFetchError(Exception):
         super().__init__(msg)
 
 
+class SourceChangedError(Exception):
+    def __init__(self, index):
+        """A chunk the controller already has doesn't match the source.
+
+        Parameters
+        ----------
+        index : int
+            Index of the chunk that changed.
+        """
+        self.index = index
+        super().__init__("Chunk {0} changed since the previous run".format(index))
+
+
+class ChunkStagingError(Exception):
+    def __init__(self, msg):
+        """Error while staging the chunks of a source.
+
+        Parameters
+        ----------
+        msg : str
+            Human readable string describing the exception.
+        """
+        self.msg = msg
+        super().__init__(msg)
+
+
 def main():
     run_module()
 
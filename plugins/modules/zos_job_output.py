@@ -69,6 +69,66 @@ options:
     type: bool
     default: false
     required: false
+  dd_content:
+    description:
+      - Part of the content of each DD to return.
+      - Returning only part of the content keeps large spool files out of the
+        module result.
+      - The steps, system and node of a job come from the JES2 DDs
+        (JESMSGLG and JESYSMSG), so they're only returned when the content of
+        those DDs is read. They aren't when I(mode=none) or when I(ddname)
+        leaves those DDs out.
+    type: dict
+    required: false
+    suboptions:
+      mode:
+        description:
+          - C(full) returns every line of the DD.
+          - C(none) returns only the DD name, record count and byte count, the
+            content of the DD is not read.
+          - C(head) and C(tail) return the first or last I(lines) lines.
+          - C(bytes) returns the lines between the byte offsets I(start) and
+            I(end) of the UTF-8 encoded content. Characters split by an offset
+            are left out.
+          - C(match) returns the lines that match the regular expression I(pattern).
+        type: str
+        choices: [full, none, head, tail, bytes, match]
+        default: full
+        required: false
+      lines:
+        description:
+          - Number of lines returned when I(mode=head) or I(mode=tail).
+        type: int
+        default: 100
+        required: false
+      start:
+        description:
+          - Byte offset where the returned content begins when I(mode=bytes).
+        type: int
+        default: 0
+        required: false
+      end:
+        description:
+          - Byte offset where the returned content ends when I(mode=bytes).
+          - Content is returned up to the end of the DD when not set.
+        type: int
+        required: false
+      pattern:
+        description:
+          - Regular expression the returned lines match when I(mode=match).
+        type: str
+        required: false
+  max_concurrency:
+    description:
+      - Maximum number of requests to JES2 running at the same time.
+      - When many jobs match, their DDs are listed and read for several jobs
+        at the same time. When a single job matches, several of its DDs are
+        read at the same time.
+      - Jobs and DDs are returned in the same order regardless of this value.
+      - A value of 1 queries the jobs and their DDs one at a time.
+    type: int
+    default: 4
+    required: false
 
 attributes:
   action:
@@ -103,6 +163,27 @@ EXAMPLES = r"""
   zos_job_output:
     job_id: "JOB00548"
     sysin_dd: true
+
+- name: List the DDs of a job without reading their content
+  zos_job_output:
+    job_id: "JOB00548"
+    dd_content:
+      mode: none
+
+- name: Get the last 50 lines of each DD of a long running job
+  zos_job_output:
+    job_id: "STC02560"
+    dd_content:
+      mode: tail
+      lines: 50
+
+- name: Get the lines of the job log with messages that start with IEF
+  zos_job_output:
+    job_id: "JOB00548"
+    dd_name: "JESMSGLG"
+    dd_content:
+      mode: match
+      pattern: "IEF[0-9]{3}I"
 """
 
 RETURN = r"""
@@ -222,7 +303,8 @@ jobs:
           sample: 574
         content:
           description:
-            The dd content.
+            The dd content. Only the part selected by I(dd_content) is
+            returned, null when I(dd_content.mode=none).
           type: list
           elements: str
           sample:
@@ -326,6 +408,84 @@ jobs:
           "step_cc": 0
         }
       ]
+    log_index:
+      description:
+        - Index of the JES2 job log (JESMSGLG) and system messages (JESYSMSG)
+          DDs, built in a single pass over their lines.
+        - Only the JES2 DDs whose content was read are indexed.
+        - Lines are counted from 0, in the same order as the content of the DD.
+      type: dict
+      contains:
+        steps:
+          description:
+            Steps that were executed with their condition code and the line
+            that reported them.
+          type: list
+          elements: dict
+          contains:
+            step_name:
+              description: Name of the step.
+              type: str
+              sample: STEP0001
+            step_cc:
+              description: Condition code of the step.
+              type: int
+              sample: 0
+            dd_name:
+              description: DD the step was found in.
+              type: str
+              sample: JESYSMSG
+            line:
+              description: Line the step was found in.
+              type: int
+              sample: 12
+        abends:
+          description:
+            Steps that ended abnormally with their abend code and the line
+            that reported them.
+          type: list
+          elements: dict
+          contains:
+            step_name:
+              description: Name of the step.
+              type: str
+              sample: STEP0001
+            abend_code:
+              description: System or user abend code.
+              type: str
+              sample: S0C4
+            dd_name:
+              description: DD the abend was found in.
+              type: str
+              sample: JESYSMSG
+            line:
+              description: Line the abend was found in.
+              type: int
+              sample: 14
+        messages:
+          description:
+            - IEF, IEA and $HASP messages found in the job log.
+            - Only the first 100 messages are returned.
+          type: list
+          elements: dict
+          contains:
+            msg_id:
+              description: ID of the message.
+              type: str
+              sample: $HASP373
+            dd_name:
+              description: DD the message was found in.
+              type: str
+              sample: JESMSGLG
+            line:
+              description: Line the message was found in.
+              type: int
+              sample: 3
+        messages_truncated:
+          description:
+            True when the job log had more messages than the ones returned.
+          type: bool
+          sample: false
   sample:
      [
       {
@@ -474,15 +634,18 @@ changed:
 
 
 from ansible.module_utils.basic import AnsibleModule
+import re
 import traceback
 from ansible_collections.ibm.ibm_zos_core.plugins.module_utils.import_handler import (
     ZOAUImportError,
 )
 from ansible_collections.ibm.ibm_zos_core.plugins.module_utils.job import (
+    DDContentSelection,
     job_output,
 )
 from ansible_collections.ibm.ibm_zos_core.plugins.module_utils import (
-    better_arg_parser
+    better_arg_parser,
+    concurrency,
 )
 from ansible_collections.ibm.ibm_zos_core.plugins.module_utils.dependency_checker import (
     validate_dependencies,
@@ -515,6 +678,23 @@ def run_module():
         owner=dict(type="str", required=False),
         dd_name=dict(type="str", required=False, aliases=['ddname']),
         sysin_dd=dict(type="bool", required=False, default=False),
+        dd_content=dict(
+            type="dict",
+            required=False,
+            options=dict(
+                mode=dict(
+                    type="str",
+                    required=False,
+                    default="full",
+                    choices=["full", "none", "head", "tail", "bytes", "match"]
+                ),
+                lines=dict(type="int", required=False, default=100),
+                start=dict(type="int", required=False, default=0),
+                end=dict(type="int", required=False),
+                pattern=dict(type="str", required=False),
+            )
+        ),
+        max_concurrency=dict(type="int", required=False, default=concurrency.DEFAULT_MAX_CONCURRENCY),
     )
 
     module = AnsibleModule(argument_spec=module_args, supports_check_mode=True)
@@ -530,6 +710,18 @@ def run_module():
             aliases=['ddname'],
         ),
         sysin_dd=dict(type="bool", required=False, default=False),
+        dd_content=dict(
+            type="dict",
+            required=False,
+            options=dict(
+                mode=dict(type="str", required=False, default="full"),
+                lines=dict(type="int", required=False, default=100),
+                start=dict(type="int", required=False, default=0),
+                end=dict(type="int", required=False),
+                pattern=dict(type="str", required=False),
+            )
+        ),
+        max_concurrency=dict(type="int", required=False, default=concurrency.DEFAULT_MAX_CONCURRENCY),
     )
 
     try:
@@ -554,13 +746,29 @@ def run_module():
     owner = module.params.get("owner")
     dd_name = module.params.get("dd_name")
     sysin = module.params.get("sysin_dd")
+    dd_content = module.params.get("dd_content")
+    max_concurrency = module.params.get("max_concurrency")
 
     if not job_id and not job_name and not owner:
         module.fail_json(msg="Please provide a job_id or job_name or owner", stderr="", **results)
 
+    if dd_content:
+        try:
+            dd_content = DDContentSelection(**dd_content)
+        except (ValueError, re.error) as err:
+            module.fail_json(msg="Parameter verification failed.", stderr=str(err), **results)
+
     try:
         results = {}
-        results["jobs"] = job_output(job_id=job_id, owner=owner, job_name=job_name, dd_name=dd_name, sysin=sysin)
+        results["jobs"] = job_output(
+            job_id=job_id,
+            owner=owner,
+            job_name=job_name,
+            dd_name=dd_name,
+            sysin=sysin,
+            dd_content=dd_content,
+            max_concurrency=max_concurrency
+        )
         for job in results["jobs"]:
             if "job_not_found" in job:
                 results["changed"] = False
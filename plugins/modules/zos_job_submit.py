@@ -69,6 +69,9 @@ options:
         Job details and contents can be retrieved later by using
         L(zos_job_query,./zos_job_query.html) or L(zos_job_output,./zos_job_output.html)
         if needed.
+      - Jobs submitted with I(wait_time=0) can be waited for together by using
+        L(zos_job_wait,./zos_job_wait.html), which refreshes all of them with a
+        single query per sweep.
       - If I(remote_src=False) and I(wait_time=0), the module will not clean the copy
         of the file on the remote system, to avoid problems with job submission.
   max_rc:
@@ -186,6 +189,21 @@ jobs:
       description: The total lapsed time the JCL ran for.
       type: int
       sample: 0
+    polling:
+      description:
+        - Cost of waiting for the job to complete.
+        - Polls are frequent right after the job is submitted and slow down
+          the longer the job runs.
+      type: dict
+      contains:
+        polls:
+          description: Number of times the status of the job was polled.
+          type: int
+          sample: 6
+        wait_time:
+          description: Seconds spent waiting between polls.
+          type: float
+          sample: 6.2
     execution_time:
       description: Total duration time of the job execution, if it has finished.
       type: str
@@ -324,6 +342,84 @@ jobs:
             "step_cc": 0
           }
         ]
+    log_index:
+      description:
+        - Index of the JES2 job log (JESMSGLG) and system messages (JESYSMSG)
+          DDs, built in a single pass over their lines.
+        - Only the JES2 DDs whose content was read are indexed.
+        - Lines are counted from 0, in the same order as the content of the DD.
+      type: dict
+      contains:
+        steps:
+          description:
+            Steps that were executed with their condition code and the line
+            that reported them.
+          type: list
+          elements: dict
+          contains:
+            step_name:
+              description: Name of the step.
+              type: str
+              sample: STEP0001
+            step_cc:
+              description: Condition code of the step.
+              type: int
+              sample: 0
+            dd_name:
+              description: DD the step was found in.
+              type: str
+              sample: JESYSMSG
+            line:
+              description: Line the step was found in.
+              type: int
+              sample: 12
+        abends:
+          description:
+            Steps that ended abnormally with their abend code and the line
+            that reported them.
+          type: list
+          elements: dict
+          contains:
+            step_name:
+              description: Name of the step.
+              type: str
+              sample: STEP0001
+            abend_code:
+              description: System or user abend code.
+              type: str
+              sample: S0C4
+            dd_name:
+              description: DD the abend was found in.
+              type: str
+              sample: JESYSMSG
+            line:
+              description: Line the abend was found in.
+              type: int
+              sample: 14
+        messages:
+          description:
+            - IEF, IEA and $HASP messages found in the job log.
+            - Only the first 100 messages are returned.
+          type: list
+          elements: dict
+          contains:
+            msg_id:
+              description: ID of the message.
+              type: str
+              sample: $HASP373
+            dd_name:
+              description: DD the message was found in.
+              type: str
+              sample: JESMSGLG
+            line:
+              description: Line the message was found in.
+              type: int
+              sample: 3
+        messages_truncated:
+          description:
+            True when the job log had more messages than the ones returned.
+          type: bool
+          sample: false
     job_class:
       description:
         Job class for this job.
@@ -658,6 +754,13 @@ EXAMPLES = r"""
     remote_src: true
     wait_time: 30
 
+- name: Submit a job without waiting for it and wait for it later with zos_job_wait.
+  zos_job_submit:
+    src: HLQ.DATA.LLQ(LONGRUN)
+    remote_src: true
+    wait_time: 0
+  register: submitted
+
 - name: Submit JCL and set the max return code the module should fail on to 16.
   zos_job_submit:
     src: HLQ.DATA.LLQ
@@ -682,7 +785,7 @@ from ansible_collections.ibm.ibm_zos_core.plugins.module_utils.better_arg_parser
     BetterArgParser,
 )
 from ansible_collections.ibm.ibm_zos_core.plugins.module_utils.job import (
-    job_output, search_dictionaries, JOB_ERROR_STATUSES
+    job_output, search_dictionaries, CompletionPoller, JOB_ERROR_STATUSES
 )
 from ansible_collections.ibm.ibm_zos_core.plugins.module_utils.import_handler import (
     ZOAUImportError,
@@ -702,7 +805,6 @@ from timeit import default_timer as timer
 from os import path
 import shutil
 import traceback
-from time import sleep
 import re
 from ansible_collections.ibm.ibm_zos_core.plugins.module_utils.log import SingletonLogger
 
@@ -724,7 +826,7 @@ JOB_SPECIAL_PROCESSING = frozenset(["TYPRUN"])
 MAX_WAIT_TIME_S = 86400
 
 
-def submit_src_jcl(module, src, src_name=None, timeout=0, is_unix=True, start_time=timer()):
+def submit_src_jcl(module, src, src_name=None, timeout=0, is_unix=True, start_time=timer(), poller=None):
     """Submit src JCL whether JCL is local (Ansible Controller), USS or in a data set.
 
         Parameters
@@ -745,6 +847,9 @@ def submit_src_jcl(module, src, src_name=None, timeout=0, is_unix=True, start_ti
             True.
         start_time : int
             time the JCL started its submission.
+        poller : CompletionPoller
+            Paces the polls made while waiting for the job to complete, one
+            bound to timeout and start_time is used when None.
 
         Returns
         -------
@@ -776,19 +881,18 @@ def submit_src_jcl(module, src, src_name=None, timeout=0, is_unix=True, start_ti
     duration = 0
     job_submitted = None
     result = {}
+    poller = poller or CompletionPoller(timeout, start_time)
 
     try:
         job_submitted = jobs.submit(src, is_unix=is_unix, **kwargs)
 
         if timeout > 0:
 
-            # Introducing a sleep to ensure we have the result of job submit carrying the job id.
-            while (job_submitted is None and duration <= timeout):
-                current_time = timer()
-                duration = round(current_time - start_time)
-                sleep(0.5)
+            # Introducing a wait to ensure we have the result of job submit carrying the job id.
+            while (job_submitted is None and poller.wait()):
+                duration = poller.duration
 
-            # Second sleep is to wait long enough for the job rc to not equal a `?`
+            # Second wait is to wait long enough for the job rc to not equal a `?`
             # which is what ZOAU sends back, opitonally we can check the 'status' as
             # that is sent back as `AC` when the job is not complete but the problem
             # with monitoring 'AC' is that STARTED tasks never exit the AC status.
@@ -797,6 +901,7 @@ def submit_src_jcl(module, src, src_name=None, timeout=0, is_unix=True, start_ti
             job_fetch_status = None
 
             if job_submitted:
+                poller.reset()
                 try:
                     job_fetched = jobs.fetch_multiple(job_submitted.job_id)[0]
                     job_fetch_rc = job_fetched.return_code
@@ -808,13 +913,13 @@ def submit_src_jcl(module, src, src_name=None, timeout=0, is_unix=True, start_ti
                 # status that matches one in JOB_STATUSES, don't wait, let the code
                 # drop through and get analyzed in the main as it will scan the job ouput
                 # Any match to JOB_STATUSES ends our processing and wait times
+                # Polls are fast at first and back off for long running jobs, only
+                # the status of the job is fetched while waiting.
                 while (job_fetch_status not in JOB_STATUSES and
                         job_fetch_status == 'AC' and
                         ((job_fetch_rc is None or len(job_fetch_rc) == 0 or
-                          job_fetch_rc == '?') and duration < timeout)):
-                    current_time = timer()
-                    duration = round(current_time - start_time)
-                    sleep(1)
+                          job_fetch_rc == '?') and poller.wait())):
+                    duration = poller.duration
                     try:
                         job_fetched = jobs.fetch_multiple(job_submitted.job_id)[0]
                         job_fetch_rc = job_fetched.return_code
@@ -1021,13 +1126,14 @@ def run_module():
     job_submitted_id = None
     duration = 0
     start_time = timer()
+    poller = CompletionPoller(wait_time, start_time)
 
     if remote_src:
         if "/" in src:
             if path.exists(src):
                 if path.isfile(src):
                     job_submitted_id, duration = submit_src_jcl(
-                        module, src, src_name=src, timeout=wait_time, is_unix=True)
+                        module, src, src_name=src, timeout=wait_time, is_unix=True, poller=poller)
                 else:
                     module.fail_json(msg=f"Unable to submit job {src} is a folder, must be a file.", **result)
             else:
@@ -1056,10 +1162,10 @@ def run_module():
                     module.fail_json(msg=f"Cannot submit job, the data set {src_data.raw_name} was not found.", **result)
 
             job_submitted_id, duration = submit_src_jcl(
-                module, src_data.name, src_name=src_data.raw_name, timeout=wait_time, is_unix=False, start_time=start_time)
+                module, src_data.name, src_name=src_data.raw_name, timeout=wait_time, is_unix=False, start_time=start_time, poller=poller)
     else:
         job_submitted_id, duration = submit_src_jcl(
-            module, src, src_name=src, timeout=wait_time, is_unix=True)
+            module, src, src_name=src, timeout=wait_time, is_unix=True, poller=poller)
 
     # Explictly pass None for the unused args else a default of '*' will be
     # used and return undersirable results
@@ -1071,12 +1177,13 @@ def run_module():
         try:
             job_output_txt = job_output(
                 job_id=job_submitted_id, owner=None, job_name=None, dd_name=None,
-                dd_scan=return_output, duration=duration, timeout=wait_time, start_time=start_time)
+                dd_scan=return_output, duration=duration, timeout=wait_time, start_time=start_time,
+                poller=poller)
             # This is resolvig a bug where the duration coming from job_output is passed by value, duration
             # being an immutable type can not be changed and must be returned or accessed from the job.py.
             if job_output_txt is not None:
                 duration = job_output_txt[0].get("duration") if not None else duration
-                job_output_txt = parsing_job_response(job_output_txt, duration)
+                job_output_txt = parsing_job_response(job_output_txt, duration, poller.stats())
 
             result["duration"] = duration
             job_msg = job_output_txt[0].get("ret_code", {}).get("msg")
@@ -1105,7 +1212,7 @@ def run_module():
             if job_output_txt:
                 result["jobs"] = job_output_txt
                 job_ret_code = job_output_txt[0].get("ret_code")
-                steps = job_output_txt[0].get("steps")
+                log_index = job_output_txt[0].get("log_index") or {}
 
                 if job_ret_code:
                     job_ret_code_msg = job_ret_code.get("msg")
@@ -1113,7 +1220,7 @@ def run_module():
                     job_ret_code_msg_code = job_ret_code.get("msg_code")
 
                     if return_output is True and max_rc is not None:
-                        is_changed = assert_valid_return_code(max_rc, job_ret_code_code, job_ret_code, steps, result)
+                        is_changed = assert_valid_return_code(max_rc, job_ret_code_code, job_ret_code, log_index, result)
 
                     if job_ret_code_msg is not None:
                         if re.search("^(?:{0})".format("|".join(JOB_STATUSES)), job_ret_code_msg):
@@ -1121,6 +1228,10 @@ def run_module():
                             if re.search("^(?:CC)", job_ret_code_msg) is None:
                                 _msg = ("The job completion code (CC) was not in the job log. "
                                         "please review the job log for status {0}.".format(job_ret_code_msg))
+                                abends = log_index.get("abends")
+                                if abends:
+                                    _msg = "{0} Step {1} ended abnormally with {2}.".format(
+                                        _msg, abends[0]["step_name"], abends[0]["abend_code"])
                                 result["stderr"] = _msg
                                 job_ret_code.update({"msg_txt": _msg})
                                 raise Exception(_msg)
@@ -1215,7 +1326,7 @@ def run_module():
     module.exit_json(**result)
 
 
-def assert_valid_return_code(max_rc, job_rc, ret_code, steps, result):
+def assert_valid_return_code(max_rc, job_rc, ret_code, log_index, result):
     """Asserts valid return code.
 
     Parameters
@@ -1226,6 +1337,9 @@ def assert_valid_return_code(max_rc, job_rc, ret_code, steps, result):
         Job return code.
     ret_code : int
         Return code.
+    log_index : dict
+        Index of the job log, the steps and their condition codes are taken
+        from it.
     result : dict()
         Result dictionary.
 
@@ -1258,8 +1372,10 @@ def assert_valid_return_code(max_rc, job_rc, ret_code, steps, result):
         result["stderr"] = _msg
         raise Exception(_msg)
 
-    for step in steps:
-        step_cc_rc = int(step["step_cc"])
+    for step in log_index.get("steps", []):
+        if step["step_cc"] is None:
+            continue
+        step_cc_rc = step["step_cc"]
         step_name_for_rc = step["step_name"]
         if step_cc_rc > max_rc:
             _msg = ("The step name {0} with return code {1} for the submitted job is "
@@ -1282,7 +1398,7 @@ def assert_valid_return_code(max_rc, job_rc, ret_code, steps, result):
     return True
 
 
-def parsing_job_response(jobs_raw, duration):
+def parsing_job_response(jobs_raw, duration, polling=None):
     """_summary_
 
     Args:
@@ -1296,10 +1412,12 @@ def parsing_job_response(jobs_raw, duration):
             "job_name": job.get("job_name"),
             "content_type": job.get("content_type"),
             "duration": duration,
+            "polling": polling,
             "execution_time": job.get("execution_time"),
             "dds": job.get("dds"),
             "ret_code": job.get("ret_code"),
             "steps": job.get("steps"),
+            "log_index": job.get("log_index"),
             "job_class": job.get("job_class"),
             "svc_class": job.get("svc_class"),
             "system": job.get("system"),
@@ -1330,10 +1448,12 @@ def build_empty_response(job_submitted_id):
         "job_name": None,
         "content_type": None,
         "duration": None,
+        "polling": None,
         "execution_time": None,
         "dds": [],
         "ret_code": {"code": None, "msg": None, "msg_code": None, "msg_txt": None},
         "steps": [],
+        "log_index": None,
         "job_class": None,
         "svc_class": None,
         "system": None,
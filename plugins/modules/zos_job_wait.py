@@ -0,0 +1,582 @@
+#!/usr/bin/python
+# -*- coding: utf-8 -*-
+
+# Copyright (c) IBM Corporation 2026
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#     http://www.apache.org/licenses/LICENSE-2.0
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from __future__ import absolute_import, division, print_function
+
+__metaclass__ = type
+
+
+DOCUMENTATION = r"""
+module: zos_job_wait
+version_added: '2.1.0'
+short_description: Wait for submitted jobs to complete
+description:
+  - Wait for one or more z/OS jobs to complete.
+  - When I(owner) is set, every sweep refreshes the jobs with one query to
+    JES for the jobs of that owner.
+  - Otherwise, every sweep makes one query to JES per type of job ID, scoped
+    by the longest prefix the job IDs of that type share. Job IDs that share
+    no more than their type are split by their first digit, so a sweep makes
+    at most ten queries per type and never lists the whole spool.
+  - Sweeps are frequent at first and slow down the longer the jobs run.
+  - Returns as soon as every job completes or, when I(fail_fast=true), as soon
+    as one of them fails.
+  - Pairs with M(ibm.ibm_zos_core.zos_job_submit) using I(wait_time=0), which
+    submits a job and returns its job ID without waiting for it.
+author:
+  - "IBM Z Open Automation Team"
+options:
+  job_ids:
+    description:
+      - IDs of the jobs to wait for.
+      - A job id must begin with `STC`, `JOB`, `TSU` and are
+        followed by up to 5 digits.
+      - When a job id is greater than 99,999, the job id format will begin
+        with `S`, `J`, `T` and are followed by 7 digits.
+    type: list
+    elements: str
+    required: true
+  owner:
+    description:
+      - Owner of the jobs.
+      - When set, each sweep lists the jobs of this owner with a single query.
+    type: str
+    required: false
+  wait_time:
+    description:
+      - Maximum number of seconds to wait for the jobs to complete.
+      - The module fails when a job hasn't completed within this time.
+    type: int
+    required: false
+    default: 10
+  max_rc:
+    description:
+      - Highest return code a completed job can have without being
+        considered failed.
+    type: int
+    required: false
+    default: 0
+  fail_fast:
+    description:
+      - Whether to stop waiting as soon as a job fails.
+      - A job fails when it ends with an error status, like C(ABEND) or
+        C(JCLERR), or with a return code greater than I(max_rc).
+      - When false, the module waits for every job to complete before
+        reporting the failed ones.
+    type: bool
+    required: false
+    default: true
+
+attributes:
+  action:
+    support: none
+    description: Indicates this has a corresponding action plugin so some parts of the options can be executed on the controller.
+  async:
+    support: full
+    description: Supports being used with the ``async`` keyword.
+  check_mode:
+    support: full
+    description: Can run in check_mode and return changed status prediction without modifying target. If not supported, the action will be skipped.
+
+seealso:
+  - module: zos_job_submit
+  - module: zos_job_query
+"""
+
+EXAMPLES = r"""
+- name: Submit jobs without waiting for them to complete.
+  zos_job_submit:
+    src: "HLQ.DATA.LLQ({{ item }})"
+    remote_src: true
+    wait_time: 0
+  loop:
+    - PAYROLL1
+    - PAYROLL2
+    - PAYROLL3
+  register: submitted
+
+- name: Wait up to 10 minutes for all the jobs, stop on the first failure.
+  zos_job_wait:
+    job_ids: "{{ submitted.results | map(attribute='jobs') | map('first') | map(attribute='job_id') | list }}"
+    wait_time: 600
+
+- name: Wait for every job of owner ADMIN to complete, allowing return codes up to 4.
+  zos_job_wait:
+    job_ids:
+      - JOB01427
+      - JOB01428
+    owner: ADMIN
+    max_rc: 4
+    fail_fast: false
+"""
+
+RETURN = r"""
+changed:
+  description:
+    Always False, waiting for jobs doesn't change the managed node.
+  returned: always
+  type: bool
+  sample: False
+completed:
+  description:
+    True when every job completed within I(wait_time).
+  returned: always
+  type: bool
+  sample: True
+duration:
+  description: Seconds spent waiting for the jobs.
+  returned: always
+  type: int
+  sample: 12
+polling:
+  description: Cost of waiting for the jobs.
+  returned: always
+  type: dict
+  contains:
+    polls:
+      description: Number of sweeps made after the first one.
+      type: int
+      sample: 6
+    wait_time:
+      description: Seconds spent waiting between sweeps.
+      type: float
+      sample: 6.2
+jobs:
+  description:
+    Status of each job, in the same order as I(job_ids).
+  returned: always
+  type: list
+  elements: dict
+  contains:
+    job_id:
+      description:
+         Unique job identifier assigned to the job by JES.
+      type: str
+      sample: JOB01427
+    job_name:
+      description:
+         The name of the batch job.
+      type: str
+      sample: PAYROLL1
+    owner:
+      description:
+         The owner who ran the job.
+      type: str
+      sample: ADMIN
+    content_type:
+      description:
+        - Type of address space used by the job.
+      type: str
+      sample: JOB
+    completed:
+      description:
+        True when the job completed, whether successfully or not.
+      type: bool
+      sample: True
+    failed:
+      description:
+        True when the job ended with an error status or a return code
+        greater than I(max_rc).
+      type: bool
+      sample: False
+    execution_time:
+      description:
+        Total duration time of the job execution, if it has finished. If the job is still running,
+        it represents the time elapsed from the job execution start and current time.
+      type: str
+      sample: 00:00:10
+    ret_code:
+      description:
+         Return code of the job.
+      type: dict
+      contains:
+        msg:
+          description:
+            Status of the job, None when the job could not be found.
+          type: str
+          sample: CC
+        msg_code:
+          description:
+            Return code or abend code of the job.
+          type: str
+          sample: "0000"
+        msg_txt:
+          description:
+             Additional information related to the job.
+          type: str
+          sample: CC
+        code:
+          description:
+             Return code converted to integer value (when possible).
+          type: int
+          sample: 0
+  sample:
+    [
+        {
+            "job_id": "JOB01427",
+            "job_name": "PAYROLL1",
+            "owner": "ADMIN",
+            "content_type": "JOB",
+            "completed": true,
+            "failed": false,
+            "execution_time": "00:00:10",
+            "ret_code": { "msg": "CC", "msg_code": "0000", "code": 0, "msg_txt": "CC" }
+        },
+        {
+            "job_id": "JOB01428",
+            "job_name": "PAYROLL2",
+            "owner": "ADMIN",
+            "content_type": "JOB",
+            "completed": false,
+            "failed": false,
+            "execution_time": "00:00:04",
+            "ret_code": { "msg": "AC", "msg_code": null, "code": null, "msg_txt": "AC" }
+        }
+    ]
+msg:
+  description:
+     Message returned on failure.
+  type: str
+  returned: failure
+  sample:
+     msg: "The job JOB01428 ended with status ABEND and code S0C4."
+"""
+
+import os
+import re
+import traceback
+
+from ansible.module_utils.basic import AnsibleModule
+from ansible.module_utils._text import to_text
+from ansible_collections.ibm.ibm_zos_core.plugins.module_utils import (
+    better_arg_parser
+)
+from ansible_collections.ibm.ibm_zos_core.plugins.module_utils.job import (
+    job_status, CompletionPoller, JOB_ERROR_STATUSES
+)
+from ansible_collections.ibm.ibm_zos_core.plugins.module_utils.dependency_checker import (
+    validate_dependencies,
+)
+from ansible_collections.ibm.ibm_zos_core.plugins.module_utils.log import SingletonLogger
+
+
+JOB_COMPLETED_STATUSES = JOB_ERROR_STATUSES | frozenset(["CC"])
+MAX_WAIT_TIME_S = 86400
+JOB_ID_TYPE = re.compile(r"^[^0-9]*")
+
+
+def sweep_scopes(job_ids):
+    """Job ID patterns that list every job with a few queries.
+
+    Job IDs are grouped by their type, like JOB, STC or J for job IDs over
+    99,999, and each group is listed with the longest prefix its job IDs
+    share. When they share nothing but their type, the prefix would list
+    every job of that type, so the group is split by the first digit that
+    differs and each part is listed with its own longest prefix. That's at
+    most ten queries per type, even when the job numbers roll over, like
+    from JOB09999 to JOB10000.
+
+    Parameters
+    ----------
+    job_ids : list[str]
+        IDs of the jobs.
+
+    Returns
+    -------
+    list[str]
+        Job IDs, or prefixes followed by a wildcard, to query.
+    """
+    groups = {}
+    id_types = []
+    for job_id in job_ids:
+        id_type = JOB_ID_TYPE.match(job_id).group(0)
+        if id_type not in groups:
+            groups[id_type] = []
+            id_types.append(id_type)
+        groups[id_type].append(job_id)
+
+    scopes = []
+    for id_type in id_types:
+        group = groups[id_type]
+        prefix = os.path.commonprefix(group)
+        if len(prefix) > len(id_type):
+            scopes.append(_group_scope(group, prefix))
+            continue
+
+        buckets = {}
+        first_digits = []
+        for job_id in group:
+            first_digit = job_id[len(id_type):len(id_type) + 1]
+            if first_digit not in buckets:
+                buckets[first_digit] = []
+                first_digits.append(first_digit)
+            buckets[first_digit].append(job_id)
+        for first_digit in first_digits:
+            bucket = buckets[first_digit]
+            scopes.append(_group_scope(bucket, os.path.commonprefix(bucket)))
+    return scopes
+
+
+def _group_scope(group, prefix):
+    """The job ID itself for a single job, otherwise the prefix followed by a wildcard."""
+    if len(set(group)) == 1:
+        return group[0]
+    return prefix + "*"
+
+
+def sweep(job_ids, owner=None):
+    """List the jobs with one query to JES, or one query per scope when
+    jobs of every owner are listed.
+
+    Parameters
+    ----------
+    job_ids : list[str]
+        IDs of the jobs.
+    owner : str
+        Owner of the jobs, jobs of every owner are listed when None.
+
+    Returns
+    -------
+    dict
+        Jobs found, by job ID. Jobs JES doesn't know about are left out.
+    """
+    # Only the status of the jobs is needed, their extended information isn't fetched.
+    if owner:
+        listing = job_status(job_id="*", owner=owner, include_extended=False)
+    else:
+        listing = []
+        for scope in sweep_scopes(job_ids):
+            listing.extend(job_status(job_id=scope, owner=owner, include_extended=False))
+    wanted = set(job_ids)
+    return dict(
+        (entry.get("job_id"), entry) for entry in listing
+        if not entry.get("job_not_found") and entry.get("job_id") in wanted
+    )
+
+
+def is_completed(job):
+    """Whether the job reached a final status."""
+    return job.get("ret_code", {}).get("msg") in JOB_COMPLETED_STATUSES
+
+
+def is_failed(job, max_rc):
+    """Whether the job ended with an error status or a return code over max_rc."""
+    ret_code = job.get("ret_code", {})
+    if ret_code.get("msg") in JOB_ERROR_STATUSES:
+        return True
+    return ret_code.get("msg") == "CC" and ret_code.get("code") is not None and ret_code.get("code") > max_rc
+
+
+def wait_for_jobs(job_ids, owner=None, wait_time=10, max_rc=0, fail_fast=True, poller=None):
+    """Sweep the jobs until they complete, one of them fails or the time runs out.
+
+    Parameters
+    ----------
+    job_ids : list[str]
+        IDs of the jobs.
+    owner : str
+        Owner of the jobs.
+    wait_time : int
+        Seconds to wait for the jobs.
+    max_rc : int
+        Highest return code of a job that didn't fail.
+    fail_fast : bool
+        Whether to stop as soon as a job fails.
+    poller : CompletionPoller
+        Paces the sweeps, one bound to wait_time is used when None.
+
+    Returns
+    -------
+    dict
+        Last status seen of the jobs found, by job ID.
+    """
+    poller = poller or CompletionPoller(wait_time)
+    while True:
+        jobs = sweep(job_ids, owner)
+        completed = [job_id for job_id in job_ids if job_id in jobs and is_completed(jobs[job_id])]
+        if len(completed) == len(job_ids):
+            return jobs
+        if fail_fast and any(is_failed(jobs[job_id], max_rc) for job_id in completed):
+            return jobs
+        if not poller.wait():
+            return jobs
+
+
+def parsing_jobs(job_ids, jobs, max_rc):
+    """Build the status of each job returned by the module.
+
+    Parameters
+    ----------
+    job_ids : list[str]
+        IDs of the jobs, in the order they're returned.
+    jobs : dict
+        Jobs found, by job ID.
+    max_rc : int
+        Highest return code of a job that didn't fail.
+
+    Returns
+    -------
+    list[dict]
+        Status of each job.
+    """
+    parsed = []
+    for job_id in job_ids:
+        job = jobs.get(job_id)
+        if job is None:
+            parsed.append({
+                "job_id": job_id,
+                "job_name": None,
+                "owner": None,
+                "content_type": None,
+                "completed": False,
+                "failed": False,
+                "execution_time": None,
+                "ret_code": {
+                    "msg": None,
+                    "msg_code": None,
+                    "code": None,
+                    "msg_txt": "The job with the job_id {0} could not be found.".format(job_id),
+                },
+            })
+            continue
+
+        ret_code = job.get("ret_code", {})
+        parsed.append({
+            "job_id": job_id,
+            "job_name": job.get("job_name"),
+            "owner": job.get("owner"),
+            "content_type": job.get("content_type"),
+            "completed": is_completed(job),
+            "failed": is_completed(job) and is_failed(job, max_rc),
+            "execution_time": job.get("execution_time"),
+            "ret_code": {
+                "msg": ret_code.get("msg"),
+                "msg_code": ret_code.get("msg_code"),
+                "code": ret_code.get("code"),
+                "msg_txt": ret_code.get("msg_txt"),
+            },
+        })
+    return parsed
+
+
+def run_module():
+    """Initialize the module.
+
+    Raises
+    ------
+    fail_json
+        Parameter verification failed.
+    fail_json
+        A job failed or didn't complete within wait_time.
+    fail_json
+        Any exception while querying the jobs.
+    """
+    module_args = dict(
+        job_ids=dict(type="list", elements="str", required=True),
+        owner=dict(type="str", required=False),
+        wait_time=dict(type="int", required=False, default=10),
+        max_rc=dict(type="int", required=False, default=0),
+        fail_fast=dict(type="bool", required=False, default=True),
+    )
+
+    result = dict(changed=False)
+
+    module = AnsibleModule(argument_spec=module_args, supports_check_mode=True)
+    # Validate dependencies
+    validate_dependencies(module)
+
+    args_def = dict(
+        job_ids=dict(type="list", elements="job_identifier", required=True),
+        owner=dict(type="str", required=False),
+        wait_time=dict(type="int", required=False, default=10),
+        max_rc=dict(type="int", required=False, default=0),
+        fail_fast=dict(type="bool", required=False, default=True),
+    )
+
+    try:
+        parser = better_arg_parser.BetterArgParser(args_def)
+        parsed_args = parser.parse_args(module.params)
+        module.params = parsed_args
+    except ValueError as err:
+        module.fail_json(
+            msg='Parameter verification failed.',
+            stderr=str(err)
+        )
+
+    wait_time = module.params.get("wait_time")
+    if wait_time < 0 or wait_time > MAX_WAIT_TIME_S:
+        module.fail_json(
+            msg=("The value for option 'wait_time' is not valid, it must "
+                 "be between 0 and {0}.".format(str(MAX_WAIT_TIME_S))),
+            **result
+        )
+
+    # Initialize logging module
+    module_verbosity_level = module._verbosity
+    SingletonLogger().get_logger(module_verbosity_level)
+
+    if module.check_mode:
+        module.exit_json(**result)
+
+    # Job IDs are listed in upper case by JES, duplicates are waited for once.
+    job_ids = list(dict.fromkeys(job_id.upper() for job_id in module.params.get("job_ids")))
+    max_rc = module.params.get("max_rc")
+    poller = CompletionPoller(wait_time)
+
+    try:
+        jobs = wait_for_jobs(
+            job_ids,
+            owner=module.params.get("owner"),
+            wait_time=wait_time,
+            max_rc=max_rc,
+            fail_fast=module.params.get("fail_fast"),
+            poller=poller
+        )
+    except Exception as err:
+        module.fail_json(msg=to_text(err), stderr=traceback.format_exc(), **result)
+
+    result["jobs"] = parsing_jobs(job_ids, jobs, max_rc)
+    result["completed"] = all(job["completed"] for job in result["jobs"])
+    result["duration"] = poller.duration
+    result["polling"] = poller.stats()
+
+    failed = [job for job in result["jobs"] if job["failed"]]
+    if failed:
+        module.fail_json(
+            msg="; ".join(
+                "The job {0} ended with status {1} and code {2}.".format(
+                    job["job_id"], job["ret_code"]["msg"], job["ret_code"]["msg_code"]
+                ) for job in failed
+            ),
+            **result
+        )
+
+    if not result["completed"]:
+        pending = [job["job_id"] for job in result["jobs"] if not job["completed"]]
+        module.fail_json(
+            msg=("The jobs {0} didn't complete within the allocated time of {1} "
+                 "seconds. Consider increasing option 'wait_time' or using module "
+                 "zos_job_query to poll for long running jobs.".format(", ".join(pending), str(wait_time))),
+            **result
+        )
+
+    module.exit_json(**result)
+
+
+def main():
+    run_module()
+
+
+if __name__ == "__main__":
+    main()
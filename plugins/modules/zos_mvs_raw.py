@@ -1810,7 +1810,7 @@ from ansible_collections.ibm.ibm_zos_core.plugins.module_utils.dependency_checke
     validate_dependencies,
 )
 from ansible_collections.ibm.ibm_zos_core.plugins.module_utils.import_handler import ZOAUImportError
-from ansible_collections.ibm.ibm_zos_core.plugins.module_utils import data_set
+from ansible_collections.ibm.ibm_zos_core.plugins.module_utils import data_set, encode
 from ansible.module_utils.basic import AnsibleModule
 from ansible_collections.ibm.ibm_zos_core.plugins.module_utils.ansible_module import (
     AnsibleModuleHelper,
@@ -3126,6 +3126,9 @@ def gather_output(dd_statements):
     """Gather DD contents for all DD statements for which
     content was requested.
 
+    Text contents are read first and converted at the end, with a
+    single conversion for all of the DDs that share the same encodings.
+
     Parameters
     ----------
         dd_statements : list[DDStatement]
@@ -3136,10 +3139,14 @@ def gather_output(dd_statements):
         output : list[dict]
                The list of DD outputs, in format expected for response on module completion.
     """
-    output = []
+    outputs = []
     for dd_statement in dd_statements:
-        output += get_dd_output(dd_statement)
-    return output
+        outputs += get_dd_output(dd_statement)
+    convert_outputs(outputs)
+    return [
+        build_dd_response(output.get("dd_name"), output.get("name"), output.get("content"))
+        for output in outputs
+    ]
 
 
 def get_dd_output(dd_statement):
@@ -3153,7 +3160,7 @@ def get_dd_output(dd_statement):
     Returns
     -------
         dd_output : list[dict]
-                  The output of a single DD, in format expected for response on module completion.
+                  The unconverted output of a single DD, as returned by get_data_set_output.
     """
     dd_output = []
     if (
@@ -3191,20 +3198,17 @@ def get_data_set_output(dd_statement):
 
     Returns
     -------
-        dd_response : dict
-                    The output of a single DD, in format expected for response on module completion.
+        dd_output : dict
+                  The DD name, data set name and contents of the DD. Text
+                  contents are left as bytes together with their from_encoding
+                  and to_encoding, to be converted by convert_outputs.
     """
     contents = ""
     if dd_statement.definition.return_content.type == "text":
-        contents = get_data_set_content(
-            name=dd_statement.definition.name,
-            base64_encode=False,
-            from_encoding=dd_statement.definition.return_content.src_encoding,
-            to_encoding=dd_statement.definition.return_content.response_encoding,
-        )
+        contents = get_data_set_content(name=dd_statement.definition.name, base64_encode=False)
     elif dd_statement.definition.return_content.type == "base64":
         contents = get_data_set_content(name=dd_statement.definition.name, base64_encode=True)
-    return build_dd_response(dd_statement.name, dd_statement.definition.name, contents)
+    return build_dd_output(dd_statement, contents)
 
 
 def get_unix_file_output(dd_statement):
@@ -3217,20 +3221,17 @@ def get_unix_file_output(dd_statement):
 
     Returns
     -------
-        dd_response : dict
-                    The output of a single DD, in format expected for response on module completion.
+        dd_output : dict
+                  The DD name, file name and contents of the DD. Text
+                  contents are left as bytes together with their from_encoding
+                  and to_encoding, to be converted by convert_outputs.
     """
     contents = ""
     if dd_statement.definition.return_content.type == "text":
-        contents = get_unix_content(
-            name=dd_statement.definition.name,
-            base64_encode=False,
-            from_encoding=dd_statement.definition.return_content.src_encoding,
-            to_encoding=dd_statement.definition.return_content.response_encoding,
-        )
+        contents = get_unix_content(name=dd_statement.definition.name, base64_encode=False)
     elif dd_statement.definition.return_content.type == "base64":
         contents = get_unix_content(name=dd_statement.definition.name, base64_encode=True)
-    return build_dd_response(dd_statement.name, dd_statement.definition.name, contents)
+    return build_dd_output(dd_statement, contents)
 
 
 def get_concatenation_output(dd_statement):
@@ -3243,18 +3244,72 @@ def get_concatenation_output(dd_statement):
 
     Returns
     -------
-        dd_response : list[dict]
-                    The output of a single DD, in the format expected for response on module completion.
-                    Response can contain multiple outputs.
+        dd_output : list[dict]
+                  The unconverted output of each data set or file in the concatenation.
     """
     # create new DDStatement objects for each concat member
     # makes it easier to handle concat and non-concat DDs consistently
-    dds = []
+    dd_output = []
     for dd in dd_statement.definition:
-        new_dd = DDStatement(dd_statement.name, dd)
-        dds.append(new_dd)
-    dd_response = gather_output(dds)
-    return dd_response
+        dd_output += get_dd_output(DDStatement(dd_statement.name, dd))
+    return dd_output
+
+
+def build_dd_output(dd_statement, contents):
+    """Keep the contents of a DD along with the encodings they
+    must be converted between.
+
+    Parameters
+    ----------
+        dd_statement : DDStatement
+                     A single DD statement.
+        contents : Union[str, bytes]
+                 The raw contents, bytes when they still need to be converted.
+
+    Returns
+    -------
+        dd_output : dict
+                  The DD name, data set or file name, contents and encodings.
+    """
+    return {
+        "dd_name": dd_statement.name,
+        "name": dd_statement.definition.name,
+        "content": contents,
+        "from_encoding": dd_statement.definition.return_content.src_encoding,
+        "to_encoding": dd_statement.definition.return_content.response_encoding,
+    }
+
+
+def convert_outputs(outputs):
+    """Convert the text contents of the DDs to their response encoding,
+    with one conversion for every pair of encodings. When a conversion
+    of several DDs fails, each one of them is converted on its own so
+    only the DDs that can't be converted are left empty.
+
+    Parameters
+    ----------
+        outputs : list[dict]
+                The DD outputs as returned by build_dd_output. Their content
+                is replaced in place by the converted text.
+    """
+    groups = {}
+    for output in outputs:
+        if isinstance(output.get("content"), bytes):
+            key = (output.get("from_encoding"), output.get("to_encoding"))
+            groups.setdefault(key, []).append(output)
+
+    for (from_encoding, to_encoding), group in groups.items():
+        try:
+            contents = convert_contents([output.get("content") for output in group], from_encoding, to_encoding)
+        except Exception:
+            contents = []
+            for output in group:
+                try:
+                    contents += convert_contents([output.get("content")], from_encoding, to_encoding)
+                except Exception:
+                    contents.append("")
+        for output, content in zip(group, contents):
+            output["content"] = content
 
 
 def build_dd_response(dd_name, name, contents):
@@ -3284,7 +3339,7 @@ def build_dd_response(dd_name, name, contents):
     return dd_response
 
 
-def get_data_set_content(name, base64_encode=False, from_encoding=None, to_encoding=None):
+def get_data_set_content(name, base64_encode=False):
     """Retrieve the raw contents of a data set.
 
     Parameters
@@ -3293,15 +3348,11 @@ def get_data_set_content(name, base64_encode=False, from_encoding=None, to_encod
              The name of the data set.
         base64_encode : bool, optional
                Determines if contents are retrieved as binary and base64 encoded. Defaults to False.
-        from_encoding : str, optional
-                      The encoding of the data set on the z/OS system. Defaults to None.
-        to_encoding : str, optional
-                    The encoding to receive the data back in. Defaults to None.
 
     Returns
     -------
-        quoted_name : str
-                    The raw content of the data set.
+        content : Union[str, bytes]
+                The base64 encoded content of the data set, or its raw bytes otherwise.
     """
     quoted_name = quote(name)
     if "'" not in quoted_name:
@@ -3311,11 +3362,11 @@ def get_data_set_content(name, base64_encode=False, from_encoding=None, to_encod
         with zoau_io.RecordIO("//{0}".format(quoted_name), "r") as records:
             content = base64.b64encode(b''.join(records.readrecords())).decode()
     else:
-        content = get_content('"//{0}"'.format(quoted_name), from_encoding, to_encoding)
+        content = get_content('"//{0}"'.format(quoted_name))
     return content
 
 
-def get_unix_content(name, base64_encode=False, from_encoding=None, to_encoding=None):
+def get_unix_content(name, base64_encode=False):
     """Retrieve the raw contents of a UNIX file.
 
     Parameters
@@ -3324,57 +3375,75 @@ def get_unix_content(name, base64_encode=False, from_encoding=None, to_encoding=
              The name of the UNIX file.
         base64_encode : bool, optional
                Determines if contents are retrieved as binary and base64 encoded. Defaults to False.
-        from_encoding : str, optional
-                      The encoding of the UNIX file on the z/OS system. Defaults to None.
-        to_encoding : str, optional
-                    The encoding to receive the data back in. Defaults to None.
 
     Returns
     -------
-        stdout : str
-               The raw content of the UNIX file.
+        content : Union[str, bytes]
+                The base64 encoded content of the UNIX file, or its raw bytes otherwise.
+                If unsuccessful in reading the file, returns empty string.
     """
     if base64_encode:
         with open(name, "rb") as f:
             content = base64.b64encode(f.read()).decode()
     else:
-        content = get_content("{0}".format(quote(name)), from_encoding, to_encoding)
+        try:
+            with open(name, "rb") as f:
+                content = f.read()
+        except (IOError, OSError):
+            content = ""
     return content
 
 
-def get_content(formatted_name, from_encoding=None, to_encoding=None):
+def get_content(formatted_name):
     """Retrieve raw contents of a data set or UNIXfile.
 
     Parameters
     ----------
         name : str
              The name of the data set or UNIX file, formatted and quoted for proper usage in command.
-        from_encoding : str, optional
-                      The encoding of the data set or UNIX file on the z/OS system. Defaults to None.
-        to_encoding : str, optional
-                    The encoding to receive the data back in. Defaults to None.
 
     Returns
     -------
-        stdout : str
+        stdout : bytes
                The raw content of the data set or UNIX file. If unsuccessful in retrieving data, returns empty string.
     """
     module = AnsibleModuleHelper(argument_spec={})
-    conversion_command = " | iconv -f {0} -t {1}".format(
-        quote(from_encoding), quote(to_encoding)
-    )
     # * name argument should already be quoted by the time it reaches here
-    # TODO: determine if response should be byte object
     rc, stdout, stderr = module.run_command(
-        "cat {0}{1}".format(formatted_name, conversion_command),
+        "cat {0}".format(formatted_name),
         use_unsafe_shell=True,
         environ_update=ENCODING_ENVIRONMENT_VARS,
-        errors='replace'
+        encoding=None
     )
     if rc:
         return ""
-    else:
-        return stdout
+    return stdout
+
+
+def convert_contents(contents, from_encoding=None, to_encoding=None):
+    """Convert the raw contents of several data sets or UNIX files
+    to the response encoding in a single call.
+
+    Parameters
+    ----------
+        contents : list[bytes]
+                 The raw contents, encoded in from_encoding.
+        from_encoding : str, optional
+                      The encoding of the data sets or UNIX files on the z/OS system. Defaults to None.
+        to_encoding : str, optional
+                    The encoding to receive the data back in. Defaults to None.
+
+    Returns
+    -------
+        contents : list[str]
+                 The converted contents, in the same order.
+
+    Raises
+    ------
+        EncodeError
+            When the contents can't be converted.
+    """
+    return encode.EncodeUtils().strings_convert_encoding(contents, from_encoding, to_encoding)
 
 
 class ZOSRawError(Exception):
@@ -41,7 +41,10 @@ options:
       - For example, to display job by job name the command would be C(cmd:"\\$dj''HELLO''")
       - By default, the command will be converted to uppercase before execution, to control this
         behavior, see the I(case_sensitive) option below.
-    type: str
+      - A list of commands runs them all in the same task, one after the other or up to
+        I(max_concurrency) at the same time. Each command waits up to I(wait_time) on its
+        own and its response is returned in I(results), in the same order as the list.
+    type: raw
     required: true
   verbose:
     description:
@@ -78,6 +81,39 @@ options:
     type: bool
     required: false
     default: false
+  max_concurrency:
+    description:
+      - Maximum number of commands running at the same time when I(cmd) is a list.
+      - A value of 1 runs the commands one after the other.
+      - Commands issued by the same user share a console, so commands running
+        at the same time may see each other's responses. Only raise this
+        value for commands whose responses can't be confused, like
+        independent display commands.
+    type: int
+    required: false
+    default: 1
+  wait_for:
+    description:
+      - Regular expression the response of the command is complete with.
+      - When set, the module returns as soon as the command responds instead
+        of waiting the full I(wait_time), which becomes the longest time to
+        wait for the response.
+      - Only the response returned for the command is searched. Messages the
+        command causes later, like the end of a started task it stopped, are
+        not part of it.
+      - When the pattern isn't in the response, the module fails with the
+        response received.
+    type: str
+    required: false
+  wait_for_msgid:
+    description:
+      - ID of the message the response of the command is complete with,
+        for example C(IEE114I).
+      - When used with I(wait_for), the pattern must appear in a line of this
+        message.
+      - Behaves like I(wait_for) otherwise.
+    type: str
+    required: false
 
 attributes:
   action:
@@ -123,20 +159,37 @@ EXAMPLES = r"""
     cmd: 'd u'
     wait_time: 10
     time_unit: 'cs'
+
+- name: Execute a batch of independent display commands, up to 8 at the same time.
+  zos_operator:
+    cmd:
+      - 'd a,l'
+      - 'd u,dasd,online'
+      - 'd iplinfo'
+      - 'd symbols'
+    wait_time: 2
+    max_concurrency: 8
+
+- name: Display the active address spaces, returning as soon as the activity summary comes back.
+  zos_operator:
+    cmd: 'd a,l'
+    wait_for_msgid: 'IEE114I'
+    wait_time: 30
 """
 
 RETURN = r"""
 rc:
     description:
-      Return code for the submitted operator command.
+      Return code for the submitted operator command, the highest return
+      code of the batch when I(cmd) is a list.
     returned: always
     type: int
     sample: 0
 cmd:
     description:
-      Operator command submitted.
+      Operator command submitted, or the list of commands submitted.
     returned: always
-    type: str
+    type: raw
     sample: d u,all
 elapsed:
     description:
@@ -202,6 +255,70 @@ stderr_lines:
     type: list
     elements: str
     sample: []
+matched:
+    description:
+      True when I(wait_for) or I(wait_for_msgid) was found in the response
+      of the command.
+    returned: when I(wait_for) or I(wait_for_msgid) is set
+    type: bool
+    sample: true
+results:
+    description:
+      Response of each command when I(cmd) is a list, in the same order as I(cmd).
+      The I(stdout) and I(stderr) of the module join the responses of every command.
+    returned: when I(cmd) is a list
+    type: list
+    elements: dict
+    contains:
+      cmd:
+        description: Operator command submitted.
+        type: str
+        sample: d a,l
+      rc:
+        description: Return code of the command, None when it failed without one.
+        type: int
+        sample: 0
+      elapsed:
+        description:
+          The number of seconds or centiseconds that elapsed waiting for the command to complete.
+        type: float
+        sample: 1.02
+      wait_time:
+        description: The maximum time in the time_unit set the command waited for.
+        type: int
+        sample: 2
+      stdout:
+        description: The standard output from the command.
+        type: str
+      stdout_lines:
+        description: The standard output split into individual lines.
+        type: list
+        elements: str
+      stderr:
+        description: The standard error from the command.
+        type: str
+      stderr_lines:
+        description: The standard error split into individual lines.
+        type: list
+        elements: str
+      changed:
+        description: True when the command ran and returned a response.
+        type: bool
+        sample: true
+      matched:
+        description:
+          True when I(wait_for) or I(wait_for_msgid) was found in the response.
+        returned: when I(wait_for) or I(wait_for_msgid) is set
+        type: bool
+        sample: true
+      failed:
+        description: True when the command failed or its response was too short.
+        type: bool
+        sample: false
+      msg:
+        description: Reason the command failed.
+        returned: failure
+        type: str
 changed:
     description:
       Indicates if any changes were made during module operation.
@@ -213,6 +330,7 @@ changed:
     sample: true
 """
 
+import re
 import traceback
 from timeit import default_timer as timer
 from ansible.module_utils.basic import AnsibleModule
@@ -231,6 +349,7 @@ from ansible_collections.ibm.ibm_zos_core.plugins.module_utils.better_arg_parser
 )
 
 from ansible_collections.ibm.ibm_zos_core.plugins.module_utils import (
+    concurrency,
     zoau_version_checker
 )
 from ansible_collections.ibm.ibm_zos_core.plugins.module_utils.dependency_checker import (
@@ -286,6 +405,36 @@ def execute_command(operator_cmd, time_unit, timeout=1, preserve=False, *args, *
     return rc, stdout, stderr, elapsed
 
 
+def response_matches(response, pattern=None, msg_id=None):
+    """Tells whether the response of a command is complete.
+
+    Parameters
+    ----------
+    response : str
+        Response received so far.
+    pattern : re.Pattern
+        Pattern the response is complete with.
+    msg_id : str
+        ID of the message the response is complete with, the pattern must
+        then appear in one of its lines.
+
+    Returns
+    -------
+    bool
+        True when the pattern or the message were found in the response.
+    """
+    if not response:
+        return False
+    if msg_id is None:
+        return pattern.search(response) is not None
+
+    msg_id_pattern = re.compile(r"(?<!\S){0}(?!\S)".format(re.escape(msg_id)))
+    for line in response.splitlines():
+        if msg_id_pattern.search(line) and (pattern is None or pattern.search(line)):
+            return True
+    return False
+
+
 def run_module():
     """Initialize the module.
 
@@ -301,11 +450,14 @@ def run_module():
         An unexpected error occurred.
     """
     module_args = dict(
-        cmd=dict(type="str", required=True),
+        cmd=dict(type="raw", required=True),
         verbose=dict(type="bool", required=False, default=False),
         wait_time=dict(type="int", required=False, default=1),
         time_unit=dict(type="str", required=False, choices=["s", "cs"], default="s"),
         case_sensitive=dict(type="bool", required=False, default=False),
+        max_concurrency=dict(type="int", required=False, default=1),
+        wait_for=dict(type="str", required=False),
+        wait_for_msgid=dict(type="str", required=False),
     )
 
     result = dict(changed=False)
@@ -324,6 +476,17 @@ def run_module():
         module_verbosity_level = module._verbosity
         SingletonLogger().get_logger(module_verbosity_level)
 
+        if isinstance(new_params.get("cmd"), list):
+            failed = run_batch(new_params, result)
+            if failed:
+                module.fail_json(
+                    msg="{0} of {1} operator commands failed: {2}. Review the results for more details.".format(
+                        len(failed), len(result["results"]), ", ".join(failed)
+                    ),
+                    **result
+                )
+            module.exit_json(**result)
+
         rc_message = run_operator_command(new_params)
         result["rc"] = rc_message.get("rc")
         result["elapsed"] = rc_message.get("elapsed")
@@ -354,6 +517,11 @@ def run_module():
         result["time_unit"] = new_params.get("time_unit")
         result["changed"] = False
 
+        if "matched" in rc_message:
+            result["matched"] = rc_message.get("matched")
+            if not result["matched"]:
+                module.fail_json(msg=_not_matched_message(new_params), **result)
+
         # rc=0, something succeeded (the calling script ran),
         # but it could still be a bad/invalid command.
         # As long as there are more than 2 lines in stdout, it's worth looking through.
@@ -383,6 +551,95 @@ def run_module():
     module.exit_json(**result)
 
 
+def run_batch(params, result):
+    """Run a list of operator commands and fill in the module result
+    with the response of each of them.
+
+    Parameters
+    ----------
+    params : dict
+        Parsed module parameters, cmd holds the list of commands.
+    result : dict
+        Module result to fill in.
+
+    Returns
+    -------
+    list[str]
+        Commands that failed.
+    """
+    time_unit = params.get("time_unit")
+    start = timer()
+    tasks = run_operator_commands(params, max_concurrency=params.get("max_concurrency"))
+    elapsed = timer() - start
+
+    result["results"] = [_batch_entry(cmdtxt, task, params) for cmdtxt, task in zip(params.get("cmd"), tasks)]
+    result["cmd"] = params.get("cmd")
+    result["rc"] = max([entry["rc"] for entry in result["results"] if entry["rc"] is not None] or [0])
+    result["elapsed"] = round(elapsed * 100, 2) if time_unit == "cs" else round(elapsed, 2)
+    result["wait_time"] = params.get("wait_time")
+    result["time_unit"] = time_unit
+    result["stdout"] = "\n".join(entry["stdout"] for entry in result["results"] if entry["stdout"])
+    result["stderr"] = "\n".join(entry["stderr"] for entry in result["results"] if entry["stderr"])
+    result["stdout_lines"] = [line for entry in result["results"] for line in entry["stdout_lines"]]
+    result["stderr_lines"] = [line for entry in result["results"] for line in entry["stderr_lines"]]
+    result["changed"] = any(entry["changed"] for entry in result["results"])
+
+    return [entry["cmd"] for entry in result["results"] if entry["failed"]]
+
+
+def _batch_entry(cmdtxt, task, params):
+    """Build the response of a command that ran in a batch.
+
+    Parameters
+    ----------
+    cmdtxt : str
+        Command that ran.
+    task : TaskResult
+        Outcome of running the command.
+    params : dict
+        Parsed module parameters.
+
+    Returns
+    -------
+    dict
+        Response of the command.
+    """
+    entry = dict(cmd=cmdtxt, wait_time=params.get("wait_time"), changed=False, failed=False)
+
+    if task.failed:
+        err = task.error
+        elapsed = task.elapsed * 100 if params.get("time_unit") == "cs" else task.elapsed
+        entry["rc"] = getattr(err, "rc", None)
+        entry["elapsed"] = round(elapsed, 2)
+        entry["stdout"] = getattr(err, "stdout", None) or ""
+        entry["stderr"] = getattr(err, "stderr", None) or ""
+        entry["failed"] = True
+        entry["msg"] = err.msg if isinstance(err, Error) else "An unexpected error occurred: {0}".format(to_text(err))
+    else:
+        entry["rc"] = task.result.get("rc")
+        entry["elapsed"] = task.result.get("elapsed")
+        entry["stdout"] = task.result.get("stdout") or ""
+        entry["stderr"] = task.result.get("stderr") or ""
+        if "matched" in task.result:
+            entry["matched"] = task.result.get("matched")
+            if not entry["matched"]:
+                entry["failed"] = True
+                entry["msg"] = _not_matched_message(params)
+
+    entry["stdout_lines"] = [line for line in entry["stdout"].split("\n") if line]
+    entry["stderr_lines"] = [line for line in entry["stderr"].split("\n") if line]
+
+    # Same checks as for a single command, a response of 2 lines or less
+    # means the command didn't run.
+    if not entry["failed"]:
+        if len(entry["stdout_lines"]) > 2:
+            entry["changed"] = True
+        else:
+            entry["failed"] = True
+            entry["msg"] = "Expected response to be more than 2 lines."
+    return entry
+
+
 def parse_params(params):
     """Use BetterArgParser to parse the module parameters.
 
@@ -397,17 +654,106 @@ def parse_params(params):
         New parameters.
     """
     arg_defs = dict(
-        cmd=dict(arg_type="str", required=True),
+        cmd=dict(arg_type=_operator_commands, required=True),
         verbose=dict(arg_type="bool", required=False, default=False),
         wait_time=dict(arg_type="int", required=False, default=1),
         time_unit=dict(type="str", required=False, choices=["s", "cs"], default="s"),
         case_sensitive=dict(arg_type="bool", required=False, default=False),
+        max_concurrency=dict(arg_type="int", required=False, default=1),
+        wait_for=dict(arg_type=_completion_pattern, required=False),
+        wait_for_msgid=dict(arg_type="str", required=False),
     )
     parser = BetterArgParser(arg_defs)
     new_params = parser.parse_args(params)
     return new_params
 
 
+def _operator_commands(contents, resolve_dependencies):
+    """Resolver for the cmd argument, a command or a list of commands.
+
+    Parameters
+    ----------
+    contents : Union[str, list[str]]
+        The contents of the argument.
+    resolved_dependencies : dict
+        Contains all of the dependencies and their contents,
+        which have already been handled,
+        for use during current arguments handling operations.
+
+    Returns
+    -------
+    Union[str, list[str]]
+        The arguments contents after any necessary operations.
+
+    Raises
+    ------
+    ValueError
+        When contents is invalid argument type.
+    """
+    if isinstance(contents, str):
+        return contents
+    if isinstance(contents, list) and contents and all(isinstance(command, str) for command in contents):
+        return contents
+    raise ValueError(
+        'Invalid argument type for "{0}". Expected a command or a list of commands.'.format(contents)
+    )
+
+
+def _completion_pattern(contents, resolve_dependencies):
+    """Resolver for the wait_for argument, compiles the pattern.
+
+    Parameters
+    ----------
+    contents : str
+        The contents of the argument.
+    resolved_dependencies : dict
+        Contains all of the dependencies and their contents,
+        which have already been handled,
+        for use during current arguments handling operations.
+
+    Returns
+    -------
+    re.Pattern
+        The compiled pattern, None when the argument isn't set.
+
+    Raises
+    ------
+    ValueError
+        When contents isn't a valid regular expression.
+    """
+    if contents is None:
+        return None
+    try:
+        return re.compile(contents, re.MULTILINE)
+    except re.error as err:
+        raise ValueError(
+            'Invalid regular expression "{0}" for wait_for: {1}.'.format(contents, err)
+        )
+
+
+def _not_matched_message(params):
+    """Message of a command whose response doesn't have the expected pattern.
+
+    Parameters
+    ----------
+    params : dict
+        Operator command parameters.
+
+    Returns
+    -------
+    str
+        Failure message.
+    """
+    expected = []
+    if params.get("wait_for") is not None:
+        expected.append('pattern "{0}"'.format(params.get("wait_for").pattern))
+    if params.get("wait_for_msgid"):
+        expected.append("message {0}".format(params.get("wait_for_msgid")))
+    return "The {0} did not appear in the response received within {1}{2}. Review the response for more details.".format(
+        " in ".join(expected), params.get("wait_time"), params.get("time_unit")
+    )
+
+
 def run_operator_command(params):
     """Runs operator command based on a given parameters in a dictionary.
 
@@ -424,32 +770,113 @@ def run_operator_command(params):
     """
     AnsibleModuleHelper(argument_spec={})
 
+    return _run_command(params.get("cmd"), params, _execute_kwargs(params))
+
+
+def run_operator_commands(params, max_concurrency=1):
+    """Runs a batch of operator commands, one after the other by default.
+
+    Every command waits up to wait_time on its own. When several run at the
+    same time a batch takes about as long as its slowest commands instead of
+    the sum of all of them, but the commands share the console of the user
+    so that's only done when asked for.
+
+    Parameters
+    ----------
+    params : dict
+        Operator command parameters, cmd holds the list of commands.
+    max_concurrency : int
+        Maximum number of commands running at the same time.
+
+    Returns
+    -------
+    list[TaskResult]
+        Outcome of each command, in the same order as cmd. The result of a
+        command is the same as the one from run_operator_command, its error
+        an OperatorCmdError when the command failed.
+    """
+    AnsibleModuleHelper(argument_spec={})
+
+    kwargs = _execute_kwargs(params)
+    return concurrency.run_concurrently(
+        lambda cmdtxt: _run_command(cmdtxt, params, kwargs),
+        params.get("cmd"),
+        max_concurrency=max_concurrency
+    )
+
+
+def _execute_kwargs(params):
+    """Build the options given to opercmd for every command.
+
+    Parameters
+    ----------
+    params : dict
+        Operator command parameters.
+
+    Returns
+    -------
+    dict
+        Keyword arguments for opercmd.execute.
+    """
     kwargs = {}
 
     if params.get("verbose"):
         kwargs.update({"verbose": True})
         kwargs.update({"debug": True})
 
-    wait_time = params.get("wait_time")
-    time_unit = params.get("time_unit")
-    cmdtxt = params.get("cmd")
-    preserve = params.get("case_sensitive")
-
     use_wait_arg = False
     if zoau_version_checker.is_zoau_version_higher_than("1.2.4"):
         use_wait_arg = True
 
-    if use_wait_arg:
+    # Waiting for a pattern, opercmd returns with the response of the command,
+    # which the pattern is searched in, instead of waiting the full wait_time.
+    if use_wait_arg and not _waits_for_response(params):
         kwargs.update({"wait": True})
 
+    return kwargs
+
+
+def _waits_for_response(params):
+    """Whether commands wait for a pattern instead of the full wait_time."""
+    return params.get("wait_for") is not None or bool(params.get("wait_for_msgid"))
+
+
+def _run_command(cmdtxt, params, kwargs):
+    """Run a single operator command.
+
+    Parameters
+    ----------
+    cmdtxt : str
+        Command to run.
+    params : dict
+        Operator command parameters.
+    kwargs : dict
+        Keyword arguments for opercmd.execute.
+
+    Returns
+    -------
+    dict
+        Return code, standard output, standard error, the cmd call
+        and time elapsed from beginning to end. When waiting for a
+        pattern, also whether the pattern was matched.
+
+    Raises
+    ------
+    OperatorCmdError
+        When the command ends with a return code greater than 0.
+    """
+    wait_time = params.get("wait_time")
+    time_unit = params.get("time_unit")
+    preserve = params.get("case_sensitive")
+
     args = []
     rc, stdout, stderr, elapsed = execute_command(cmdtxt, time_unit=time_unit, timeout=wait_time, preserve=preserve, *args, **kwargs)
 
     if rc > 0:
         message = "\nOut: {0}\nErr: {1}\nRan: {2}".format(stdout, stderr, cmdtxt)
-        raise OperatorCmdError(cmdtxt, rc, message.split("\n"))
+        raise OperatorCmdError(cmdtxt, rc, message.split("\n"), stdout=stdout, stderr=stderr)
 
-    return {
+    response = {
         "rc": rc,
         "stdout": stdout,
         "stderr": stderr,
@@ -457,6 +884,11 @@ def run_operator_command(params):
         "elapsed": elapsed,
     }
 
+    if _waits_for_response(params):
+        response["matched"] = response_matches(stdout, params.get("wait_for"), params.get("wait_for_msgid"))
+
+    return response
+
 
 class Error(Exception):
     pass
@@ -473,13 +905,29 @@ class OperatorCmdError(Error):
         Return code.
     message : str
         Human readable string describing the exception.
+    stdout : str
+        Standard output of the command.
+    stderr : str
+        Standard error of the command.
 
     Attributes
     ----------
+    cmd : str
+        Command that failed.
+    rc : int
+        Return code.
+    stdout : str
+        Standard output of the command.
+    stderr : str
+        Standard error of the command.
     msg : str
         Human readable string describing the exception.
     """
-    def __init__(self, cmd, rc, message):
+    def __init__(self, cmd, rc, message, stdout=None, stderr=None):
+        self.cmd = cmd
+        self.rc = rc
+        self.stdout = stdout
+        self.stderr = stderr
         self.msg = 'An error occurred executing the operator command "{0}", with RC={1} and response "{2}"'.format(
             cmd, str(rc), message
         )
@@ -1017,7 +1017,8 @@ from ansible_collections.ibm.ibm_zos_core.plugins.module_utils.import_handler im
 from ansible_collections.ibm.ibm_zos_core.plugins.module_utils.data_set import (
     DataSet,
     DatasetCreateError,
-    GDSNameResolveError
+    GDSNameResolveError,
+    temp_data_set_pool
 )
 from ansible_collections.ibm.ibm_zos_core.plugins.module_utils.dependency_checker import (
     validate_dependencies,
@@ -1824,9 +1825,9 @@ return 0"""
             return data
 
         try:
-            # First creating a temp data set to hold the LISTDSI script.
-            # All options are meant to allocate just enough space for it.
-            temp_script_location = DataSet.create_temp(
+            # First getting a temp data set to hold the LISTDSI script.
+            # All options are meant to ask for just enough space for it.
+            temp_script_location = temp_data_set_pool.acquire(
                 hlq=self.tmp_hlq,
                 type='SEQ',
                 record_format='FB',
@@ -1857,7 +1858,7 @@ return 0"""
                 stderr=err.stderr_response
             )
         finally:
-            datasets.delete(temp_script_location)
+            temp_data_set_pool.release(temp_script_location)
 
         attributes['missing_volumes'] = self.missing_volumes
         data['attributes'] = fill_missing_attrs(
@@ -881,7 +881,8 @@ def test_copy_subdirs_folders_and_validate_recursive_encoding_local(ansible_zos_
 
 @pytest.mark.uss
 @pytest.mark.parametrize("copy_directory", [False, True])
-def test_copy_local_dir_to_non_existing_dir(ansible_zos_module, copy_directory):
+@pytest.mark.parametrize("transfer_mode", ["files", "archive"])
+def test_copy_local_dir_to_non_existing_dir(ansible_zos_module, copy_directory, transfer_mode):
     """
     This test evaluates the behavior of testing copy of a directory when src ends
     with '/' versus only the dir name. Expectation is that when only dir name is provided
@@ -899,7 +900,7 @@ def test_copy_local_dir_to_non_existing_dir(ansible_zos_module, copy_directory):
         os.mkdir(source_path)
         populate_dir(source_path)
 
-        copy_result = hosts.all.zos_copy(src=source_path, dest=dest_path)
+        copy_result = hosts.all.zos_copy(src=source_path, dest=dest_path, transfer_mode=transfer_mode)
 
         stat_source_res = hosts.all.stat(path="{0}/{1}".format(dest_path, src_basename))
         if copy_directory:
@@ -3459,7 +3460,8 @@ def test_copy_dir_to_non_existing_pdse(ansible_zos_module):
 
 @pytest.mark.uss
 @pytest.mark.pdse
-def test_copy_dir_crlf_endings_to_non_existing_pdse(ansible_zos_module):
+@pytest.mark.parametrize("transfer_mode", ["files", "archive"])
+def test_copy_dir_crlf_endings_to_non_existing_pdse(ansible_zos_module, transfer_mode):
     hosts = ansible_zos_module
     dest = get_tmp_ds_name()
 
@@ -3471,7 +3473,7 @@ def test_copy_dir_crlf_endings_to_non_existing_pdse(ansible_zos_module):
         os.mkdir(source_path)
         populate_dir_crlf_endings(source_path)
 
-        copy_res = hosts.all.zos_copy(src=source_path, dest=dest)
+        copy_res = hosts.all.zos_copy(src=source_path, dest=dest, transfer_mode=transfer_mode)
         verify_copy = hosts.all.shell(
             cmd="cat \"//'{0}({1})'\"".format(dest, "FILE2"),
             executable=SHELL_EXECUTABLE,
@@ -3491,6 +3493,53 @@ def test_copy_dir_crlf_endings_to_non_existing_pdse(ansible_zos_module):
         hosts.all.zos_data_set(name=dest, state="absent")
 
 
+@pytest.mark.uss
+@pytest.mark.pdse
+def test_sync_local_dir_to_existing_pdse(ansible_zos_module):
+    hosts = ansible_zos_module
+    dest = get_tmp_ds_name()
+
+    temp_path = tempfile.mkdtemp()
+    source_path = "{0}/source/".format(temp_path)
+
+    try:
+        os.mkdir(source_path)
+        populate_dir(source_path)
+
+        copy_res = hosts.all.zos_copy(src=source_path, dest=dest, sync=True)
+        for result in copy_res.contacted.values():
+            assert result.get("msg") is None
+            assert result.get("changed") is True
+            assert result.get("unchanged_entries") == 0
+
+        # Copying the same tree again shouldn't write anything.
+        copy_res = hosts.all.zos_copy(src=source_path, dest=dest, sync=True, replace=True)
+        for result in copy_res.contacted.values():
+            assert result.get("msg") is None
+            assert result.get("changed") is False
+            assert result.get("unchanged_entries") == 5
+
+        with open(os.path.join(source_path, "file3"), "w") as infile:
+            infile.write("changed content")
+
+        copy_res = hosts.all.zos_copy(src=source_path, dest=dest, sync=True, replace=True)
+        verify_copy = hosts.all.shell(
+            cmd="cat \"//'{0}({1})'\"".format(dest, "FILE3"),
+            executable=SHELL_EXECUTABLE,
+        )
+
+        for result in copy_res.contacted.values():
+            assert result.get("msg") is None
+            assert result.get("changed") is True
+            assert result.get("unchanged_entries") == 4
+        for result in verify_copy.contacted.values():
+            assert result.get("rc") == 0
+            assert result.get("stdout").rstrip() == "changed content"
+    finally:
+        shutil.rmtree(temp_path)
+        hosts.all.zos_data_set(name=dest, state="absent")
+
+
 @pytest.mark.uss
 @pytest.mark.pdse
 @pytest.mark.parametrize("src_type", ["pds", "pdse"])
@@ -277,6 +277,54 @@ def test_fetch_sequential_data_set_fixed_block(ansible_zos_module):
             os.remove(dest_path)
 
 
+def test_fetch_sequential_data_set_in_chunks(ansible_zos_module):
+    hosts = ansible_zos_module
+    TEST_PS = get_tmp_ds_name()
+    uss_file = get_random_file_name(dir=TMP_DIRECTORY, prefix='FE')
+    hosts.all.zos_data_set(
+        name=TEST_PS,
+        state="present",
+        type="seq",
+        record_format="fb",
+        record_length=80,
+        space_type="m",
+        space_primary=10
+    )
+    # 100000 records take at least two chunks of 1 MB, trailing blanks or not.
+    hosts.all.shell(
+        cmd="awk 'BEGIN {{ for (i = 1; i <= 100000; i++) printf \"RECORD %06d\\n\", i }}' > {0}".format(uss_file)
+    )
+    hosts.all.shell(cmd=f"dcp {uss_file} \"{TEST_PS}\"")
+    params = {
+        "src":TEST_PS,
+        "dest":"/tmp/",
+        "flat":True,
+        "chunk_size":1
+    }
+    dest_path = "/tmp/" + TEST_PS
+    try:
+        results = hosts.all.zos_fetch(**params)
+        for result in results.contacted.values():
+            assert result.get("changed") is True
+            assert result.get("data_set_type") == "Sequential"
+            assert result.get("chunks") == -(-os.path.getsize(dest_path) // (1024 * 1024))
+            assert result.get("chunks") >= 2
+            assert result.get("resumed_chunks") == 0
+            assert result.get("dest") == dest_path
+            assert not os.path.exists(dest_path + ".part")
+            assert not os.path.exists(dest_path + ".journal")
+            with open(dest_path, "r", encoding="utf-8") as infile:
+                lines = [line.rstrip() for line in infile.read().splitlines()]
+            assert len(lines) == 100000
+            assert lines[0] == "RECORD 000001"
+            assert lines[-1] == "RECORD 100000"
+    finally:
+        hosts.all.zos_data_set(name=TEST_PS, state="absent")
+        hosts.all.file(path=uss_file, state="absent")
+        if os.path.exists(dest_path):
+            os.remove(dest_path)
+
+
 def test_fetch_sequential_data_set_variable_block(ansible_zos_module):
     hosts = ansible_zos_module
     TEST_PS_VB = get_tmp_ds_name(3)
@@ -719,6 +767,42 @@ def test_fetch_sequential_data_set_replace_on_local_machine(ansible_zos_module):
             os.remove(dest_path)
 
 
+def test_fetch_sequential_data_set_present_on_local_machine(ansible_zos_module):
+    hosts = ansible_zos_module
+    TEST_PS = get_tmp_ds_name()
+    hosts.all.zos_data_set(
+        name=TEST_PS,
+        state="present",
+        type="seq",
+        space_type="m",
+        space_primary=5
+    )
+    hosts.all.shell(cmd=f"decho \"{TEST_DATA}\" \"{TEST_PS}\"")
+    dest_path = "/tmp/" + TEST_PS
+    params = {
+        "src":TEST_PS,
+        "dest":"/tmp/",
+        "flat":True
+    }
+    try:
+        hosts.all.zos_fetch(**params)
+        local_checksum = checksum(dest_path, hash_func=sha256)
+        local_mtime = os.path.getmtime(dest_path)
+
+        results = hosts.all.zos_fetch(**params)
+        for result in results.contacted.values():
+            assert result.get("changed") is False
+            assert result.get("checksum") == local_checksum
+            assert result.get("module_stderr") is None
+            assert result.get("dest") == dest_path
+            # The local copy was not transferred again.
+            assert os.path.getmtime(dest_path) == local_mtime
+    finally:
+        hosts.all.zos_data_set(name=TEST_PS, state="absent")
+        if os.path.exists(dest_path):
+            os.remove(dest_path)
+
+
 def test_fetch_partitioned_data_set_replace_on_local_machine(ansible_zos_module):
     hosts = ansible_zos_module
     pds_name = get_tmp_ds_name()
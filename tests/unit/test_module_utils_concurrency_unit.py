@@ -0,0 +1,58 @@
+# -*- coding: utf-8 -*-
+
+# Copyright (c) IBM Corporation 2026
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#     http://www.apache.org/licenses/LICENSE-2.0
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from __future__ import absolute_import, division, print_function
+
+__metaclass__ = type
+
+import threading
+import time
+
+import pytest
+
+from ansible_collections.ibm.ibm_zos_core.plugins.module_utils.concurrency import (
+    run_concurrently
+)
+
+
+def _check_even(number):
+    if number % 2:
+        raise ValueError("{0} is odd".format(number))
+    return number * 10
+
+
+@pytest.mark.parametrize("max_concurrency", [1, 4])
+def test_results_keep_item_order(max_concurrency):
+    tasks = run_concurrently(_check_even, range(6), max_concurrency=max_concurrency)
+
+    assert [task.item for task in tasks] == list(range(6))
+    assert [task.result for task in tasks] == [0, None, 20, None, 40, None]
+    assert [str(task.error) for task in tasks if task.failed] == ["1 is odd", "3 is odd", "5 is odd"]
+
+
+def test_concurrency_is_bounded():
+    lock = threading.Lock()
+    running = [0]
+    peak = [0]
+
+    def work(item):
+        with lock:
+            running[0] += 1
+            peak[0] = max(peak[0], running[0])
+        time.sleep(0.01)
+        with lock:
+            running[0] -= 1
+
+    run_concurrently(work, range(20), max_concurrency=3)
+
+    assert 1 < peak[0] <= 3
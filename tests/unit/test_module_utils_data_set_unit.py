@@ -18,7 +18,11 @@ __metaclass__ = type
 
 import pytest
 
-from ansible_collections.ibm.ibm_zos_core.plugins.module_utils.data_set import MVSCmdExecError
+from ansible_collections.ibm.ibm_zos_core.plugins.module_utils.data_set import (
+    DataSet,
+    MVSCmdExecError,
+    catalog_cache
+)
 
 IMPORT_NAME = "ansible_collections.ibm.ibm_zos_core.plugins.module_utils.data_set"
 
@@ -31,11 +35,24 @@ class DummyModule(object):
         self.rc = rc
         self.stdout = stdout
         self.stderr = stderr
+        self.calls = 0
+        self.data = None
 
     def run_command(self, *args, **kwargs):
+        self.calls += 1
+        self.data = kwargs.get("data")
         return (self.rc, self.stdout, self.stderr)
 
 
+@pytest.fixture(autouse=True)
+def clear_catalog_cache():
+    """Every test starts without cached catalog entries, inside a cache scope."""
+    catalog_cache.invalidate()
+    with catalog_cache.scope():
+        yield
+    catalog_cache.invalidate()
+
+
 # Unit tests are intended to exercise code paths (not test for functionality).
 
 # These unit tests are NOT run on any z/OS system, so hard-coded data set names will not matter.
@@ -114,4 +131,533 @@ def test_dataset_cataloged_unit(zos_import_mocker, rc, stdout, expected_return,
     finally:
         if not expected_exception_type:
             assert not error_raised
-        assert results == expected_return
\ No newline at end of file
+        assert results == expected_return
+
+
+stdout_ds_on_volume = """0
+  LISTCAT ENTRIES('{0}') ALL
+0NONVSAM ------- {0}
+      IN-CAT --- CATALOG.SVPLEX9.MASTER
+    VOLUMES
+      VOLSER------------000000     DEVTYPE------X'3010200F'     FSEQN------------------0
+1IDCAMS  SYSTEM SERVICES  """.format(data_set_name)
+
+
+def test_catalog_cache_runs_listcat_once(zos_import_mocker):
+    mocker, importer = zos_import_mocker
+    zos_module_util_data_set = importer(IMPORT_NAME)
+    module = DummyModule(stdout=stdout_ds_on_volume)
+    mocker.patch(
+        "{0}.AnsibleModuleHelper".format(IMPORT_NAME),
+        create=True,
+        return_value=module,
+    )
+    cache = zos_module_util_data_set.catalog_cache
+    hits, misses = cache.hits, cache.misses
+
+    assert zos_module_util_data_set.DataSet.data_set_cataloged(data_set_name)
+    assert zos_module_util_data_set.DataSet.data_set_cataloged_volume_list(data_set_name) == ["000000"]
+    assert not zos_module_util_data_set.DataSet.data_set_cataloged(data_set_name, volumes=["222222"])
+    assert module.calls == 1
+    assert (cache.hits - hits, cache.misses - misses) == (2, 1)
+
+    cache.invalidate("{0}(MEMBER)".format(data_set_name.lower()))
+    assert zos_module_util_data_set.DataSet.data_set_cataloged(data_set_name)
+    assert module.calls == 2
+
+
+def test_catalog_cache_skips_missing_data_sets(zos_import_mocker):
+    mocker, importer = zos_import_mocker
+    zos_module_util_data_set = importer(IMPORT_NAME)
+    module = DummyModule(rc=4, stdout=stdout_ds_not_in_catalog)
+    mocker.patch(
+        "{0}.AnsibleModuleHelper".format(IMPORT_NAME),
+        create=True,
+        return_value=module,
+    )
+
+    assert not zos_module_util_data_set.DataSet.data_set_cataloged(data_set_name)
+    assert not zos_module_util_data_set.DataSet.data_set_cataloged(data_set_name)
+    assert module.calls == 2
+
+
+def test_catalog_cache_keeps_nothing_outside_a_scope(zos_import_mocker):
+    mocker, importer = zos_import_mocker
+    zos_module_util_data_set = importer(IMPORT_NAME)
+    module = DummyModule(stdout=stdout_ds_on_volume)
+    mocker.patch(
+        "{0}.AnsibleModuleHelper".format(IMPORT_NAME),
+        create=True,
+        return_value=module,
+    )
+    cache = zos_module_util_data_set.catalog_cache
+    cache._depth, depth = 0, cache._depth
+
+    try:
+        assert zos_module_util_data_set.DataSet.data_set_cataloged(data_set_name)
+        assert zos_module_util_data_set.DataSet.data_set_cataloged(data_set_name)
+        assert module.calls == 2
+
+        with cache.scope():
+            assert zos_module_util_data_set.DataSet.data_set_cataloged(data_set_name)
+            assert zos_module_util_data_set.DataSet.data_set_cataloged(data_set_name)
+            assert module.calls == 3
+        assert not cache._entries
+    finally:
+        cache._depth = depth
+
+
+def test_catalog_cache_invalidates_vsam_components():
+    catalog_cache._entries = {
+        "USER.VSAM": None,
+        "USER.VSAM.DATA": None,
+        "USER.VSAM2": None,
+    }
+
+    catalog_cache.invalidate("user.vsam")
+
+    assert list(catalog_cache._entries) == ["USER.VSAM2"]
+
+
+other_data_set_name = "USER.PRIVATE.MISSING"
+
+stdout_many_data_sets = """
+1IDCAMS  SYSTEM SERVICES                                           TIME: 13:34:18        06/06/24     PAGE      1
+0
+  LISTCAT ENTRIES('{0}') ALL
+0NONVSAM ------- {0}
+      IN-CAT --- CATALOG.SVPLEX9.MASTER
+    VOLUMES
+      VOLSER------------000000     DEVTYPE------X'3010200F'     FSEQN------------------0
+0IDC0001I FUNCTION COMPLETED, HIGHEST CONDITION CODE WAS 0
+0
+  LISTCAT ENTRIES('{1}') ALL
+0IDC3012I ENTRY {1} NOT FOUND
+ IDC3009I ** VSAM CATALOG RETURN CODE IS 8 - REASON CODE IS IGG0CLEG-42
+ IDC1566I ** {1} NOT LISTED
+0IDC0001I FUNCTION COMPLETED, HIGHEST CONDITION CODE WAS 4
+0
+0IDC0002I IDCAMS PROCESSING COMPLETE. MAXIMUM CONDITION CODE WAS 4
+""".format(data_set_name, other_data_set_name)
+
+
+def test_catalog_entries_of_many_data_sets(zos_import_mocker):
+    mocker, importer = zos_import_mocker
+    zos_module_util_data_set = importer(IMPORT_NAME)
+    module = DummyModule(rc=4, stdout=stdout_many_data_sets)
+    mocker.patch(
+        "{0}.AnsibleModuleHelper".format(IMPORT_NAME),
+        create=True,
+        return_value=module,
+    )
+
+    entries = zos_module_util_data_set.DataSet.get_catalog_entries(
+        [data_set_name, other_data_set_name.lower(), data_set_name]
+    )
+
+    assert list(entries) == [data_set_name, other_data_set_name]
+    assert entries[data_set_name].rc == 0
+    assert entries[data_set_name].cataloged
+    assert entries[data_set_name].entry_type == "NONVSAM"
+    assert entries[data_set_name].volumes == ["000000"]
+    assert entries[other_data_set_name].rc == 4
+    assert not entries[other_data_set_name].cataloged
+
+    assert zos_module_util_data_set.DataSet.data_set_exists(data_set_name)
+    assert module.calls == 1
+    assert list(zos_module_util_data_set.catalog_cache._entries) == [data_set_name]
+
+
+def test_catalog_entries_split_in_batches(zos_import_mocker):
+    mocker, importer = zos_import_mocker
+    zos_module_util_data_set = importer(IMPORT_NAME)
+    module = DummyModule(rc=4, stdout=stdout_many_data_sets)
+    mocker.patch(
+        "{0}.AnsibleModuleHelper".format(IMPORT_NAME),
+        create=True,
+        return_value=module,
+    )
+    mocker.patch("{0}.LISTCAT_BATCH_SIZE".format(IMPORT_NAME), 1)
+
+    entries = zos_module_util_data_set.DataSet.get_catalog_entries([data_set_name, other_data_set_name])
+
+    assert module.calls == 2
+    assert entries[data_set_name].cataloged
+    assert not entries[other_data_set_name].cataloged
+
+
+stdout_bulk_delete = """
+1IDCAMS  SYSTEM SERVICES                                           TIME: 13:34:18        06/06/24     PAGE      1
+0
+  DELETE 'USER.PRIVATE.DS1'
+0IDC0550I ENTRY (A) USER.PRIVATE.DS1 DELETED
+0IDC0001I FUNCTION COMPLETED, HIGHEST CONDITION CODE WAS 0
+0
+  DELETE 'USER.PRIVATE.DS2' NOSCRATCH
+0IDC3012I ENTRY USER.PRIVATE.DS2 NOT FOUND
+0IDC0551I ** ENTRY USER.PRIVATE.DS2 NOT DELETED
+0IDC0001I FUNCTION COMPLETED, HIGHEST CONDITION CODE WAS 8
+0
+0IDC0002I IDCAMS PROCESSING COMPLETE. MAXIMUM CONDITION CODE WAS 8
+"""
+
+
+def test_bulk_delete_maps_condition_codes(zos_import_mocker):
+    mocker, importer = zos_import_mocker
+    zos_module_util_data_set = importer(IMPORT_NAME)
+    module = DummyModule(rc=8, stdout=stdout_bulk_delete)
+    mocker.patch(
+        "{0}.AnsibleModuleHelper".format(IMPORT_NAME),
+        create=True,
+        return_value=module,
+    )
+
+    results = zos_module_util_data_set.DataSet.bulk_delete(
+        ["USER.PRIVATE.DS1", "USER.PRIVATE.DS2", "USER.PRIVATE.DS3"],
+        noscratch=[False, True, False]
+    )
+
+    assert module.calls == 1
+    assert module.data == "\n".join([
+        " DELETE 'USER.PRIVATE.DS1'",
+        " DELETE 'USER.PRIVATE.DS2' NOSCRATCH",
+        " DELETE 'USER.PRIVATE.DS3'",
+    ])
+    assert [rc for rc, output in results] == [0, 8, 16]
+    assert "DS1 DELETED" in results[0][1]
+    assert "DS2 NOT DELETED" in results[1][1]
+    assert "DS1" not in results[1][1]
+
+
+def test_idcams_statements_split_in_batches(zos_import_mocker):
+    mocker, importer = zos_import_mocker
+    zos_module_util_data_set = importer(IMPORT_NAME)
+    module = DummyModule(stdout="0IDC0001I FUNCTION COMPLETED, HIGHEST CONDITION CODE WAS 0\n")
+    mocker.patch(
+        "{0}.AnsibleModuleHelper".format(IMPORT_NAME),
+        create=True,
+        return_value=module,
+    )
+    mocker.patch("{0}.IDCAMS_BATCH_SIZE".format(IMPORT_NAME), 2)
+
+    results = zos_module_util_data_set.DataSet.bulk_delete(
+        ["USER.PRIVATE.DS1", "USER.PRIVATE.DS2", "USER.PRIVATE.DS3"]
+    )
+
+    assert module.calls == 2
+    assert module.data == " DELETE 'USER.PRIVATE.DS3'"
+    assert [rc for rc, output in results] == [0, 16, 0]
+
+
+@pytest.mark.parametrize("arguments", [
+    dict(type="seq", record_format="fb", record_length=80),
+    dict(type="seq", record_format="vba", record_length=137, block_size=27998),
+    dict(type="large", record_format="fb", record_length=80, block_size=27920),
+    dict(type="pds", record_format="u", record_length=0, block_size=32760, directory_blocks=10),
+    dict(type="pdse", record_format="fb", record_length=80),
+    dict(type="pdse", record_format="fb", record_length=80, directory_blocks=20),
+])
+def test_allocate_statement_matches_zoau_arguments(arguments):
+    arguments = dict(name="USER.PRIVATE.DS", space_primary=5, space_secondary=3, space_type="m", **arguments)
+    assert DataSet.can_bulk_create(**arguments)
+
+    statement = DataSet._build_allocate_statement(**arguments)
+    zoau_arguments = DataSet._build_zoau_args(**arguments)
+
+    assert "RECFM({0})".format(",".join(zoau_arguments["record_format"].upper())) in statement
+    assert "LRECL({0})".format(zoau_arguments["record_length"]) in statement
+    if "block_size" in zoau_arguments:
+        assert "BLKSIZE({0})".format(zoau_arguments["block_size"]) in statement
+    else:
+        assert "BLKSIZE" not in statement
+    if arguments["type"] == "pdse":
+        assert "DIR({0})".format(zoau_arguments.get("directory_blocks", 5)) in statement
+    elif "directory_blocks" in zoau_arguments:
+        assert "DIR({0})".format(zoau_arguments["directory_blocks"]) in statement
+    else:
+        assert "DIR(" not in statement
+
+
+@pytest.mark.parametrize("arguments", [
+    dict(type="seq", record_format="u"),
+    dict(type="pds", record_format="fb", block_size=27920),
+    dict(type="ksds", record_format=None),
+    dict(type="zfs", record_format=None),
+])
+def test_allocations_left_to_zoau(arguments):
+    assert not DataSet.can_bulk_create(**arguments)
+
+
+def test_build_allocate_statement():
+    statement = DataSet._build_allocate_statement(
+        name="USER.PRIVATE.PDSE",
+        type="pdse",
+        space_primary=5,
+        space_secondary=3,
+        space_type="m",
+        record_format="fba",
+        record_length=133,
+        volumes=["vol001"],
+        sms_storage_class="sc1",
+        key_length=None,
+    )
+
+    assert statement == """ ALLOCATE -
+    DSNAME('USER.PRIVATE.PDSE') -
+    NEW CATALOG -
+    DSNTYPE(LIBRARY) -
+    DSORG(PO) DIR(5) -
+    SPACE(5,3) AVBLOCK(1) AVGREC(M) -
+    RECFM(F,B,A) -
+    LRECL(133) -
+    VOLUME(VOL001) -
+    STORCLAS(SC1)"""
+    assert all(len(line) <= 72 for line in statement.splitlines())
+
+
+def test_temp_data_set_pool_reuses_data_sets(zos_import_mocker):
+    mocker, importer = zos_import_mocker
+    zos_module_util_data_set = importer(IMPORT_NAME)
+    temp_names = iter("USER.TEMP{0}".format(number) for number in range(10))
+    create_temp = mocker.patch(
+        "{0}.DataSet.create_temp".format(IMPORT_NAME), side_effect=lambda **kwargs: next(temp_names)
+    )
+    truncate = mocker.patch("{0}.TempDataSetPool._truncate".format(IMPORT_NAME), return_value=True)
+    datasets = mocker.patch("{0}.datasets".format(IMPORT_NAME), new=mocker.MagicMock())
+    pool = zos_module_util_data_set.TempDataSetPool()
+
+    first = pool.acquire(hlq="user", space_primary=5, space_type="K")
+    pool.release(first)
+    # Same space class (64K) as the first request.
+    assert pool.acquire(hlq="USER", space_primary=60, space_type="K") == first
+    # Different record format and space class.
+    assert pool.acquire(hlq="USER", record_format="VB", space_primary=60, space_type="K") != first
+    assert pool.acquire(hlq="USER", space_primary=1, space_type="M") != first
+
+    # Same space class, but no secondary space.
+    assert pool.acquire(hlq="USER", space_primary=60, space_secondary=0, space_type="K") != first
+
+    assert (pool.allocations, pool.reuses) == (4, 1)
+    assert create_temp.call_args_list[0][1]["space_primary"] == 64
+    assert create_temp.call_args_list[0][1]["space_secondary"] == 5
+    assert create_temp.call_args_list[2][1]["space_primary"] == 1024
+    assert create_temp.call_args_list[2][1]["space_secondary"] == 5 * 1024
+    assert create_temp.call_args_list[3][1]["space_secondary"] == 0
+    truncate.assert_called_once_with(first)
+
+    pool.cleanup()
+    assert sorted(call[0][0] for call in datasets.delete.call_args_list) == [
+        "USER.TEMP0", "USER.TEMP1", "USER.TEMP2", "USER.TEMP3"
+    ]
+
+
+def test_temp_data_set_pool_deletes_data_sets_it_cannot_empty(zos_import_mocker):
+    mocker, importer = zos_import_mocker
+    zos_module_util_data_set = importer(IMPORT_NAME)
+    mocker.patch("{0}.DataSet.create_temp".format(IMPORT_NAME), side_effect=["USER.TEMP0", "USER.TEMP1"])
+    mocker.patch("{0}.TempDataSetPool._truncate".format(IMPORT_NAME), return_value=False)
+    datasets = mocker.patch("{0}.datasets".format(IMPORT_NAME), new=mocker.MagicMock())
+    pool = zos_module_util_data_set.TempDataSetPool()
+
+    pool.release(pool.acquire())
+    datasets.delete.assert_called_once_with("USER.TEMP0")
+    assert pool.acquire() == "USER.TEMP1"
+
+
+def test_data_set_attributes_from_listing(zos_import_mocker):
+    mocker, importer = zos_import_mocker
+    zos_module_util_data_set = importer(IMPORT_NAME)
+    module = DummyModule()
+    mocker.patch(
+        "{0}.AnsibleModuleHelper".format(IMPORT_NAME),
+        create=True,
+        return_value=module,
+    )
+    listing = mocker.MagicMock(
+        organization="PS",
+        record_format="FBA",
+        record_length="133",
+        block_size="27930",
+        volume="000000",
+        total_space="56664",
+    )
+    listing.name = data_set_name
+    datasets = mocker.patch("{0}.datasets".format(IMPORT_NAME), new=mocker.MagicMock())
+    datasets.list_datasets.return_value = [listing]
+
+    ds_utils = zos_module_util_data_set.DataSetUtils(data_set_name.lower())
+    assert ds_utils.exists()
+    assert (ds_utils.ds_type(), ds_utils.recfm(), ds_utils.lrecl(), ds_utils.blksize(), ds_utils.volume()) == (
+        "PS", "FBA", 133, 27930, "000000"
+    )
+
+    attributes = zos_module_util_data_set.DataSet.get_attributes("{0}(MEMBER)".format(data_set_name))
+    assert attributes.source == "listing"
+    assert attributes.space == 56664
+    assert attributes.has_asa_chars
+    datasets.list_datasets.assert_called_once_with(data_set_name)
+    assert module.calls == 0
+
+    catalog_cache.invalidate(data_set_name)
+    zos_module_util_data_set.DataSet.get_attributes(data_set_name)
+    assert datasets.list_datasets.call_count == 2
+
+
+stdout_listds = """  LISTDS '{0}'
+{0}
+--RECFM-LRECL-BLKSIZE-DSORG
+  VB    1028  32760   PS
+--VOLUMES--
+  000000
+READY
+END
+""".format(data_set_name)
+
+
+def test_data_set_attributes_fall_back_to_listds(zos_import_mocker):
+    mocker, importer = zos_import_mocker
+    zos_module_util_data_set = importer(IMPORT_NAME)
+    module = DummyModule(stdout=stdout_ds_on_volume)
+    mocker.patch(
+        "{0}.AnsibleModuleHelper".format(IMPORT_NAME),
+        create=True,
+        return_value=module,
+    )
+    datasets = mocker.patch("{0}.datasets".format(IMPORT_NAME), new=mocker.MagicMock())
+    datasets.list_datasets.return_value = []
+    ikjeft01 = mocker.patch("{0}.mvs_cmd.ikjeft01".format(IMPORT_NAME), return_value=(0, stdout_listds, ""))
+
+    attributes = zos_module_util_data_set.DataSet.get_attributes(data_set_name)
+    assert attributes.exists
+    assert attributes.source == "listds"
+    assert (attributes.dsorg, attributes.recfm, attributes.lrecl, attributes.blksize) == ("PS", "VB", 1028, 32760)
+    assert attributes.volumes == ["000000"]
+    assert attributes.space is None
+    assert not attributes.has_asa_chars
+
+    assert zos_module_util_data_set.DataSet.get_attributes(data_set_name) is attributes
+    assert (module.calls, ikjeft01.call_count) == (1, 1)
+
+
+def test_data_set_attributes_of_missing_data_sets_are_not_cached(zos_import_mocker):
+    mocker, importer = zos_import_mocker
+    zos_module_util_data_set = importer(IMPORT_NAME)
+    module = DummyModule(rc=4, stdout=stdout_ds_not_in_catalog)
+    mocker.patch(
+        "{0}.AnsibleModuleHelper".format(IMPORT_NAME),
+        create=True,
+        return_value=module,
+    )
+    datasets = mocker.patch("{0}.datasets".format(IMPORT_NAME), new=mocker.MagicMock())
+    datasets.list_datasets.return_value = []
+
+    assert not zos_module_util_data_set.DataSetUtils(data_set_name).exists()
+    assert not zos_module_util_data_set.DataSet.get_attributes(data_set_name).exists
+    assert datasets.list_datasets.call_count == 2
+
+
+def test_member_directory_answers_membership_from_one_listing(zos_import_mocker):
+    mocker, importer = zos_import_mocker
+    zos_module_util_data_set = importer(IMPORT_NAME)
+    module = DummyModule()
+    mocker.patch(
+        "{0}.AnsibleModuleHelper".format(IMPORT_NAME),
+        create=True,
+        return_value=module,
+    )
+    datasets = mocker.patch("{0}.datasets".format(IMPORT_NAME), new=mocker.MagicMock())
+    datasets.list_members.return_value = ["MEM1", "MEM2"]
+    DataSet = zos_module_util_data_set.DataSet
+
+    assert DataSet.data_set_member_exists("{0}(mem1)".format(data_set_name))
+    assert not DataSet.data_set_member_exists("{0}(MEM3)".format(data_set_name))
+    assert DataSet.data_set_shared_members("USER.PRIVATE.SRC(MEM*)", data_set_name)
+    datasets.list_members.assert_has_calls([mocker.call(data_set_name), mocker.call("USER.PRIVATE.SRC(MEM*)")])
+    assert datasets.list_members.call_count == 2
+
+    mocker.patch("{0}.DataSet.data_set_cataloged".format(IMPORT_NAME), return_value=True)
+    datasets.delete_members.return_value = 0
+    DataSet.create_member("{0}(MEM3)".format(data_set_name))
+    DataSet.delete_member("{0}(MEM1)".format(data_set_name))
+    assert DataSet.get_member_directory(data_set_name).members() == ["MEM2", "MEM3"]
+    assert datasets.list_members.call_count == 2
+    # Only the cp of create_member ran, no head for existence checks.
+    assert module.calls == 1
+
+    DataSet.delete_member("{0}(MEM*)".format(data_set_name))
+    DataSet.get_member_directory(data_set_name)
+    assert datasets.list_members.call_count == 3
+
+
+def test_member_directory_sees_members_written_outside_a_scope(zos_import_mocker):
+    mocker, importer = zos_import_mocker
+    zos_module_util_data_set = importer(IMPORT_NAME)
+    mocker.patch("{0}.AnsibleModuleHelper".format(IMPORT_NAME), create=True, return_value=DummyModule())
+    datasets = mocker.patch("{0}.datasets".format(IMPORT_NAME), new=mocker.MagicMock())
+    datasets.list_members.side_effect = [["MEM1"], ["MEM1", "MEM2"]]
+    DataSet = zos_module_util_data_set.DataSet
+    cache = zos_module_util_data_set.catalog_cache
+    cache._depth, depth = 0, cache._depth
+
+    try:
+        assert not DataSet.data_set_member_exists("{0}(MEM2)".format(data_set_name))
+        # MEM2 gets written by something other than DataSet, like IEBCOPY.
+        assert DataSet.data_set_member_exists("{0}(MEM2)".format(data_set_name))
+        assert not cache._directories
+    finally:
+        cache._depth = depth
+
+
+def test_member_directory_reads_aliases_and_stats(zos_import_mocker):
+    mocker, importer = zos_import_mocker
+    zos_module_util_data_set = importer(IMPORT_NAME)
+    module = DummyModule(stdout="MEM1  01.00 2024/06/06 2024/06/07 10:12 12 12 0 USER\nALIAS1\n")
+    mocker.patch(
+        "{0}.AnsibleModuleHelper".format(IMPORT_NAME),
+        create=True,
+        return_value=module,
+    )
+    datasets = mocker.patch("{0}.datasets".format(IMPORT_NAME), new=mocker.MagicMock())
+    datasets.list_members.side_effect = lambda name, options=None: ["MEM1"] if options else ["MEM1", "ALIAS1"]
+
+    directory = zos_module_util_data_set.DataSet.get_member_directory(data_set_name)
+    assert directory.aliases is None
+    assert directory.members(aliases=False) == ["ALIAS1", "MEM1"]
+
+    directory = zos_module_util_data_set.DataSet.get_member_directory(data_set_name, aliases=True, stats=True)
+    assert directory.aliases == {"ALIAS1"}
+    assert directory.members(aliases=False) == ["MEM1"]
+    assert directory.stats["MEM1"][0] == "01.00"
+    assert directory.stats["ALIAS1"] == []
+    # The second read only needed the listing without aliases.
+    assert datasets.list_members.call_count == 2
+    assert module.calls == 1
+
+    directory.add("mem1")
+    assert "MEM1" not in directory.stats
+
+
+def test_member_directory_lists_members_without_aliases_once(zos_import_mocker):
+    mocker, importer = zos_import_mocker
+    zos_module_util_data_set = importer(IMPORT_NAME)
+    mocker.patch("{0}.AnsibleModuleHelper".format(IMPORT_NAME), create=True, return_value=DummyModule())
+    datasets = mocker.patch("{0}.datasets".format(IMPORT_NAME), new=mocker.MagicMock())
+    datasets.list_members.side_effect = lambda name, options=None: ["MEM1"] if options else ["MEM1", "ALIAS1"]
+    DataSet = zos_module_util_data_set.DataSet
+    cache = zos_module_util_data_set.catalog_cache
+    cache._depth, depth = 0, cache._depth
+
+    try:
+        directory = DataSet.get_member_directory(data_set_name, hide_aliases=True)
+        assert directory.members(aliases=False) == ["MEM1"]
+        assert not directory.complete
+        datasets.list_members.assert_called_once_with(data_set_name, options="-H ")
+    finally:
+        cache._depth = depth
+
+    # The incomplete snapshot isn't kept, a full one answers from the scope.
+    DataSet.get_member_directory(data_set_name, hide_aliases=True)
+    assert not cache._directories
+    DataSet.get_member_directory(data_set_name, aliases=True)
+    assert DataSet.get_member_directory(data_set_name, hide_aliases=True).members(aliases=False) == ["MEM1"]
+    assert datasets.list_members.call_count == 4
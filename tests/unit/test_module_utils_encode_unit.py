@@ -0,0 +1,335 @@
+# -*- coding: utf-8 -*-
+
+# Copyright (c) IBM Corporation 2026
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#     http://www.apache.org/licenses/LICENSE-2.0
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from __future__ import absolute_import, division, print_function
+
+__metaclass__ = type
+
+import filecmp
+import io
+import os
+import subprocess
+import time
+
+import pytest
+from ansible.module_utils.common.text.converters import to_text
+from mock import MagicMock
+
+from ansible_collections.ibm.ibm_zos_core.plugins.module_utils import encode
+from ansible_collections.ibm.ibm_zos_core.plugins.module_utils.encode import (
+    CodeSetConverter,
+    EncodeError,
+    EncodeFilesError,
+    EncodeUtils,
+    get_codec,
+)
+
+# ISO8859-1 "abc\n[]^\xac" in IBM-1047 and IBM-037, the newline is mapped
+# to NL (0x15) like z/OS iconv does for USS text.
+LATIN1_TEXT = b"abc\n[]^\xac"
+IBM1047_TEXT = bytes(bytearray([0x81, 0x82, 0x83, 0x15, 0xAD, 0xBD, 0x5F, 0xB0]))
+IBM037_TEXT = bytes(bytearray([0x81, 0x82, 0x83, 0x15, 0xBA, 0xBB, 0xB0, 0x5F]))
+
+
+@pytest.mark.parametrize("code_set,expected", [
+    ("IBM-1047", IBM1047_TEXT),
+    ("IBM-037", IBM037_TEXT),
+])
+def test_convert_single_byte_code_sets(code_set, expected):
+    to_ebcdic = CodeSetConverter("ISO8859-1", code_set)
+    from_ebcdic = CodeSetConverter(code_set, "ISO8859-1")
+
+    assert to_ebcdic.supported
+    assert to_ebcdic.convert(LATIN1_TEXT) == expected
+    assert from_ebcdic.convert(expected) == LATIN1_TEXT
+
+
+def test_convert_multi_byte_across_chunks():
+    text = u"línea 1\nlínea 2 ç\n"
+    converter = CodeSetConverter("UTF-8", "IBM-1047", chunk_size=1)
+
+    converted = b"".join(converter.iter_convert(io.BytesIO(text.encode("utf-8"))))
+
+    assert converted == get_codec("IBM-1047").encode(text)[0]
+    assert CodeSetConverter("IBM-1047", "UTF-8").convert(converted) == text.encode("utf-8")
+
+
+def test_convert_characters_outside_latin1():
+    # IBM-1140 is IBM-037 with the euro sign in place of the currency sign.
+    assert CodeSetConverter("UTF-8", "IBM-1140").convert(u"€".encode("utf-8")) == b"\x9f"
+
+
+def test_convert_invalid_data_fails():
+    with pytest.raises(EncodeError):
+        CodeSetConverter("UTF-8", "IBM-037").convert(u"€".encode("utf-8"))
+
+    # Truncated multi-byte sequence at the end of the input.
+    with pytest.raises(EncodeError):
+        list(CodeSetConverter("UTF-8", "IBM-037").iter_convert(io.BytesIO(b"abc\xc3")))
+
+
+def test_unknown_code_sets_are_left_to_iconv():
+    assert get_codec("IBM-930") is None
+    assert not CodeSetConverter("IBM-930", "UTF-8").supported
+
+
+def test_convert_file(tmp_path):
+    src = tmp_path / "src"
+    dest = tmp_path / "dest"
+    src.write_bytes(LATIN1_TEXT * 1000)
+
+    CodeSetConverter("ISO8859-1", "IBM-1047", chunk_size=7).convert_file(str(src), str(dest))
+
+    assert dest.read_bytes() == IBM1047_TEXT * 1000
+
+
+@pytest.fixture
+def encode_utils(monkeypatch):
+    monkeypatch.setattr(encode, "AnsibleModuleHelper", MagicMock())
+    return EncodeUtils()
+
+
+def test_convert_directory_reports_every_failure(tmp_path, encode_utils):
+    src = tmp_path / "src"
+    (src / "nested").mkdir(parents=True)
+    for name in ("file1", "file2", os.path.join("nested", "file3")):
+        (src / name).write_bytes(b"abc\n")
+    (src / "bad1").write_bytes(b"\xff")
+    (src / "nested" / "bad2").write_bytes(b"\xfe")
+    dest = tmp_path / "dest"
+
+    with pytest.raises(EncodeFilesError) as err:
+        encode_utils.uss_convert_encoding_prev(str(src), str(dest), "UTF-8", "IBM-1047")
+
+    assert sorted(err.value.failures) == [str(src / "bad1"), str(src / "nested" / "bad2")]
+    assert sorted(err.value.converted) == [
+        str(dest / "file1"), str(dest / "file2"), str(dest / "nested" / "file3")
+    ]
+    assert (dest / "nested" / "file3").read_bytes() == b"\x81\x82\x83\x15"
+
+
+@pytest.mark.parametrize("to_code,expected_concurrency", [("IBM-1047", 1), ("IBM-930", 4)])
+def test_convert_files_only_parallel_with_iconv(monkeypatch, encode_utils, to_code, expected_concurrency):
+    pools = []
+
+    def run_concurrently(func, items, max_concurrency):
+        pools.append(max_concurrency)
+        return []
+
+    monkeypatch.setattr(encode, "run_concurrently", run_concurrently)
+    encode_utils.uss_convert_encoding_files([("/a", "/a"), ("/b", "/b")], "UTF-8", to_code, max_concurrency=4)
+
+    assert pools == [expected_concurrency]
+
+
+def test_tag_files_in_batches(tmp_path, monkeypatch, encode_utils):
+    (tmp_path / "dir").mkdir()
+    files = [str(tmp_path / "file{0}".format(i)) for i in range(6)]
+    # Room for two paths per chtag call.
+    monkeypatch.setattr(encode, "TAG_BATCH_LENGTH", 2 * (len(files[0]) + 1))
+    encode_utils.module.run_command.side_effect = lambda cmd, **kwargs: (
+        (1, "", "chtag failed") if files[4] in cmd else (0, "", "")
+    )
+
+    failures = encode_utils.uss_tag_encoding_files(files + [str(tmp_path / "dir")], "IBM-1047")
+
+    assert failures == {files[4]: "chtag failed"}
+    commands = [call[0][0] for call in encode_utils.module.run_command.call_args_list]
+    assert commands[-1] == ["chtag", "-Rc", "IBM-1047", str(tmp_path / "dir")]
+    # Only the batch that failed gets retried file by file.
+    assert [cmd[3:] for cmd in commands if cmd[1] == "-tc"] == [
+        files[0:2], files[2:4], files[4:6], [files[4]], [files[5]]
+    ]
+
+
+def test_strings_convert_encoding_in_process(encode_utils):
+    converted = encode_utils.strings_convert_encoding(
+        [b"\xc8\x85\x93\x93\x96", IBM1047_TEXT, u"abc"], "IBM-1047", "ISO8859-1"
+    )
+
+    assert converted == [u"Hello", u"abc\n[]^\ufffd", u"abc"]
+    assert not encode_utils.module.run_command.called
+
+
+def test_strings_convert_encoding_with_one_iconv(encode_utils):
+    encode_utils.module.run_command.return_value = (0, b"A\0BB\0", b"")
+
+    converted = encode_utils.strings_convert_encoding([u"a", u"bb", u""], "IBM-930", "UTF-8")
+
+    assert converted == [u"A", u"BB", u""]
+    encode_utils.module.run_command.assert_called_once()
+    assert encode_utils.module.run_command.call_args[1]["data"] == b"a\0bb\0"
+
+
+class FakeRecordIO(object):
+    """Keeps the records of data sets in memory, keyed by name."""
+
+    data_sets = {}
+
+    def __init__(self, name, mode="r"):
+        self.name = name[3:-1]
+        self.mode = mode
+        self.position = 0
+        if mode == "w":
+            self.data_sets[self.name] = []
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        return False
+
+    def readrecords(self, count):
+        records = self.data_sets[self.name][self.position:self.position + count]
+        self.position += len(records)
+        return records
+
+    def writerecords(self, records):
+        self.data_sets[self.name].extend(records)
+
+
+class FakeDataSet(object):
+    def __init__(self, record_format, record_length, name=None):
+        self.name = name
+        self.record_format = record_format
+        self.record_length = record_length
+        self.total_space = 56664
+
+
+@pytest.fixture
+def fake_data_sets(monkeypatch):
+    layouts = {
+        "USER.FB80": FakeDataSet("FB", 80),
+        "USER.FB80.COPY": FakeDataSet("FB", 80),
+        "USER.FB40": FakeDataSet("FB", 40),
+        "USER.VB84": FakeDataSet("VB", 84),
+        "USER.PDS": FakeDataSet("FB", 80),
+    }
+    temp_names = iter("USER.TEMP{0}".format(i) for i in range(10))
+    datasets = MagicMock()
+    datasets.list_datasets.side_effect = lambda name: [layouts[name]]
+    datasets.list_members.return_value = ["MEM1", "MEM2"]
+    monkeypatch.setattr(encode, "datasets", datasets)
+    temp_data_set_pool = MagicMock()
+    temp_data_set_pool.acquire.side_effect = lambda **kwargs: next(temp_names)
+    monkeypatch.setattr(encode.data_set, "temp_data_set_pool", temp_data_set_pool)
+    monkeypatch.setattr(encode, "zoau_io", MagicMock(RecordIO=FakeRecordIO))
+    monkeypatch.setattr(encode, "RECORD_BATCH_SIZE", 2)
+    FakeRecordIO.data_sets = {}
+    return FakeRecordIO.data_sets
+
+
+@pytest.mark.parametrize("dest", ["USER.FB80.COPY", "USER.VB84"])
+def test_mvs_convert_records(encode_utils, fake_data_sets, dest):
+    fake_data_sets["USER.FB80"] = [LATIN1_TEXT.ljust(80)] * 5
+
+    assert encode_utils.mvs_convert_encoding(
+        "USER.FB80", dest, "ISO8859-1", "IBM-1047", src_type="PS", dest_type="PS"
+    )
+
+    assert fake_data_sets[dest] == [IBM1047_TEXT + b"\x40" * 72] * 5
+
+
+def test_mvs_convert_records_in_place(encode_utils, fake_data_sets):
+    fake_data_sets["USER.PDS(MEM1)"] = [LATIN1_TEXT] * 3
+    fake_data_sets["USER.PDS(MEM2)"] = [b"abc"]
+
+    assert encode_utils.mvs_convert_encoding(
+        "USER.PDS", "USER.PDS", "ISO8859-1", "IBM-1047", src_type="PO", dest_type="PO"
+    )
+
+    assert fake_data_sets["USER.PDS(MEM1)"] == [IBM1047_TEXT] * 3
+    assert fake_data_sets["USER.PDS(MEM2)"] == [b"\x81\x82\x83"]
+    encode.data_set.temp_data_set_pool.release.assert_called_once_with("USER.TEMP0")
+
+
+def test_mvs_convert_records_not_fitting_dest(encode_utils, fake_data_sets):
+    converter = CodeSetConverter("ISO8859-1", "IBM-1047")
+
+    assert not encode_utils._mvs_convert_records("USER.FB80", "USER.FB40", converter, "PS", "PS")
+    assert not encode_utils._mvs_convert_records("USER.VB84", "USER.FB80", converter, "PS", "PS")
+    assert not encode_utils._mvs_convert_records("USER.FB80", "USER.PDS", converter, "PS", "PO")
+    assert fake_data_sets == {}
+
+
+BENCHMARK_SIZES = {
+    "1MB": 1024 * 1024,
+    "100MB": 100 * 1024 * 1024,
+    "2GB": 2 * 1024 * 1024 * 1024,
+}
+
+
+def _write_sample(path, size, record):
+    # Only whole records are written, a multi-byte character cut at the end
+    # would make the sample invalid.
+    records = size // len(record)
+    block_records = 1024 * 1024 // len(record)
+    with open(path, "wb") as outfile:
+        while records > 0:
+            outfile.write(record * min(records, block_records))
+            records -= block_records
+
+
+@pytest.mark.benchmark
+@pytest.mark.skipif(
+    not os.environ.get("ZOS_ENCODE_BENCHMARK"),
+    reason="Set ZOS_ENCODE_BENCHMARK=1 to compare in-process conversions with iconv."
+)
+@pytest.mark.parametrize("size_name", list(BENCHMARK_SIZES))
+@pytest.mark.parametrize("from_code,to_code,record", [
+    ("ISO8859-1", "IBM-1047", u"       IDENTIFICATION DIVISION.  PROGRAM-ID. HELLO.".ljust(80).encode("latin-1")),
+    ("UTF-8", "IBM-1047", u"       DISPLAY 'línea con acentos ç'.".ljust(80).encode("utf-8")),
+])
+def test_benchmark_against_iconv(tmp_path, request, size_name, from_code, to_code, record):
+    # The records have no line breaks, iconv maps LF to 0x25 where z/OS
+    # maps it to NL, so both outputs have to match byte for byte.
+    src = str(tmp_path / "src")
+    in_process_dest = str(tmp_path / "in_process")
+    iconv_dest = str(tmp_path / "iconv")
+    _write_sample(src, BENCHMARK_SIZES[size_name], record)
+
+    start = time.time()
+    CodeSetConverter(from_code, to_code).convert_file(src, in_process_dest)
+    request.node.user_properties.append(("in_process_seconds", time.time() - start))
+
+    start = time.time()
+    with open(iconv_dest, "wb") as outfile:
+        subprocess.check_call(["iconv", "-f", from_code, "-t", to_code, src], stdout=outfile)
+    request.node.user_properties.append(("iconv_seconds", time.time() - start))
+
+    assert filecmp.cmp(in_process_dest, iconv_dest, shallow=False)
+
+
+@pytest.mark.benchmark
+@pytest.mark.skipif(
+    not os.environ.get("ZOS_ENCODE_BENCHMARK"),
+    reason="Set ZOS_ENCODE_BENCHMARK=1 to compare in-process conversions with iconv."
+)
+def test_benchmark_strings_against_iconv(request, encode_utils):
+    strings = [u"IEE136I LOCAL: TIME={0:05d}".format(i) for i in range(10000)]
+
+    start = time.time()
+    converted = encode_utils.strings_convert_encoding(strings, "ISO8859-1", "IBM-1047")
+    batch = time.time() - start
+
+    start = time.time()
+    per_call = [
+        subprocess.check_output("printf %s '{0}' | iconv -f ISO8859-1 -t IBM-1047".format(src), shell=True)
+        for src in strings
+    ]
+    per_string = time.time() - start
+
+    request.node.user_properties.append(("batch_seconds", batch))
+    request.node.user_properties.append(("printf_iconv_seconds", per_string))
+    assert converted == [to_text(src, errors="replace") for src in per_call]
+    assert batch < per_string
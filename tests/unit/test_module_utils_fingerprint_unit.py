@@ -0,0 +1,76 @@
+# -*- coding: utf-8 -*-
+
+# Copyright (c) IBM Corporation 2026
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#     http://www.apache.org/licenses/LICENSE-2.0
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from __future__ import absolute_import, division, print_function
+
+__metaclass__ = type
+
+import os
+
+from ansible_collections.ibm.ibm_zos_core.plugins.module_utils.encode import get_codec
+from ansible_collections.ibm.ibm_zos_core.plugins.module_utils.fingerprint import (
+    build_manifest,
+    file_fingerprint,
+    record_fingerprint,
+    text_fingerprint,
+)
+
+
+def test_record_fingerprint_matches_fixed_length_records():
+    local_lines = "       IDENTIFICATION DIVISION.\r\n       PROGRAM-ID. HELLO.\r\n\r\n".splitlines()
+    records = [
+        "       IDENTIFICATION DIVISION.".ljust(80).encode("cp037"),
+        "       PROGRAM-ID. HELLO.".ljust(80).encode("cp037"),
+        " ".ljust(80).encode("cp037"),
+    ]
+
+    remote_lines = [record.decode("cp037") for record in records]
+    assert record_fingerprint(local_lines) == record_fingerprint(remote_lines)
+    assert record_fingerprint(local_lines) != record_fingerprint(remote_lines[:1])
+
+
+def test_build_manifest(tmp_path):
+    (tmp_path / "nested").mkdir()
+    (tmp_path / "MEMBER1").write_bytes(b"line 1\r\nline 2\r\n")
+    (tmp_path / "nested" / "MEMBER2").write_bytes(b"\xff\xfe")
+
+    manifest = build_manifest(str(tmp_path), charset="UTF-8")
+
+    assert manifest["MEMBER1"] == text_fingerprint("line 1\r\nline 2\r\n")
+    assert manifest[os.path.join("nested", "MEMBER2")] is None
+
+    manifest = build_manifest(str(tmp_path), charset="UTF-8", records=True)
+
+    assert manifest["MEMBER1"] == record_fingerprint(["line 1", "line 2"])
+    assert manifest[os.path.join("nested", "MEMBER2")] is None
+
+    manifest = build_manifest(str(tmp_path), binary=True)
+    assert manifest[os.path.join("nested", "MEMBER2")][0] == 2
+
+
+def test_text_fingerprint_is_exact_after_conversion(tmp_path):
+    codec = get_codec("IBM-1047")
+    local_file = tmp_path / "local"
+    remote_file = tmp_path / "remote"
+    local_file.write_bytes(b"line 1\r\nline 2 \n")
+    remote_file.write_bytes(codec.encode("line 1\r\nline 2 \n")[0])
+
+    expected = file_fingerprint(str(local_file), "UTF-8")
+    assert file_fingerprint(str(remote_file), "IBM-1047") == expected
+
+    # Edits that records would hide still count for USS files.
+    for content in ("line 1\nline 2 \n", "line 1\r\nline 2\n", "line 1\r\nline 2 \n\n"):
+        remote_file.write_bytes(codec.encode(content)[0])
+        assert file_fingerprint(str(remote_file), "IBM-1047") != expected
+        assert file_fingerprint(str(remote_file), "IBM-1047", records=True) == \
+            file_fingerprint(str(local_file), "UTF-8", records=True)
@@ -0,0 +1,329 @@
+# -*- coding: utf-8 -*-
+
+# Copyright (c) IBM Corporation 2026
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#     http://www.apache.org/licenses/LICENSE-2.0
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from __future__ import absolute_import, division, print_function
+
+__metaclass__ = type
+
+import fnmatch
+import os
+import time
+
+import pytest
+
+from ansible_collections.ibm.ibm_zos_core.plugins.module_utils import job
+from ansible_collections.ibm.ibm_zos_core.plugins.module_utils.job import DDContentSelection
+
+IMPORT_NAME = "ansible_collections.ibm.ibm_zos_core.plugins.module_utils.job"
+
+JOB_LOG = (
+    "1                    J E S 2  J O B  L O G  --  S Y S T E M  S0W1  --  N O D E  N1\n"
+    "0\n"
+    " 10.10.10 JOB00134 ---- FRIDAY,    06 JUN 2024 ----\n"
+    " 10.10.10 JOB00134  $HASP373 HELLO    STARTED - INIT 1    - CLASS R        - SYS S0W1\n"
+)
+SYSTEM_MESSAGES = (
+    " IEF142I HELLO STEP0001 - STEP WAS EXECUTED - COND CODE 0000\n"
+    " IEF373I STEP/STEP0001/START 2024158.1010\n"
+)
+PROGRAM_OUTPUT = "".join("LINE {0:05d}\n".format(number) for number in range(1, 1001))
+
+
+class JobEntry(object):
+    """Used in place of the jobs ZOAU returns, without the optional
+    attributes so the module has to look into the job log for them."""
+
+    def __init__(self, job_id="JOB00134", name="HELLO"):
+        self.job_id = job_id
+        self.name = name
+        self.owner = "USER"
+        self.job_type = "JOB"
+        self.status = "CC"
+        self.return_code = "0000"
+        self.service_class = None
+        self.job_class = "R"
+        self.priority = 1
+        self.asid = 0
+        self.creation_datetime = "2024-06-06T10:10:10"
+        self.queue_position = 0
+        self.program_name = "IEBGENER"
+
+
+@pytest.fixture
+def jobs(mocker):
+    contents = {"JESMSGLG": JOB_LOG, "JESYSMSG": SYSTEM_MESSAGES, "SYSUT2": PROGRAM_OUTPUT}
+    jobs = mocker.patch("{0}.jobs".format(IMPORT_NAME), new=mocker.MagicMock())
+    jobs.fetch_multiple.return_value = [JobEntry()]
+    jobs.list_dds.return_value = [
+        dict(dd_name=name, step_name="JES2" if name.startswith("JES") else "STEP0001",
+             records=content.count("\n"), bytes=len(content), dsid="2")
+        for name, content in contents.items()
+    ]
+    jobs.read_output.side_effect = lambda job_id, step_name, dd_name: contents[dd_name]
+    return jobs
+
+
+def _read_dd_names(jobs):
+    return [call[0][2] for call in jobs.read_output.call_args_list]
+
+
+def test_full_content_is_the_default(jobs):
+    result = job.job_output(job_id="JOB00134")[0]
+
+    assert [dd["content"][0] for dd in result["dds"]] == [
+        JOB_LOG.split("\n")[0], SYSTEM_MESSAGES.split("\n")[0], "LINE 00001"
+    ]
+    assert result["steps"] == [{"step_name": "STEP0001", "step_cc": 0}]
+    assert (result["system"], result["subsystem"]) == ("S0W1", "N1")
+    assert _read_dd_names(jobs) == ["JESMSGLG", "JESYSMSG", "SYSUT2"]
+
+
+def test_metadata_only_reads_no_dd(jobs):
+    result = job.job_output(job_id="JOB00134", dd_content=DDContentSelection("none"))[0]
+
+    assert [(dd["dd_name"], dd["content"]) for dd in result["dds"]] == [
+        ("JESMSGLG", None), ("JESYSMSG", None), ("SYSUT2", None)
+    ]
+    assert result["dds"][2]["record_count"] == 1000
+    assert result["steps"] == []
+    assert result["system"] is None
+    assert _read_dd_names(jobs) == []
+
+
+def test_selected_dd_is_the_only_one_read(jobs):
+    result = job.job_output(
+        job_id="JOB00134", dd_name="JESMSGLG", dd_content=DDContentSelection("match", pattern="HASP373")
+    )[0]
+
+    assert len(result["dds"]) == 1
+    assert result["dds"][0]["content"] == [JOB_LOG.split("\n")[3]]
+    assert result["system"] == "S0W1"
+    assert _read_dd_names(jobs) == ["JESMSGLG"]
+
+    result = job.job_output(job_id="JOB00134", dd_name="SYSUT2")[0]
+
+    assert result["steps"] == []
+    assert _read_dd_names(jobs) == ["JESMSGLG", "SYSUT2"]
+
+
+@pytest.mark.parametrize(
+    "selection, expected",
+    [
+        (DDContentSelection("head", lines=2), ["LINE 00001", "LINE 00002"]),
+        (DDContentSelection("tail", lines=2), ["LINE 00999", "LINE 01000"]),
+        (DDContentSelection("bytes", start=11, end=22), ["LINE 00002", ""]),
+        (DDContentSelection("match", pattern=r"LINE 0099[89]"), ["LINE 00998", "LINE 00999"]),
+        (DDContentSelection("head", lines=0), []),
+    ]
+)
+def test_select_part_of_the_content(selection, expected):
+    assert selection.select(PROGRAM_OUTPUT) == expected
+
+
+def test_select_bytes_counts_encoded_bytes():
+    # "\u20ac" takes 3 bytes in UTF-8, the second offset cuts "\xe9" in half.
+    text = u"\u20ac1\nAB\xe9"
+
+    assert DDContentSelection("bytes", start=3, end=7).select(text) == [u"1", u"AB"]
+    assert DDContentSelection("bytes", start=3).select(text) == [u"1", u"AB\xe9"]
+
+
+@pytest.mark.parametrize(
+    "arguments",
+    [dict(mode="first"), dict(mode="tail"), dict(mode="bytes", start=10, end=5), dict(mode="match")]
+)
+def test_invalid_selection(arguments):
+    with pytest.raises(ValueError):
+        DDContentSelection(**arguments)
+
+
+def test_job_log_is_indexed_in_one_pass():
+    index = job.JobLogIndex()
+    index.scan("JESMSGLG", JOB_LOG)
+    index.scan("JESYSMSG", SYSTEM_MESSAGES + (
+        " IEF450I HELLO STEP0002 - ABEND=S0C4 U0000 REASON=00000004\n"
+        " IEF450I HELLO STEP0003 - ABEND=S000 U0016 REASON=00000000\n"
+    ))
+
+    assert (index.system, index.node) == ("S0W1", "N1")
+    assert index.step_results() == [{"step_name": "STEP0001", "step_cc": 0}]
+    assert index.to_dict()["steps"][0]["line"] == 0
+    assert [(abend["step_name"], abend["abend_code"], abend["line"]) for abend in index.abends] == [
+        ("STEP0002", "S0C4", 2), ("STEP0003", "U0016", 3)
+    ]
+    assert [(message["msg_id"], message["dd_name"], message["line"]) for message in index.messages] == [
+        ("$HASP373", "JESMSGLG", 3), ("IEF142I", "JESYSMSG", 0), ("IEF373I", "JESYSMSG", 1),
+        ("IEF450I", "JESYSMSG", 2), ("IEF450I", "JESYSMSG", 3),
+    ]
+
+
+def test_job_log_messages_are_capped():
+    index = job.JobLogIndex(max_messages=2)
+    index.scan("JESYSMSG", SYSTEM_MESSAGES * 2)
+
+    assert [message["line"] for message in index.messages] == [0, 1]
+    assert index.to_dict()["messages_truncated"] is True
+    assert index.step_results() == [{"step_name": "STEP0001", "step_cc": 0}] * 2
+
+
+def test_steps_come_from_the_index_once(jobs):
+    contents = {"JESMSGLG": JOB_LOG, "JESYSMSG": SYSTEM_MESSAGES, "SYSUT2": SYSTEM_MESSAGES}
+    jobs.read_output.side_effect = lambda job_id, step_name, dd_name: contents[dd_name]
+
+    result = job.job_output(job_id="JOB00134")[0]
+
+    assert result["steps"] == [{"step_name": "STEP0001", "step_cc": 0}]
+    assert [message["msg_id"] for message in result["log_index"]["messages"]] == ["$HASP373", "IEF142I", "IEF373I"]
+
+
+def test_jobs_are_collected_concurrently_in_order(jobs):
+    jobs.fetch_multiple.return_value = [JobEntry(job_id="JOB{0:05d}".format(number)) for number in range(1, 9)]
+    listed = []
+    jobs.list_dds.side_effect = lambda job_id, sysin=False: listed.append(job_id) or [
+        dict(dd_name="JESMSGLG", step_name="JES2", records=4, bytes=len(JOB_LOG), dsid="2")
+    ]
+
+    results = job.job_output(owner="USER", max_concurrency=4)
+
+    assert [result["job_id"] for result in results] == ["JOB{0:05d}".format(number) for number in range(1, 9)]
+    assert sorted(listed) == [result["job_id"] for result in results]
+    assert all(result["system"] == "S0W1" for result in results)
+
+
+def test_dd_read_errors_are_raised(jobs):
+    jobs.read_output.side_effect = RuntimeError("JES2 is not available")
+
+    with pytest.raises(RuntimeError):
+        job.job_output(job_id="JOB00134", max_concurrency=2)
+
+
+@pytest.fixture
+def clock(mocker):
+    now = [0.0]
+
+    def sleep(seconds):
+        now[0] += seconds
+
+    mocker.patch("{0}.timer".format(IMPORT_NAME), side_effect=lambda: now[0])
+    mocker.patch("{0}.sleep".format(IMPORT_NAME), side_effect=sleep)
+    return now
+
+
+def test_polls_back_off_until_the_timeout(clock):
+    poller = job.CompletionPoller(10, start_time=0.0)
+    intervals = []
+    while poller.wait():
+        intervals.append(round(clock[0] - sum(intervals), 3))
+
+    assert intervals == [0.2, 0.4, 0.8, 1.6, 3.2, 3.8]
+    assert poller.stats() == {"polls": 6, "wait_time": 10.0}
+    assert poller.duration == 10
+
+    poller.reset()
+    assert poller.interval == job.CompletionPoller.INITIAL_INTERVAL
+    assert not poller.wait()
+
+
+def test_wait_for_job_uses_status_only_probe(jobs, clock):
+    listings = [[], [], [JobEntry()]]
+    jobs.fetch_multiple.side_effect = lambda **kwargs: listings.pop(0) if listings else [JobEntry()]
+    poller = job.CompletionPoller(30, start_time=0.0)
+
+    result = job.job_output(job_id="JOB00134", timeout=30, start_time=0.0, poller=poller)[0]
+
+    assert result["job_id"] == "JOB00134"
+    assert [call[1].get("include_extended", False) for call in jobs.fetch_multiple.call_args_list] == [
+        True, False, False, True
+    ]
+    assert poller.stats() == {"polls": 2, "wait_time": 0.6}
+
+
+def test_job_without_timeout_gets_one_more_probe(jobs, clock):
+    listings = [[], [JobEntry()]]
+    jobs.fetch_multiple.side_effect = lambda **kwargs: listings.pop(0) if listings else [JobEntry()]
+
+    result = job.job_output(job_id="JOB00134", timeout=0, start_time=0.0)[0]
+
+    assert result["job_id"] == "JOB00134"
+    assert jobs.fetch_multiple.call_count == 3
+    assert clock[0] == 1
+
+
+def test_every_job_waits_with_its_own_poller(jobs, mocker):
+    jobs.fetch_multiple.return_value = [JobEntry(job_id="JOB{0:05d}".format(number)) for number in range(1, 5)]
+    build_job = mocker.patch("{0}._build_job".format(IMPORT_NAME), side_effect=lambda entry, **kwargs: kwargs)
+    poller = job.CompletionPoller(30)
+
+    job.job_output(owner="USER", timeout=30, poller=poller, max_concurrency=4)
+    assert all(call[1]["poller"] is None for call in build_job.call_args_list)
+
+    jobs.fetch_multiple.return_value = [JobEntry()]
+    job.job_output(job_id="JOB00134", timeout=30, poller=poller)
+    assert build_job.call_args[1]["poller"] is poller
+
+
+@pytest.mark.parametrize(
+    "pattern, expected",
+    [("PAYROLL*", "PAYROLL*"), ("H*O", "H*"), ("HELLO", "HELLO"), ("*", None), ("?ELLO", None), ("", None)]
+)
+def test_pushdown_pattern(pattern, expected):
+    assert job._pushdown_pattern(pattern) == expected
+
+
+def test_job_name_prefix_is_pushed_down(jobs):
+    jobs.fetch_multiple.return_value = [JobEntry(name="HELLO"), JobEntry(job_id="JOB00135", name="HALO")]
+
+    results = job.job_status(job_name="H*LO")
+
+    assert [result["job_name"] for result in results] == ["HELLO", "HALO"]
+    jobs.fetch_multiple.assert_called_once_with(job_id=None, job_owner="*", job_name="H*", include_extended=True)
+
+    job.job_status(job_id="JOB00134", include_extended=False)
+    assert jobs.fetch_multiple.call_args == ((), dict(job_id="JOB00134", job_owner="*", include_extended=False))
+
+
+@pytest.mark.benchmark
+@pytest.mark.skipif(
+    not os.environ.get("ZOS_JOB_BENCHMARK"),
+    reason="Set ZOS_JOB_BENCHMARK=1 to time querying a 50000 job spool."
+)
+def test_benchmark_job_name_pushdown(jobs, mocker, request):
+    spool = [
+        JobEntry(job_id="J{0:07d}".format(number), name="PAYROLL{0}".format(number % 10) if number % 500 == 0 else "BATCH")
+        for number in range(50000)
+    ]
+    # JES filters on its side, so the listings are built before the timings
+    # and only the work left to the module is measured.
+    listings = {None: spool, "PAYROLL*": [entry for entry in spool if fnmatch.fnmatch(entry.name, "PAYROLL*")]}
+    listed = []
+
+    def fetch_multiple(job_id=None, job_owner=None, job_name=None, include_extended=False):
+        listed.append(len(listings[job_name]))
+        return listings[job_name]
+
+    jobs.fetch_multiple.side_effect = fetch_multiple
+
+    start = time.time()
+    pushed_down = job.job_status(owner="USER", job_name="PAYROLL*", include_extended=False)
+    with_pushdown = time.time() - start
+
+    mocker.patch("{0}._pushdown_pattern".format(IMPORT_NAME), return_value=None)
+    start = time.time()
+    filtered = job.job_status(owner="USER", job_name="PAYROLL*", include_extended=False)
+    without_pushdown = time.time() - start
+
+    request.node.user_properties.append(("pushdown_seconds", with_pushdown))
+    request.node.user_properties.append(("python_filter_seconds", without_pushdown))
+    assert len(pushed_down) == len(filtered) == 100
+    assert listed == [100, 50000]
+    assert with_pushdown < without_pushdown
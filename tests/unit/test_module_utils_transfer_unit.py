@@ -0,0 +1,230 @@
+# -*- coding: utf-8 -*-
+
+# Copyright (c) IBM Corporation 2026
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#     http://www.apache.org/licenses/LICENSE-2.0
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from __future__ import absolute_import, division, print_function
+
+__metaclass__ = type
+
+import os
+import shutil
+
+import pytest
+
+from ansible_collections.ibm.ibm_zos_core.plugins.module_utils.fingerprint import (
+    binary_fingerprint,
+)
+from ansible_collections.ibm.ibm_zos_core.plugins.module_utils.transfer import (
+    ARCHIVE_SUFFIX,
+    ChunkJournal,
+    SFTPSession,
+    create_transfer_archive,
+)
+from ansible_collections.ibm.ibm_zos_core.plugins.modules.zos_copy import (
+    extract_transfer_archive
+)
+
+
+class DummyConnection(object):
+    """Used in place of Ansible's ssh connection so we can record
+    the commands and transfers issued by a session."""
+
+    def __init__(self, options=None, rc=0, stdout=b"/u/user/tmp\n"):
+        self.options = dict(
+            ssh_transfer_method="smart",
+            ssh_args="",
+            ssh_common_args="",
+            sftp_extra_args="",
+            remote_user="user",
+        )
+        self.options.update(options or {})
+        self.rc = rc
+        self.stdout = stdout
+        self.commands = []
+        self.transfers = []
+
+    def get_option(self, option):
+        return self.options[option]
+
+    def set_option(self, option, value):
+        self.options[option] = value
+
+    def exec_command(self, cmd):
+        self.commands.append(cmd)
+        return (self.rc, self.stdout, b"")
+
+    def _file_transport_command(self, in_path, out_path, sftp_action):
+        self.transfers.append((sftp_action, in_path, out_path))
+        return (0, b"", b"")
+
+
+def test_session_overrides_and_restores_options():
+    connection = DummyConnection()
+
+    with SFTPSession(connection, transfer_user="become_user"):
+        assert connection.options["ssh_transfer_method"] == "sftp"
+        assert "ControlPersist" in connection.options["ssh_common_args"]
+        assert connection.options["remote_user"] == "become_user"
+
+    assert connection.options["ssh_transfer_method"] == "smart"
+    assert connection.options["ssh_common_args"] == ""
+    assert connection.options["remote_user"] == "user"
+
+
+@pytest.mark.parametrize("option", ["ssh_args", "ssh_extra_args"])
+def test_session_keeps_user_multiplexing_options(option):
+    connection = DummyConnection(options={option: "-o ControlMaster=no"})
+
+    with SFTPSession(connection):
+        assert connection.options["ssh_common_args"] == ""
+
+
+def test_session_prepares_remote_dir_in_one_command():
+    connection = DummyConnection()
+
+    with SFTPSession(connection) as session:
+        rc, path, stderr = session.prepare_remote_dir("~/tmp", subdirs=["src"])
+
+    assert rc == 0
+    assert path == "/u/user/tmp"
+    assert connection.commands == ["mkdir -p ~/tmp ~/tmp/src && cd ~/tmp && pwd"]
+
+
+def test_session_records_transfers():
+    connection = DummyConnection()
+
+    with SFTPSession(connection) as session:
+        session.transfer("put", "/does/not/exist", "/u/user/tmp", recursive=True)
+        session.transfer("get", "/u/user/tmp/file", "/does/not/exist")
+
+    assert connection.transfers == [
+        ("put -r", "/does/not/exist", "/u/user/tmp"),
+        ("get", "/u/user/tmp/file", "/does/not/exist"),
+    ]
+    assert [transfer["rc"] for transfer in session.transfers] == [0, 0]
+    assert all(transfer["elapsed"] >= 0 for transfer in session.transfers)
+
+
+def test_transfer_archive_round_trip(tmp_path):
+    src = tmp_path / "local" / "copybooks"
+    src.mkdir(parents=True)
+    (src / "MEMBER1").write_text("record 1\n")
+    (src / "nested").mkdir()
+    (src / "nested" / "MEMBER2").write_text("record 2\n")
+
+    remote_tmp = tmp_path / "remote"
+    remote_tmp.mkdir()
+    module_src = str(remote_tmp / "copybooks")
+
+    local_archive = create_transfer_archive(str(src), "copybooks")
+    try:
+        shutil.move(local_archive, module_src + ARCHIVE_SUFFIX)
+    finally:
+        if os.path.exists(local_archive):
+            os.remove(local_archive)
+
+    assert extract_transfer_archive(module_src)
+    assert (remote_tmp / "copybooks" / "MEMBER1").read_text() == "record 1\n"
+    assert (remote_tmp / "copybooks" / "nested" / "MEMBER2").read_text() == "record 2\n"
+    assert not os.path.exists(module_src + ARCHIVE_SUFFIX)
+    assert not extract_transfer_archive(module_src)
+
+
+def _write_chunk(path, data, index, last=False):
+    path.write_bytes(data)
+    return dict(
+        index=index,
+        size=len(data),
+        checksum=binary_fingerprint(data)[1],
+        last=last,
+    )
+
+
+def test_chunk_journal_resumes_transfer(tmp_path):
+    dest = str(tmp_path / "USER.VSAM")
+    source = dict(src="USER.VSAM", chunk_records=10)
+    chunk_path = tmp_path / "chunk"
+
+    journal = ChunkJournal(dest, source)
+    assert journal.load() == 0
+    journal.add_chunk(str(chunk_path), _write_chunk(chunk_path, b"first\n", 0))
+
+    # Data appended after the last recorded chunk is dropped on resume.
+    with open(journal.part_path, "ab") as outfile:
+        outfile.write(b"partial")
+
+    journal = ChunkJournal(dest, source)
+    assert journal.load() == 1
+    journal.add_chunk(str(chunk_path), _write_chunk(chunk_path, b"second\n", 1, last=True))
+    assert journal.finished
+    journal.complete()
+
+    with open(dest, "rb") as infile:
+        assert infile.read() == b"first\nsecond\n"
+    assert not os.path.exists(journal.part_path)
+    assert not os.path.exists(journal.journal_path)
+
+
+def test_chunk_journal_discards_other_sources(tmp_path):
+    dest = str(tmp_path / "USER.VSAM")
+    chunk_path = tmp_path / "chunk"
+
+    journal = ChunkJournal(dest, dict(src="USER.VSAM", chunk_records=10))
+    journal.load()
+    journal.add_chunk(str(chunk_path), _write_chunk(chunk_path, b"first\n", 0))
+
+    journal = ChunkJournal(dest, dict(src="USER.VSAM", chunk_records=20))
+    assert journal.load() == 0
+    assert os.path.getsize(journal.part_path) == 0
+
+
+def test_chunk_journal_rejects_bad_chunks(tmp_path):
+    journal = ChunkJournal(str(tmp_path / "USER.SEQ"), dict(src="USER.SEQ"))
+    journal.load()
+    chunk_path = tmp_path / "chunk"
+
+    chunk = _write_chunk(chunk_path, b"first\n", 0)
+    chunk_path.write_bytes(b"fir5t\n")
+    with pytest.raises(ValueError):
+        journal.add_chunk(str(chunk_path), chunk)
+
+    with pytest.raises(ValueError):
+        journal.add_chunk(str(chunk_path), _write_chunk(chunk_path, b"second\n", 1))
+
+    assert journal.chunks == []
+    assert os.path.getsize(journal.part_path) == 0
+
+
+def test_chunk_journal_truncates_chunks_of_a_changed_source(tmp_path):
+    dest = str(tmp_path / "USER.SEQ")
+    source = dict(src="USER.SEQ", chunk_size=1)
+    chunk_path = tmp_path / "chunk"
+
+    journal = ChunkJournal(dest, source)
+    journal.load()
+    first = _write_chunk(chunk_path, b"first\n", 0)
+    journal.add_chunk(str(chunk_path), first)
+    journal.add_chunk(str(chunk_path), _write_chunk(chunk_path, b"second\n", 1, last=True))
+
+    # Reading the journal to resume leaves it untouched.
+    journal = ChunkJournal(dest, source)
+    recorded = journal.read()
+    assert len(recorded) == 2
+    assert recorded[0]["checksum"] == first["checksum"]
+    assert journal.load() == 2
+    assert journal.finished
+
+    # The source changed after its first chunk, the second one is fetched again.
+    journal.truncate(1)
+    assert not journal.finished
+    assert os.path.getsize(journal.part_path) == len(b"first\n")
+    assert ChunkJournal(dest, source).load() == 1
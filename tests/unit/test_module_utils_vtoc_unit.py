@@ -0,0 +1,220 @@
+# -*- coding: utf-8 -*-
+
+# Copyright (c) IBM Corporation 2026
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#     http://www.apache.org/licenses/LICENSE-2.0
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from __future__ import absolute_import, division, print_function
+
+__metaclass__ = type
+
+import os
+import time
+
+import pytest
+
+from ansible_collections.ibm.ibm_zos_core.plugins.module_utils import vtoc
+
+IMPORT_NAME = "ansible_collections.ibm.ibm_zos_core.plugins.module_utils.vtoc"
+
+HEADER_DATA_SET = (
+    "0---------------DATA SET NAME----------------   SER NO  SEQNO  DATE.CRE  DATE.EXP  DATE.REF  "
+    "EXT  DSORG  RECFM  OPTCD  BLKSIZE"
+)
+HEADER_ALLOCATION = (
+    "0SMS.IND  LRECL  KEYLEN  INITIAL ALLOC  2ND ALLOC  EXTEND  LAST BLK(T-R-L)  DIR.REM  "
+    "F2 OR F3(C-H-R)  DSCB(C-H-R)"
+)
+HEADER_EATTR = "0 EATTR"
+HEADER_EXTENTS = "0EXTENTS  NO  LOW(C-H)     HIGH(C-H)"
+
+
+class DummyModule(object):
+    """Used in place of Ansible's module
+    so we can easily mock the desired behavior."""
+
+    def __init__(self, rc=0, stdout="", stderr=""):
+        self.rc = rc
+        self.stdout = stdout
+        self.stderr = stderr
+        self.calls = 0
+
+    def run_command(self, *args, **kwargs):
+        self.calls += 1
+        return (self.rc, self.stdout, self.stderr)
+
+
+def _table_row(header, values):
+    """Place every value below the column header it belongs to."""
+    row = [" "] * len(header)
+    for column, value in values:
+        start = max(header.index(column), 1)
+        row[start:start + len(value)] = value
+    return "".join(row).rstrip()
+
+
+def _vtoc_section(name, volume="VOL001", dsorg="PS", extents=1):
+    lines = [
+        HEADER_DATA_SET,
+        _table_row(HEADER_DATA_SET, [
+            ("DATA SET NAME", name), ("SER NO", volume), ("SEQNO", "1"), ("DATE.CRE", "2024.158"),
+            ("DATE.EXP", "00.000"), ("DATE.REF", "2024.160"), ("EXT", str(extents)), ("DSORG", dsorg),
+            ("RECFM", "FB"), ("OPTCD", "00"), ("BLKSIZE", "27920"),
+        ]),
+        HEADER_ALLOCATION,
+        _table_row(HEADER_ALLOCATION, [
+            ("SMS.IND", "S"), ("LRECL", "80"), ("INITIAL ALLOC", "TRKS"), ("2ND ALLOC", "1"),
+            ("EXTEND", "10KB"), ("LAST BLK(T-R-L)", "0 1 55"), ("DSCB(C-H-R)", "0 0 5"),
+        ]),
+        HEADER_EATTR,
+        " NS",
+    ]
+    if extents:
+        lines.append(HEADER_EXTENTS)
+        for number in range(extents):
+            lines.append("{0}{1:>3} {2:>5}{3:>5}   {4:>5}{5:>4}".format(
+                " " * 10, number, 40 + number, 0, 40 + number, 14
+            ))
+    else:
+        lines.append(" THE ABOVE DATASET HAS NO EXTENTS")
+    return "\n".join(lines) + "\n"
+
+
+def _vtoc_listing(sections, volume="VOL001"):
+    return (
+        "1SYSTEMS SUPPORT UTILITIES---IEHLIST                                  PAGE 1\n"
+        "0                    CONTENTS OF VTOC ON VOL {0}  <THIS VOLUME IS NOT SMS MANAGED>\n".format(volume)
+        + "".join(sections)
+        + "0THERE ARE    100 EMPTY CYLINDERS PLUS     10 EMPTY TRACKS ON THIS VOLUME\n"
+    )
+
+
+@pytest.fixture
+def volume_listing(mocker):
+    listing = _vtoc_listing([
+        _vtoc_section("USER.PRIVATE.SEQ"),
+        _vtoc_section("USER.PRIVATE.KSDS.DATA", dsorg="VS", extents=2),
+        _vtoc_section("USER.PRIVATE.EMPTY", extents=0),
+    ])
+    module = DummyModule(stdout=listing)
+    mocker.patch("{0}.AnsibleModuleHelper".format(IMPORT_NAME), return_value=module)
+    vtoc.invalidate()
+    with vtoc.cache_scope():
+        yield module
+
+
+def test_parse_data_set_info():
+    data_set = vtoc._parse_data_set_info(
+        _vtoc_section("USER.PRIVATE.SEQ", extents=2)
+    )
+
+    assert data_set["data_set_name"] == "USER.PRIVATE.SEQ"
+    assert data_set["volume"] == "VOL001"
+    assert data_set["data_set_organization"] == "PS"
+    assert data_set["record_length"] == "80"
+    assert data_set["original_space_secondary"] == "10KB"
+    assert data_set["last_block_pointer"] == {"track": "0", "block": "1", "bytes_remaining": "55"}
+    assert data_set["dscb_format_1_or_8"] == {"cylinder": "0", "track": "0", "record": "5"}
+    assert data_set["extents"] == [
+        {"number": "0", "low": {"cylinder": "40", "track": "0"}, "high": {"cylinder": "40", "track": "14"}},
+        {"number": "1", "low": {"cylinder": "41", "track": "0"}, "high": {"cylinder": "41", "track": "14"}},
+    ]
+
+
+def test_volume_index_runs_iehlist_once(volume_listing):
+    assert vtoc.get_data_set_entry("user.private.seq", "VOL001")["data_set_organization"] == "PS"
+    assert vtoc.get_data_set_entry("USER.PRIVATE.KSDS.DATA", "vol001")["data_set_organization"] == "VS"
+    assert vtoc.get_data_set_entry("USER.PRIVATE.MISSING", "VOL001") is None
+
+    index = vtoc.get_volume_index("VOL001")
+    assert "USER.PRIVATE.EMPTY" in index
+    assert index.names == ["USER.PRIVATE.SEQ", "USER.PRIVATE.KSDS.DATA", "USER.PRIVATE.EMPTY"]
+    assert "extents" not in index.get("USER.PRIVATE.EMPTY")
+    assert volume_listing.calls == 1
+
+    vtoc.invalidate("vol001")
+    assert vtoc.get_data_set_entry("USER.PRIVATE.SEQ", "VOL001") is not None
+    assert volume_listing.calls == 2
+
+
+def test_volume_entry_parses_every_data_set(volume_listing):
+    data_sets = vtoc.get_volume_entry("VOL001")
+
+    assert [data_set["data_set_name"] for data_set in data_sets] == vtoc.get_volume_index("VOL001").names
+    assert len(data_sets[1]["extents"]) == 2
+    assert volume_listing.calls == 1
+
+
+def test_volume_index_is_only_kept_inside_a_scope(mocker):
+    module = DummyModule(stdout=_vtoc_listing([_vtoc_section("USER.PRIVATE.SEQ")]))
+    mocker.patch("{0}.AnsibleModuleHelper".format(IMPORT_NAME), return_value=module)
+    vtoc.invalidate()
+
+    assert vtoc.get_data_set_entry("USER.PRIVATE.SEQ", "VOL001") is not None
+    assert vtoc.get_data_set_entry("USER.PRIVATE.SEQ", "VOL001") is not None
+    assert module.calls == 2
+
+    with vtoc.cache_scope():
+        vtoc.get_data_set_entry("USER.PRIVATE.SEQ", "VOL001")
+        vtoc.get_data_set_entry("USER.PRIVATE.SEQ", "VOL001")
+    assert module.calls == 3
+    assert vtoc.get_volume_index("VOL001") is not None
+    assert module.calls == 4
+
+
+def test_failed_listing_is_not_indexed(mocker):
+    module = DummyModule(rc=12)
+    mocker.patch("{0}.AnsibleModuleHelper".format(IMPORT_NAME), return_value=module)
+    vtoc.invalidate()
+
+    assert vtoc.get_volume_index("VOL001") is None
+    assert vtoc.get_data_set_entry("USER.PRIVATE.SEQ", "VOL001") is None
+    assert module.calls == 2
+
+
+class _UncachedLayouts(dict):
+    """Column layouts found again for every row, like before they were cached."""
+
+    def __setitem__(self, key, value):
+        pass
+
+
+@pytest.mark.benchmark
+@pytest.mark.skipif(
+    not os.environ.get("ZOS_VTOC_BENCHMARK"),
+    reason="Set ZOS_VTOC_BENCHMARK=1 to time parsing a 10000 data set VTOC listing."
+)
+def test_benchmark_parse_volume_listing(mocker, request):
+    listing = _vtoc_listing([
+        _vtoc_section("USER.BENCH.DS{0:05d}".format(number), extents=1 + number % 3) for number in range(10000)
+    ])
+
+    start = time.time()
+    data_sets = vtoc._process_output(listing)
+    parse_all = time.time() - start
+
+    start = time.time()
+    index = vtoc.VolumeTableOfContents(listing)
+    for number in range(0, 10000, 100):
+        index.get("USER.BENCH.DS{0:05d}".format(number))
+    index_lookups = time.time() - start
+
+    mocker.patch.object(vtoc, "_column_layouts", _UncachedLayouts())
+    start = time.time()
+    uncached = vtoc._process_output(listing)
+    parse_all_uncached = time.time() - start
+
+    request.node.user_properties.append(("parse_all_seconds", parse_all))
+    request.node.user_properties.append(("parse_all_uncached_layouts_seconds", parse_all_uncached))
+    request.node.user_properties.append(("index_and_100_lookups_seconds", index_lookups))
+    assert len(data_sets) == len(index) == 10000
+    assert uncached == data_sets
+    assert parse_all < parse_all_uncached
+    assert index_lookups < parse_all
@@ -0,0 +1,100 @@
+# -*- coding: utf-8 -*-
+
+# Copyright (c) IBM Corporation 2026
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#     http://www.apache.org/licenses/LICENSE-2.0
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from __future__ import absolute_import, division, print_function
+
+__metaclass__ = type
+
+import os
+import shutil
+
+import pytest
+from mock import MagicMock
+
+from ansible_collections.ibm.ibm_zos_core.plugins.module_utils import encode
+from ansible_collections.ibm.ibm_zos_core.plugins.modules.zos_copy import (
+    CopyHandler,
+    CopyOperationError,
+)
+
+
+@pytest.fixture
+def copy_handler(tmp_path, monkeypatch):
+    monkeypatch.setenv("TMPDIR", str(tmp_path))
+    module = MagicMock()
+    module.run_command.return_value = (0, "", "")
+    return CopyHandler(module)
+
+
+def test_lf_endings_single_pass(tmp_path, copy_handler):
+    src = tmp_path / "src"
+    # IBM-1047 "AB\r\nCD\r\n", the newline is NL (0x15).
+    src.write_bytes(b"\xc1\xc2\x0d\x15\xc3\xc4\x0d\x15")
+
+    converted = copy_handler.create_temp_with_lf_endings(str(src), "IBM-1047")
+
+    assert converted != str(src)
+    with open(converted, "rb") as converted_file:
+        assert converted_file.read() == b"\xc1\xc2\x15\xc3\xc4\x15"
+    assert sorted(os.listdir(str(tmp_path))) == sorted(["src", os.path.basename(converted)])
+    assert copy_handler.module.run_command.call_args[0] == ("chtag -tc IBM-1047 {0}".format(converted),)
+
+
+def test_lf_endings_without_carriage_returns(tmp_path, copy_handler):
+    src = tmp_path / "src"
+    src.write_bytes(b"\xc1\xc2\x15\xc3\xc4\x15")
+
+    assert copy_handler.create_temp_with_lf_endings(str(src), "IBM-1047") == str(src)
+    assert os.listdir(str(tmp_path)) == ["src"]
+    copy_handler.module.run_command.assert_not_called()
+
+
+@pytest.mark.skipif(shutil.which("iconv") is None, reason="iconv is not available")
+def test_lf_endings_code_set_without_codec(tmp_path, copy_handler):
+    src = tmp_path / "src"
+    # In UTF-16 a CR is two bytes, so it must be decoded before removing it.
+    src.write_bytes(u"a\r\nb\r\nഊ".encode("utf-16-le"))
+
+    converted = copy_handler.create_temp_with_lf_endings(str(src), "UTF-16LE")
+
+    with open(converted, "rb") as converted_file:
+        assert converted_file.read() == u"a\nb\nഊ".encode("utf-16-le")
+
+
+@pytest.mark.skipif(shutil.which("iconv") is None, reason="iconv is not available")
+def test_lf_endings_invalid_code_set(tmp_path, copy_handler):
+    src = tmp_path / "src"
+    src.write_bytes(b"a\r\n")
+
+    with pytest.raises(CopyOperationError):
+        copy_handler.create_temp_with_lf_endings(str(src), "NOT-A-CODE-SET")
+    assert os.listdir(str(tmp_path)) == ["src"]
+
+
+def test_convert_encoding_dir_reports_every_failure(tmp_path, monkeypatch, copy_handler):
+    monkeypatch.setattr(encode, "AnsibleModuleHelper", MagicMock())
+    src = tmp_path / "src"
+    src.mkdir()
+    for i in range(5):
+        (src / "file{0}".format(i)).write_bytes(b"abc\n")
+    (src / "bad1").write_bytes(b"\xff")
+    (src / "bad2").write_bytes(b"\xfe")
+
+    with pytest.raises(CopyOperationError) as err:
+        copy_handler._convert_encoding_dir(str(src), "UTF-8", "IBM-1047")
+
+    assert "2 file(s)" in err.value.json_args["msg"]
+    assert [line.split(":")[0] for line in err.value.json_args["stderr_lines"]] == [
+        str(src / "bad1"), str(src / "bad2")
+    ]
+    assert (src / "file4").read_bytes() == b"\x81\x82\x83\x15"
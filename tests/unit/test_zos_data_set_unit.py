@@ -0,0 +1,94 @@
+# -*- coding: utf-8 -*-
+
+# Copyright (c) IBM Corporation 2026
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#     http://www.apache.org/licenses/LICENSE-2.0
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from __future__ import absolute_import, division, print_function
+
+__metaclass__ = type
+
+IMPORT_NAME = "ansible_collections.ibm.ibm_zos_core.plugins.modules.zos_data_set"
+
+
+class DummyCatalogEntry(object):
+    def __init__(self, cataloged, entry_type=None):
+        self.rc = 0 if cataloged else 4
+        self.cataloged = cataloged
+        self.entry_type = entry_type
+
+
+def batch_entry(name, state, type="seq"):
+    return dict(name=name, state=state, type=type, tmp_hlq=None, volumes=None, scratch=None)
+
+
+def test_batch_groups_bulk_operations(zos_import_mocker):
+    mocker, importer = zos_import_mocker
+    zos_data_set = importer(IMPORT_NAME)
+    catalog_entries = {
+        "USER.OLD1": DummyCatalogEntry(True, "NONVSAM"),
+        "USER.OLD2": DummyCatalogEntry(True, "NONVSAM"),
+        "USER.NEW1": DummyCatalogEntry(False),
+        "USER.NEW2": DummyCatalogEntry(False),
+    }
+    mocker.patch("{0}.DataSet.get_catalog_entries".format(IMPORT_NAME), return_value=catalog_entries)
+    bulk_delete = mocker.patch(
+        "{0}.DataSet.bulk_delete".format(IMPORT_NAME), return_value=[(0, ""), (8, "NOT DELETED")]
+    )
+    bulk_create = mocker.patch(
+        "{0}.DataSet.bulk_create".format(IMPORT_NAME), return_value=[(0, ""), (0, "")]
+    )
+    single = mocker.patch("{0}.perform_data_set_operations".format(IMPORT_NAME), return_value=True)
+
+    changed, data_set_list = zos_data_set.perform_batch_data_set_operations([
+        batch_entry("USER.OLD1", "absent"),
+        batch_entry("USER.NEW1", "present"),
+        batch_entry("USER.OLD2", "absent"),
+        batch_entry("USER.NEW2", "present"),
+        batch_entry("USER.NEW2(MEMBER)", "present", type="member"),
+    ])
+
+    assert changed
+    assert [data_set.name for data_set in data_set_list] == [
+        "USER.OLD1", "USER.NEW1", "USER.OLD2", "USER.NEW2", "USER.NEW2(MEMBER)"
+    ]
+    assert bulk_delete.call_args[0][0] == ["USER.OLD1", "USER.OLD2"]
+    assert [args["name"] for args in bulk_create.call_args[0][0]] == ["USER.NEW1", "USER.NEW2"]
+    # The failed deletion is retried on its own, then the member is created.
+    assert [call[1]["data_set"].name for call in single.call_args_list] == ["USER.OLD2", "USER.NEW2(MEMBER)"]
+
+
+def test_batch_keeps_vsam_on_single_path(zos_import_mocker):
+    mocker, importer = zos_import_mocker
+    zos_data_set = importer(IMPORT_NAME)
+    catalog_entries = {
+        "USER.KSDS": DummyCatalogEntry(True, "CLUSTER"),
+        "USER.ZFS": DummyCatalogEntry(True, "CLUSTER"),
+        "USER.NEWKSDS": DummyCatalogEntry(False),
+        "USER.NEWZFS": DummyCatalogEntry(False),
+    }
+    mocker.patch("{0}.DataSet.get_catalog_entries".format(IMPORT_NAME), return_value=catalog_entries)
+    bulk_delete = mocker.patch("{0}.DataSet.bulk_delete".format(IMPORT_NAME))
+    bulk_create = mocker.patch("{0}.DataSet.bulk_create".format(IMPORT_NAME))
+    single = mocker.patch("{0}.perform_data_set_operations".format(IMPORT_NAME), return_value=True)
+
+    changed, data_set_list = zos_data_set.perform_batch_data_set_operations([
+        batch_entry("USER.KSDS", "absent", type="ksds"),
+        batch_entry("USER.ZFS", "absent", type="zfs"),
+        batch_entry("USER.NEWKSDS", "present", type="ksds"),
+        batch_entry("USER.NEWZFS", "present", type="zfs"),
+    ])
+
+    assert changed
+    assert not bulk_delete.called
+    assert not bulk_create.called
+    assert [call[1]["data_set"].name for call in single.call_args_list] == [
+        "USER.KSDS", "USER.ZFS", "USER.NEWKSDS", "USER.NEWZFS"
+    ]
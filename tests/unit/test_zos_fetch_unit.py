@@ -0,0 +1,144 @@
+# -*- coding: utf-8 -*-
+
+# Copyright (c) IBM Corporation 2026
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#     http://www.apache.org/licenses/LICENSE-2.0
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from __future__ import absolute_import, division, print_function
+
+__metaclass__ = type
+
+import json
+import os
+import threading
+from hashlib import sha256
+
+import pytest
+
+from ansible_collections.ibm.ibm_zos_core.plugins.modules import zos_fetch
+from ansible_collections.ibm.ibm_zos_core.plugins.modules.zos_fetch import (
+    ChunkStager,
+    ChunkStagingError,
+    SourceChangedError,
+)
+
+MEGABYTE = 1024 * 1024
+
+
+def _blocks(content, size=64 * 1024):
+    for start in range(0, len(content), size):
+        yield content[start:start + size]
+
+
+def _manifests(staging_dir):
+    manifests = []
+    index = 0
+    while os.path.exists(os.path.join(staging_dir, "chunk.{0}.json".format(index))):
+        with open(os.path.join(staging_dir, "chunk.{0}.json".format(index))) as infile:
+            manifests.append(json.load(infile))
+        index += 1
+    return manifests
+
+
+@pytest.fixture(autouse=True)
+def fast_polling(mocker):
+    mocker.patch.object(zos_fetch, "CHUNK_POLL_INTERVAL", 0.01)
+
+
+@pytest.mark.parametrize("size,count", [(0, 1), (MEGABYTE, 1), (2 * MEGABYTE + 5, 3)])
+def test_chunk_stager_cuts_the_source(tmp_path, size, count):
+    content = os.urandom(size)
+
+    ChunkStager(str(tmp_path), 1, window=count).stage(_blocks(content))
+
+    manifests = _manifests(str(tmp_path))
+    assert [manifest["index"] for manifest in manifests] == list(range(count))
+    assert [manifest["last"] for manifest in manifests] == [False] * (count - 1) + [True]
+
+    joined = b""
+    for manifest in manifests:
+        data = (tmp_path / "chunk.{0}".format(manifest["index"])).read_bytes()
+        assert manifest["staged"]
+        assert manifest["size"] == len(data)
+        assert manifest["checksum"] == sha256(data).hexdigest()
+        joined += data
+    assert joined == content
+
+
+def test_chunk_stager_only_checks_resumed_chunks(tmp_path):
+    content = os.urandom(2 * MEGABYTE + 5)
+    resume_chunks = [dict(size=MEGABYTE, checksum=sha256(content[:MEGABYTE]).hexdigest())]
+
+    ChunkStager(str(tmp_path), 1, resume_chunks=resume_chunks).stage(_blocks(content))
+
+    assert [manifest["staged"] for manifest in _manifests(str(tmp_path))] == [False, True, True]
+    assert not (tmp_path / "chunk.0").exists()
+    assert (tmp_path / "chunk.1").read_bytes() + (tmp_path / "chunk.2").read_bytes() == content[MEGABYTE:]
+
+
+def test_chunk_stager_detects_a_changed_source(tmp_path):
+    content = os.urandom(2 * MEGABYTE)
+    resume_chunks = [
+        dict(size=MEGABYTE, checksum=sha256(content[:MEGABYTE]).hexdigest()),
+        dict(size=MEGABYTE, checksum=sha256(b"previous").hexdigest()),
+    ]
+
+    with pytest.raises(SourceChangedError) as err:
+        ChunkStager(str(tmp_path), 1, resume_chunks=resume_chunks).stage(_blocks(content))
+
+    assert err.value.index == 1
+    assert not any(name.startswith("chunk.1") for name in os.listdir(str(tmp_path)))
+
+
+def test_chunk_stager_waits_for_chunks_to_be_taken(tmp_path):
+    content = os.urandom(5 * MEGABYTE)
+    staging_dir = str(tmp_path)
+    taken = []
+    most_staged = []
+
+    def take_chunks():
+        index = 0
+        manifest_path = os.path.join(staging_dir, "chunk.{0}.json".format(index))
+        while len(taken) < 5:
+            if os.path.exists(manifest_path):
+                staged = [name for name in os.listdir(staging_dir) if zos_fetch.CHUNK_FILE_PATTERN.match(name)]
+                most_staged.append(len(staged))
+                chunk_path = os.path.join(staging_dir, "chunk.{0}".format(index))
+                with open(chunk_path, "rb") as infile:
+                    taken.append(infile.read())
+                os.remove(chunk_path)
+                index += 1
+                manifest_path = os.path.join(staging_dir, "chunk.{0}.json".format(index))
+
+    consumer = threading.Thread(target=take_chunks)
+    consumer.daemon = True
+    consumer.start()
+    ChunkStager(staging_dir, 1, window=2, idle_timeout=30).stage(_blocks(content))
+    consumer.join(30)
+
+    assert b"".join(taken) == content
+    assert max(most_staged) <= 2
+
+
+def test_chunk_stager_gives_up_when_chunks_are_not_taken(tmp_path):
+    content = os.urandom(3 * MEGABYTE)
+
+    with pytest.raises(ChunkStagingError):
+        ChunkStager(str(tmp_path), 1, window=1, idle_timeout=0).stage(_blocks(content))
+
+
+def test_chunk_stager_reports_an_incomplete_source(tmp_path):
+    def completed():
+        raise zos_fetch.ZOSFetchError(msg="dump failed")
+
+    with pytest.raises(zos_fetch.ZOSFetchError):
+        ChunkStager(str(tmp_path), 1).stage(_blocks(b"partial"), completed=completed)
+
+    assert not (tmp_path / "chunk.0.json").exists()
@@ -0,0 +1,146 @@
+# -*- coding: utf-8 -*-
+
+# Copyright (c) IBM Corporation 2026
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#     http://www.apache.org/licenses/LICENSE-2.0
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from __future__ import absolute_import, division, print_function
+
+__metaclass__ = type
+
+import pytest
+
+from ansible_collections.ibm.ibm_zos_core.plugins.modules import zos_job_wait
+
+IMPORT_NAME = "ansible_collections.ibm.ibm_zos_core.plugins.modules.zos_job_wait"
+
+
+def _job(job_id, msg, code=None):
+    return {
+        "job_id": job_id,
+        "job_name": "PAYROLL",
+        "owner": "ADMIN",
+        "content_type": "JOB",
+        "execution_time": "00:00:01",
+        "ret_code": {"msg": msg, "msg_code": None if code is None else str(code), "code": code, "msg_txt": msg},
+    }
+
+
+class Poller(object):
+    """Used in place of CompletionPoller so sweeps don't sleep."""
+
+    def __init__(self, sweeps):
+        self.sweeps = sweeps
+        self.polls = 0
+
+    def wait(self):
+        if self.polls + 1 >= self.sweeps:
+            return False
+        self.polls += 1
+        return True
+
+
+@pytest.fixture
+def listings(mocker):
+    sweeps = []
+    calls = []
+
+    def job_status(job_id=None, owner=None, include_extended=True):
+        assert not include_extended
+        calls.append((job_id, owner))
+        return sweeps.pop(0) if len(sweeps) > 1 else sweeps[0]
+
+    mocker.patch("{0}.job_status".format(IMPORT_NAME), side_effect=job_status)
+    return sweeps, calls
+
+
+@pytest.mark.parametrize(
+    "job_ids, expected",
+    [
+        (["JOB01427", "JOB01428", "JOB01533"], ["JOB01*"]),
+        (["JOB01427"], ["JOB01427"]),
+        (["JOB01427", "STC00012", "JOB01533"], ["JOB01*", "STC00012"]),
+        (["JOB09999", "J0010000"], ["JOB09999", "J0010000"]),
+        (["JOB01427", "JOB21427"], ["JOB01427", "JOB21427"]),
+        (["JOB09998", "JOB09999", "JOB10000", "JOB10001"], ["JOB0999*", "JOB1000*"]),
+        (["JOB01427", "JOB01427"], ["JOB01427"]),
+        (["STC00012", "STC00013", "TSU00001", "TSU00002"], ["STC0001*", "TSU0000*"]),
+    ]
+)
+def test_sweep_scopes_never_list_the_whole_spool(job_ids, expected):
+    assert zos_job_wait.sweep_scopes(job_ids) == expected
+
+
+def test_every_job_is_refreshed_in_one_sweep(listings):
+    sweeps, calls = listings
+    sweeps.extend([
+        [_job("JOB01427", "AC"), _job("JOB01428", "AC"), _job("JOB01499", "CC", 0)],
+        [_job("JOB01427", "CC", 0), _job("JOB01428", "AC")],
+        [_job("JOB01427", "CC", 0), _job("JOB01428", "CC", 4)],
+    ])
+
+    jobs = zos_job_wait.wait_for_jobs(["JOB01427", "JOB01428"], owner="ADMIN", max_rc=4, poller=Poller(10))
+
+    assert calls == [("*", "ADMIN")] * 3
+    parsed = zos_job_wait.parsing_jobs(["JOB01428", "JOB01427"], jobs, max_rc=4)
+    assert [(job["job_id"], job["completed"], job["failed"]) for job in parsed] == [
+        ("JOB01428", True, False), ("JOB01427", True, False)
+    ]
+
+
+@pytest.mark.parametrize("fail_fast, sweeps", [(True, 1), (False, 2)])
+def test_failed_job_stops_the_wait(listings, fail_fast, sweeps):
+    listing, calls = listings
+    listing.extend([
+        [_job("JOB01427", "ABEND"), _job("JOB01428", "AC")],
+        [_job("JOB01427", "ABEND"), _job("JOB01428", "CC", 0)],
+    ])
+
+    jobs = zos_job_wait.wait_for_jobs(["JOB01427", "JOB01428"], fail_fast=fail_fast, poller=Poller(10))
+
+    assert len(calls) == sweeps
+    assert [job["failed"] for job in zos_job_wait.parsing_jobs(["JOB01427"], jobs, max_rc=0)] == [True]
+
+
+def test_mixed_job_ids_are_swept_per_type(listings):
+    sweeps, calls = listings
+    sweeps.append([_job("JOB01427", "CC", 0), _job("STC00012", "CC", 0)])
+
+    jobs = zos_job_wait.wait_for_jobs(["JOB01427", "STC00012"], poller=Poller(10))
+
+    assert calls == [("JOB01427", None), ("STC00012", None)]
+    assert sorted(jobs) == ["JOB01427", "STC00012"]
+
+
+@pytest.mark.parametrize("owner, expected", [
+    (None, [("JOB0999*", None), ("JOB1000*", None)]),
+    ("ADMIN", [("*", "ADMIN")]),
+])
+def test_rollover_is_swept_with_few_queries(listings, owner, expected):
+    sweeps, calls = listings
+    job_ids = ["JOB{0:05d}".format(number) for number in range(9990, 10010)]
+    sweeps.append([_job(job_id, "CC", 0) for job_id in job_ids] + [_job("JOB10010", "AC")])
+
+    jobs = zos_job_wait.wait_for_jobs(job_ids, owner=owner, poller=Poller(10))
+
+    assert calls == expected
+    assert sorted(jobs) == job_ids
+
+
+def test_missing_job_is_reported_when_time_runs_out(listings):
+    listing, calls = listings
+    listing.append([_job("JOB01427", "CC", 0)])
+
+    jobs = zos_job_wait.wait_for_jobs(["JOB01427", "JOB01428"], poller=Poller(3))
+    parsed = zos_job_wait.parsing_jobs(["JOB01427", "JOB01428"], jobs, max_rc=0)
+
+    assert len(calls) == 3
+    assert parsed[1]["completed"] is False
+    assert parsed[1]["ret_code"]["msg"] is None
@@ -701,3 +701,33 @@ def test_ksds_exception_key_offset(
     }
     with pytest.raises(ValueError):
         raw.parse_and_validate_args(valid_args)
+
+
+def test_convert_outputs_once_per_encoding(
+    zos_import_mocker,
+):
+    mocker, importer = zos_import_mocker
+    raw = importer(IMPORT_NAME)
+    calls = []
+
+    def convert_contents(contents, from_encoding=None, to_encoding=None):
+        calls.append((from_encoding, to_encoding, list(contents)))
+        if b"bad" in contents:
+            raise ValueError("cannot convert")
+        return [content.decode().upper() for content in contents]
+
+    mocker.patch("{0}.convert_contents".format(IMPORT_NAME), create=True, side_effect=convert_contents)
+    outputs = [
+        {"content": b"one", "from_encoding": "IBM-1047", "to_encoding": "ISO8859-1"},
+        {"content": "YmFzZTY0", "from_encoding": "IBM-1047", "to_encoding": "ISO8859-1"},
+        {"content": b"two", "from_encoding": "IBM-1047", "to_encoding": "ISO8859-1"},
+        {"content": b"three", "from_encoding": "IBM-037", "to_encoding": "UTF-8"},
+        {"content": b"bad", "from_encoding": "IBM-037", "to_encoding": "UTF-8"},
+    ]
+
+    raw.convert_outputs(outputs)
+
+    assert [output["content"] for output in outputs] == ["ONE", "YmFzZTY0", "TWO", "THREE", ""]
+    assert calls[0] == ("IBM-1047", "ISO8859-1", [b"one", b"two"])
+    assert calls[1] == ("IBM-037", "UTF-8", [b"three", b"bad"])
+    assert len(calls) == 4
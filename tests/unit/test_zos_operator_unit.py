@@ -64,3 +64,121 @@ def test_zos_opreator_various_args(zos_import_mocker, args, expected):
     except Exception as e:
         passed = False
     assert passed == expected
+
+
+@pytest.mark.parametrize("cmd,expected", [
+    (["d u,all", "d a,l"], True),
+    ([], False),
+    (["d u,all", 123], False),
+])
+def test_zos_operator_batch_args(zos_import_mocker, cmd, expected):
+    mocker, importer = zos_import_mocker
+    zos_operator = importer(IMPORT_NAME)
+    passed = True
+    try:
+        zos_operator.parse_params({"cmd": cmd})
+    except Exception:
+        passed = False
+    assert passed == expected
+
+
+def test_zos_operator_batch_keeps_command_order(zos_import_mocker):
+    mocker, importer = zos_import_mocker
+    zos_operator = importer(IMPORT_NAME)
+    mocker.patch("{0}.AnsibleModuleHelper".format(IMPORT_NAME), create=True)
+    mocker.patch("{0}.zoau_version_checker.is_zoau_version_higher_than".format(IMPORT_NAME), return_value=True)
+
+    def execute_command(cmdtxt, **kwargs):
+        if cmdtxt == "d bad":
+            return 8, "", "IEE305I BAD COMMAND INVALID", 0.1
+        return 0, "\n".join(["RESPONSE", cmdtxt, "LINE 1", "LINE 2"]), "", 0.1
+
+    mocker.patch("{0}.execute_command".format(IMPORT_NAME), side_effect=execute_command)
+    params = zos_operator.parse_params({"cmd": ["d u,all", "d bad", "d a,l"], "max_concurrency": 2})
+    result = {}
+
+    failed = zos_operator.run_batch(params, result)
+
+    assert failed == ["d bad"]
+    assert [entry["cmd"] for entry in result["results"]] == ["d u,all", "d bad", "d a,l"]
+    assert [entry["failed"] for entry in result["results"]] == [False, True, False]
+    assert result["results"][1]["rc"] == 8
+    assert result["results"][1]["stderr_lines"] == ["IEE305I BAD COMMAND INVALID"]
+    assert result["rc"] == 8
+    assert result["changed"] is True
+
+
+def test_zos_operator_batch_runs_one_command_at_a_time_by_default(zos_import_mocker):
+    mocker, importer = zos_import_mocker
+    zos_operator = importer(IMPORT_NAME)
+    mocker.patch("{0}.AnsibleModuleHelper".format(IMPORT_NAME), create=True)
+    run_concurrently = mocker.patch("{0}.concurrency.run_concurrently".format(IMPORT_NAME), return_value=[])
+
+    params = zos_operator.parse_params({"cmd": ["d u,all", "d a,l"]})
+    zos_operator.run_operator_commands(params, max_concurrency=params.get("max_concurrency"))
+
+    assert params.get("max_concurrency") == 1
+    assert run_concurrently.call_args[1]["max_concurrency"] == 1
+
+
+D_A_L_RESPONSE = "\n".join([
+    "EC000000   2026290  10:12:01.00            -D A,L",
+    "EC000000   2026290  10:12:01.00             IEE114I 10.12.01 2026.290 ACTIVITY 812",
+    "                                             JOBS     M/S    TS USERS    SYSAS    INITS",
+    "                                            00002    00021    00001      00034    00020",
+])
+
+
+@pytest.mark.parametrize("pattern,msg_id,expected", [
+    (r"JOBS\s+M/S", None, True),
+    (None, "IEE114I", True),
+    (r"ACTIVITY", "IEE114I", True),
+    (r"JOBS", "IEE114I", False),
+    (None, "IEE115I", False),
+])
+def test_zos_operator_response_matches(zos_import_mocker, pattern, msg_id, expected):
+    mocker, importer = zos_import_mocker
+    zos_operator = importer(IMPORT_NAME)
+    pattern = zos_operator._completion_pattern(pattern, {})
+
+    assert zos_operator.response_matches(D_A_L_RESPONSE, pattern, msg_id) == expected
+
+
+def test_zos_operator_invalid_wait_for(zos_import_mocker):
+    mocker, importer = zos_import_mocker
+    zos_operator = importer(IMPORT_NAME)
+
+    with pytest.raises(ValueError):
+        zos_operator.parse_params({"cmd": "d a,l", "wait_for": "IEE114I("})
+
+
+def test_zos_operator_returns_once_response_matches(zos_import_mocker):
+    mocker, importer = zos_import_mocker
+    zos_operator = importer(IMPORT_NAME)
+    mocker.patch("{0}.AnsibleModuleHelper".format(IMPORT_NAME), create=True)
+    mocker.patch("{0}.zoau_version_checker.is_zoau_version_higher_than".format(IMPORT_NAME), return_value=True)
+    execute_command = mocker.patch(
+        "{0}.execute_command".format(IMPORT_NAME), return_value=(0, D_A_L_RESPONSE, "", 0.4)
+    )
+    params = zos_operator.parse_params({"cmd": "d a,l", "wait_for_msgid": "IEE114I", "wait_time": 30})
+
+    response = zos_operator.run_operator_command(params)
+
+    assert response["matched"] is True
+    assert response["elapsed"] < 30
+    assert "wait" not in execute_command.call_args.kwargs
+
+
+def test_zos_operator_only_searches_the_command_response(zos_import_mocker):
+    mocker, importer = zos_import_mocker
+    zos_operator = importer(IMPORT_NAME)
+    mocker.patch("{0}.AnsibleModuleHelper".format(IMPORT_NAME), create=True)
+    mocker.patch("{0}.zoau_version_checker.is_zoau_version_higher_than".format(IMPORT_NAME), return_value=True)
+    mocker.patch("{0}.execute_command".format(IMPORT_NAME), return_value=(0, D_A_L_RESPONSE, "", 0.4))
+    params = zos_operator.parse_params({"cmd": "d a,l", "wait_for_msgid": "IEE115I", "wait_time": 30})
+
+    response = zos_operator.run_operator_command(params)
+
+    assert response["matched"] is False
+    assert response["stdout"] == D_A_L_RESPONSE
+    assert not hasattr(zos_operator, "zsystem")